@@ -20,6 +20,9 @@ import matplotlib.pyplot as plt
 import matplotlib
 matplotlib.use('Agg')
 
+from .frame_transport import FRAME_SEGMENT_ENV, FrameWriter
+from .raster import apply_palette, draw_arrows, linear_gradient
+
 logger = logging.getLogger(__name__)
 
 class BaseVisualizer(ABC):
@@ -133,14 +136,29 @@ class BaseVisualizer(ABC):
         }
         return json.dumps(frame_data)
 
-    def run(self):
-        """Main loop for the visualizer."""
+    def run(self, frame_segment: Optional[str] = None):
+        """
+        Main loop for the visualizer. Given a shared-memory segment name (or
+        DAWN_FRAME_SEGMENT in the environment), raw RGB frames go to a frame
+        ring the server maps; otherwise JSON frames are printed to stdout.
+        """
+        frame_segment = frame_segment or os.environ.get(FRAME_SEGMENT_ENV)
+        writer: Optional[FrameWriter] = None
         try:
             while self.is_running:
+                if writer is not None and writer.consumer_lag() >= writer.slots:
+                    time.sleep(1/30)  # Nobody is reading: skip rendering until they catch up
+                    continue
                 self.generate()
                 frame = self.render()
-                frame_data = self._create_frame_data(frame)
-                print(frame_data, flush=True)  # Print to stdout for the server to capture
+                if frame_segment:
+                    pixels = np.asarray(frame.convert('RGB'))
+                    if writer is None:
+                        writer = FrameWriter(frame_segment, pixels.shape[1], pixels.shape[0])
+                    writer.write(pixels, self.frame_count)
+                else:
+                    frame_data = self._create_frame_data(frame)
+                    print(frame_data, flush=True)  # Print to stdout for the server to capture
                 self.frame_count += 1
                 time.sleep(1/30)  # Target 30 FPS
         except KeyboardInterrupt:
@@ -148,23 +166,14 @@ class BaseVisualizer(ABC):
         except Exception as e:
             logger.error(f"Error in visualizer: {str(e)}")
         finally:
+            if writer is not None:
+                writer.close()
             self.cleanup()
 
     @staticmethod
     def create_gradient_background(width: int, height: int, color1: tuple, color2: tuple) -> Image.Image:
         """Create a gradient background."""
-        image = Image.new('RGB', (width, height))
-        pixels = image.load()
-        
-        for y in range(height):
-            for x in range(width):
-                # Calculate gradient
-                r = int(color1[0] * (1 - y/height) + color2[0] * (y/height))
-                g = int(color1[1] * (1 - y/height) + color2[1] * (y/height))
-                b = int(color1[2] * (1 - y/height) + color2[2] * (y/height))
-                pixels[x, y] = (r, g, b)
-        
-        return image
+        return Image.fromarray(linear_gradient(width, height, color1, color2))
 
     @staticmethod
     def draw_text(image: Image.Image, text: str, position: tuple, color: tuple = (255, 255, 255), 
@@ -182,36 +191,16 @@ class BaseVisualizer(ABC):
 
     @staticmethod
     def create_heatmap(data: np.ndarray, width: int, height: int, 
-                      min_val: float = 0, max_val: float = 1) -> Image.Image:
-        """Create a heatmap from 2D data."""
-        # Normalize data
-        data = (data - min_val) / (max_val - min_val)
-        data = np.clip(data, 0, 1)
-        
-        # Create RGB image
-        image = np.zeros((height, width, 3), dtype=np.uint8)
-        
-        # Color mapping (blue to red)
-        image[..., 0] = (data * 255).astype(np.uint8)  # Red
-        image[..., 1] = 0  # Green
-        image[..., 2] = ((1 - data) * 255).astype(np.uint8)  # Blue
-        
-        return Image.fromarray(image)
+                      min_val: float = 0, max_val: float = 1, palette: str = 'heat') -> Image.Image:
+        """Create a heatmap from 2D data (blue to red by default)."""
+        return Image.fromarray(apply_palette(data, palette, min_val, max_val))
 
     @staticmethod
     def create_vector_field(vectors: np.ndarray, width: int, height: int, 
                           scale: float = 1.0, color: tuple = (0, 255, 136)) -> Image.Image:
-        """Create a vector field visualization."""
-        image = Image.new('RGB', (width, height), (0, 0, 0))
-        draw = ImageDraw.Draw(image)
-        
-        # Draw vectors
-        for y in range(0, height, 20):
-            for x in range(0, width, 20):
-                if y < vectors.shape[0] and x < vectors.shape[1]:
-                    vx, vy = vectors[y, x]
-                    end_x = int(x + vx * scale)
-                    end_y = int(y + vy * scale)
-                    draw.line([(x, y), (end_x, end_y)], fill=color, width=1)
-        
-        return image 
\ No newline at end of file
+        """Create a vector field visualization: one arrow per 20 pixel grid cell."""
+        frame = np.zeros((height, width, 3), dtype=np.uint8)
+        ys, xs = np.mgrid[0:min(height, vectors.shape[0]):20, 0:min(width, vectors.shape[1]):20]
+        origins = np.stack([xs.ravel(), ys.ravel()], axis=1)
+        draw_arrows(frame, origins, vectors[ys.ravel(), xs.ravel()], color, scale=scale)
+        return Image.fromarray(frame)
@@ -0,0 +1,269 @@
+"""
+Frame transport for DAWN visualizer processes
+Visualizers publish raw RGB frames into a shared-memory ring buffer instead
+of printing base64 PNG JSON to stdout; the server maps the same segment and
+reads the newest frame directly. Frames are only compressed at the websocket
+edge, as a PNG keyframe or the PNG of the changed rectangle.
+
+The visual server's VisualManager gives each process a segment named by
+frame_segment_name and lists it in the process metadata, so websocket
+clients can ask for a stream by process name; a standalone visualizer is
+pointed at its segment through DAWN_FRAME_SEGMENT.
+
+Segment layout (little endian):
+    header  64 bytes  magic, version, channels, slots, width, height,
+                      write_seq (newest complete frame), read_seq (reader ack)
+    slots   n x (64 byte slot header + width * height * channels bytes)
+                      slot header: seq, timestamp, frame_count, height, width
+
+Sequence numbers start at 1. A slot's seq is zeroed while it is being
+written, so a reader that sees the same seq before and after copying has an
+untorn frame. The reader acknowledges every frame it takes by storing its
+seq in read_seq; a writer whose reader is a whole ring behind can skip
+rendering until someone reads again.
+"""
+
+import base64
+import hashlib
+import io
+import logging
+import os
+import struct
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, NamedTuple, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FRAME_SEGMENT_ENV = "DAWN_FRAME_SEGMENT"
+
+MAGIC = b"DWNF"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIII")
+HEADER_SIZE = 64
+WRITE_SEQ_OFFSET = 24  # read_seq follows at 32
+SLOT_INFO = struct.Struct("<dQII")  # after the slot's 8-byte seq
+SLOT_HEADER_SIZE = 64
+
+# Segments created by writers in this process (and so registered with its resource tracker)
+_owned_segments = set()
+
+
+def frame_segment_name(visualizer: str, owner: Optional[int] = None) -> str:
+    """Segment name for one visualizer, unique per owning process and short enough for macOS (31 chars)"""
+    digest = hashlib.blake2s(visualizer.encode(), digest_size=4).hexdigest()
+    return f"dawn_{owner or os.getpid()}_{digest}"
+
+
+class Frame(NamedTuple):
+    """One frame taken from the ring; dropped counts frames overwritten before they were read"""
+    seq: int
+    timestamp: float
+    frame_count: int
+    pixels: np.ndarray
+    dropped: int = 0
+
+
+def _slot_stride(width: int, height: int, channels: int) -> int:
+    payload = width * height * channels
+    return SLOT_HEADER_SIZE + (payload + 63) // 64 * 64
+
+
+class _FrameRing:
+    """Views over a mapped segment shared by the writer and reader"""
+
+    def __init__(self, shm: shared_memory.SharedMemory):
+        self.shm = shm
+        magic, version, self.channels, self.slots, self.width, self.height = HEADER.unpack_from(shm.buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{shm.name} is not a DAWN frame segment (v{VERSION})")
+        self.stride = _slot_stride(self.width, self.height, self.channels)
+        self._counters = np.ndarray((2,), dtype=np.uint64, buffer=shm.buf, offset=WRITE_SEQ_OFFSET)
+        self._slot_seqs = [np.ndarray((1,), dtype=np.uint64, buffer=shm.buf, offset=self._slot_offset(slot))
+                           for slot in range(self.slots)]
+
+    @property
+    def write_seq(self) -> int:
+        return int(self._counters[0])
+
+    @property
+    def read_seq(self) -> int:
+        return int(self._counters[1])
+
+    def _slot_offset(self, slot: int) -> int:
+        return HEADER_SIZE + slot * self.stride
+
+    def _payload(self, slot: int, height: int, width: int) -> np.ndarray:
+        return np.ndarray((height, width, self.channels), dtype=np.uint8, buffer=self.shm.buf,
+                          offset=self._slot_offset(slot) + SLOT_HEADER_SIZE)
+
+    def release(self):
+        # Drop the numpy views first: a segment with exported buffers cannot close
+        self._counters = None
+        self._slot_seqs = []
+        self.shm.close()
+
+
+class FrameWriter(_FrameRing):
+    """
+    Producer side of a frame ring. Creates (or replaces) the named segment
+    with room for `slots` frames of up to width x height pixels.
+    """
+
+    def __init__(self, name: str, width: int, height: int, channels: int = 3, slots: int = 3):
+        size = HEADER_SIZE + slots * _slot_stride(width, height, channels)
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _owned_segments.add(shm._name)
+        shm.buf[:HEADER_SIZE] = bytes(HEADER_SIZE)
+        HEADER.pack_into(shm.buf, 0, MAGIC, VERSION, channels, slots, width, height)
+        super().__init__(shm)
+        self._seq = 0
+        self._stats = {'frames': 0, 'bytes': 0}
+
+    def consumer_lag(self) -> int:
+        """Frames written since the reader last acknowledged one"""
+        return self._seq - self.read_seq
+
+    def write(self, pixels: np.ndarray, frame_count: Optional[int] = None) -> int:
+        """Publish one (height, width, channels) uint8 frame and return its sequence number"""
+        pixels = np.asarray(pixels, dtype=np.uint8)
+        height, width = pixels.shape[:2]
+        channels = pixels.shape[2] if pixels.ndim == 3 else 1
+        if height > self.height or width > self.width or channels != self.channels:
+            raise ValueError(f"frame {width}x{height}x{channels} does not fit the "
+                             f"{self.width}x{self.height}x{self.channels} ring {self.shm.name}")
+
+        seq = self._seq + 1
+        slot = seq % self.slots
+        offset = self._slot_offset(slot)
+        self._slot_seqs[slot][0] = 0  # torn until the final seq lands
+        self._payload(slot, height, width)[...] = pixels.reshape(height, width, channels)
+        SLOT_INFO.pack_into(self.shm.buf, offset + 8, time.time(),
+                            seq if frame_count is None else frame_count, height, width)
+        self._slot_seqs[slot][0] = seq
+        self._counters[0] = seq
+        self._seq = seq
+        self._stats['frames'] += 1
+        self._stats['bytes'] += pixels.nbytes
+        return seq
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {**self._stats, 'write_seq': self._seq, 'read_seq': self.read_seq,
+                'consumer_lag': self.consumer_lag()}
+
+    def close(self, unlink: bool = True):
+        shm = self.shm
+        self.release()
+        if unlink:
+            _owned_segments.discard(shm._name)
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class FrameReader(_FrameRing):
+    """Consumer side of a frame ring: takes the newest frame and acknowledges it"""
+
+    def __init__(self, name: str):
+        shm = shared_memory.SharedMemory(name=name)
+        # The writer owns the segment; don't let this process's tracker unlink it on exit
+        if shm._name not in _owned_segments:
+            resource_tracker.unregister(shm._name, "shared_memory")
+        try:
+            super().__init__(shm)
+        except ValueError:
+            shm.close()
+            raise
+        self.last_seq = 0
+
+    @classmethod
+    def attach(cls, name: str) -> Optional["FrameReader"]:
+        """Map the segment if its writer has created it yet"""
+        try:
+            return cls(name)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def read(self, retries: int = 3) -> Optional[Frame]:
+        """The newest frame if one arrived since the last read, else None"""
+        for _ in range(retries):
+            seq = self.write_seq
+            if seq == self.last_seq:
+                return None
+            slot = seq % self.slots
+            offset = self._slot_offset(slot)
+            if int(self._slot_seqs[slot][0]) != seq:
+                continue  # being overwritten; the header has moved on
+            timestamp, frame_count, height, width = SLOT_INFO.unpack_from(self.shm.buf, offset + 8)
+            pixels = self._payload(slot, height, width).copy()
+            if int(self._slot_seqs[slot][0]) != seq:
+                continue  # torn
+            dropped = max(seq - self.last_seq - 1, 0)
+            self.last_seq = seq
+            self._counters[1] = seq
+            return Frame(seq, timestamp, frame_count, pixels, dropped)
+        return None
+
+    def close(self):
+        self.release()
+
+
+class FrameEdgeEncoder:
+    """
+    Websocket-edge encoder for one frame stream: a PNG keyframe every
+    `keyframe_interval` frames (or when most of the frame changed), in
+    between the PNG of the rectangle that changed since the last frame sent.
+    """
+
+    def __init__(self, keyframe_interval: int = 30, max_delta_fraction: float = 0.5):
+        self.keyframe_interval = keyframe_interval
+        self.max_delta_fraction = max_delta_fraction
+        self._previous: Optional[np.ndarray] = None
+        self._since_keyframe = 0
+
+    def encode(self, frame: Frame) -> Optional[Dict[str, Any]]:
+        """Message for the websocket, or None if nothing changed"""
+        pixels = frame.pixels
+        keyframe = (self._previous is None or self._previous.shape != pixels.shape
+                    or self._since_keyframe + 1 >= self.keyframe_interval)
+        x = y = 0
+        patch = pixels
+        if not keyframe:
+            changed = np.any(pixels != self._previous, axis=2)
+            rows, columns = np.flatnonzero(changed.any(axis=1)), np.flatnonzero(changed.any(axis=0))
+            if not rows.size:
+                return None
+            y, x = int(rows[0]), int(columns[0])
+            patch = pixels[y:rows[-1] + 1, x:columns[-1] + 1]
+            keyframe = patch.shape[0] * patch.shape[1] > self.max_delta_fraction * changed.size
+            if keyframe:
+                x = y = 0
+                patch = pixels
+
+        self._previous = pixels
+        self._since_keyframe = 0 if keyframe else self._since_keyframe + 1
+        return {
+            "type": "frame" if keyframe else "delta",
+            "seq": frame.seq,
+            "frame_count": frame.frame_count,
+            "timestamp": frame.timestamp,
+            "x": x, "y": y, "width": patch.shape[1], "height": patch.shape[0],
+            "frame": self._png(patch),
+        }
+
+    @staticmethod
+    def _png(pixels: np.ndarray) -> str:
+        from PIL import Image  # only the websocket edge compresses frames
+
+        buffer = io.BytesIO()
+        Image.fromarray(pixels.squeeze()).save(buffer, format="PNG", compress_level=1)
+        return base64.b64encode(buffer.getvalue()).decode()
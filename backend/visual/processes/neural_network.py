@@ -1,6 +1,7 @@
 import numpy as np
 import cv2
 from ..base_visual import BaseVisualProcess
+from ..raster import draw_lines, draw_points
 
 class VisualProcess(BaseVisualProcess):
     """Neural network visualization process."""
@@ -36,55 +37,36 @@ class VisualProcess(BaseVisualProcess):
                     connections.append((i, j))
         return np.array(connections)
     
+    @staticmethod
+    def _colors(level: np.ndarray) -> np.ndarray:
+        """(255 * (1 - level), 255 * level, 255) per neuron or connection"""
+        return np.stack([255 * (1 - level), 255 * level, np.full_like(level, 255)], axis=1).astype(np.uint8)
+    
     def _update_impl(self, dt: float) -> None:
         """Update neural network state."""
         self.time += dt
         
-        # Update neuron activations
-        for i in range(self.num_neurons):
-            # Oscillate activation based on time and phase
-            self.neurons[i, 2] = 0.5 + 0.5 * np.sin(self.time * 2 + self.neurons[i, 3])
-            
-            # Add some random noise
-            self.neurons[i, 2] += np.random.normal(0, 0.1)
-            self.neurons[i, 2] = np.clip(self.neurons[i, 2], 0, 1)
+        # Update neuron activations: oscillate with time and phase, plus some noise
+        activations = 0.5 + 0.5 * np.sin(self.time * 2 + self.neurons[:, 3])
+        activations += np.random.normal(0, 0.1, self.num_neurons)
+        self.neurons[:, 2] = np.clip(activations, 0, 1)
+        activation = self.neurons[:, 2]
+        positions = self.neurons[:, :2].astype(int)
         
         # Create new frame
         frame = np.zeros((self.height, self.width, 3), dtype=np.uint8)
         
-        # Draw connections
-        for i, j in self.connections:
-            # Get neuron positions
-            x1, y1 = int(self.neurons[i, 0]), int(self.neurons[i, 1])
-            x2, y2 = int(self.neurons[j, 0]), int(self.neurons[j, 1])
-            
-            # Calculate connection strength based on neuron activations
-            strength = (self.neurons[i, 2] + self.neurons[j, 2]) / 2
-            
-            # Draw line with varying color based on strength
-            color = (
-                int(255 * (1 - strength)),  # Red
-                int(255 * strength),        # Green
-                255                         # Blue
-            )
-            cv2.line(frame, (x1, y1), (x2, y2), color, 1)
+        # Draw connections, coloured by the mean activation of their neurons
+        if len(self.connections):
+            i, j = self.connections[:, 0], self.connections[:, 1]
+            strength = (activation[i] + activation[j]) / 2
+            draw_lines(frame, positions[i], positions[j], self._colors(strength))
         
-        # Draw neurons
-        for i in range(self.num_neurons):
-            x, y = int(self.neurons[i, 0]), int(self.neurons[i, 1])
-            activation = self.neurons[i, 2]
-            
-            # Draw neuron circle
-            radius = int(3 + 2 * activation)
-            color = (
-                int(255 * (1 - activation)),  # Red
-                int(255 * activation),        # Green
-                255                           # Blue
-            )
-            cv2.circle(frame, (x, y), radius, color, -1)
-            
-            # Add glow effect
-            cv2.circle(frame, (x, y), radius + 2, color, 1)
+        # Draw neurons with a glow ring
+        colors = self._colors(activation)
+        radii = (3 + 2 * activation).astype(int)
+        draw_points(frame, positions, colors, radii)
+        draw_points(frame, positions, colors, radii + 2, outline=True)
         
         # Add some text
         cv2.putText(
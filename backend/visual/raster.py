@@ -0,0 +1,162 @@
+"""
+Raster primitives for DAWN visualizers
+NumPy building blocks for frames that are produced as (height, width, 3)
+uint8 arrays: lookup-table palettes, broadcast gradients and batched line,
+arrow and point rasterisation. Each call does its work as a handful of array
+operations over every pixel, segment or point at once, so per-frame CPU
+goes to content instead of Python pixel loops.
+"""
+
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+Color = Tuple[int, int, int]
+Colors = Union[Color, Sequence[Color], np.ndarray]
+
+# Colour stops of the named palettes, evenly spaced from 0 to 1
+PALETTES: Dict[str, Tuple[Color, ...]] = {
+    'heat': ((0, 0, 255), (255, 0, 0)),
+    'dawn': ((0, 0, 0), (0, 204, 51), (0, 255, 65)),
+    'viridis': ((68, 1, 84), (59, 82, 139), (33, 145, 140), (94, 201, 98), (253, 231, 37)),
+    'inferno': ((0, 0, 4), (87, 16, 110), (188, 55, 84), (249, 142, 9), (252, 255, 164)),
+    'rdylbu_r': ((49, 54, 149), (116, 173, 209), (255, 255, 191), (244, 109, 67), (165, 0, 38)),
+}
+
+
+def palette_lut(stops: Sequence[Color], size: int = 256) -> np.ndarray:
+    """(size, 3) uint8 table interpolated linearly between evenly spaced colour stops"""
+    stops = np.asarray(stops, dtype=np.float64)
+    if len(stops) == 1:
+        return np.repeat(np.rint(stops).astype(np.uint8), size, axis=0)
+    positions = np.linspace(0.0, 1.0, len(stops))
+    samples = np.linspace(0.0, 1.0, size)
+    channels = [np.interp(samples, positions, stops[:, channel]) for channel in range(3)]
+    return np.rint(np.stack(channels, axis=1)).astype(np.uint8)
+
+
+@lru_cache(maxsize=32)
+def get_palette(name: str, size: int = 256) -> np.ndarray:
+    """Lookup table of a named palette (read-only, shared between callers)"""
+    lut = palette_lut(PALETTES[name], size)
+    lut.setflags(write=False)
+    return lut
+
+
+def apply_palette(values: np.ndarray, lut: Union[str, np.ndarray], vmin: float = 0.0,
+                  vmax: float = 1.0) -> np.ndarray:
+    """Colour an array of scalars: values in [vmin, vmax] index the table, NaN takes its first entry"""
+    if isinstance(lut, str):
+        lut = get_palette(lut)
+    span = (vmax - vmin) or 1.0
+    scaled = (np.asarray(values, dtype=np.float64) - vmin) * ((len(lut) - 1) / span)
+    indices = np.clip(np.nan_to_num(scaled, nan=0.0), 0, len(lut) - 1).astype(np.intp)
+    return lut[indices]
+
+
+def linear_gradient(width: int, height: int, color1: Color, color2: Color,
+                    vertical: bool = True) -> np.ndarray:
+    """Frame blending color1 into color2 from top to bottom (or left to right)"""
+    length = height if vertical else width
+    t = (np.arange(length) / length)[:, None]
+    ramp = (np.asarray(color1, dtype=np.float64) * (1 - t)
+            + np.asarray(color2, dtype=np.float64) * t).astype(np.uint8)
+    ramp = ramp[:, None, :] if vertical else ramp[None, :, :]
+    return np.ascontiguousarray(np.broadcast_to(ramp, (height, width, 3)))
+
+
+def radial_gradient(width: int, height: int, inner: Color, outer: Color,
+                    center: Optional[Tuple[float, float]] = None,
+                    radius: Optional[float] = None) -> np.ndarray:
+    """Frame blending inner into outer with distance from center (default: frame centre)"""
+    cx, cy = center if center is not None else ((width - 1) / 2, (height - 1) / 2)
+    radius = radius or np.hypot(max(cx, width - 1 - cx), max(cy, height - 1 - cy)) or 1.0
+    t = np.minimum(np.hypot(np.arange(width)[None, :] - cx, np.arange(height)[:, None] - cy) / radius, 1.0)
+    return (np.asarray(inner, dtype=np.float64) * (1 - t[..., None])
+            + np.asarray(outer, dtype=np.float64) * t[..., None]).astype(np.uint8)
+
+
+def _per_item_colors(colors: Colors, count: int) -> np.ndarray:
+    colors = np.asarray(colors, dtype=np.uint8)
+    return np.broadcast_to(colors, (count, 3)) if colors.ndim == 1 else colors
+
+
+def draw_lines(frame: np.ndarray, starts: np.ndarray, ends: np.ndarray, colors: Colors) -> np.ndarray:
+    """
+    Draw one-pixel segments starts[i] -> ends[i] ((n, 2) arrays of x, y)
+    into frame in place, all segments in one scatter. colors is one RGB
+    triple or one per segment; later segments win where they overlap.
+    """
+    starts = np.asarray(starts, dtype=np.float64).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=np.float64).reshape(-1, 2)
+    if not len(starts):
+        return frame
+    colors = _per_item_colors(colors, len(starts))
+
+    deltas = ends - starts
+    samples = np.ceil(np.abs(deltas).max(axis=1)).astype(np.intp) + 1
+    segment = np.repeat(np.arange(len(starts)), samples)
+    offsets = np.cumsum(samples) - samples
+    t = (np.arange(len(segment)) - offsets[segment]) / np.maximum(samples - 1, 1)[segment]
+    points = np.rint(starts[segment] + t[:, None] * deltas[segment]).astype(np.intp)
+
+    height, width = frame.shape[:2]
+    inside = (points[:, 0] >= 0) & (points[:, 0] < width) & (points[:, 1] >= 0) & (points[:, 1] < height)
+    frame[points[inside, 1], points[inside, 0]] = colors[segment[inside]]
+    return frame
+
+
+def draw_arrows(frame: np.ndarray, origins: np.ndarray, vectors: np.ndarray, colors: Colors,
+                scale: float = 1.0, head_size: float = 0.3, head_angle: float = 0.5) -> np.ndarray:
+    """
+    Draw arrows from origins along scale * vectors ((n, 2) arrays of x, y)
+    into frame in place. Heads are two barbs of head_size times the arrow
+    length, head_angle radians off the shaft; zero-length arrows are skipped.
+    """
+    origins = np.asarray(origins, dtype=np.float64).reshape(-1, 2)
+    shafts = np.asarray(vectors, dtype=np.float64).reshape(-1, 2) * scale
+    colors = _per_item_colors(colors, len(origins))
+    visible = np.abs(shafts).max(axis=1) >= 0.5 if len(shafts) else np.zeros(0, dtype=bool)
+    origins, shafts, colors = origins[visible], shafts[visible], colors[visible]
+
+    tips = origins + shafts
+    back = -shafts * head_size
+    barbs = []
+    for angle in (head_angle, -head_angle):
+        cos, sin = np.cos(angle), np.sin(angle)
+        barbs.append(tips + np.stack([back[:, 0] * cos - back[:, 1] * sin,
+                                      back[:, 0] * sin + back[:, 1] * cos], axis=1))
+    return draw_lines(frame, np.concatenate([origins, tips, tips]),
+                      np.concatenate([tips] + barbs), np.concatenate([colors] * 3))
+
+
+@lru_cache(maxsize=64)
+def _stamp(radius: int, outline: bool) -> Tuple[np.ndarray, np.ndarray]:
+    span = np.arange(-radius, radius + 1)
+    dy, dx = np.meshgrid(span, span, indexing='ij')
+    distance = np.hypot(dx, dy)
+    mask = np.abs(distance - radius) < 0.5 if outline else distance <= radius + 0.5
+    return dy[mask], dx[mask]
+
+
+def draw_points(frame: np.ndarray, centers: np.ndarray, colors: Colors,
+                radius: Union[int, Sequence[int], np.ndarray] = 0, outline: bool = False) -> np.ndarray:
+    """
+    Stamp filled discs (or one-pixel rings) of the given radius, one per
+    point or per-point, at centers ((n, 2) array of x, y) into frame in place.
+    """
+    centers = np.rint(np.asarray(centers, dtype=np.float64).reshape(-1, 2)).astype(np.intp)
+    colors = _per_item_colors(colors, len(centers))
+    radii = np.broadcast_to(np.asarray(radius, dtype=np.intp), (len(centers),))
+    height, width = frame.shape[:2]
+
+    for value in np.unique(radii):
+        group = radii == value
+        dy, dx = _stamp(int(value), outline)
+        ys = (centers[group, 1][:, None] + dy[None, :]).ravel()
+        xs = (centers[group, 0][:, None] + dx[None, :]).ravel()
+        fill = np.repeat(colors[group], len(dy), axis=0)
+        inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        frame[ys[inside], xs[inside]] = fill[inside]
+    return frame
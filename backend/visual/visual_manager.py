@@ -1,6 +1,7 @@
 import time
 from typing import Dict, List, Optional, Type
 from .base_visual import BaseVisualProcess
+from .frame_transport import FrameWriter, frame_segment_name
 import importlib
 import os
 import logging
@@ -20,6 +21,8 @@ class VisualManager:
         self.processes: Dict[str, BaseVisualProcess] = {}
         self.last_update = 0
         self._process_classes: Dict[str, Type[BaseVisualProcess]] = {}
+        self.frame_segments: Dict[str, str] = {}
+        self._frame_writers: Dict[str, FrameWriter] = {}
         
         # Setup GIF saver
         self.gif_saver = setup_gif_saver("visualmanager")
@@ -36,6 +39,7 @@ class VisualManager:
             process: Visual process instance to register
         """
         self.processes[process.name] = process
+        self.frame_segments[process.name] = frame_segment_name(process.name)
         logger.info(f"Registered visual process: {process.name}")
     
     def unregister_process(self, name: str) -> None:
@@ -47,6 +51,8 @@ class VisualManager:
         if name in self.processes:
             self.processes[name].stop()
             del self.processes[name]
+            self.frame_segments.pop(name, None)
+            self._close_frame_writer(name)
             logger.info(f"Unregistered visual process: {name}")
     
     def get_process(self, name: str) -> Optional[BaseVisualProcess]:
@@ -66,7 +72,18 @@ class VisualManager:
         Returns:
             List of process metadata dictionaries
         """
-        return [p.get_metadata() for p in self.processes.values()]
+        return [self.describe_process(p) for p in self.processes.values()]
+    
+    def describe_process(self, process: BaseVisualProcess) -> Dict:
+        """Process metadata plus the shared-memory segment its frames are published to.
+        
+        Args:
+            process: Registered process to describe
+            
+        Returns:
+            Metadata dictionary with a 'frame_segment' entry
+        """
+        return {**process.get_metadata(), 'frame_segment': self.frame_segments.get(process.name)}
     
     def update_all(self) -> None:
         """Update all active visual processes."""
@@ -78,9 +95,29 @@ class VisualManager:
             if process.is_active:
                 try:
                     process.update(dt)
+                    self._publish_frame(process)
                 except Exception as e:
                     logger.error(f"Error updating process {process.name}: {e}")
     
+    def _publish_frame(self, process: BaseVisualProcess) -> None:
+        """Copy a process's current frame into its frame ring for websocket streams."""
+        writer = self._frame_writers.get(process.name)
+        frame = process._frame
+        if writer is not None and (frame.shape[1] > writer.width or frame.shape[0] > writer.height):
+            self._close_frame_writer(process.name)  # grown past the ring: streams reattach to a new one
+            writer = None
+        if writer is None:
+            writer = FrameWriter(self.frame_segments[process.name], frame.shape[1], frame.shape[0])
+            self._frame_writers[process.name] = writer
+        elif writer.consumer_lag() >= writer.slots:
+            return  # Nobody is streaming this process
+        writer.write(frame[..., ::-1], process.frame_count)  # frames are BGR, the ring is RGB
+    
+    def _close_frame_writer(self, name: str) -> None:
+        writer = self._frame_writers.pop(name, None)
+        if writer is not None:
+            writer.close()
+    
     def capture_frame(self, process_name: str) -> Optional[str]:
         """Capture a frame from a specific process.
         
@@ -189,8 +226,10 @@ class VisualManager:
             print(f"\nError saving animation GIF: {e}", file=sys.stderr)
 
     def cleanup(self):
-        """Cleanup function to save GIF"""
+        """Cleanup function to save GIF and release frame rings"""
         self.save_animation_gif()
+        for name in list(self._frame_writers):
+            self._close_frame_writer(name)
 
     def signal_handler(self, signum, frame):
         """Signal handler to save GIF on termination"""
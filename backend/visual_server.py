@@ -13,6 +13,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from PIL import Image
 from pydantic import BaseModel
 from visual.visual_manager import VisualManager
+from visual.frame_transport import FrameEdgeEncoder, FrameReader
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -68,7 +69,7 @@ async def create_process(request: ProcessRequest):
             return ProcessResponse(
                 success=True,
                 message=f"Created process: {request.name}",
-                data=process.get_metadata()
+                data=visual_manager.describe_process(process)
             )
         raise HTTPException(status_code=404, detail=f"Process class not found: {request.name}")
     except Exception as e:
@@ -83,7 +84,7 @@ async def get_process(name: str):
         return ProcessResponse(
             success=True,
             message=f"Found process: {name}",
-            data=process.get_metadata()
+            data=visual_manager.describe_process(process)
         )
     raise HTTPException(status_code=404, detail=f"Process not found: {name}")
 
@@ -133,9 +134,37 @@ class ConnectionManager:
 
 manager = ConnectionManager()
 
+async def stream_frames(websocket: WebSocket, segment: str, fps: float = 30.0, process: Optional[str] = None):
+    """Relay a visualizer's shared-memory frame ring to one websocket, sending only what changed."""
+    reader: Optional[FrameReader] = None
+    encoder = FrameEdgeEncoder()
+    idle = 0
+    try:
+        while True:
+            if reader is None:
+                reader = FrameReader.attach(segment)  # the visualizer may not have started yet
+            frame = reader.read() if reader else None
+            if frame:
+                idle = 0
+                message = await asyncio.to_thread(encoder.encode, frame)
+                if message:
+                    await websocket.send_json({**message, "segment": segment, "process": process})
+            elif reader:
+                idle += 1
+                if idle >= fps:
+                    # Quiet for a second: the ring may have been replaced (restart or resize), so remap it
+                    reader.close()
+                    reader, idle = None, 0
+                    encoder = FrameEdgeEncoder()
+            await asyncio.sleep(1 / fps)
+    finally:
+        if reader:
+            reader.close()
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
+    streams: Dict[str, asyncio.Task] = {}
     try:
         while True:
             data = await websocket.receive_text()
@@ -155,6 +184,23 @@ async def websocket_endpoint(websocket: WebSocket):
                             "type": "error",
                             "message": f"Process not found or inactive: {process_name}"
                         })
+                elif request.get("type") == "stream_frames":
+                    # Clients name a process (its segment is in the process metadata) or a raw segment
+                    process_name = request.get("process")
+                    segment = request.get("segment") or visual_manager.frame_segments.get(process_name)
+                    if not segment:
+                        await websocket.send_json({
+                            "type": "error",
+                            "message": f"No frame stream for process: {process_name}"
+                        })
+                    elif segment not in streams:
+                        streams[segment] = asyncio.create_task(
+                            stream_frames(websocket, segment, request.get("fps", 30.0), process_name))
+                elif request.get("type") == "stop_stream":
+                    segment = request.get("segment") or visual_manager.frame_segments.get(request.get("process"))
+                    task = streams.pop(segment, None)
+                    if task:
+                        task.cancel()
             except json.JSONDecodeError:
                 await websocket.send_json({
                     "type": "error",
@@ -162,6 +208,9 @@ async def websocket_endpoint(websocket: WebSocket):
                 })
     except WebSocketDisconnect:
         manager.disconnect(websocket)
+    finally:
+        for task in streams.values():
+            task.cancel()
 
 # Background task to update processes
 @app.on_event("startup")
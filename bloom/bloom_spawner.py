@@ -13,6 +13,9 @@ import hashlib
 import math
 import colorsys
 
+from fractal.fractal_engine import JuliaJob, JuliaResult, Viewport, render_julia, render_julia_batch
+from fractal.render_cache import get_render_cache, quantise, render_key
+
 # ============== Configuration ==============
 
 BLOOM_DIR = "juliet_flowers/bloom_metadata"
@@ -108,8 +111,41 @@ class EnhancedJuliaFractal:
                               entropy_score: float, mood: str = "reflective", 
                               is_synthesis: bool = False) -> str:
         """Generate enhanced Julia fractal"""
-        
+        return self.generate_enhanced_julia_batch([{
+            'seed_id': seed_id, 'lineage_depth': lineage_depth, 'bloom_factor': bloom_factor,
+            'entropy_score': entropy_score, 'mood': mood, 'is_synthesis': is_synthesis
+        }])[0]
+
+    def generate_enhanced_julia_batch(self, requests: List[Dict[str, Any]]) -> List[str]:
+        """
+        Generate several Julia fractals at once (e.g. a rebloom storm); each
+        request holds generate_enhanced_julia's keyword arguments. The frames
+        are rendered concurrently on the shared fractal engine; blooms whose
+        quantised parameters were rendered before come from the render cache.
+        """
+        cache = get_render_cache()
+        plans = [self._plan_julia(**request) for request in requests]
+        paths = []
+        for plan in plans:
+            filepath = self._signature_path(plan['seed_id'])
+            paths.append(cache.fetch(plan['cache_key'], filepath))
+            if paths[-1] is not None:
+                print(f"[Fractal] ♻️ Reused cached render: {os.path.basename(filepath)}")
+        
+        misses = [index for index, path in enumerate(paths) if path is None]
+        results = render_julia_batch([plans[index]['job'] for index in misses])
+        for index, result in zip(misses, results):
+            paths[index] = self._finish_julia(plans[index], result)
+            cache.store(plans[index]['cache_key'], paths[index])
+        return paths
+
+    def _plan_julia(self, seed_id: str, lineage_depth: int, bloom_factor: float, 
+                    entropy_score: float, mood: str = "reflective", 
+                    is_synthesis: bool = False) -> Dict[str, Any]:
+        """Fractal parameters for one bloom, snapped to the render cache grid"""
         width, height = IMG_SIZE
+        bloom_factor = quantise(bloom_factor)
+        entropy_score = quantise(entropy_score)
         
         # Get mood parameters
         params = self.moods_to_params.get(mood, self.moods_to_params['reflective'])
@@ -129,76 +165,77 @@ class EnhancedJuliaFractal:
         zoom = params['zoom'] * (1.0 - bloom_factor * 0.1)
         rotation = params['rotation'] + (seed_hash % 100) / 100.0 * np.pi
         
+        return {
+            'seed_id': seed_id, 'lineage_depth': lineage_depth, 'bloom_factor': bloom_factor,
+            'entropy_score': entropy_score, 'mood': mood, 'is_synthesis': is_synthesis, 'c': c,
+            'cache_key': render_key('bloom_spawner', seed_id=seed_id, lineage_depth=lineage_depth,
+                                    bloom_factor=bloom_factor, entropy_score=entropy_score, mood=mood,
+                                    is_synthesis=is_synthesis, size=IMG_SIZE),
+            'job': self._julia_job(width, height, c, zoom, rotation,
+                                   lineage_depth, bloom_factor, is_synthesis)
+        }
+
+    def _finish_julia(self, plan: Dict[str, Any], result: JuliaResult) -> str:
+        """Colour, decorate and save one rendered bloom fractal"""
+        seed_id, mood, c = plan['seed_id'], plan['mood'], plan['c']
+        
         # Generate fractal data
-        escape_data = self._generate_julia_set(width, height, c, zoom, rotation, 
-                                               lineage_depth, bloom_factor, is_synthesis)
+        escape_data = self._escape_data(plan['job'], result)
         
         # Apply coloring
-        img_array = self._apply_mood_coloring(escape_data, mood, entropy_score)
+        img_array = self._apply_mood_coloring(escape_data, mood, plan['entropy_score'])
         
         # Create PIL image
         img = Image.fromarray(img_array.astype(np.uint8))
         
         # Post-processing for synthesis blooms
-        if is_synthesis:
+        if plan['is_synthesis']:
             img = self._apply_synthesis_effects(img)
         
         # Add overlay
-        img = self._add_overlay(img, seed_id, lineage_depth, mood, 
-                               entropy_score, bloom_factor, c)
+        img = self._add_overlay(img, seed_id, plan['lineage_depth'], mood, 
+                               plan['entropy_score'], plan['bloom_factor'], c)
         
         # Save
-        timestamp = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
-        filename = f"{seed_id}_{timestamp}.png"
-        filepath = os.path.join(FRACTAL_DIR, filename)
+        filepath = self._signature_path(seed_id)
         img.save(filepath, quality=95)
         
-        print(f"[Fractal] Generated: {filename} (C = {c_real:.4f} + {c_imag:.4f}i)")
+        print(f"[Fractal] Generated: {os.path.basename(filepath)} (C = {c.real:.4f} + {c.imag:.4f}i)")
         
         return filepath
 
+    def _signature_path(self, seed_id: str) -> str:
+        timestamp = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
+        return os.path.join(FRACTAL_DIR, f"{seed_id}_{timestamp}.png")
+
     def _generate_julia_set(self, width: int, height: int, c: complex, 
                            zoom: float, rotation: float, lineage_depth: int, 
                            bloom_factor: float, is_synthesis: bool) -> np.ndarray:
         """Generate Julia set data"""
-        # Coordinate arrays with rotation
-        cos_rot = np.cos(rotation)
-        sin_rot = np.sin(rotation)
-        
-        x = np.linspace(-zoom, zoom, width)
-        y = np.linspace(-zoom, zoom, height)
-        X, Y = np.meshgrid(x, y)
-        
-        # Apply rotation
-        X_rot = X * cos_rot - Y * sin_rot
-        Y_rot = X * sin_rot + Y * cos_rot
-        Z = X_rot + 1j * Y_rot
-        
+        job = self._julia_job(width, height, c, zoom, rotation, lineage_depth, bloom_factor, is_synthesis)
+        return self._escape_data(job, render_julia(job))
+
+    def _julia_job(self, width: int, height: int, c: complex, 
+                   zoom: float, rotation: float, lineage_depth: int, 
+                   bloom_factor: float, is_synthesis: bool) -> JuliaJob:
+        """Engine job: rotated [-zoom, zoom] square, escape radius 4, smooth escape"""
         # Enhanced iteration count
         base_iter = 256
         iterations = base_iter + int(lineage_depth * 20) + int(bloom_factor * 50)
         if is_synthesis:
             iterations += 128
         
-        # Julia set iteration with smooth coloring
-        escape_count = np.zeros(Z.shape, dtype=float)
-        smooth_escape = np.zeros(Z.shape, dtype=float)
-        
-        for i in range(iterations):
-            mask = np.abs(Z) <= 4
-            Z[mask] = Z[mask]**2 + c
-            
-            # Track escape velocity
-            escaped = (np.abs(Z) > 4) & (escape_count == 0)
-            if np.any(escaped):
-                smooth_escape[escaped] = i + 1 - np.log2(np.log2(np.abs(Z[escaped])))
-                escape_count[escaped] = i
-        
-        # Points that never escaped
-        smooth_escape[escape_count == 0] = iterations
-        
-        # Normalize
-        return smooth_escape / iterations
+        viewport = Viewport.linspace(width, height, (-zoom, zoom), (-zoom, zoom), rotation=rotation)
+        return JuliaJob(c, viewport, iterations, escape_radius=4.0, smooth=True)
+
+    @staticmethod
+    def _escape_data(job: JuliaJob, result: JuliaResult) -> np.ndarray:
+        """Normalised smooth escape values (1.0 for points that never escaped)"""
+        smooth_escape = result.smooth.copy()
+        # Points escaping on the first step have always been scored one step later
+        smooth_escape[result.steps == 1] += 1
+        smooth_escape[result.steps == 0] = job.max_iter
+        return smooth_escape / job.max_iter
 
     def _apply_mood_coloring(self, data: np.ndarray, mood: str, entropy: float) -> np.ndarray:
         """Apply mood-based coloring to fractal data"""
@@ -15,6 +15,7 @@ from enum import Enum
 
 # DAWN Core Imports
 from core.tick_emitter import current_tick, tick_subscribe
+from core.telemetry_sink import get_telemetry_sink
 from reflection.owl.owl_tracer_log import owl_log
 
 # 🧬 GENETIC CROSSOVER IMPORTS - Helix Partners
@@ -137,6 +138,9 @@ class EntropyFluctuation:
         self.collapse_prevention = CollapsePreventionSystem()
         self.crystallization_prevention = CrystallizationPreventionSystem()
         
+        # Telemetry is written off the tick path by the shared sink
+        self.telemetry = get_telemetry_sink()
+        
         # Threading and synchronization
         self.lock = threading.Lock()
         self.tick_subscription = None
@@ -587,19 +591,13 @@ class EntropyFluctuation:
             'tick': tick
         }
         
-        try:
-            with open(entropy_file, 'w') as f:
-                json.dump(entropy_data, f, indent=2)
-        except Exception as e:
-            owl_log(f"⚠️ [ENTROPY] Failed to write entropy file: {e}", "warning")
+        self.telemetry.write_snapshot(entropy_file, entropy_data)
         
         # Analytics curve
         analytics_file = "juliet_flowers/cluster_report/entropy_analytics/entropy_curve.csv"
-        try:
-            with open(analytics_file, 'a') as f:
-                f.write(f"{tick},{entropy_value:.4f},{state.name},{pattern.name},{self.current_field.magnitude:.4f}\n")
-        except Exception as e:
-            owl_log(f"⚠️ [ENTROPY] Failed to write analytics: {e}", "warning")
+        self.telemetry.append_line(
+            analytics_file,
+            f"{tick},{entropy_value:.4f},{state.name},{pattern.name},{self.current_field.magnitude:.4f}")
 
     def _record_crossover_event(self, entropy_value: float, decay_state: Dict, pattern: EntropyPattern):
         """Record genetic crossover event with decay handler"""
@@ -616,11 +614,7 @@ class EntropyFluctuation:
             'event_id': self.crossover_events
         }
         
-        try:
-            with open(crossover_file, 'a') as f:
-                f.write(json.dumps(event_data) + '\n')
-        except Exception as e:
-            owl_log(f"⚠️ [ENTROPY] Failed to record crossover: {e}", "warning")
+        self.telemetry.append_json(crossover_file, event_data)
 
     def get_current_entropy(self) -> float:
         """Get current entropy value"""
@@ -662,7 +656,8 @@ class EntropyFluctuation:
                 'entropy_history': len(self.entropy_history),
                 'field_history': len(self.field_history),
                 'pattern_history': len(self.pattern_history)
-            }
+            },
+            'telemetry': self.telemetry.get_statistics()
         }
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -13,10 +13,16 @@ import numpy as np
 from collections import deque, defaultdict
 import statistics
 import json
+import time
 import logging
 from scipy import stats
 from scipy.signal import find_peaks
 
+from core.entropy_stats import (
+    EntropySampleColumns, RunningMoments, SourceInterner,
+    correlation_matrix, stack_windows, top_k_partners
+)
+
 # DAWN Core Imports
 try:
     from core.pulse_controller import PulseController
@@ -100,9 +106,11 @@ class EntropyAnalyzer:
             pulse_controller: DAWN pulse controller for thermal integration
             sigil_engine: DAWN sigil engine for cognitive load tracking
         """
-        # Sample storage
-        self.samples: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_samples_per_bloom))
+        # Sample storage: one columnar ring (with running statistics) per bloom
+        self.samples: Dict[str, EntropySampleColumns] = {}
+        self.sources = SourceInterner()
         self.profiles: Dict[str, EntropyProfile] = {}
+        self.global_moments = RunningMoments()
         
         # Configuration
         self.max_samples = max_samples_per_bloom
@@ -128,6 +136,11 @@ class EntropyAnalyzer:
         self.chaos_alerts: List[ChaosAlert] = []
         self.last_prediction_update = datetime.now()
         
+        # Correlation matrix cache, keyed on (bloom_ids, window, top_k) and
+        # validated against each bloom's sample generation
+        self._correlation_cache: Dict[Tuple, Tuple[Tuple[int, ...], Dict]] = {}
+        self.correlation_cache_size = 8
+        
         # Thermal integration
         self.thermal_entropy_correlation = {}
         self.last_thermal_sync = datetime.now()
@@ -153,16 +166,16 @@ class EntropyAnalyzer:
         # Validate entropy
         entropy = np.clip(entropy, 0.0, 1.0)
         
-        # Create sample
-        sample = EntropySample(bloom_id=bloom_id, entropy=entropy, source=source)
-        self.samples[bloom_id].append(sample)
+        # Store sample (also folds it into the bloom's running statistics)
+        evicted = self._get_sample_store(bloom_id).append(
+            float(entropy), time.time(), self.sources.code(source))
         
         # Update profile
         profile = self._update_profile(bloom_id)
         
         # Update global statistics
         self.total_samples += 1
-        self._update_global_stats()
+        self._update_global_stats(entropy, evicted)
         
         # Check for hot/cooling status
         self._update_temperature_status(bloom_id, profile)
@@ -184,6 +197,151 @@ class EntropyAnalyzer:
         
         return profile
     
+    def add_entropy_samples_batch(self, bloom_ids: List[str], values,
+                                  sources: Any = "bloom") -> Dict[str, EntropyProfile]:
+        """
+        Add a tick's worth of entropy samples in one pass.
+        
+        Samples are appended in order, then every touched bloom's profile is
+        refreshed once, with chaos scores computed by a single vectorised
+        scoring pass rather than per sample.
+        
+        Args:
+            bloom_ids: Bloom ID for each sample
+            values: Entropy value for each sample (0.0 - 1.0)
+            sources: One source for all samples, or one per sample
+            
+        Returns:
+            Updated entropy profiles for the touched blooms
+        """
+        values = np.clip(np.asarray(values, dtype=np.float64), 0.0, 1.0)
+        if len(bloom_ids) != values.size:
+            raise ValueError(f"Got {len(bloom_ids)} bloom IDs for {values.size} values")
+        if not values.size:
+            return {}
+        
+        if isinstance(sources, str):
+            source_codes = [self.sources.code(sources)] * values.size
+        else:
+            if len(sources) != values.size:
+                raise ValueError(f"Got {len(sources)} sources for {values.size} values")
+            source_codes = [self.sources.code(source) for source in sources]
+        
+        # Store samples; one timestamp for the whole batch
+        now = time.time()
+        touched: Dict[str, float] = {}
+        for bloom_id, entropy, code in zip(bloom_ids, values.tolist(), source_codes):
+            evicted = self._get_sample_store(bloom_id).append(entropy, now, code)
+            self._update_global_stats(entropy, evicted)
+            touched[bloom_id] = entropy
+        self.total_samples += values.size
+        
+        # One vectorised scoring pass over every touched bloom
+        touched_ids = list(touched)
+        chaos_scores = self.score_blooms(touched_ids)['chaos'].tolist()
+        
+        profiles = {}
+        for bloom_id, chaos_score in zip(touched_ids, chaos_scores):
+            profile = self._update_profile(bloom_id, chaos_score=chaos_score)
+            self._update_temperature_status(bloom_id, profile)
+            profiles[bloom_id] = profile
+        
+        # Thermal / sigil integration once per batch, keyed on the hottest sample
+        hottest = max(touched, key=touched.get)
+        if self.pulse_controller and PULSE_CONTROLLER_AVAILABLE:
+            self._sync_with_thermal_system(hottest, touched[hottest])
+        if self.sigil_engine and SIGIL_ENGINE_AVAILABLE:
+            self._sync_with_sigil_system(hottest, touched[hottest])
+        
+        if (datetime.now() - self.last_prediction_update).seconds > 60:
+            self.chaos_predictions.clear()
+            self.last_prediction_update = datetime.now()
+        
+        logger.debug(f"🧬 Added {values.size} entropy samples across {len(profiles)} blooms")
+        
+        return profiles
+    
+    def score_blooms(self, bloom_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Compute chaos factors for many blooms at once.
+        
+        Builds one right-aligned (blooms x window) matrix and derives
+        volatility, acceleration, oscillation, anomaly rate and chaos score
+        for every row with array operations.
+        
+        Args:
+            bloom_ids: Blooms to score (None for all tracked blooms)
+            
+        Returns:
+            Dictionary with 'bloom_ids' and one array per factor:
+            'volatility', 'acceleration', 'oscillating', 'anomaly_rate', 'chaos'
+        """
+        if bloom_ids is None:
+            bloom_ids = list(self.samples)
+        stores = [self.samples.get(bloom_id) for bloom_id in bloom_ids]
+        counts = np.array([len(store) if store is not None else 0 for store in stores])
+        
+        n = len(bloom_ids)
+        result = {
+            'bloom_ids': list(bloom_ids),
+            'volatility': np.zeros(n),
+            'acceleration': np.zeros(n),
+            'oscillating': np.zeros(n, dtype=bool),
+            'anomaly_rate': np.zeros(n),
+            'chaos': np.zeros(n),
+        }
+        
+        # Chaos scoring needs at least 20 samples
+        rows = np.flatnonzero(counts >= 20)
+        if not rows.size:
+            return result
+        
+        eligible = [stores[i] for i in rows]
+        row_counts = counts[rows]
+        matrix = stack_windows(eligible, int(row_counts.max()))
+        means = np.array([store.mean for store in eligible])
+        stds = np.array([store.std for store in eligible])
+        
+        # Volatility: std of returns over the volatility window (0 until it is full)
+        window = min(self.volatility_window, matrix.shape[1])
+        returns = np.diff(matrix[:, -window:], axis=1)
+        volatility = np.where(row_counts >= self.volatility_window, np.nanstd(returns, axis=1), 0.0)
+        volatility_score = np.minimum(volatility / 0.2, 1.0)
+        
+        # Trend window (last 10 samples, always full for eligible rows)
+        recent_diffs = np.diff(matrix[:, -10:], axis=1)
+        sign_changes = np.count_nonzero(recent_diffs[:, 1:] * recent_diffs[:, :-1] < 0, axis=1)
+        oscillating = sign_changes > recent_diffs.shape[1] * 0.6
+        acceleration = (recent_diffs[:, -1] - recent_diffs[:, 0]) / (recent_diffs.shape[1] - 1)
+        
+        # Anomaly rate (NaN padding never compares as anomalous)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            z_scores = np.abs(matrix - means[:, None]) / stds[:, None]
+        anomaly_counts = np.count_nonzero(z_scores > 2.5, axis=1)
+        anomaly_counts[stds == 0] = 0
+        anomaly_rate = anomaly_counts / row_counts
+        
+        factors = [
+            volatility_score,
+            means,
+            np.where(oscillating, 0.8, 0.2),
+            np.minimum(np.abs(acceleration) * 5, 1.0),
+            np.minimum(anomaly_rate * 10, 1.0),
+        ]
+        if self.pulse_controller and PULSE_CONTROLLER_AVAILABLE:
+            factors.append(np.array([self._get_thermal_chaos_factor(bloom_ids[i]) for i in rows]))
+            weights = [0.25, 0.15, 0.15, 0.12, 0.12, 0.21]
+        else:
+            weights = [0.3, 0.2, 0.2, 0.15, 0.15]
+        chaos = np.minimum(np.dot(weights, np.vstack(factors)), 1.0)
+        
+        result['volatility'][rows] = volatility
+        result['acceleration'][rows] = acceleration
+        result['oscillating'][rows] = oscillating
+        result['anomaly_rate'][rows] = anomaly_rate
+        result['chaos'][rows] = chaos
+        return result
+    
     def get_entropy_variance(self, bloom_id: str) -> float:
         """
         Get the entropy variance for a bloom.
@@ -216,7 +374,7 @@ class EntropyAnalyzer:
                 continue
                 
             # Get most recent entropy
-            recent_entropy = self.samples[bloom_id][-1].entropy
+            recent_entropy = self.samples[bloom_id].latest
             
             if recent_entropy >= threshold:
                 hot_blooms.append((bloom_id, recent_entropy))
@@ -235,13 +393,13 @@ class EntropyAnalyzer:
         """
         at_risk_blooms = []
         
-        for bloom_id, profile in self.profiles.items():
-            if bloom_id not in self.samples or len(self.samples[bloom_id]) < 10:
-                continue
-            
-            # Calculate chaos score
-            chaos_score = self._calculate_chaos_score(bloom_id)
-            
+        candidates = [bloom_id for bloom_id in self.profiles
+                      if bloom_id in self.samples and len(self.samples[bloom_id]) >= 10]
+        
+        # Calculate chaos scores for all candidates in one pass
+        chaos_scores = self.score_blooms(candidates)['chaos'].tolist()
+        
+        for bloom_id, chaos_score in zip(candidates, chaos_scores):
             # Cache the prediction
             self.chaos_predictions[bloom_id] = chaos_score
             
@@ -261,8 +419,8 @@ class EntropyAnalyzer:
         
         # Keep only recent alerts
         self.chaos_alerts = [alert for alert in self.chaos_alerts 
-                           if (datetime.now() - alert.predicted_cascade_time).seconds < 3600
-                           if alert.predicted_cascade_time]
+                           if alert.predicted_cascade_time
+                           if (datetime.now() - alert.predicted_cascade_time).seconds < 3600]
         
         return at_risk_blooms
     
@@ -281,11 +439,37 @@ class EntropyAnalyzer:
         if bloom_id not in self.samples:
             return []
         
-        samples = list(self.samples[bloom_id])
+        store = self.samples[bloom_id]
+        timestamps = store.timestamps()
+        entropies = store.values()
         if window_size:
-            samples = samples[-window_size:]
+            timestamps = timestamps[-window_size:]
+            entropies = entropies[-window_size:]
         
-        return [(s.timestamp, s.entropy) for s in samples]
+        return [(datetime.fromtimestamp(ts), entropy)
+                for ts, entropy in zip(timestamps.tolist(), entropies.tolist())]
+    
+    def get_samples(self, bloom_id: str) -> List[EntropySample]:
+        """
+        Materialise a bloom's retained samples as EntropySample objects.
+        
+        Args:
+            bloom_id: ID of the bloom
+            
+        Returns:
+            List of samples, oldest first
+        """
+        if bloom_id not in self.samples:
+            return []
+        
+        store = self.samples[bloom_id]
+        return [
+            EntropySample(bloom_id=bloom_id, entropy=entropy,
+                          timestamp=datetime.fromtimestamp(ts), source=source)
+            for entropy, ts, source in zip(store.values().tolist(),
+                                           store.timestamps().tolist(),
+                                           self.sources.names(store.source_codes()))
+        ]
     
     def get_entropy_phase_portrait(self, bloom_id: str) -> Dict:
         """
@@ -300,23 +484,19 @@ class EntropyAnalyzer:
         if bloom_id not in self.samples or len(self.samples[bloom_id]) < 3:
             return {'error': 'Insufficient data'}
         
-        samples = list(self.samples[bloom_id])
-        entropies = [s.entropy for s in samples]
+        store = self.samples[bloom_id]
+        entropies = store.values()
         
-        # Calculate rate of change
-        rates = []
-        for i in range(1, len(entropies)):
-            time_delta = (samples[i].timestamp - samples[i-1].timestamp).total_seconds()
-            if time_delta > 0:
-                rate = (entropies[i] - entropies[i-1]) / time_delta
-                rates.append(rate)
-            else:
-                rates.append(0.0)
+        # Calculate rate of change (zero where timestamps coincide)
+        time_deltas = np.diff(store.timestamps())
+        entropy_deltas = np.diff(entropies)
+        rates = np.zeros_like(entropy_deltas)
+        np.divide(entropy_deltas, time_deltas, out=rates, where=time_deltas > 0)
         
         # Create phase portrait data
         portrait = {
-            'entropy': entropies[1:],  # Skip first since no rate
-            'rate_of_change': rates,
+            'entropy': entropies[1:].tolist(),  # Skip first since no rate
+            'rate_of_change': rates.tolist(),
             'trajectory_length': len(rates),
             'phase_space_area': self._calculate_phase_space_area(entropies[1:], rates),
             'thermal_coupling': self._get_thermal_coupling(bloom_id)
@@ -339,35 +519,42 @@ class EntropyAnalyzer:
         if bloom_id not in self.samples or len(self.samples[bloom_id]) < 20:
             return []
         
-        samples = list(self.samples[bloom_id])
-        entropies = [s.entropy for s in samples]
+        store = self.samples[bloom_id]
         
-        # Calculate z-scores
-        mean = np.mean(entropies)
-        std = np.std(entropies)
+        # Calculate z-scores against the running moments
+        mean = store.mean
+        std = store.std
         
         if std == 0:
             return []
         
+        entropies = store.values()
+        z_scores = np.abs(entropies - mean) / std
+        indices = np.flatnonzero(z_scores > z_score_threshold)
+        if not indices.size:
+            return []
+        
+        timestamps = store.timestamps()[indices].tolist()
+        sources = self.sources.names(store.source_codes()[indices])
+        
         anomalies = []
-        for i, (sample, entropy) in enumerate(zip(samples, entropies)):
-            z_score = abs((entropy - mean) / std)
+        for ts, entropy, z_score, source in zip(timestamps, entropies[indices].tolist(),
+                                                z_scores[indices].tolist(), sources):
+            timestamp = datetime.fromtimestamp(ts)
+            anomaly = {
+                'timestamp': timestamp,
+                'entropy': entropy,
+                'z_score': z_score,
+                'severity': 'critical' if z_score > 4.0 else 'high' if z_score > 3.5 else 'medium',
+                'type': 'spike' if entropy > mean else 'drop',
+                'source': source
+            }
             
-            if z_score > z_score_threshold:
-                anomaly = {
-                    'timestamp': sample.timestamp,
-                    'entropy': entropy,
-                    'z_score': z_score,
-                    'severity': 'critical' if z_score > 4.0 else 'high' if z_score > 3.5 else 'medium',
-                    'type': 'spike' if entropy > mean else 'drop',
-                    'source': sample.source
-                }
-                
-                # Add thermal context if available
-                if self.pulse_controller and PULSE_CONTROLLER_AVAILABLE:
-                    anomaly['thermal_context'] = self._get_thermal_context_at_time(sample.timestamp)
-                
-                anomalies.append(anomaly)
+            # Add thermal context if available
+            if self.pulse_controller and PULSE_CONTROLLER_AVAILABLE:
+                anomaly['thermal_context'] = self._get_thermal_context_at_time(timestamp)
+            
+            anomalies.append(anomaly)
         
         return anomalies
     
@@ -375,6 +562,10 @@ class EntropyAnalyzer:
         """
         Calculate entropy correlations between multiple blooms.
         
+        Blooms with a full 50-sample window are correlated in one matrix
+        pass; pairs involving shorter histories fall back to a per-pair
+        correlation over their common recent window.
+        
         Args:
             bloom_ids: List of bloom IDs to correlate
             
@@ -382,6 +573,16 @@ class EntropyAnalyzer:
             Dictionary mapping bloom ID pairs to correlation coefficients
         """
         correlations = {}
+        window = 50
+        
+        # Full-window blooms: one matrix product
+        full_ids = [bid for bid in bloom_ids
+                    if bid in self.samples and len(self.samples[bid]) >= window]
+        full = set(full_ids)
+        if len(full_ids) >= 2:
+            result = self.get_entropy_correlation_matrix(full_ids, window=window)
+            matrix = result['matrix']
+            position = {bid: i for i, bid in enumerate(result['bloom_ids'])}
         
         for i in range(len(bloom_ids)):
             for j in range(i + 1, len(bloom_ids)):
@@ -390,17 +591,23 @@ class EntropyAnalyzer:
                 if bloom1 not in self.samples or bloom2 not in self.samples:
                     continue
                 
+                if bloom1 in full and bloom2 in full:
+                    corr = matrix[position[bloom1], position[bloom2]]
+                    if not np.isnan(corr):
+                        correlations[(bloom1, bloom2)] = float(corr)
+                    continue
+                
                 # Get overlapping time periods
-                samples1 = list(self.samples[bloom1])
-                samples2 = list(self.samples[bloom2])
+                samples1 = self.samples[bloom1].values()
+                samples2 = self.samples[bloom2].values()
                 
                 if len(samples1) < 10 or len(samples2) < 10:
                     continue
                 
                 # Simple correlation using recent samples
-                recent_size = min(50, len(samples1), len(samples2))
-                entropy1 = [s.entropy for s in samples1[-recent_size:]]
-                entropy2 = [s.entropy for s in samples2[-recent_size:]]
+                recent_size = min(window, len(samples1), len(samples2))
+                entropy1 = samples1[-recent_size:]
+                entropy2 = samples2[-recent_size:]
                 
                 if len(entropy1) == len(entropy2):
                     corr = np.corrcoef(entropy1, entropy2)[0, 1]
@@ -409,6 +616,62 @@ class EntropyAnalyzer:
         
         return correlations
     
+    def get_entropy_correlation_matrix(self, bloom_ids: Optional[List[str]] = None,
+                                       window: int = 50,
+                                       top_k: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Calculate the full entropy correlation matrix in one matrix product.
+        
+        All included blooms are aligned on their most recent common window
+        (at most `window` samples). Results are cached and reused until any
+        included bloom receives a new sample.
+        
+        Args:
+            bloom_ids: Blooms to correlate (None for all blooms with >= 10 samples)
+            window: Maximum number of recent samples to correlate over
+            top_k: If set, also return each bloom's k most strongly correlated partners
+            
+        Returns:
+            Dictionary with 'bloom_ids', 'window', 'matrix' (read-only array,
+            NaN where undefined) and, if requested, 'top_partners' mapping
+            bloom ID to a list of (partner_id, correlation) tuples
+        """
+        if bloom_ids is None:
+            bloom_ids = list(self.samples)
+        bloom_ids = [bid for bid in bloom_ids
+                     if bid in self.samples and len(self.samples[bid]) >= 10]
+        
+        key = (tuple(bloom_ids), window, top_k)
+        generations = tuple(self.samples[bid].generation for bid in bloom_ids)
+        cached = self._correlation_cache.get(key)
+        if cached is not None and cached[0] == generations:
+            return cached[1]
+        
+        length = min([window] + [len(self.samples[bid]) for bid in bloom_ids])
+        matrix = correlation_matrix(stack_windows([self.samples[bid] for bid in bloom_ids], length))
+        matrix.flags.writeable = False
+        
+        result = {
+            'bloom_ids': bloom_ids,
+            'window': length,
+            'matrix': matrix,
+        }
+        
+        if top_k:
+            indices, values = top_k_partners(matrix, top_k)
+            result['top_partners'] = {
+                bloom_id: [(bloom_ids[j], corr)
+                           for j, corr in zip(row_indices.tolist(), row_values.tolist()) if j >= 0]
+                for bloom_id, row_indices, row_values in zip(bloom_ids, indices, values)
+            }
+        
+        # Bounded cache: drop the oldest entry when full
+        if key not in self._correlation_cache and len(self._correlation_cache) >= self.correlation_cache_size:
+            self._correlation_cache.pop(next(iter(self._correlation_cache)))
+        self._correlation_cache[key] = (generations, result)
+        
+        return result
+    
     def predict_entropy_future(self, bloom_id: str, steps: int = 5) -> List[float]:
         """
         Predict future entropy values using simple time series forecasting.
@@ -423,8 +686,7 @@ class EntropyAnalyzer:
         if bloom_id not in self.samples or len(self.samples[bloom_id]) < 20:
             return []
         
-        samples = list(self.samples[bloom_id])
-        entropies = [s.entropy for s in samples]
+        entropies = self.samples[bloom_id].values()
         
         # Simple linear regression for trend
         x = np.arange(len(entropies))
@@ -465,7 +727,7 @@ class EntropyAnalyzer:
             return {'error': 'No data available'}
         
         profile = self.profiles[bloom_id]
-        samples = list(self.samples[bloom_id]) if bloom_id in self.samples else []
+        entropies = self.samples[bloom_id].values() if bloom_id in self.samples else np.empty(0)
         
         report = {
             'bloom_id': bloom_id,
@@ -487,10 +749,8 @@ class EntropyAnalyzer:
         }
         
         # Add recent behavior
-        if samples:
-            recent_window = min(20, len(samples))
-            recent_samples = samples[-recent_window:]
-            recent_entropies = [s.entropy for s in recent_samples]
+        if entropies.size:
+            recent_entropies = entropies[-20:]
             
             report['recent_behavior'] = {
                 'mean': np.mean(recent_entropies),
@@ -529,10 +789,13 @@ class EntropyAnalyzer:
         Args:
             thermal_data: Dictionary with thermal metrics
         """
+        bloom_ids, values = [], []
+        
         if 'heat' in thermal_data:
             # Convert thermal heat to entropy contribution
             heat_entropy = min(thermal_data['heat'] / 100.0, 1.0)
-            self.add_entropy_sample("thermal_system", heat_entropy, source="thermal")
+            bloom_ids.append("thermal_system")
+            values.append(heat_entropy)
         
         if 'zone' in thermal_data:
             # Map thermal zones to entropy levels
@@ -542,7 +805,11 @@ class EntropyAnalyzer:
                 'SURGE': 0.8
             }
             zone_entropy = zone_entropy_map.get(thermal_data['zone'], 0.5)
-            self.add_entropy_sample("thermal_zone", zone_entropy, source="thermal")
+            bloom_ids.append("thermal_zone")
+            values.append(zone_entropy)
+        
+        if bloom_ids:
+            self.add_entropy_samples_batch(bloom_ids, values, sources="thermal")
     
     def inject_sigil_awareness(self, sigil_data: Dict[str, Any]) -> None:
         """
@@ -551,6 +818,8 @@ class EntropyAnalyzer:
         Args:
             sigil_data: Dictionary with sigil metrics
         """
+        bloom_ids, values = [], []
+        
         try:
             if 'active_sigils' in sigil_data:
                 # Entropy from number of active sigils
@@ -565,14 +834,19 @@ class EntropyAnalyzer:
                     sigil_count = 0
                     
                 sigil_count_entropy = min(sigil_count / 10.0, 1.0)
-                self.add_entropy_sample("sigil_load", sigil_count_entropy, source="sigil")
+                bloom_ids.append("sigil_load")
+                values.append(sigil_count_entropy)
         except Exception as e:
-            self.logger.warning(f"🚨 Sigil sync error: {e}")
+            logger.warning(f"🚨 Sigil sync error: {e}")
         
         if 'execution_heat' in sigil_data:
             # Entropy from sigil execution intensity
             execution_entropy = min(sigil_data['execution_heat'] / 100.0, 1.0)
-            self.add_entropy_sample("sigil_execution", execution_entropy, source="sigil")
+            bloom_ids.append("sigil_execution")
+            values.append(execution_entropy)
+        
+        if bloom_ids:
+            self.add_entropy_samples_batch(bloom_ids, values, sources="sigil")
             
         # Store in sigil entropy history
         if sigil_data:
@@ -585,32 +859,41 @@ class EntropyAnalyzer:
     # PRIVATE METHODS
     # ═══════════════════════════════════════════════════════════════════════════════
     
-    def _update_profile(self, bloom_id: str) -> EntropyProfile:
-        """Update entropy profile for a bloom"""
-        samples = list(self.samples[bloom_id])
+    def _get_sample_store(self, bloom_id: str) -> EntropySampleColumns:
+        """Get (or create) the columnar sample store for a bloom"""
+        store = self.samples.get(bloom_id)
+        if store is None:
+            store = EntropySampleColumns(capacity=self.max_samples,
+                                         trend_window=10,
+                                         volatility_window=self.volatility_window)
+            self.samples[bloom_id] = store
+        return store
+    
+    def _update_profile(self, bloom_id: str,
+                        chaos_score: Optional[float] = None) -> EntropyProfile:
+        """
+        Update entropy profile for a bloom from its running statistics.
+        A precomputed chaos_score (from score_blooms) skips per-bloom scoring.
+        """
+        store = self.samples.get(bloom_id)
         
-        if not samples:
+        if store is None or not store.count:
             return EntropyProfile(bloom_id=bloom_id)
         
-        entropies = [s.entropy for s in samples]
-        
-        # Calculate statistics
         profile = EntropyProfile(
             bloom_id=bloom_id,
-            mean=np.mean(entropies),
-            variance=np.var(entropies),
-            std_dev=np.std(entropies),
-            min_entropy=min(entropies),
-            max_entropy=max(entropies),
-            last_sample_time=samples[-1].timestamp,
-            sample_count=len(samples)
+            mean=store.mean,
+            variance=store.variance,
+            std_dev=store.std,
+            min_entropy=store.min,
+            max_entropy=store.max,
+            last_sample_time=datetime.fromtimestamp(store.last_timestamp),
+            sample_count=store.count
         )
         
         # Determine trend
-        if len(samples) >= 10:
-            recent = entropies[-10:]
-            x = np.arange(len(recent))
-            slope, _, _, _, _ = stats.linregress(x, recent)
+        if store.count >= 10:
+            slope = store.trend_slope()
             
             if abs(slope) < 0.01:
                 profile.trend = 'stable'
@@ -620,16 +903,16 @@ class EntropyAnalyzer:
                 profile.trend = 'decreasing'
             
             # Check for oscillation
-            if self._detect_oscillation(recent):
+            if store.is_oscillating():
                 profile.trend = 'oscillating'
         
-        # Calculate volatility score
-        if len(samples) >= self.volatility_window:
-            window_samples = entropies[-self.volatility_window:]
-            profile.volatility_score = self._calculate_volatility_score(window_samples)
+        # Calculate volatility score (assuming max reasonable volatility is 0.2)
+        profile.volatility_score = min(store.return_volatility() / 0.2, 1.0)
         
         # Calculate chaos score
-        profile.chaos_score = self._calculate_chaos_score(bloom_id)
+        if chaos_score is None:
+            chaos_score = self._calculate_chaos_score(bloom_id, profile)
+        profile.chaos_score = chaos_score
         
         # Calculate thermal correlation if available
         if self.pulse_controller and PULSE_CONTROLLER_AVAILABLE:
@@ -638,15 +921,14 @@ class EntropyAnalyzer:
         self.profiles[bloom_id] = profile
         return profile
     
-    def _calculate_chaos_score(self, bloom_id: str) -> float:
+    def _calculate_chaos_score(self, bloom_id: str,
+                               profile: Optional[EntropyProfile] = None) -> float:
         """Calculate chaos prediction score for a bloom"""
-        if bloom_id not in self.profiles:
-            return 0.0
-        
-        profile = self.profiles[bloom_id]
-        samples = list(self.samples[bloom_id])
+        if profile is None:
+            profile = self.profiles.get(bloom_id)
+        store = self.samples.get(bloom_id)
         
-        if len(samples) < 20:
+        if profile is None or store is None or store.count < 20:
             return 0.0
         
         # Factors contributing to chaos
@@ -665,14 +947,11 @@ class EntropyAnalyzer:
             factors.append(0.2)
         
         # 4. Recent acceleration
-        recent_entropies = [s.entropy for s in samples[-10:]]
-        if len(recent_entropies) >= 3:
-            accel = self._calculate_acceleration(recent_entropies)
-            factors.append(min(abs(accel) * 5, 1.0))
+        accel = store.acceleration()
+        factors.append(min(abs(accel) * 5, 1.0))
         
         # 5. Anomaly frequency
-        anomalies = self.detect_entropy_anomalies(bloom_id)
-        anomaly_rate = len(anomalies) / len(samples)
+        anomaly_rate = store.anomaly_count(2.5) / store.count
         factors.append(min(anomaly_rate * 10, 1.0))
         
         # 6. Thermal coupling (if available)
@@ -688,59 +967,15 @@ class EntropyAnalyzer:
         
         return min(chaos_score, 1.0)
     
-    def _calculate_volatility_score(self, entropy_values: List[float]) -> float:
-        """Calculate volatility score from entropy values"""
-        if len(entropy_values) < 2:
-            return 0.0
-        
-        # Calculate returns (changes)
-        returns = [entropy_values[i] - entropy_values[i-1] 
-                  for i in range(1, len(entropy_values))]
-        
-        # Volatility is standard deviation of returns
-        volatility = np.std(returns)
-        
-        # Normalize to 0-1 scale (assuming max reasonable volatility is 0.2)
-        normalized = min(volatility / 0.2, 1.0)
-        
-        return normalized
-    
-    def _detect_oscillation(self, values: List[float]) -> bool:
-        """Detect oscillating pattern in values"""
-        if len(values) < 5:
-            return False
-        
-        # Count sign changes in differences
-        diffs = [values[i] - values[i-1] for i in range(1, len(values))]
-        sign_changes = sum(1 for i in range(1, len(diffs)) 
-                          if diffs[i] * diffs[i-1] < 0)
-        
-        # High frequency of sign changes indicates oscillation
-        return sign_changes > len(diffs) * 0.6
-    
-    def _calculate_acceleration(self, values: List[float]) -> float:
-        """Calculate acceleration (second derivative) of values"""
-        if len(values) < 3:
-            return 0.0
-        
-        # First derivative (velocity)
-        velocities = [values[i] - values[i-1] for i in range(1, len(values))]
-        
-        # Second derivative (acceleration)
-        accelerations = [velocities[i] - velocities[i-1] 
-                        for i in range(1, len(velocities))]
-        
-        return np.mean(accelerations) if accelerations else 0.0
-    
-    def _calculate_phase_space_area(self, entropies: List[float], 
-                                   rates: List[float]) -> float:
+    def _calculate_phase_space_area(self, entropies: np.ndarray, 
+                                   rates: np.ndarray) -> float:
         """Calculate area covered in phase space"""
         if len(entropies) < 3:
             return 0.0
         
         # Simple rectangular area estimation
-        e_range = max(entropies) - min(entropies)
-        r_range = max(rates) - min(rates) if rates else 0
+        e_range = float(np.ptp(entropies))
+        r_range = float(np.ptp(rates)) if len(rates) else 0
         
         return e_range * r_range
     
@@ -749,7 +984,7 @@ class EntropyAnalyzer:
         if profile.sample_count < 5:
             return
         
-        recent_entropy = self.samples[bloom_id][-1].entropy
+        recent_entropy = self.samples[bloom_id].latest
         
         # Critical bloom criteria
         if profile.chaos_score > 0.9:
@@ -776,15 +1011,15 @@ class EntropyAnalyzer:
         elif bloom_id in self.cooling_blooms and profile.volatility_score < 0.2:
             self.cooling_blooms.remove(bloom_id)
     
-    def _update_global_stats(self):
-        """Update global entropy statistics"""
-        all_entropies = []
-        for samples in self.samples.values():
-            all_entropies.extend([s.entropy for s in samples])
-        
-        if all_entropies:
-            self.global_entropy_mean = np.mean(all_entropies)
-            self.global_entropy_std = np.std(all_entropies)
+    def _update_global_stats(self, entropy: float, evicted: Optional[float] = None):
+        """Update global entropy statistics with one ingested (and one evicted) sample"""
+        self.global_moments.push(entropy)
+        if evicted is not None:
+            self.global_moments.pop(evicted)
+        
+        if self.global_moments.count:
+            self.global_entropy_mean = self.global_moments.mean
+            self.global_entropy_std = self.global_moments.std
     
     def _assess_stability(self, profile: EntropyProfile) -> str:
         """Assess stability level of a bloom"""
@@ -1028,8 +1263,8 @@ class EntropyAnalyzer:
         """Save analyzer state to file"""
         data = {
             'samples': {
-                bloom_id: [s.to_dict() for s in samples]
-                for bloom_id, samples in self.samples.items()
+                bloom_id: [s.to_dict() for s in self.get_samples(bloom_id)]
+                for bloom_id in self.samples
             },
             'profiles': {
                 bloom_id: {
@@ -0,0 +1,499 @@
+#!/usr/bin/env python3
+"""
+entropy_stats.py - Incremental Entropy Statistics for DAWN
+Streaming moments, sliding-window regression and volatility used by the
+EntropyAnalyzer so that ingesting a sample costs O(1) regardless of how many
+blooms or samples are already being tracked, plus the columnar ring storage
+the analyzer keeps its samples in.
+
+🧬 DAWN Core Component - Backing engine for core.entropy_analyzer
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+import math
+
+import numpy as np
+
+
+class RunningMoments:
+    """
+    Welford running mean/variance with support for removing samples.
+
+    Removal makes it usable over sliding windows: push the incoming value and
+    pop the evicted one. Variance is the population variance (``np.var``).
+    """
+
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def push(self, value: float) -> None:
+        """Add a value to the running moments"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def pop(self, value: float) -> None:
+        """Remove a previously pushed value from the running moments"""
+        if self.count <= 1:
+            self.reset()
+            return
+        delta = value - self.mean
+        self.mean = (self.count * self.mean - value) / (self.count - 1)
+        self.count -= 1
+        self.m2 -= delta * (value - self.mean)
+        if self.m2 < 0.0:
+            self.m2 = 0.0
+
+    def merge(self, other: 'RunningMoments') -> None:
+        """Fold another set of moments into this one (Chan et al.)"""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+
+    def reset(self) -> None:
+        """Clear all accumulated moments"""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class RingColumns:
+    """
+    Columnar ring buffer with a contiguous chronological view.
+
+    Each column is a NumPy array. Until the ring is full the columns grow
+    geometrically and are filled linearly; once full they are mirrored
+    (every write lands at ``i`` and ``i + capacity``) so the retained window
+    is always a single contiguous slice and can be handed out as a zero-copy
+    view without reordering.
+    """
+
+    INITIAL_SIZE = 16
+
+    def __init__(self, capacity: int, dtypes: Dict[str, Any]):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self._dtypes = dict(dtypes)
+        size = min(self.INITIAL_SIZE, capacity)
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.zeros(size, dtype=dtype) for name, dtype in self._dtypes.items()
+        }
+        self._head = 0          # next write position once mirrored
+        self._count = 0
+        self._mirrored = False
+
+    def _append_row(self, row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Write one row, returning the evicted row once at capacity"""
+        columns = self._columns
+
+        if not self._mirrored:
+            size = next(iter(columns.values())).size
+            if self._count == size and size < self.capacity:
+                self._grow(min(size * 2, self.capacity))
+            if self._count < self.capacity:
+                for name, value in row.items():
+                    columns[name][self._count] = value
+                self._count += 1
+                return None
+            self._mirror()
+
+        head = self._head
+        evicted = {name: columns[name][head].item() for name in row}
+        mirror = head + self.capacity
+        for name, value in row.items():
+            column = columns[name]
+            column[head] = value
+            column[mirror] = value
+        self._head = (head + 1) % self.capacity
+        return evicted
+
+    def _grow(self, size: int) -> None:
+        for name, column in self._columns.items():
+            grown = np.zeros(size, dtype=column.dtype)
+            grown[:self._count] = column[:self._count]
+            self._columns[name] = grown
+
+    def _mirror(self) -> None:
+        for name, column in self._columns.items():
+            self._columns[name] = np.concatenate((column[:self.capacity], column[:self.capacity]))
+        self._head = 0
+        self._mirrored = True
+
+    def column(self, name: str) -> np.ndarray:
+        """Retained values of a column in chronological order (read-only view)"""
+        column = self._columns[name]
+        if self._mirrored:
+            view = column[self._head:self._head + self.capacity]
+        else:
+            view = column[:self._count]
+        view = view.view()
+        view.flags.writeable = False
+        return view
+
+    def last(self, name: str) -> Any:
+        """Most recent value of a column"""
+        if self._mirrored:
+            return self._columns[name][self._head + self.capacity - 1].item()
+        return self._columns[name][self._count - 1].item()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self._columns.values())
+
+
+class SlidingWindowStats(RingColumns):
+    """
+    Fixed-capacity window of entropy values with O(1) windowed statistics.
+
+    Tracks, for the retained window:
+      * mean / variance / min / max of all retained values
+      * least-squares slope over the last ``trend_window`` values
+      * sign-change count of first differences over the same trend window
+      * std-dev of returns over the last ``volatility_window`` values
+
+    Running sums are reseeded from the buffer once per ``capacity`` evictions
+    so floating-point drift stays bounded at amortised O(1) cost.
+    """
+
+    COLUMNS: Dict[str, Any] = {'entropy': np.float64}
+
+    def __init__(self, capacity: int = 1000, trend_window: int = 10,
+                 volatility_window: int = 50):
+        super().__init__(capacity, self.COLUMNS)
+
+        self.trend_window = max(2, min(trend_window, capacity))
+        self.volatility_window = max(2, min(volatility_window, capacity))
+        self._seq = 0           # total values ever pushed
+        self._latest = 0.0
+
+        # Whole-window moments and monotonic deques of (seq, value) for min/max
+        self.moments = RunningMoments()
+        self._min_queue: Deque[Tuple[int, float]] = deque()
+        self._max_queue: Deque[Tuple[int, float]] = deque()
+
+        # Trend window: values plus regression sums with local x = 0..m-1
+        self._trend: Deque[float] = deque(maxlen=self.trend_window)
+        self._trend_sum_y = 0.0
+        self._trend_sum_xy = 0.0
+
+        # Sign-change flags between consecutive differences in the trend window
+        self._sign_flags: Deque[bool] = deque(maxlen=max(1, self.trend_window - 2))
+        self._sign_changes = 0
+
+        # Returns over the volatility window
+        self._returns: Deque[float] = deque(maxlen=self.volatility_window - 1)
+        self._return_moments = RunningMoments()
+
+        self._evictions_since_reseed = 0
+
+    # ─── ingest ────────────────────────────────────────────────────────────
+
+    def push(self, value: float, **columns: Any) -> Optional[float]:
+        """
+        Append a value (plus any extra column values), evicting the oldest
+        row once at capacity.
+
+        Returns:
+            The evicted entropy value, or None if the window was not yet full
+        """
+        value = float(value)
+        previous = self._latest if self._count else None
+        self._latest = value
+
+        columns['entropy'] = value
+        evicted_row = self._append_row(columns)
+        evicted = evicted_row['entropy'] if evicted_row is not None else None
+
+        seq = self._seq
+        self._seq += 1
+
+        # Whole-window moments
+        self.moments.push(value)
+        if evicted is not None:
+            self.moments.pop(evicted)
+
+        # Sliding min/max
+        oldest_seq = self._seq - self._count
+        while self._min_queue and self._min_queue[-1][1] >= value:
+            self._min_queue.pop()
+        self._min_queue.append((seq, value))
+        while self._min_queue[0][0] < oldest_seq:
+            self._min_queue.popleft()
+        while self._max_queue and self._max_queue[-1][1] <= value:
+            self._max_queue.pop()
+        self._max_queue.append((seq, value))
+        while self._max_queue[0][0] < oldest_seq:
+            self._max_queue.popleft()
+
+        self._push_trend(value)
+        if previous is not None:
+            self._push_return(value - previous)
+
+        if evicted is not None:
+            self._evictions_since_reseed += 1
+            if self._evictions_since_reseed >= self.capacity:
+                self._reseed()
+
+        return evicted
+
+    def _push_trend(self, value: float) -> None:
+        trend = self._trend
+        m = len(trend)
+
+        # Sign-change bookkeeping on the differences entering the window
+        if m >= 2:
+            d_prev = trend[-1] - trend[-2]
+            d_new = value - trend[-1]
+            flag = d_new * d_prev < 0
+            if len(self._sign_flags) == self._sign_flags.maxlen:
+                self._sign_changes -= self._sign_flags[0]
+            self._sign_flags.append(flag)
+            self._sign_changes += flag
+
+        if m < self.trend_window:
+            self._trend_sum_xy += m * value
+            self._trend_sum_y += value
+        else:
+            oldest = trend[0]
+            # Shifting x down by one removes one copy of every remaining y
+            self._trend_sum_xy += -(self._trend_sum_y - oldest) + (m - 1) * value
+            self._trend_sum_y += value - oldest
+        trend.append(value)
+
+    def _push_return(self, ret: float) -> None:
+        if len(self._returns) == self._returns.maxlen:
+            self._return_moments.pop(self._returns[0])
+        self._returns.append(ret)
+        self._return_moments.push(ret)
+
+    def _reseed(self) -> None:
+        """Recompute running sums exactly from the retained values"""
+        self._evictions_since_reseed = 0
+
+        values = self.values()
+        self.moments.count = int(values.size)
+        self.moments.mean = float(values.mean()) if values.size else 0.0
+        self.moments.m2 = float(((values - self.moments.mean) ** 2).sum()) if values.size else 0.0
+
+        trend = np.fromiter(self._trend, dtype=np.float64, count=len(self._trend))
+        self._trend_sum_y = float(trend.sum())
+        self._trend_sum_xy = float(np.dot(np.arange(trend.size), trend))
+
+        self._return_moments.reset()
+        for ret in self._returns:
+            self._return_moments.push(ret)
+
+    # ─── accessors ─────────────────────────────────────────────────────────
+
+    @property
+    def generation(self) -> int:
+        """Total values ever pushed; changes whenever the window changes"""
+        return self._seq
+
+    @property
+    def latest(self) -> float:
+        return self._latest
+
+    @property
+    def mean(self) -> float:
+        return self.moments.mean
+
+    @property
+    def variance(self) -> float:
+        return self.moments.variance
+
+    @property
+    def std(self) -> float:
+        return self.moments.std
+
+    @property
+    def min(self) -> float:
+        return self._min_queue[0][1] if self._min_queue else 1.0
+
+    @property
+    def max(self) -> float:
+        return self._max_queue[0][1] if self._max_queue else 0.0
+
+    def values(self) -> np.ndarray:
+        """Retained entropy values in chronological order (read-only view)"""
+        return self.column('entropy')
+
+    def trend_slope(self) -> float:
+        """Least-squares slope over the trend window"""
+        m = len(self._trend)
+        if m < 2:
+            return 0.0
+        sum_x = m * (m - 1) / 2.0
+        sum_xx = (m - 1) * m * (2 * m - 1) / 6.0
+        denom = m * sum_xx - sum_x * sum_x
+        return (m * self._trend_sum_xy - sum_x * self._trend_sum_y) / denom
+
+    def is_oscillating(self) -> bool:
+        """High frequency of direction changes across the trend window"""
+        m = len(self._trend)
+        if m < 5:
+            return False
+        return self._sign_changes > (m - 1) * 0.6
+
+    def acceleration(self) -> float:
+        """Mean second difference over the trend window"""
+        trend = self._trend
+        m = len(trend)
+        if m < 3:
+            return 0.0
+        # Second differences telescope to (last velocity - first velocity)
+        first_velocity = trend[1] - trend[0]
+        last_velocity = trend[-1] - trend[-2]
+        return (last_velocity - first_velocity) / (m - 2)
+
+    def return_volatility(self) -> float:
+        """Std-dev of returns over the volatility window (0 until it is full)"""
+        if self._count < self.volatility_window:
+            return 0.0
+        return self._return_moments.std
+
+    def anomaly_count(self, z_score_threshold: float = 2.5) -> int:
+        """Number of retained values further than z std-devs from the mean"""
+        std = self.std
+        if self._count == 0 or std == 0:
+            return 0
+        values = self.values()
+        return int(np.count_nonzero(np.abs(values - self.mean) > z_score_threshold * std))
+
+
+class EntropySampleColumns(SlidingWindowStats):
+    """
+    Per-bloom columnar sample store: entropy, epoch-float timestamp and an
+    interned source code per sample, plus the running window statistics.
+    """
+
+    COLUMNS: Dict[str, Any] = {
+        'entropy': np.float64,
+        'timestamp': np.float64,
+        'source': np.int32,
+    }
+
+    def append(self, entropy: float, timestamp: float, source_code: int) -> Optional[float]:
+        """Append one sample; returns the evicted entropy value if any"""
+        return self.push(entropy, timestamp=timestamp, source=source_code)
+
+    def timestamps(self) -> np.ndarray:
+        """Epoch-second timestamps in chronological order (read-only view)"""
+        return self.column('timestamp')
+
+    def source_codes(self) -> np.ndarray:
+        """Interned source codes in chronological order (read-only view)"""
+        return self.column('source')
+
+    @property
+    def last_timestamp(self) -> float:
+        return self.last('timestamp')
+
+
+def stack_windows(windows: List[RingColumns], length: int,
+                  column: str = 'entropy') -> np.ndarray:
+    """
+    Stack the most recent ``length`` values of each window into one
+    right-aligned (len(windows) x length) matrix, NaN-padded on the left.
+    """
+    matrix = np.full((len(windows), length), np.nan)
+    for row, window in enumerate(windows):
+        values = window.column(column)[-length:]
+        if values.size:
+            matrix[row, length - values.size:] = values
+    return matrix
+
+
+def correlation_matrix(matrix: np.ndarray) -> np.ndarray:
+    """
+    Pearson correlation between all rows of a (rows x window) matrix in a
+    single matrix product. Rows with zero variance correlate as NaN.
+    """
+    centered = matrix - matrix.mean(axis=1, keepdims=True)
+    norms = np.sqrt(np.einsum('ij,ij->i', centered, centered))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        corr = (centered @ centered.T) / np.outer(norms, norms)
+    np.clip(corr, -1.0, 1.0, out=corr)
+    corr[np.diag_indices_from(corr)] = np.where(norms > 0, 1.0, np.nan)
+    return corr
+
+
+def top_k_partners(corr: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Indices and correlations of each row's k strongest partners by absolute
+    correlation (self and NaN excluded), strongest first. Missing partners
+    are reported as index -1 with NaN correlation.
+    """
+    n = corr.shape[0]
+    k = max(0, min(k, n - 1))
+    indices = np.full((n, k), -1, dtype=np.int64)
+    values = np.full((n, k), np.nan)
+    if not k:
+        return indices, values
+
+    strength = np.abs(corr)
+    np.fill_diagonal(strength, -1.0)
+    strength = np.nan_to_num(strength, nan=-1.0)
+
+    candidates = np.argpartition(-strength, k - 1, axis=1)[:, :k]
+    candidate_strength = np.take_along_axis(strength, candidates, axis=1)
+    order = np.argsort(-candidate_strength, axis=1)
+    candidates = np.take_along_axis(candidates, order, axis=1)
+    found = np.take_along_axis(candidate_strength, order, axis=1) >= 0
+
+    indices[found] = candidates[found]
+    values[found] = np.take_along_axis(corr, candidates, axis=1)[found]
+    return indices, values
+
+
+class SourceInterner:
+    """Maps sample source strings to small integer codes and back"""
+
+    def __init__(self):
+        self._codes: Dict[str, int] = {}
+        self._names: List[str] = []
+
+    def code(self, name: str) -> int:
+        code = self._codes.get(name)
+        if code is None:
+            code = len(self._names)
+            self._codes[name] = code
+            self._names.append(name)
+        return code
+
+    def name(self, code: int) -> str:
+        return self._names[code]
+
+    def names(self, codes: np.ndarray) -> List[str]:
+        names = self._names
+        return [names[c] for c in codes.tolist()]
@@ -0,0 +1,263 @@
+"""
+DAWN Matrix Profile - Vectorised motif matching for rebloop detection
+
+For every window length L the rebloop detector compares the newest L-step
+subsequence of each metric with the L+1 subsequences starting in the 2L
+steps before it - one row of the matrix profile, restricted to that span.
+Its similarity (PatternDetector._calculate_pattern_similarity) combines the
+Pearson correlation of the values, their z-normalised Euclidean distance
+(sqrt(2L(1 - corr))) and the Pearson correlation of the first differences,
+so every term follows from sliding dot products plus window sums.
+
+recent_motif_profile() scores all window lengths in one pass: the dot
+products lie on diagonals of the distance matrix and are read from
+cumulative sums of lagged products (SCRIMP). StreamingMotifProfile keeps
+them current as points arrive with the STAMPI recurrence
+QT' = QT - x[a]x[b] + x[c]x[d], an O(1) update per (length, candidate)
+entry, and recomputes exactly every `refresh_interval` points to bound
+rounding drift.
+
+Windows that are constant up to rounding count as constant (the scalar
+version only special-cases an exactly zero standard deviation), and
+windows holding non-finite readings score 0.
+"""
+
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Scores within this of the best count as ties, resolved like the scalar
+# scan: earliest candidate, then shortest window, then channel order
+TIE_TOLERANCE = 1e-6
+
+# A window whose std is at most this fraction of its mean is constant
+FLAT_TOLERANCE = 1e-7
+
+
+class MotifProfile(NamedTuple):
+    """Best match of the newest window, per channel and window length"""
+    lengths: np.ndarray     # (n_lengths,) window lengths, ascending
+    scores: np.ndarray      # (channels, n_lengths) similarity in [0, 1]
+    positions: np.ndarray   # (channels, n_lengths) match offset within the preceding span
+    amplitudes: np.ndarray  # (channels, n_lengths) max - min of the newest window
+
+    def best(self, threshold: float) -> Optional[Tuple[int, int]]:
+        """(channel, length index) of the best score above threshold, or None"""
+        scores = self.scores.T.ravel()  # length-major, channel-minor order
+        candidates = np.flatnonzero(scores > threshold)
+        if not candidates.size:
+            return None
+        top = scores[candidates].max()
+        entry = int(candidates[np.argmax(scores[candidates] >= top - TIE_TOLERANCE)])
+        length_index, channel = divmod(entry, self.scores.shape[0])
+        return channel, length_index
+
+
+class _Layout:
+    """
+    Flattened (window length, candidate) entries for a series of n points.
+    Positions are counted back from the end: the newest window starts
+    `window` points before it and candidate windows `rel_start` points before it.
+    """
+
+    def __init__(self, n: int, min_length: int, max_length: int):
+        lengths = np.arange(max(min_length, 1), min(max_length, n // 2), dtype=np.int64)
+        spans = np.minimum(2 * lengths, n - lengths)
+        counts = spans - lengths + 1
+        self.lengths = lengths
+        self.offsets = np.cumsum(counts) - counts
+        self.window = np.repeat(lengths, counts)
+        self.candidate = np.arange(int(counts.sum())) - np.repeat(self.offsets, counts)
+        self.lag = np.repeat(spans, counts) - self.candidate
+        self.rel_start = self.window + self.lag
+        self.span = int(self.rel_start.max()) if self.rel_start.size else 0
+
+    @property
+    def size(self) -> int:
+        return len(self.window)
+
+
+def steady_span(min_length: int, max_length: int) -> int:
+    """Series length from which the layout no longer changes as points arrive"""
+    if max_length <= max(min_length, 1):
+        return 0
+    return max(2 * max_length, 3 * (max_length - 1))
+
+
+def recent_motif_profile(series: np.ndarray, min_length: int, max_length: int) -> Optional[MotifProfile]:
+    """
+    Score the newest window of every length in [min_length, max_length)
+    against the windows before it, for each row of `series` (channels, n).
+    Returns None when the series is too short for any window length.
+    """
+    series = np.atleast_2d(np.asarray(series, dtype=float))
+    layout = _Layout(series.shape[1], min_length, max_length)
+    if not layout.size:
+        return None
+    values, invalid = _sanitise(series[:, -layout.span:])
+    offset = values.mean(axis=1, keepdims=True)
+    centred = values - offset
+    qt, qt_diff = _dot_products(centred, layout)
+    return _profile(values, invalid, centred, offset, layout, qt, qt_diff)
+
+
+class StreamingMotifProfile:
+    """
+    Recent-motif profile over a stream of multi-channel points.
+    Until the series reaches its steady span the profile is computed from
+    scratch; after that, once profile() has been asked for, the dot products
+    are updated in O(entries) per appended point.
+    """
+
+    def __init__(self, channels: int, min_length: int, max_length: int, refresh_interval: int = 256):
+        self.channels = channels
+        self.min_length = min_length
+        self.max_length = max_length
+        self.refresh_interval = refresh_interval
+        self.span = steady_span(min_length, max_length)
+        self.count = 0
+
+        self._layout = _Layout(self.span, min_length, max_length)
+        # One extra point: the recurrence reads the value leaving the span
+        self._values = np.zeros((channels, self.span + 1))
+        self._invalid = np.zeros((channels, self.span + 1), dtype=bool)
+        self._qt: Optional[np.ndarray] = None
+        self._qt_diff: Optional[np.ndarray] = None
+        self._offset = np.zeros((channels, 1))
+        self._since_refresh = 0
+
+        layout, span = self._layout, self.span
+        # Buffer indices of the terms entering/leaving each entry's dot products
+        self._leaving = (span - layout.window, span - layout.rel_start)
+        self._entering = span - layout.rel_start + layout.window
+
+    def append(self, point: Sequence[float]):
+        """Add one point (a value per channel)"""
+        values, invalid = _sanitise(np.asarray(point, dtype=float).reshape(self.channels, 1))
+        self._values[:, :-1] = self._values[:, 1:]
+        self._values[:, -1:] = values
+        self._invalid[:, :-1] = self._invalid[:, 1:]
+        self._invalid[:, -1:] = invalid
+        self.count += 1
+
+        if self._qt is None:
+            return
+        if self._since_refresh >= self.refresh_interval:
+            self._qt = self._qt_diff = None
+            return
+        self._since_refresh += 1
+        y = self._values - self._offset
+        diffs = np.diff(self._values, axis=1)
+        (pattern, candidate), entering = self._leaving, self._entering
+        self._qt += y[:, -1:] * y[:, entering] - y[:, pattern] * y[:, candidate]
+        self._qt_diff += diffs[:, -1:] * diffs[:, entering - 1] - diffs[:, pattern] * diffs[:, candidate]
+
+    def profile(self) -> Optional[MotifProfile]:
+        """Profile of the points appended so far (None while too short)"""
+        if self.count < self.span or not self._layout.size:
+            available = min(self.count, self.span)
+            return recent_motif_profile(self._values[:, self._values.shape[1] - available:],
+                                        self.min_length, self.max_length) if available else None
+
+        values, invalid = self._values[:, 1:], self._invalid[:, 1:]
+        if self._qt is None:
+            self._offset = values.mean(axis=1, keepdims=True)
+            self._qt, self._qt_diff = _dot_products(values - self._offset, self._layout)
+            self._since_refresh = 0
+        return _profile(values, invalid, values - self._offset, self._offset,
+                        self._layout, self._qt, self._qt_diff)
+
+
+# ─── kernels ───────────────────────────────────────────────────────────────
+
+def _sanitise(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    invalid = ~np.isfinite(values)
+    return np.where(invalid, 0.0, values), invalid
+
+
+def _prefix(values: np.ndarray) -> np.ndarray:
+    """Cumulative sums along the last axis with a leading zero"""
+    out = np.zeros(values.shape[:-1] + (values.shape[-1] + 1,))
+    np.cumsum(values, axis=-1, out=out[..., 1:])
+    return out
+
+
+def _lagged_dot_products(values: np.ndarray, lag: np.ndarray, start: np.ndarray,
+                         length: np.ndarray) -> np.ndarray:
+    """sum_k values[s + k] * values[s + lag + k] for k < length, per entry,
+    from cumulative sums along each diagonal of the lagged products"""
+    channels, n = values.shape
+    padded = np.zeros((channels, n + int(lag.max())))
+    padded[:, :n] = values
+    shifted = sliding_window_view(padded, n, axis=1)  # shifted[:, j, u] = padded[:, u + j]
+    diagonals = _prefix(values[:, None, :] * shifted)
+    return diagonals[:, lag, start + length] - diagonals[:, lag, start]
+
+
+def _dot_products(centred: np.ndarray, layout: _Layout) -> Tuple[np.ndarray, np.ndarray]:
+    """Dot products of the newest window with each candidate, for the values and their differences"""
+    start = centred.shape[1] - layout.rel_start
+    qt = _lagged_dot_products(centred, layout.lag, start, layout.window)
+    qt_diff = _lagged_dot_products(np.diff(centred, axis=1), layout.lag, start, layout.window - 1)
+    return qt, qt_diff
+
+
+def _pearson(values: np.ndarray, offset, dot: np.ndarray, a: np.ndarray, b: np.ndarray,
+             length: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pearson correlation of values[:, a:a+length] and values[:, b:b+length]
+    per entry (NaN where either window is constant), plus the constant flags
+    """
+    length = np.maximum(length, 1)
+    sums, squares = _prefix(values), _prefix(values * values)
+    changes = _prefix((np.diff(values, axis=1) != 0).astype(float))
+
+    def moments(start):
+        total = sums[:, start + length] - sums[:, start]
+        centred = np.maximum(squares[:, start + length] - squares[:, start] - total * total / length, 0.0)
+        varying = changes[:, start + length - 1] > changes[:, start]
+        flat = ~varying | (np.sqrt(centred / length) <= FLAT_TOLERANCE * np.abs(total / length + offset))
+        return total, centred, flat
+
+    sum_a, centred_a, flat_a = moments(a)
+    sum_b, centred_b, flat_b = moments(b)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        correlation = (dot - sum_a * sum_b / length) / np.sqrt(centred_a * centred_b)
+    correlation = np.where(flat_a | flat_b, np.nan, np.clip(correlation, -1.0, 1.0))
+    return correlation, flat_a, flat_b
+
+
+def _profile(values: np.ndarray, invalid: np.ndarray, centred: np.ndarray, offset: np.ndarray,
+             layout: _Layout, qt: np.ndarray, qt_diff: np.ndarray) -> MotifProfile:
+    n = values.shape[1]
+    window = layout.window
+    pattern_start, candidate_start = n - window, n - layout.rel_start
+
+    correlation, flat_pattern, flat_candidate = _pearson(
+        centred, offset, qt, pattern_start, candidate_start, window)
+    trend, _, _ = _pearson(np.diff(centred, axis=1), 0.0, qt_diff, pattern_start, candidate_start, window - 1)
+
+    distance = np.sqrt(np.maximum(2.0 * window * (1.0 - np.nan_to_num(correlation)), 0.0))
+    distance = np.where(flat_pattern & flat_candidate, 0.0,
+                        np.where(flat_pattern | flat_candidate, np.sqrt(window), distance))
+    correlation = np.where(window > 1, np.nan_to_num(correlation), 1.0)
+    trend = np.where(window > 2, np.nan_to_num(trend), 1.0)
+
+    scores = np.clip(0.5 * np.maximum(correlation, 0.0) + 0.3 / (1.0 + distance)
+                     + 0.2 * np.maximum(trend, 0.0), 0.0, 1.0)
+    if invalid.any():
+        bad = _prefix(invalid.astype(float))
+        scores[(bad[:, n:] > bad[:, pattern_start]) | (bad[:, candidate_start + window] > bad[:, candidate_start])] = 0.0
+    scores[~np.isfinite(scores)] = 0.0
+
+    best = np.maximum.reduceat(scores, layout.offsets, axis=1)
+    counts = np.diff(np.append(layout.offsets, layout.size))
+    near_best = scores >= np.repeat(best, counts, axis=1) - TIE_TOLERANCE
+    positions = np.minimum.reduceat(np.where(near_best, layout.candidate, layout.size), layout.offsets, axis=1)
+
+    newest_first = values[:, ::-1]
+    last = layout.lengths - 1
+    amplitudes = (np.maximum.accumulate(newest_first, axis=1)[:, last]
+                  - np.minimum.accumulate(newest_first, axis=1)[:, last])
+    return MotifProfile(layout.lengths, best, positions, amplitudes)
@@ -0,0 +1,248 @@
+"""
+DAWN Chunk Feature Index - Packed numeric features for CognitiveRouter
+Stores entropy/heat/SCUP/time plus interned speaker/topic/mood codes for every
+chunk in parallel NumPy columns, with sigil and keyword posting lists, so
+rebloom scoring runs as one vectorised kernel over all chunks. Entropy range
+queries use a sorted copy of the entropy column plus a small unsorted tail of
+recent additions that is merged in once it grows.
+
+Rows are append-only; deleted chunks are tombstoned and the columns compacted
+once tombstones dominate. Readers take a snapshot (column references plus a
+row count) under the caller's lock and score without holding it.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, NamedTuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Fixed origins keep timestamps as small seconds offsets (full float precision)
+_NAIVE_ORIGIN = datetime(2000, 1, 1)
+_AWARE_ORIGIN = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+FLOAT_COLUMNS = ("entropy", "heat", "scup", "time")
+CODE_COLUMNS = ("speaker", "topic", "mood")
+
+
+def timestamp_seconds(timestamp: datetime) -> float:
+    """Seconds since a fixed origin (naive or UTC-aware to match the timestamp)"""
+    origin = _NAIVE_ORIGIN if timestamp.tzinfo is None else _AWARE_ORIGIN
+    return (timestamp - origin).total_seconds()
+
+
+class FeatureSnapshot(NamedTuple):
+    """Consistent view of the first `count` rows, safe to read without the lock"""
+    count: int
+    ids: List[str]
+    alive: np.ndarray
+    columns: Dict[str, np.ndarray]
+    sigil_postings: Dict[str, List[int]]
+    keyword_postings: Dict[str, List[int]]
+    codes: Dict[str, Dict[str, int]]
+    sorted_rows: np.ndarray
+    sorted_entropy: np.ndarray
+    unsorted_rows: np.ndarray
+
+
+class ChunkFeatureIndex:
+    """Columnar feature store with posting lists for memory chunks"""
+
+    def __init__(self, capacity: int = 1024, merge_threshold: int = 4096):
+        self.merge_threshold = merge_threshold
+        self._reset(capacity)
+
+    def _reset(self, capacity: int):
+        self.count = 0
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.columns: Dict[str, np.ndarray] = {name: np.zeros(capacity) for name in FLOAT_COLUMNS}
+        self.columns.update({name: np.full(capacity, -1, dtype=np.int32) for name in CODE_COLUMNS})
+        self.codes: Dict[str, Dict[str, int]] = {name: {} for name in CODE_COLUMNS}
+        self.sigil_postings: Dict[str, List[int]] = defaultdict(list)
+        self.keyword_postings: Dict[str, List[int]] = defaultdict(list)
+        self.tombstones = 0
+
+        # Sorted entropy (rows + keys) and rows appended since the last merge
+        self._sorted_rows = np.zeros(0, dtype=np.int64)
+        self._sorted_entropy = np.zeros(0)
+        self._unsorted_rows: List[int] = []
+
+    def __len__(self) -> int:
+        return self.count - self.tombstones
+
+    # ─── maintenance ───────────────────────────────────────────────────────
+
+    def add(self, chunk_id: str, chunk, keywords: Iterable[str]) -> int:
+        """Index a chunk's features (re-adding an id tombstones its old row)"""
+        previous = self.rows.get(chunk_id)
+        if previous is not None:
+            self._discard_row(previous)
+            self._maybe_compact()
+
+        row = self.count
+        if row == len(self.alive):
+            self._grow()
+        self.ids.append(chunk_id)
+        self.rows[chunk_id] = row
+        self.count += 1
+        self._unsorted_rows.append(row)
+
+        columns = self.columns
+        columns["entropy"][row] = chunk.get_entropy()
+        columns["heat"][row] = chunk.get_heat()
+        columns["scup"][row] = chunk.get_scup()
+        columns["time"][row] = timestamp_seconds(chunk.timestamp)
+        columns["speaker"][row] = self._code("speaker", chunk.speaker)
+        columns["topic"][row] = self._code("topic", chunk.topic) if chunk.topic else -1
+        columns["mood"][row] = self._code("mood", chunk.get_mood())
+
+        for sigil in set(chunk.sigils):
+            self.sigil_postings[sigil].append(row)
+        for keyword in set(keywords):
+            self.keyword_postings[keyword].append(row)
+        self.alive[row] = True
+        return row
+
+    def remove(self, chunk_id: str) -> bool:
+        """Tombstone a chunk; columns are compacted once tombstones dominate"""
+        row = self.rows.pop(chunk_id, None)
+        if row is None:
+            return False
+        self._discard_row(row)
+        self._maybe_compact()
+        return True
+
+    def clear(self):
+        self._reset(len(self.alive))
+
+    # ─── queries ───────────────────────────────────────────────────────────
+
+    def snapshot(self) -> FeatureSnapshot:
+        """Capture references for lock-free reading (call with the owner's lock held)"""
+        # Merging costs O(N log N); let the tail grow with N to amortise it
+        if len(self._unsorted_rows) > max(self.merge_threshold, self.count >> 6):
+            self._merge_sorted()
+        return FeatureSnapshot(
+            count=self.count,
+            ids=self.ids,
+            alive=self.alive,
+            columns=dict(self.columns),
+            sigil_postings=self.sigil_postings,
+            keyword_postings=self.keyword_postings,
+            codes=self.codes,
+            sorted_rows=self._sorted_rows,
+            sorted_entropy=self._sorted_entropy,
+            unsorted_rows=np.array(self._unsorted_rows, dtype=np.int64),
+        )
+
+    @staticmethod
+    def posting_counts(postings: Dict[str, List[int]], terms: Iterable[str], count: int) -> np.ndarray:
+        """Number of the given terms posted for each of the first `count` rows"""
+        lists = [postings[term] for term in terms if term in postings]
+        if not lists:
+            return np.zeros(count, dtype=np.int64)
+        rows = np.concatenate([np.asarray(posting, dtype=np.int64) for posting in lists])
+        return np.bincount(rows[rows < count], minlength=count)[:count]
+
+    @staticmethod
+    def entropy_range(snapshot: FeatureSnapshot, low: float, high: float) -> np.ndarray:
+        """Live rows (ascending) whose entropy lies in [low, high]"""
+        start = np.searchsorted(snapshot.sorted_entropy, low, side="left")
+        stop = np.searchsorted(snapshot.sorted_entropy, high, side="right")
+        rows = snapshot.sorted_rows[start:stop]
+
+        tail = snapshot.unsorted_rows
+        if tail.size:
+            tail_entropy = snapshot.columns["entropy"][tail]
+            rows = np.concatenate([rows, tail[(tail_entropy >= low) & (tail_entropy <= high)]])
+
+        rows = rows[rows < snapshot.count]
+        return np.unique(rows[snapshot.alive[rows]])
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            "rows": self.count,
+            "live": len(self),
+            "tombstones": self.tombstones,
+            "unsorted_tail": len(self._unsorted_rows),
+            "sigils": len(self.sigil_postings),
+            "keywords": len(self.keyword_postings),
+            "nbytes": int(self.alive.nbytes + sum(column.nbytes for column in self.columns.values())),
+        }
+
+    # ─── internals ─────────────────────────────────────────────────────────
+
+    def _code(self, column: str, value: str) -> int:
+        codes = self.codes[column]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+        return code
+
+    def _discard_row(self, row: int):
+        self.alive[row] = False
+        self.tombstones += 1
+
+    def _maybe_compact(self):
+        if self.tombstones > max(self.merge_threshold, self.count // 2):
+            self._compact()
+
+    def _merge_sorted(self):
+        rows = np.flatnonzero(self.alive[:self.count])
+        order = np.argsort(self.columns["entropy"][rows], kind="stable")
+        self._sorted_rows = rows[order]
+        self._sorted_entropy = self.columns["entropy"][self._sorted_rows]
+        self._unsorted_rows = []
+
+    def _grow(self):
+        # New arrays: snapshots holding the old ones stay valid
+        capacity = len(self.alive) * 2
+        self.alive = self._resized(self.alive, capacity)
+        self.columns = {name: self._resized(column, capacity) for name, column in self.columns.items()}
+
+    @staticmethod
+    def _resized(column: np.ndarray, capacity: int) -> np.ndarray:
+        grown = np.full(capacity, -1 if column.dtype == np.int32 else 0, dtype=column.dtype)
+        grown[:len(column)] = column
+        return grown
+
+    def _compact(self):
+        keep = np.flatnonzero(self.alive[:self.count])
+        remap = np.full(self.count, -1, dtype=np.int64)
+        remap[keep] = np.arange(keep.size)
+
+        capacity = max(1024, len(self.alive))
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:keep.size] = True
+        columns = {}
+        for name, column in self.columns.items():
+            compacted = np.full(capacity, -1 if column.dtype == np.int32 else 0, dtype=column.dtype)
+            compacted[:keep.size] = column[keep]
+            columns[name] = compacted
+
+        def remap_postings(postings: Dict[str, List[int]]) -> Dict[str, List[int]]:
+            remapped: Dict[str, List[int]] = defaultdict(list)
+            for term, rows in postings.items():
+                live = remap[np.asarray(rows, dtype=np.int64)]
+                live = live[live >= 0]
+                if live.size:
+                    remapped[term] = np.unique(live).tolist()
+            return remapped
+
+        # Replace whole structures so outstanding snapshots remain consistent
+        self.sigil_postings = remap_postings(self.sigil_postings)
+        self.keyword_postings = remap_postings(self.keyword_postings)
+        self.ids = [self.ids[row] for row in keep.tolist()]
+        self.rows = {chunk_id: row for row, chunk_id in enumerate(self.ids)}
+        self.alive = alive
+        self.columns = columns
+        self.count = int(keep.size)
+        self.tombstones = 0
+        self._unsorted_rows = list(range(self.count))
+        self._merge_sorted()
+        logger.debug(f"Compacted chunk feature index to {self.count} rows")
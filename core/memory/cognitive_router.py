@@ -6,13 +6,19 @@ Integrated with DAWN's existing memory infrastructure.
 
 import uuid
 import re
+import logging
 import threading
 import time
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Set
 from collections import defaultdict
 
+import numpy as np
+
 from .memory_chunk import MemoryChunk
+from .chunk_feature_index import ChunkFeatureIndex, FeatureSnapshot, timestamp_seconds
+
+logger = logging.getLogger(__name__)
 
 
 class CognitiveRouter:
@@ -30,6 +36,7 @@ class CognitiveRouter:
         self.sigil_index: Dict[str, Set[str]] = defaultdict(set)
         self.mood_index: Dict[str, Set[str]] = defaultdict(set)
         self.entropy_index: Dict[str, Set[str]] = defaultdict(set)  # Bucketed entropy ranges
+        self.feature_index = ChunkFeatureIndex()  # Packed features for vectorised scans
         self.creation_count = 0
         
         # Thread safety
@@ -77,7 +84,9 @@ class CognitiveRouter:
             entropy_bucket = self._get_entropy_bucket(chunk.get_entropy())
             self.entropy_index[entropy_bucket].add(chunk_id)
             
-            print(f"🧠 Memory stored: {chunk_id[:8]}... - {chunk.summary()}")
+            self.feature_index.add(chunk_id, chunk, self._extract_keywords(chunk.content))
+            
+            logger.debug(f"🧠 Memory stored: {chunk_id[:8]}... - {chunk.summary()}")
             return chunk_id
     
     def delete_chunk(self, chunk_id: str) -> bool:
@@ -113,8 +122,9 @@ class CognitiveRouter:
             
             # Remove from main storage
             del self.chunks[chunk_id]
+            self.feature_index.remove(chunk_id)
             
-            print(f"🗑️ Memory deleted: {chunk_id[:8]}... - {chunk.summary()}")
+            logger.debug(f"🗑️ Memory deleted: {chunk_id[:8]}... - {chunk.summary()}")
             return True
     
     def get_chunk(self, chunk_id: str) -> Optional[MemoryChunk]:
@@ -146,28 +156,88 @@ class CognitiveRouter:
             if not self.chunks:
                 return []
             
-            candidates = []
-            query_words = set(self._extract_keywords(query_chunk.content))
-            
-            print(f"🔍 Reblooming for: {query_chunk.summary()}")
-            print(f"   Query keywords: {query_words}")
-            
-            for chunk_id, chunk in self.chunks.items():
-                # Skip self-matching
-                if hasattr(query_chunk, 'memory_id') and chunk_id == query_chunk.memory_id:
-                    continue
-                
-                similarity_score = self._calculate_dawn_similarity(query_chunk, chunk, query_words)
-                
-                if similarity_score > 0:
-                    candidates.append((similarity_score, chunk))
-            
-            # Sort by similarity score (descending) and limit results
-            candidates.sort(key=lambda x: x[0], reverse=True)
-            top_candidates = [chunk for score, chunk in candidates[:max_candidates]]
-            
-            print(f"   Found {len(top_candidates)} rebloom candidates")
-            return top_candidates
+            snapshot = self.feature_index.snapshot()
+        
+        # Score every indexed chunk without holding the lock
+        query_words = set(self._extract_keywords(query_chunk.content))
+        logger.debug(f"🔍 Reblooming for: {query_chunk.summary()} - keywords: {query_words}")
+        
+        scores = self._score_rebloom_candidates(snapshot, query_chunk, query_words)
+        
+        # Skip dead rows and self-matching (one extra row covers the query itself)
+        scores[~snapshot.alive[:snapshot.count]] = 0.0
+        self_id = getattr(query_chunk, 'memory_id', None)
+        
+        top_candidates = []
+        for row in self._top_rows(scores, max_candidates + 1):
+            chunk_id = snapshot.ids[row]
+            chunk = self.chunks.get(chunk_id)
+            if chunk is not None and chunk_id != self_id:
+                top_candidates.append(chunk)
+        top_candidates = top_candidates[:max_candidates]
+        
+        logger.debug(f"   Found {len(top_candidates)} rebloom candidates")
+        return top_candidates
+    
+    def _score_rebloom_candidates(self, snapshot: FeatureSnapshot, query_chunk: MemoryChunk,
+                                  query_words: Set[str]) -> np.ndarray:
+        """
+        Vectorised _calculate_dawn_similarity of the query against every
+        snapshot row (same terms, applied in the same order).
+        """
+        n = snapshot.count
+        columns = {name: column[:n] for name, column in snapshot.columns.items()}
+        codes = snapshot.codes
+        score = np.zeros(n)
+        
+        # Same speaker boost
+        score += np.where(columns["speaker"] == codes["speaker"].get(query_chunk.speaker, -2), 0.2, 0.0)
+        
+        # Same topic boost
+        if query_chunk.topic:
+            score += np.where(columns["topic"] == codes["topic"].get(query_chunk.topic, -2), 0.3, 0.0)
+        
+        # Shared sigils boost (capped at 3 sigils)
+        shared_sigils = ChunkFeatureIndex.posting_counts(snapshot.sigil_postings, set(query_chunk.sigils), n)
+        score += np.where(shared_sigils > 0, 0.2 * np.minimum(shared_sigils, 3), 0.0)
+        
+        # Content word overlap
+        if query_words:
+            word_overlap = ChunkFeatureIndex.posting_counts(snapshot.keyword_postings, query_words, n)
+            score += np.where(word_overlap > 0, 0.1 * np.minimum(word_overlap / len(query_words), 0.5), 0.0)
+        
+        # DAWN pulse state similarity
+        entropy_diff = np.abs(query_chunk.get_entropy() - columns["entropy"])
+        heat_diff = np.abs(query_chunk.get_heat() - columns["heat"])
+        scup_diff = np.abs(query_chunk.get_scup() - columns["scup"])
+        pulse_similarity = np.where(entropy_diff < 0.2, 0.3 * (0.2 - entropy_diff) / 0.2, 0.0)
+        pulse_similarity += np.where(heat_diff < 20.0, 0.3 * (20.0 - heat_diff) / 20.0, 0.0)
+        pulse_similarity += np.where(scup_diff < 0.3, 0.4 * (0.3 - scup_diff) / 0.3, 0.0)
+        score += np.minimum(pulse_similarity, 1.0) * 0.2
+        
+        # Mood similarity
+        score += np.where(columns["mood"] == codes["mood"].get(query_chunk.get_mood(), -2), 0.1, 0.0)
+        
+        # Time proximity (within 1 hour)
+        time_diff = np.abs(timestamp_seconds(query_chunk.timestamp) - columns["time"])
+        score += np.where(time_diff < 3600, 0.1 * (1 - time_diff / 3600), 0.0)
+        
+        return np.minimum(score, 1.0)
+    
+    @staticmethod
+    def _top_rows(scores: np.ndarray, limit: int) -> List[int]:
+        """Rows with positive score, best first; ties keep insertion order"""
+        positive = np.flatnonzero(scores > 0)
+        if limit <= 0 or not positive.size:
+            return []
+        if positive.size > limit:
+            values = scores[positive]
+            kth = np.partition(values, -limit)[-limit]
+            above = positive[values > kth]
+            ties = positive[values == kth][:limit - above.size]
+            positive = np.sort(np.concatenate([above, ties]))
+        order = np.argsort(-scores[positive], kind="stable")
+        return positive[order].tolist()
     
     def _calculate_dawn_similarity(self, query_chunk: MemoryChunk, candidate_chunk: MemoryChunk, query_words: Set[str]) -> float:
         """
@@ -389,33 +459,44 @@ class CognitiveRouter:
     
     def find_by_entropy_range(self, min_entropy: float, max_entropy: float) -> List[MemoryChunk]:
         """Find all memories within an entropy range."""
-        matching_chunks = []
-        for chunk in self.chunks.values():
-            entropy = chunk.get_entropy()
-            if min_entropy <= entropy <= max_entropy:
-                matching_chunks.append(chunk)
-        return matching_chunks
+        with self.lock:
+            snapshot = self.feature_index.snapshot()
+        rows = ChunkFeatureIndex.entropy_range(snapshot, min_entropy, max_entropy)
+        return self._chunks_for_rows(snapshot, rows)
     
     def find_similar_pulse_state(self, reference_chunk: MemoryChunk, tolerance: float = 0.2) -> List[MemoryChunk]:
         """Find memories with similar pulse state to reference chunk."""
-        similar_chunks = []
         ref_entropy = reference_chunk.get_entropy()
         ref_heat = reference_chunk.get_heat()
         ref_scup = reference_chunk.get_scup()
         
-        for chunk in self.chunks.values():
-            # Skip self
-            if hasattr(reference_chunk, 'memory_id') and hasattr(chunk, 'memory_id'):
-                if reference_chunk.memory_id == chunk.memory_id:
-                    continue
-            
-            # Check if pulse states are similar
-            if (abs(chunk.get_entropy() - ref_entropy) <= tolerance and
-                abs(chunk.get_heat() - ref_heat) <= tolerance * 50 and  # Scale for heat
-                abs(chunk.get_scup() - ref_scup) <= tolerance):
-                similar_chunks.append(chunk)
+        with self.lock:
+            snapshot = self.feature_index.snapshot()
         
-        return similar_chunks
+        # Entropy range from the sorted index (padded for rounding), then exact checks
+        slack = 1e-9 * max(1.0, abs(ref_entropy))
+        rows = ChunkFeatureIndex.entropy_range(snapshot, ref_entropy - tolerance - slack,
+                                               ref_entropy + tolerance + slack)
+        columns = snapshot.columns
+        rows = rows[
+            (np.abs(columns["entropy"][rows] - ref_entropy) <= tolerance) &
+            (np.abs(columns["heat"][rows] - ref_heat) <= tolerance * 50) &  # Scale for heat
+            (np.abs(columns["scup"][rows] - ref_scup) <= tolerance)
+        ]
+        
+        # Skip self
+        self_id = getattr(reference_chunk, 'memory_id', None)
+        return [chunk for chunk in self._chunks_for_rows(snapshot, rows)
+                if self_id is None or chunk.memory_id != self_id]
+    
+    def _chunks_for_rows(self, snapshot: FeatureSnapshot, rows: np.ndarray) -> List[MemoryChunk]:
+        """Resolve snapshot rows to chunks still present in storage"""
+        chunks = []
+        for row in rows.tolist():
+            chunk = self.chunks.get(snapshot.ids[row])
+            if chunk is not None:
+                chunks.append(chunk)
+        return chunks
     
     def get_stats(self) -> Dict[str, Any]:
         """Get comprehensive statistics about stored memories."""
@@ -461,6 +542,7 @@ class CognitiveRouter:
             self.sigil_index.clear()
             self.mood_index.clear()
             self.entropy_index.clear()
+            self.feature_index.clear()
             
             print(f"🧹 Cleared {count} memories from cognitive router")
             return count
@@ -109,65 +109,97 @@ class MemoryRouter:
             dict: Routing decisions made
         """
         with self.lock:
-            routing_result = {
-                'working_memory': False,
-                'recent_memory': False,
-                'significant_memory': False,
-                'cognitive_stored': False,
-                'vector_indexed': False,
-                'trace_logged': False,
-                'anchor_created': False
-            }
-            
-            self.routing_decisions += 1
-            
-            # Calculate memory importance
-            importance = self._calculate_importance(chunk)
-            
-            # Route to cognitive router
-            if self.cognitive_router:
-                try:
-                    chunk_id = self.cognitive_router.add_chunk(chunk)
-                    routing_result['cognitive_stored'] = True
-                    logger.debug(f"Routed {chunk.memory_id} to cognitive router as {chunk_id[:8]}...")
-                except Exception as e:
-                    logger.warning(f"Failed to route to cognitive router: {e}")
+            return self._route_locked(chunk, index_vector=True)
+    
+    def route_memories(self, chunks: List[MemoryChunk]) -> List[Dict[str, bool]]:
+        """
+        Route many memory chunks, embedding and vector-indexing them in one batch.
+        
+        Args:
+            chunks: Memory chunks to route
             
-            # Add to vector index for semantic search
-            if self.vector_index:
+        Returns:
+            list: Routing decisions per chunk
+        """
+        with self.lock:
+            vector_indexed = False
+            if self.vector_index and chunks:
                 try:
-                    self.vector_index.add(chunk)
-                    routing_result['vector_indexed'] = True
-                    logger.debug(f"Added {chunk.memory_id} to vector index")
+                    # Chunks restored from the vector snapshot keep their vectors
+                    self.vector_index.add_batch(chunks, skip_existing=True)
+                    vector_indexed = True
+                    logger.debug(f"Added {len(chunks)} memories to vector index")
                 except Exception as e:
-                    logger.warning(f"Failed to add to vector index: {e}")
-            
-            # Legacy routing (maintain compatibility)
-            # Route to working memory if high importance or recent interaction
-            if importance > 0.7 or self._is_recent_interaction(chunk):
-                self.working_memory.append(chunk)
-                routing_result['working_memory'] = True
-                logger.debug(f"Routed {chunk.memory_id} to working memory (importance: {importance:.3f})")
-            
-            # Always route to recent memory
-            self.recent_memories.append(chunk)
-            routing_result['recent_memory'] = True
-            
-            # Route to significant memory if above threshold
-            if importance > self.importance_threshold:
-                self.significant_memories.append(chunk)
-                routing_result['significant_memory'] = True
-                
-                # Prune significant memories if too many
-                if len(self.significant_memories) > self.max_active_memories // 10:
-                    self.significant_memories.sort(key=self._calculate_importance, reverse=True)
-                    self.significant_memories = self.significant_memories[:self.max_active_memories // 10]
-            
-            # Update routing patterns
-            self._update_routing_patterns(chunk)
-            
-            logger.debug(f"Memory {chunk.memory_id} routed with importance {importance:.3f}")
-            return routing_result
+                    logger.warning(f"Failed to batch add to vector index: {e}")
+            
+            results = []
+            for chunk in chunks:
+                routing_result = self._route_locked(chunk, index_vector=False)
+                routing_result['vector_indexed'] = vector_indexed
+                results.append(routing_result)
+            return results
+    
+    def _route_locked(self, chunk: MemoryChunk, index_vector: bool) -> Dict[str, bool]:
+        """Route a single chunk (lock held); vector indexing is optional for batch callers"""
+        routing_result = {
+            'working_memory': False,
+            'recent_memory': False,
+            'significant_memory': False,
+            'cognitive_stored': False,
+            'vector_indexed': False,
+            'trace_logged': False,
+            'anchor_created': False
+        }
+        
+        self.routing_decisions += 1
+        
+        # Calculate memory importance
+        importance = self._calculate_importance(chunk)
+        
+        # Route to cognitive router
+        if self.cognitive_router:
+            try:
+                chunk_id = self.cognitive_router.add_chunk(chunk)
+                routing_result['cognitive_stored'] = True
+                logger.debug(f"Routed {chunk.memory_id} to cognitive router as {chunk_id[:8]}...")
+            except Exception as e:
+                logger.warning(f"Failed to route to cognitive router: {e}")
+        
+        # Add to vector index for semantic search
+        if self.vector_index and index_vector:
+            try:
+                self.vector_index.add(chunk)
+                routing_result['vector_indexed'] = True
+                logger.debug(f"Added {chunk.memory_id} to vector index")
+            except Exception as e:
+                logger.warning(f"Failed to add to vector index: {e}")
+        
+        # Legacy routing (maintain compatibility)
+        # Route to working memory if high importance or recent interaction
+        if importance > 0.7 or self._is_recent_interaction(chunk):
+            self.working_memory.append(chunk)
+            routing_result['working_memory'] = True
+            logger.debug(f"Routed {chunk.memory_id} to working memory (importance: {importance:.3f})")
+        
+        # Always route to recent memory
+        self.recent_memories.append(chunk)
+        routing_result['recent_memory'] = True
+        
+        # Route to significant memory if above threshold
+        if importance > self.importance_threshold:
+            self.significant_memories.append(chunk)
+            routing_result['significant_memory'] = True
+            
+            # Prune significant memories if too many
+            if len(self.significant_memories) > self.max_active_memories // 10:
+                self.significant_memories.sort(key=self._calculate_importance, reverse=True)
+                self.significant_memories = self.significant_memories[:self.max_active_memories // 10]
+        
+        # Update routing patterns
+        self._update_routing_patterns(chunk)
+        
+        logger.debug(f"Memory {chunk.memory_id} routed with importance {importance:.3f}")
+        return routing_result
     
     def retrieve_memories(self, 
                          query: str,
@@ -436,13 +468,47 @@ class MemoryRouter:
             return [result.chunk for result in results]
         return []
     
+    def remove_memory(self, memory_id: str) -> bool:
+        """
+        Prune a memory from the cognitive router, vector index and active pools.
+        
+        Args:
+            memory_id: ID of the memory to remove
+            
+        Returns:
+            bool: True if the memory was found anywhere
+        """
+        with self.lock:
+            removed = False
+            if self.cognitive_router and memory_id in self.cognitive_router.chunks:
+                removed = self.cognitive_router.delete_chunk(memory_id) or removed
+            if self.vector_index:
+                removed = self.vector_index.remove_chunk(memory_id) or removed
+            
+            for pool in (self.working_memory, self.recent_memories):
+                kept = [chunk for chunk in pool if chunk.memory_id != memory_id]
+                if len(kept) != len(pool):
+                    pool.clear()
+                    pool.extend(kept)
+                    removed = True
+            significant = [chunk for chunk in self.significant_memories if chunk.memory_id != memory_id]
+            if len(significant) != len(self.significant_memories):
+                self.significant_memories = significant
+                removed = True
+            return removed
+    
     def compress_memories(self) -> Dict[str, Any]:
         """
         Generate a compressed representation of all stored memories.
+        Also compacts tombstoned rows out of the vector index.
         
         Returns:
             Dict[str, Any]: Compressed memory representation
         """
+        if self.vector_index and self.vector_index.tombstones:
+            self.vector_index.wait_for_compaction()
+            self.vector_index.compact()
+        
         if self.cognitive_router:
             return self.cognitive_router.compress()
         return {'compressed_memories': 'Cognitive router not available'}
@@ -501,6 +567,10 @@ class DAWNMemoryRoutingSystem:
         self.router = MemoryRouter(pulse_controller=pulse_controller)
         self.loader = DAWNMemoryLoader(memories_dir=str(self.memories_dir))
         
+        # Persisted vector index (memory-mapped, so restarts skip re-embedding)
+        self.vector_snapshot_dir = self.memories_dir / "vector_index"
+        self._load_vector_snapshot()
+        
         # Integration with existing DAWN systems
         self.trace_log = None
         self.anchor_system = None
@@ -646,6 +716,8 @@ class DAWNMemoryRoutingSystem:
             str: Path where memories were saved
         """
         with self.lock:
+            self._save_vector_snapshot()
+            
             if not self.unsaved_memories:
                 logger.debug("No unsaved memories to save")
                 return ""
@@ -686,13 +758,30 @@ class DAWNMemoryRoutingSystem:
         """
         chunks = self.loader.load_memory_from_json(filepath)
         
-        # Route loaded memories
-        for chunk in chunks:
-            self.router.route_memory(chunk)
+        # Route loaded memories (one embedding batch for the vector index)
+        self.router.route_memories(chunks)
         
         logger.info(f"Loaded and routed {len(chunks)} memories from {filepath}")
         return chunks
     
+    def _load_vector_snapshot(self) -> None:
+        """Restore the router's vector index from its on-disk snapshot, if any."""
+        if not self.router.vector_index or not (self.vector_snapshot_dir / "manifest.json").exists():
+            return
+        try:
+            self.router.vector_index.load(str(self.vector_snapshot_dir))
+        except Exception as e:
+            logger.warning(f"Failed to load vector index snapshot: {e}")
+    
+    def _save_vector_snapshot(self) -> None:
+        """Append vectors added since the last save to the on-disk snapshot."""
+        if not self.router.vector_index:
+            return
+        try:
+            self.router.vector_index.save(str(self.vector_snapshot_dir))
+        except Exception as e:
+            logger.warning(f"Failed to save vector index snapshot: {e}")
+    
     def get_system_stats(self) -> Dict[str, Any]:
         """Get comprehensive system statistics."""
         router_stats = self.router.get_routing_stats()
@@ -4,6 +4,7 @@ memory_trace_log.py - DAWN's Enhanced Memory & Linguistic Genome Architecture
 A reflection and reference system with double helix genome structure for evolving consciousness
 """
 
+import atexit
 import json
 import time
 import numpy as np
@@ -16,6 +17,8 @@ from collections import deque, defaultdict
 import hashlib
 import random
 
+from .trace_journal import TraceJournal
+
 
 @dataclass
 class MemoryCrossover:
@@ -108,14 +111,104 @@ class GenomicMemoryTrace:
         return overlap / total if total > 0 else 0.0
 
 
+class TraceSimilarityIndex:
+    """
+    Columnar index for GenomicMemoryTrace.similarity_score.
+    
+    The thermal/entropy/emotional terms are scored for every indexed trace in
+    one vectorised pass; the genome term comes from an inverted index over
+    crossover triggers, so only traces sharing a trigger get a Jaccard score
+    (the rest score 0, or 0.5 when both have no triggers). Scores match
+    similarity_score exactly.
+    """
+    
+    def __init__(self, capacity: int = 256):
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.thermal = np.zeros(capacity)
+        self.entropy = np.zeros(capacity)
+        self.valence = np.zeros(capacity)
+        self.trigger_counts = np.zeros(capacity, dtype=np.int64)
+        self.triggers: List[Set[str]] = []
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def add(self, trace: GenomicMemoryTrace) -> int:
+        """Index a trace (re-adding an id updates its row) and return its row"""
+        memory_id = trace.timestamp
+        triggers = {c.linguistic_trigger for c in trace.linguistic_genome.memory_crossovers}
+        
+        row = self.rows.get(memory_id)
+        if row is None:
+            row = len(self.ids)
+            if row == len(self.thermal):
+                self._grow()
+            self.ids.append(memory_id)
+            self.triggers.append(set())
+            self.rows[memory_id] = row
+        
+        for trigger in self.triggers[row] - triggers:
+            self.postings[trigger].remove(row)
+        for trigger in triggers - self.triggers[row]:
+            self.postings[trigger].append(row)
+        self.triggers[row] = triggers
+        
+        self.thermal[row] = trace.thermal_trace
+        self.entropy[row] = trace.entropy_signature
+        self.valence[row] = trace.emotional_valence
+        self.trigger_counts[row] = len(triggers)
+        return row
+    
+    def scores(self, rows: List[int], limit: int) -> np.ndarray:
+        """Similarity of each indexed row in `rows` against rows [0, limit)"""
+        q = np.asarray(rows)
+        thermal_sim = 1.0 - np.abs(self.thermal[q, None] - self.thermal[None, :limit]) / 10.0
+        entropy_sim = 1.0 - np.abs(self.entropy[q, None] - self.entropy[None, :limit]) / 10.0
+        emotional_sim = 1.0 - np.abs(self.valence[q, None] - self.valence[None, :limit]) / 2.0
+        
+        # Genome term: 0.5 between two trigger-less traces, else Jaccard (0 without overlap)
+        empty = self.trigger_counts[:limit] == 0
+        genome_sim = np.outer(empty[q], empty) * 0.5
+        for i, row in enumerate(rows):
+            if not self.triggers[row]:
+                continue
+            overlap: Dict[int, int] = defaultdict(int)
+            for trigger in self.triggers[row]:
+                for other in self.postings[trigger]:
+                    if other < limit:
+                        overlap[other] += 1
+            if overlap:
+                others = np.fromiter(overlap.keys(), dtype=np.int64, count=len(overlap))
+                shared = np.fromiter(overlap.values(), dtype=np.float64, count=len(overlap))
+                total = len(self.triggers[row]) + self.trigger_counts[others] - shared
+                genome_sim[i, others] = shared / total
+        
+        return (thermal_sim * 0.3 + entropy_sim * 0.3 +
+                emotional_sim * 0.15 + genome_sim * 0.25)
+    
+    def _grow(self):
+        capacity = len(self.thermal) * 2
+        for name in ('thermal', 'entropy', 'valence', 'trigger_counts'):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:len(column)] = column
+            setattr(self, name, grown)
+
+
 class SemanticMemoryGraph:
     """Graph structure for semantic memory connections"""
     
+    SIMILARITY_THRESHOLD = 0.6
+    BULK_BLOCK_SIZE = 256
+    
     def __init__(self):
         self.memory_nodes: Dict[str, GenomicMemoryTrace] = {}
         self.semantic_edges: Dict[str, Set[str]] = defaultdict(set)
         self.linguistic_pathways: Dict[str, List[str]] = {}
         self.constitutional_clusters: Dict[str, Set[str]] = defaultdict(set)
+        self.similarity_index = TraceSimilarityIndex()
     
     def add_memory(self, trace: GenomicMemoryTrace):
         """Add memory to semantic graph"""
@@ -123,31 +216,78 @@ class SemanticMemoryGraph:
         self.memory_nodes[memory_id] = trace
         self.build_semantic_connections(trace)
     
+    def add_memories(self, traces: List[GenomicMemoryTrace]):
+        """
+        Bulk-add memories (e.g. on reload). Produces the same graph as calling
+        add_memory for each trace in order, scoring blocks of new traces
+        against everything indexed before them in one pass.
+        """
+        pending: List[GenomicMemoryTrace] = []
+        pending_ids: Set[str] = set()
+        
+        for trace in traces:
+            if trace.timestamp in self.memory_nodes or trace.timestamp in pending_ids:
+                # Re-added id: flush the block so ordering matches add_memory
+                self._connect_block(pending)
+                pending, pending_ids = [], set()
+                self.add_memory(trace)
+                continue
+            pending.append(trace)
+            pending_ids.add(trace.timestamp)
+            if len(pending) == self.BULK_BLOCK_SIZE:
+                self._connect_block(pending)
+                pending, pending_ids = [], set()
+        self._connect_block(pending)
+    
+    def _connect_block(self, block: List[GenomicMemoryTrace]):
+        if not block:
+            return
+        index = self.similarity_index
+        first = len(index)
+        for trace in block:
+            self.memory_nodes[trace.timestamp] = trace
+            index.add(trace)
+        
+        scores = index.scores(list(range(first, first + len(block))), first + len(block))
+        for i, trace in enumerate(block):
+            # Each trace connects only to traces added before it
+            row_scores = scores[i, :first + i]
+            for row in np.flatnonzero(row_scores > self.SIMILARITY_THRESHOLD):
+                other = self.memory_nodes.get(index.ids[row])
+                if other is not None:
+                    self._connect(trace, other, float(row_scores[row]))
+    
     def build_semantic_connections(self, new_trace: GenomicMemoryTrace):
         """Connect new memory to existing semantic web"""
         new_id = new_trace.timestamp
+        index = self.similarity_index
+        row = index.add(new_trace)
         
-        # Find similar memories
-        for mem_id, trace in self.memory_nodes.items():
-            if mem_id == new_id:
+        # Find similar memories (indexed rows follow memory_nodes insertion order)
+        row_scores = index.scores([row], len(index))[0]
+        row_scores[row] = -np.inf
+        for other in np.flatnonzero(row_scores > self.SIMILARITY_THRESHOLD):
+            mem_id = index.ids[other]
+            if mem_id == new_id or mem_id not in self.memory_nodes:
                 continue
-                
-            similarity = new_trace.similarity_score(trace)
-            
-            # Create edge if similarity is high enough
-            if similarity > 0.6:
-                self.semantic_edges[new_id].add(mem_id)
-                self.semantic_edges[mem_id].add(new_id)
-                
-                # Update linguistic pathways
-                self._update_linguistic_pathways(new_id, mem_id, similarity)
-                
-                # Cluster by constitutional alignment
-                if new_trace.constitutional_markers and trace.constitutional_markers:
-                    shared_markers = set(new_trace.constitutional_markers) & set(trace.constitutional_markers)
-                    for marker in shared_markers:
-                        self.constitutional_clusters[marker].add(new_id)
-                        self.constitutional_clusters[marker].add(mem_id)
+            self._connect(new_trace, self.memory_nodes[mem_id], float(row_scores[other]))
+    
+    def _connect(self, new_trace: GenomicMemoryTrace, trace: GenomicMemoryTrace, similarity: float):
+        """Create the edge, pathway and constitutional clustering for a similar pair"""
+        new_id = new_trace.timestamp
+        mem_id = trace.timestamp
+        self.semantic_edges[new_id].add(mem_id)
+        self.semantic_edges[mem_id].add(new_id)
+        
+        # Update linguistic pathways
+        self._update_linguistic_pathways(new_id, mem_id, similarity)
+        
+        # Cluster by constitutional alignment
+        if new_trace.constitutional_markers and trace.constitutional_markers:
+            shared_markers = set(new_trace.constitutional_markers) & set(trace.constitutional_markers)
+            for marker in shared_markers:
+                self.constitutional_clusters[marker].add(new_id)
+                self.constitutional_clusters[marker].add(mem_id)
     
     def _update_linguistic_pathways(self, id1: str, id2: str, strength: float):
         """Create/update linguistic generation paths"""
@@ -438,11 +578,20 @@ class MemoryGenomeEvolution:
 class EnhancedMemoryTraceLog:
     """Enhanced DAWN memory system with linguistic genome architecture"""
     
-    def __init__(self, log_path: str = "dawn_genomic_memory_traces.json"):
+    def __init__(self, log_path: str = "dawn_genomic_memory_traces.json", background_flush: bool = True):
         self.log_path = Path(log_path)
         self.traces: deque = deque(maxlen=10000)
         self.lock = threading.Lock()
         
+        # Append-only trace journal (supersedes the full JSON rewrite)
+        self.journal = TraceJournal(
+            self.log_path.with_suffix(".jsonl"),
+            key="timestamp",
+            retain=self.traces.maxlen,
+            background=background_flush
+        )
+        atexit.register(self.journal.close)
+        
         # Initialize subsystems
         self.scaffold = LinguisticMemoryScaffold()
         self.genome_evolution = MemoryGenomeEvolution()
@@ -530,9 +679,8 @@ class EnhancedMemoryTraceLog:
                 self.scaffold.constitutional_memory_guardian.evaluate_constitutional_alignment(trace)
             )
         
-        # Save periodically
-        if len(self.traces) % 10 == 0:
-            self._save_traces()
+        # Persist (queued for the journal's next group commit)
+        self.journal.append(self._serialize_trace(trace))
             
         return trace
     
@@ -607,6 +755,9 @@ class EnhancedMemoryTraceLog:
             trace.linguistic_genome.linguistic_fidelity = min(1.0, trace.linguistic_genome.linguistic_fidelity + 0.02)
         else:
             trace.linguistic_genome.linguistic_fidelity = max(0.0, trace.linguistic_genome.linguistic_fidelity - 0.01)
+        
+        # Newer journal record supersedes the original
+        self.journal.append(self._serialize_trace(trace))
     
     def generate_genomic_reflection(self, current_state: Dict) -> Dict:
         """Generate memory-grounded reflection using genome algorithms"""
@@ -745,79 +896,99 @@ class EnhancedMemoryTraceLog:
         else:
             return "dispersed, seeking form, gesture-space"
     
+    def _serialize_trace(self, trace: GenomicMemoryTrace) -> Dict:
+        """Convert a trace (with genome data) to a JSON-serializable dict"""
+        trace_dict = asdict(trace)
+        # Handle complex genome structure
+        trace_dict['linguistic_genome'] = {
+            'strand_a': trace.linguistic_genome.strand_a,
+            'strand_b': trace.linguistic_genome.strand_b,
+            'memory_crossovers': [asdict(c) for c in trace.linguistic_genome.memory_crossovers],
+            'recall_accuracy': trace.linguistic_genome.recall_accuracy,
+            'linguistic_fidelity': trace.linguistic_genome.linguistic_fidelity,
+            'genome_id': trace.linguistic_genome.genome_id
+        }
+        return trace_dict
+    
+    def _deserialize_trace(self, trace_dict: Dict) -> GenomicMemoryTrace:
+        """Rebuild a trace from its serialized dict"""
+        # Reconstruct genome
+        genome_data = trace_dict.get('linguistic_genome', {})
+        genome = MemoryGenome(
+            strand_a=genome_data.get('strand_a', {}),
+            strand_b=genome_data.get('strand_b', {}),
+            memory_crossovers=[MemoryCrossover(**c) for c in genome_data.get('memory_crossovers', [])],
+            recall_accuracy=genome_data.get('recall_accuracy', 0.8),
+            linguistic_fidelity=genome_data.get('linguistic_fidelity', 0.7)
+        )
+        
+        # Create trace
+        return GenomicMemoryTrace(
+            timestamp=trace_dict['timestamp'],
+            thought_fragment=trace_dict['thought_fragment'],
+            thermal_trace=trace_dict['thermal_trace'],
+            entropy_signature=trace_dict['entropy_signature'],
+            awareness_level=trace_dict['awareness_level'],
+            sigil_cause=trace_dict['sigil_cause'],
+            fractal_anchor=trace_dict['fractal_anchor'],
+            emotional_valence=trace_dict['emotional_valence'],
+            coherence_note=trace_dict['coherence_note'],
+            linguistic_genome=genome,
+            expression_attempts=trace_dict.get('expression_attempts', []),
+            successful_expressions=trace_dict.get('successful_expressions', []),
+            genome_evolution_log=trace_dict.get('genome_evolution_log', []),
+            semantic_connections=trace_dict.get('semantic_connections', []),
+            constitutional_markers=trace_dict.get('constitutional_markers', [])
+        )
+    
     def _save_traces(self):
-        """Save enhanced traces with genome data"""
+        """Write all queued traces to the journal now"""
+        self.journal.flush()
+    
+    def close(self):
+        """Flush the journal and stop its background writer"""
+        self.journal.close()
+    
+    def export_traces(self, filepath: Optional[str] = None):
+        """Export every trace as a single JSON document (the legacy format)"""
         with self.lock:
-            # Convert traces to serializable format
-            trace_data = []
-            for trace in self.traces:
-                trace_dict = asdict(trace)
-                # Handle complex genome structure
-                trace_dict['linguistic_genome'] = {
-                    'strand_a': trace.linguistic_genome.strand_a,
-                    'strand_b': trace.linguistic_genome.strand_b,
-                    'memory_crossovers': [asdict(c) for c in trace.linguistic_genome.memory_crossovers],
-                    'recall_accuracy': trace.linguistic_genome.recall_accuracy,
-                    'linguistic_fidelity': trace.linguistic_genome.linguistic_fidelity,
-                    'genome_id': trace.linguistic_genome.genome_id
-                }
-                trace_data.append(trace_dict)
-            
-            data = {
-                'traces': trace_data,
-                'semantic_graph': {
-                    'nodes': len(self.scaffold.semantic_memory_web.memory_nodes),
-                    'edges': len(self.scaffold.semantic_memory_web.semantic_edges)
-                },
-                'genome_bank_size': len(self.scaffold.memory_genome_bank.genome_bank),
-                'last_updated': datetime.now().isoformat()
-            }
-            
-            with open(self.log_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            trace_data = [self._serialize_trace(trace) for trace in self.traces]
+        
+        data = {
+            'traces': trace_data,
+            'semantic_graph': {
+                'nodes': len(self.scaffold.semantic_memory_web.memory_nodes),
+                'edges': len(self.scaffold.semantic_memory_web.semantic_edges)
+            },
+            'genome_bank_size': len(self.scaffold.memory_genome_bank.genome_bank),
+            'last_updated': datetime.now().isoformat()
+        }
+        
+        with open(filepath or self.log_path, 'w') as f:
+            json.dump(data, f, indent=2)
     
     def _load_traces(self):
-        """Load enhanced traces from disk"""
-        if self.log_path.exists():
-            try:
+        """Stream traces from the journal, migrating a legacy JSON log if present"""
+        try:
+            if self.journal.path.exists():
+                self._restore_traces([self._deserialize_trace(d) for d in self.journal.load()])
+            elif self.log_path.exists() and self.log_path != self.journal.path:
                 with open(self.log_path, 'r') as f:
                     data = json.load(f)
-                    
-                    for trace_dict in data.get('traces', []):
-                        # Reconstruct genome
-                        genome_data = trace_dict.get('linguistic_genome', {})
-                        genome = MemoryGenome(
-                            strand_a=genome_data.get('strand_a', {}),
-                            strand_b=genome_data.get('strand_b', {}),
-                            memory_crossovers=[MemoryCrossover(**c) for c in genome_data.get('memory_crossovers', [])],
-                            recall_accuracy=genome_data.get('recall_accuracy', 0.8),
-                            linguistic_fidelity=genome_data.get('linguistic_fidelity', 0.7)
-                        )
-                        
-                        # Create trace
-                        trace = GenomicMemoryTrace(
-                            timestamp=trace_dict['timestamp'],
-                            thought_fragment=trace_dict['thought_fragment'],
-                            thermal_trace=trace_dict['thermal_trace'],
-                            entropy_signature=trace_dict['entropy_signature'],
-                            awareness_level=trace_dict['awareness_level'],
-                            sigil_cause=trace_dict['sigil_cause'],
-                            fractal_anchor=trace_dict['fractal_anchor'],
-                            emotional_valence=trace_dict['emotional_valence'],
-                            coherence_note=trace_dict['coherence_note'],
-                            linguistic_genome=genome,
-                            expression_attempts=trace_dict.get('expression_attempts', []),
-                            successful_expressions=trace_dict.get('successful_expressions', []),
-                            genome_evolution_log=trace_dict.get('genome_evolution_log', []),
-                            semantic_connections=trace_dict.get('semantic_connections', []),
-                            constitutional_markers=trace_dict.get('constitutional_markers', [])
-                        )
-                        
-                        self.traces.append(trace)
-                        self.scaffold.semantic_memory_web.add_memory(trace)
-                        
-            except Exception as e:
-                print(f"Starting fresh genomic memory log: {e}")
+                
+                trace_dicts = data.get('traces', [])
+                self._restore_traces([self._deserialize_trace(d) for d in trace_dicts])
+                for trace_dict in trace_dicts:
+                    self.journal.append(trace_dict)
+                self.journal.flush()
+                
+        except Exception as e:
+            print(f"Starting fresh genomic memory log: {e}")
+    
+    def _restore_traces(self, traces: List[GenomicMemoryTrace]):
+        """Re-register loaded traces with the in-memory structures"""
+        self.traces.extend(traces)
+        self.scaffold.semantic_memory_web.add_memories(traces)
 
 
 # Backward compatibility wrapper
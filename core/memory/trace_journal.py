@@ -0,0 +1,209 @@
+"""
+DAWN Trace Journal - Append-only JSON Lines persistence for genomic traces
+Records are queued by the caller and written by a background flusher in
+groups (one write per batch), so logging a trace costs O(1) regardless of how
+many traces already exist. A record whose key was seen before supersedes the
+earlier one; the journal is periodically compacted in the background down to
+the latest record per key, keeping only the most recent `retain` keys.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TraceJournal:
+    """Group-committed JSONL journal with last-write-wins compaction"""
+
+    def __init__(self, path: str, key: str = "timestamp", retain: Optional[int] = None,
+                 group_size: int = 64, flush_interval: float = 1.0,
+                 compaction_ratio: float = 2.0, min_compaction_records: int = 1000,
+                 background: bool = True, fsync: bool = False):
+        """
+        Initialize the journal.
+
+        Args:
+            path: JSONL file to append to
+            key: Record field identifying a trace (later records replace earlier ones)
+            retain: Keep only the most recent N keys when loading and compacting
+            group_size: Wake the flusher once this many records are queued
+            flush_interval: Maximum seconds a queued record waits before being written
+            compaction_ratio: Compact once on-disk records exceed ratio * live records
+            min_compaction_records: Never compact journals smaller than this
+            background: Write from a daemon thread (False writes on flush() only)
+            fsync: fsync after every group commit
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.key = key
+        self.retain = retain
+        self.group_size = group_size
+        self.flush_interval = flush_interval
+        self.compaction_ratio = compaction_ratio
+        self.min_compaction_records = min_compaction_records
+        self.fsync = fsync
+
+        self._queue: List[Dict[str, Any]] = []
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._closed = False
+
+        # Records on disk and the distinct keys they cover (reset by load/compact)
+        self.records_on_disk = 0
+        self._keys = set()
+
+        # Statistics
+        self.records_written = 0
+        self.group_commits = 0
+        self.compactions = 0
+
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self._thread = threading.Thread(target=self._run, name="TraceJournalFlusher", daemon=True)
+            self._thread.start()
+
+    # ─── writing ───────────────────────────────────────────────────────────
+
+    def append(self, record: Dict[str, Any]):
+        """Queue a record for the next group commit"""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError(f"Trace journal is closed: {self.path}")
+            self._queue.append(record)
+            if len(self._queue) >= self.group_size:
+                self._condition.notify()
+
+    def flush(self):
+        """Write all queued records (and any due compaction) on the calling thread"""
+        with self._write_lock:
+            with self._condition:
+                batch, self._queue = self._queue, []
+            self._write_locked(batch)
+
+    def close(self):
+        """Stop the flusher and write everything still queued"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def compact(self):
+        """Rewrite the journal with only the latest record per retained key"""
+        with self._write_lock:
+            self._compact_locked()
+
+    @property
+    def live_records(self) -> int:
+        if self.retain is None:
+            return len(self._keys)
+        return min(len(self._keys), self.retain)
+
+    def needs_compaction(self) -> bool:
+        return self.records_on_disk >= max(self.min_compaction_records,
+                                           self.compaction_ratio * max(1, self.live_records))
+
+    # ─── reading ───────────────────────────────────────────────────────────
+
+    def iter_records(self) -> Generator[Dict[str, Any], None, None]:
+        """Stream raw records in write order, skipping a torn or corrupt line"""
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Skipping invalid journal line {line_num} in {self.path}: {e}")
+
+    def load(self) -> Generator[Dict[str, Any], None, None]:
+        """
+        Stream the latest record per key, in order of first appearance,
+        limited to the most recent `retain` keys.
+        """
+        latest: "OrderedDict[Any, Dict[str, Any]]" = OrderedDict()
+        records = 0
+        for record in self.iter_records():
+            records += 1
+            latest[record.get(self.key)] = record
+
+        self.records_on_disk = records
+        self._keys = set(latest)
+
+        skip = len(latest) - self.retain if self.retain is not None else 0
+        for index, record in enumerate(latest.values()):
+            if index >= skip:
+                yield record
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "queued": len(self._queue),
+            "records_on_disk": self.records_on_disk,
+            "live_records": self.live_records,
+            "records_written": self.records_written,
+            "group_commits": self.group_commits,
+            "compactions": self.compactions,
+        }
+
+    # ─── internals ─────────────────────────────────────────────────────────
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._closed or len(self._queue) >= self.group_size,
+                    timeout=self.flush_interval
+                )
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Trace journal flush failed: {e}")
+
+    def _write_locked(self, batch: List[Dict[str, Any]]):
+        if batch:
+            payload = "".join(json.dumps(record, default=str) + "\n" for record in batch)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(payload)
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            self.records_on_disk += len(batch)
+            self._keys.update(record.get(self.key) for record in batch)
+            self.records_written += len(batch)
+            self.group_commits += 1
+
+        if self.needs_compaction():
+            self._compact_locked()
+
+    def _compact_locked(self):
+        records = list(self.load())
+        if self.records_on_disk == len(records):
+            return
+
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+        self.records_on_disk = len(records)
+        self._keys = {record.get(self.key) for record in records}
+        self.compactions += 1
+        logger.info(f"Compacted trace journal {self.path}: {len(records)} records")
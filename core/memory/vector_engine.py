@@ -0,0 +1,389 @@
+"""
+DAWN Vector Engine - Pure-NumPy vector indices for the memory vector index
+Used when FAISS is not installed. Vectors live in one preallocated float32
+matrix with amortised doubling growth (pre-normalised for cosine), and top-k
+selection uses argpartition instead of a full sort. IVFVectorIndex adds a
+k-means coarse quantiser so a query only scores the vectors in its nprobe
+closest lists.
+
+Both indices follow the FAISS calling convention used by DAWNVectorIndex:
+add() takes an (n, d) array, search() takes (q, d) queries and returns
+(scores, indices) arrays of shape (q, k) padded with -1 indices. Rows are
+positional; remove() tombstones rows in an alive bitmap that search masks
+out, and rebuild() produces a compacted copy holding only the given rows.
+search() also takes an optional boolean row mask (a metadata filter) that is
+applied inside top-k selection: sparse masks score only the matching rows,
+dense ones are masked out of the full scan. A trained IVF index applies a
+dense mask to its probed lists, which is approximate like any IVF search,
+and scans every matching row when the probed lists hold fewer than k.
+"""
+
+import copy
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Masks selecting at most this fraction of rows are searched by gathering them
+SPARSE_MASK_FRACTION = 0.25
+
+
+class FlatVectorIndex:
+    """Exact search over a contiguous, preallocated vector matrix"""
+
+    backend_name = "numpy-flat"
+
+    def __init__(self, dimension: int, metric: str = "cosine", capacity: int = 1024):
+        if metric not in ("cosine", "inner_product", "l2"):
+            raise ValueError(f"Unknown metric: {metric}")
+        self.dimension = dimension
+        self.metric = metric
+        self.ntotal = 0
+        self.ndead = 0
+        self._vectors = np.zeros((capacity, dimension), dtype=np.float32)
+        # Squared norms for L2 distance via ||x||^2 - 2 x.q + ||q||^2
+        self._sq_norms = np.zeros(capacity, dtype=np.float32)
+        self._alive = np.zeros(capacity, dtype=bool)
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Read-only view of the stored (normalised for cosine) vectors"""
+        view = self._vectors[:self.ntotal]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def live_count(self) -> int:
+        return self.ntotal - self.ndead
+
+    def add(self, vectors: np.ndarray):
+        """Append vectors (shape (n, d) or (d,))"""
+        vectors = self._prepare(vectors)
+        count = len(vectors)
+        self._reserve(self.ntotal + count)
+        self._vectors[self.ntotal:self.ntotal + count] = vectors
+        self._sq_norms[self.ntotal:self.ntotal + count] = np.einsum("ij,ij->i", vectors, vectors)
+        self._alive[self.ntotal:self.ntotal + count] = True
+        self.ntotal += count
+
+    def remove(self, rows) -> int:
+        """Tombstone rows so searches skip them; returns how many were live"""
+        rows = np.asarray(rows, dtype=np.int64).reshape(-1)
+        rows = np.unique(rows[(rows >= 0) & (rows < self.ntotal)])
+        rows = rows[self._alive[rows]]
+        self._alive[rows] = False
+        self.ndead += len(rows)
+        return len(rows)
+
+    def rebuild(self, keep: np.ndarray) -> "FlatVectorIndex":
+        """
+        Compacted copy holding only `keep` rows (ascending), renumbered from 0.
+        Reads rows without mutating this index, so it can run concurrently
+        with appends beyond the highest kept row.
+        """
+        rebuilt = copy.copy(self)
+        rebuilt._vectors = self._vectors[keep]
+        rebuilt._sq_norms = self._sq_norms[keep]
+        rebuilt._alive = np.ones(len(keep), dtype=bool)
+        rebuilt.ntotal = len(keep)
+        rebuilt.ndead = 0
+        return rebuilt
+
+    def search(self, queries: np.ndarray, k: int,
+               mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Top-k (scores, indices) per query among rows where mask is True (all if None);
+        cosine/IP best-first, L2 nearest-first"""
+        queries = self._prepare(queries)
+        if mask is not None:
+            return self._search_masked(queries, k, mask)
+        return self._search_rows(queries, k, None)
+
+    def reset(self):
+        self.ntotal = 0
+        self.ndead = 0
+
+    def attach(self, vectors: np.ndarray):
+        """
+        Serve already-prepared vectors (e.g. a read-only memmap) without copying.
+        The matrix becomes the storage at full capacity, so the next add()
+        copies it into owned memory and mapped pages stay untouched until then.
+        """
+        if vectors.ndim != 2 or vectors.shape[1] != self.dimension:
+            raise ValueError(f"Expected (n, {self.dimension}) vectors, got {vectors.shape}")
+        self._vectors = vectors
+        self._alive = np.ones(len(vectors), dtype=bool)
+        self.ntotal = len(vectors)
+        self.ndead = 0
+        # Only L2 scoring reads the norms; skip touching every page otherwise
+        self._sq_norms = np.einsum("ij,ij->i", vectors, vectors) if self.metric == "l2" \
+            else np.zeros(len(vectors), dtype=np.float32)
+
+    # ─── internals ─────────────────────────────────────────────────────────
+
+    def _prepare(self, vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1)
+        if vectors.shape[1] != self.dimension:
+            raise ValueError(f"Expected dimension {self.dimension}, got {vectors.shape[1]}")
+        if self.metric == "cosine":
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms > 0, norms, 1.0)
+        return vectors
+
+    def _reserve(self, size: int):
+        capacity = len(self._vectors)
+        if size <= capacity:
+            return
+        capacity = max(capacity, 16)
+        while capacity < size:
+            capacity *= 2
+        vectors = np.zeros((capacity, self.dimension), dtype=np.float32)
+        vectors[:self.ntotal] = self._vectors[:self.ntotal]
+        sq_norms = np.zeros(capacity, dtype=np.float32)
+        sq_norms[:self.ntotal] = self._sq_norms[:self.ntotal]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:self.ntotal] = self._alive[:self.ntotal]
+        self._vectors, self._sq_norms, self._alive = vectors, sq_norms, alive
+
+    def _scores(self, queries: np.ndarray, rows: Optional[np.ndarray]) -> np.ndarray:
+        """Scores oriented so that larger is better"""
+        vectors = self._vectors[:self.ntotal] if rows is None else self._vectors[rows]
+        products = queries @ vectors.T
+        if self.metric != "l2":
+            return products
+        sq_norms = self._sq_norms[:self.ntotal] if rows is None else self._sq_norms[rows]
+        return 2.0 * products - sq_norms[None, :]
+
+    def _search_masked(self, queries: np.ndarray, k: int, mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        selected = mask[:self.ntotal] & self._alive[:self.ntotal]
+        if np.count_nonzero(selected) <= SPARSE_MASK_FRACTION * self.ntotal:
+            return self._search_rows(queries, k, np.flatnonzero(selected))
+        return self._search_rows(queries, k, None, selected)
+
+    def _search_rows(self, queries: np.ndarray, k: int, rows: Optional[np.ndarray],
+                     selected: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Exact top-k over `rows` (or all rows, restricted to `selected` when given)"""
+        scores_out = np.full((len(queries), k), -np.inf if self.metric != "l2" else np.inf, dtype=np.float32)
+        indices_out = np.full((len(queries), k), -1, dtype=np.int64)
+        if rows is not None and self.ndead:
+            rows = rows[self._alive[rows]]
+        if rows is None and selected is None and self.ndead:
+            selected = self._alive[:self.ntotal]
+        if rows is not None:
+            available = len(rows)
+        else:
+            available = self.ntotal if selected is None else int(np.count_nonzero(selected))
+        if k <= 0 or available == 0:
+            return scores_out, indices_out
+
+        scores = self._scores(queries, rows)
+        if selected is not None:
+            # Excluded rows can never win: at most `available` are selected
+            scores[:, ~selected] = -np.inf
+        top = min(k, available)
+        columns = scores.shape[1]
+        if top < columns:
+            candidates = np.argpartition(-scores, top - 1, axis=1)[:, :top]
+        else:
+            candidates = np.broadcast_to(np.arange(columns), (len(queries), columns))
+        candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind="stable")
+        candidates = np.take_along_axis(candidates, order, axis=1)
+        candidate_scores = np.take_along_axis(candidate_scores, order, axis=1)
+
+        if self.metric == "l2":
+            # Convert back to squared distances
+            sq_queries = np.einsum("ij,ij->i", queries, queries)
+            candidate_scores = np.maximum(sq_queries[:, None] - candidate_scores, 0.0)
+
+        indices_out[:, :top] = candidates if rows is None else rows[candidates]
+        scores_out[:, :top] = candidate_scores
+        return scores_out, indices_out
+
+
+class IVFVectorIndex(FlatVectorIndex):
+    """
+    Inverted-file index: k-means centroids partition the vectors into lists
+    and a query scores only its nprobe closest lists. Until enough vectors
+    exist to train the quantiser it behaves as a flat index; it retrains
+    whenever the collection has grown by `retrain_factor` since training.
+    """
+
+    backend_name = "numpy-ivf"
+
+    def __init__(self, dimension: int, metric: str = "cosine", nlist: Optional[int] = None,
+                 nprobe: int = 8, capacity: int = 1024, min_train_size: int = 2048,
+                 retrain_factor: float = 4.0, kmeans_iterations: int = 10, seed: int = 7):
+        super().__init__(dimension, metric, capacity)
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.min_train_size = min_train_size
+        self.retrain_factor = retrain_factor
+        self.kmeans_iterations = kmeans_iterations
+        self._rng = np.random.default_rng(seed)
+
+        self.centroids: Optional[np.ndarray] = None
+        self.trained_size = 0
+        self._lists: List[List[int]] = []
+        self._list_arrays: List[Optional[np.ndarray]] = []
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    def add(self, vectors: np.ndarray):
+        start = self.ntotal
+        super().add(vectors)
+        if self._should_train():
+            self.train()
+        elif self.is_trained:
+            self._assign(np.arange(start, self.ntotal))
+
+    def search(self, queries: np.ndarray, k: int,
+               mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        queries = self._prepare(queries)
+        selected = None
+        if mask is not None:
+            selected = mask[:self.ntotal] & self._alive[:self.ntotal]
+            # Selective filters are cheaper (and exact) as a scan of the matching rows
+            if not self.is_trained or np.count_nonzero(selected) <= SPARSE_MASK_FRACTION * self.ntotal:
+                return self._search_masked(queries, k, mask)
+        if not self.is_trained:
+            return self._search_rows(queries, k, None)
+
+        nprobe = min(self.nprobe, len(self.centroids))
+        probe_scores = self._centroid_scores(queries)
+        probes = np.argpartition(-probe_scores, nprobe - 1, axis=1)[:, :nprobe]
+
+        scores_out = np.empty((len(queries), k), dtype=np.float32)
+        indices_out = np.empty((len(queries), k), dtype=np.int64)
+        for i, query_probes in enumerate(probes):
+            rows = np.concatenate([self._list_rows(int(p)) for p in query_probes])
+            if selected is not None:
+                rows = rows[selected[rows]]
+            if selected is not None and len(rows) < k:
+                # Too few matches in the probed lists: scan every matching row instead
+                scores, indices = self._search_rows(queries[i:i + 1], k, None, selected)
+            else:
+                scores, indices = self._search_rows(queries[i:i + 1], k, rows)
+            scores_out[i], indices_out[i] = scores[0], indices[0]
+        return scores_out, indices_out
+
+    def train(self):
+        """(Re)train the coarse quantiser on the stored vectors and reassign all lists"""
+        data = self._vectors[:self.ntotal]
+        # ~sqrt(N) lists keeps the default nprobe at a few percent of the data
+        nlist = self.nlist or int(np.clip(np.sqrt(self.ntotal), 16, 4096))
+        nlist = min(nlist, self.ntotal)
+
+        # Train on a sample (~64 points per centroid), then assign everything
+        sample_size = min(self.ntotal, max(nlist * 64, 10000))
+        sample = data[self._rng.choice(self.ntotal, sample_size, replace=False)]
+        centroids = sample[self._rng.choice(sample_size, nlist, replace=False)].copy()
+        for _ in range(self.kmeans_iterations):
+            assignment = self._nearest(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            counts = np.bincount(assignment, minlength=nlist)
+            empty = counts == 0
+            centroids[~empty] = sums[~empty] / counts[~empty, None]
+            # Re-seed empty clusters from random sample points
+            if empty.any():
+                centroids[empty] = sample[self._rng.choice(sample_size, int(empty.sum()))]
+            if self.metric == "cosine":
+                norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+                centroids /= np.where(norms > 0, norms, 1.0)
+
+        self.centroids = centroids
+        self.trained_size = self.ntotal
+        self._lists = [[] for _ in range(nlist)]
+        self._list_arrays = [None] * nlist
+        self._assign(np.arange(self.ntotal))
+        logger.debug(f"Trained IVF quantiser: {nlist} lists over {self.ntotal} vectors")
+
+    def attach(self, vectors: np.ndarray):
+        self.reset()
+        super().attach(vectors)
+        if self._should_train():
+            self.train()
+
+    def rebuild(self, keep: np.ndarray) -> "IVFVectorIndex":
+        rebuilt = super().rebuild(keep)
+        rebuilt._rng = np.random.default_rng(self._rng.integers(1 << 31))
+        if self.is_trained:
+            # Keep the quantiser; renumber list members and drop the rest
+            count = int(keep[-1]) + 1 if len(keep) else 0
+            remap = np.full(count, -1, dtype=np.int64)
+            remap[keep] = np.arange(len(keep))
+            lists = []
+            for list_id in range(len(self._lists)):
+                rows = self._list_rows(list_id)
+                rows = remap[rows[rows < count]]
+                lists.append(rows[rows >= 0].tolist())
+            rebuilt.centroids = self.centroids.copy()
+            rebuilt._lists = lists
+            rebuilt._list_arrays = [None] * len(lists)
+        elif rebuilt._should_train():
+            rebuilt.train()
+        return rebuilt
+
+    def reset(self):
+        super().reset()
+        self.centroids = None
+        self.trained_size = 0
+        self._lists = []
+        self._list_arrays = []
+
+    def list_sizes(self) -> np.ndarray:
+        return np.array([len(rows) for rows in self._lists], dtype=np.int64)
+
+    # ─── internals ─────────────────────────────────────────────────────────
+
+    def _should_train(self) -> bool:
+        if not self.is_trained:
+            return self.ntotal >= self.min_train_size
+        return self.nlist is None and self.ntotal >= self.trained_size * self.retrain_factor
+
+    def _centroid_scores(self, queries: np.ndarray) -> np.ndarray:
+        products = queries @ self.centroids.T
+        if self.metric != "l2":
+            return products
+        return 2.0 * products - np.einsum("ij,ij->i", self.centroids, self.centroids)[None, :]
+
+    def _nearest(self, vectors: np.ndarray, centroids: np.ndarray, batch: int = 8192) -> np.ndarray:
+        assignment = np.empty(len(vectors), dtype=np.int64)
+        if self.metric == "l2":
+            centroid_sq = np.einsum("ij,ij->i", centroids, centroids)
+        for start in range(0, len(vectors), batch):
+            products = vectors[start:start + batch] @ centroids.T
+            if self.metric == "l2":
+                products = 2.0 * products - centroid_sq[None, :]
+            assignment[start:start + batch] = np.argmax(products, axis=1)
+        return assignment
+
+    def _assign(self, rows: np.ndarray):
+        assignment = self._nearest(self._vectors[rows], self.centroids)
+        for row, list_id in zip(rows.tolist(), assignment.tolist()):
+            self._lists[list_id].append(row)
+            self._list_arrays[list_id] = None
+
+    def _list_rows(self, list_id: int) -> np.ndarray:
+        rows = self._list_arrays[list_id]
+        if rows is None:
+            rows = self._list_arrays[list_id] = np.array(self._lists[list_id], dtype=np.int64)
+        return rows
+
+
+def create_vector_engine(dimension: int, index_type: str = "flat", metric: str = "cosine",
+                         nlist: Optional[int] = None, nprobe: int = 8) -> FlatVectorIndex:
+    """Build the NumPy engine for an IndexConfig-style index type"""
+    if index_type == "flat":
+        return FlatVectorIndex(dimension, metric)
+    if index_type in ("ivf", "hnsw"):
+        if index_type == "hnsw":
+            logger.info("HNSW is not available in the NumPy backend - using IVF")
+        return IVFVectorIndex(dimension, metric, nlist=nlist, nprobe=nprobe)
+    raise ValueError(f"Unknown index type: {index_type}")
@@ -0,0 +1,191 @@
+"""
+DAWN Vector Filters - Metadata bitmaps for filtered vector search
+Keeps speaker/topic/mood codes, entropy and pulse-state readings for every
+row of the vector matrix in parallel NumPy columns, so a filter becomes one
+boolean mask that the search kernel applies before top-k selection, and
+pulse-state reranking is a vectorised pass over the candidate rows.
+
+Filter semantics match the original per-result checks in DAWNVectorIndex:
+chunks without a speaker/topic attribute pass those filters, chunks without
+get_mood() never match a mood filter.
+"""
+
+import math
+from typing import Any, Dict, Iterable, NamedTuple, Optional
+
+import numpy as np
+
+# Same boundaries as CognitiveRouter._get_entropy_bucket
+ENTROPY_BUCKETS = ("very_low", "low", "medium", "high", "very_high")
+ENTROPY_EDGES = np.array([0.2, 0.4, 0.6, 0.8])
+
+MISSING = -1  # value not seen / not set
+ABSENT = -2  # chunk has no such attribute
+NO_MATCH = -3  # code for a filter value no row has
+
+CODE_COLUMNS = ("speaker", "topic", "mood", "pulse_mood")
+FLOAT_COLUMNS = ("entropy", "pulse_heat", "pulse_entropy")
+
+_ATTRIBUTE_ABSENT = object()
+
+
+class FilterFields(NamedTuple):
+    """Filterable attributes of one chunk (_ATTRIBUTE_ABSENT / NaN when missing)"""
+    speaker: Any
+    topic: Any
+    mood: Any
+    pulse_mood: Any
+    entropy: float
+    pulse_heat: float
+    pulse_entropy: float
+
+
+def _number(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _pulse_fields(pulse_state: Any):
+    if not isinstance(pulse_state, dict) or not pulse_state:
+        return _ATTRIBUTE_ABSENT, math.nan, math.nan
+    return (pulse_state.get('mood', _ATTRIBUTE_ABSENT),
+            _number(pulse_state['heat']) if 'heat' in pulse_state else math.nan,
+            _number(pulse_state['entropy']) if 'entropy' in pulse_state else math.nan)
+
+
+def chunk_filter_fields(chunk: Any) -> FilterFields:
+    """Filter fields of a live chunk object"""
+    pulse_mood, pulse_heat, pulse_entropy = _pulse_fields(getattr(chunk, 'pulse_state', None))
+    return FilterFields(
+        speaker=getattr(chunk, 'speaker', _ATTRIBUTE_ABSENT),
+        topic=getattr(chunk, 'topic', _ATTRIBUTE_ABSENT),
+        mood=chunk.get_mood() if hasattr(chunk, 'get_mood') else _ATTRIBUTE_ABSENT,
+        pulse_mood=pulse_mood,
+        entropy=_number(chunk.get_entropy()) if hasattr(chunk, 'get_entropy') else math.nan,
+        pulse_heat=pulse_heat,
+        pulse_entropy=pulse_entropy,
+    )
+
+
+def memory_chunk_dict_fields(data: Dict[str, Any]) -> FilterFields:
+    """Filter fields of a MemoryChunk.to_dict() payload, without rebuilding the chunk"""
+    pulse_state = data.get('pulse_state') or {}
+    pulse_mood, pulse_heat, pulse_entropy = _pulse_fields(pulse_state)
+    return FilterFields(
+        speaker=data.get('speaker'),
+        topic=data.get('topic'),
+        mood=pulse_state.get('mood', 'neutral'),
+        pulse_mood=pulse_mood,
+        entropy=_number(pulse_state.get('entropy', 0.0)),
+        pulse_heat=pulse_heat,
+        pulse_entropy=pulse_entropy,
+    )
+
+
+class MetadataBitmaps:
+    """Per-row filter columns aligned with a vector index's row numbers"""
+
+    def __init__(self, capacity: int = 1024):
+        self.count = 0
+        self.columns: Dict[str, np.ndarray] = {name: np.full(capacity, MISSING, dtype=np.int32)
+                                               for name in CODE_COLUMNS}
+        self.columns.update({name: np.full(capacity, np.nan) for name in FLOAT_COLUMNS})
+        self.codes: Dict[str, Dict[Any, int]] = {name: {} for name in CODE_COLUMNS}
+
+    def set_rows(self, start: int, fields: Iterable[FilterFields]):
+        """Write fields for rows start, start+1, ... (growing as needed)"""
+        fields = list(fields)
+        stop = start + len(fields)
+        self._reserve(stop)
+        for offset, row_fields in enumerate(fields):
+            row = start + offset
+            for name in CODE_COLUMNS:
+                self.columns[name][row] = self._code(name, getattr(row_fields, name))
+            for name in FLOAT_COLUMNS:
+                self.columns[name][row] = getattr(row_fields, name)
+        self.count = max(self.count, stop)
+
+    def mask(self, count: int, speaker: Any = None, topic: Any = None, mood: Any = None,
+             entropy_bucket: Optional[str] = None) -> Optional[np.ndarray]:
+        """Boolean mask over the first `count` rows, or None when no filter is set"""
+        self._reserve(count)
+        mask = None
+
+        def combine(selected: np.ndarray):
+            nonlocal mask
+            mask = selected if mask is None else mask & selected
+
+        for name, value in (("speaker", speaker), ("topic", topic)):
+            if value:
+                column = self.columns[name][:count]
+                combine((column == self.codes[name].get(value, NO_MATCH)) | (column == ABSENT))
+        if mood:
+            combine(self.columns["mood"][:count] == self.codes["mood"].get(mood, NO_MATCH))
+        if entropy_bucket:
+            if entropy_bucket not in ENTROPY_BUCKETS:
+                raise ValueError(f"Unknown entropy bucket: {entropy_bucket}")
+            entropy = self.columns["entropy"][:count]
+            buckets = np.searchsorted(ENTROPY_EDGES, entropy, side="right")
+            combine(~np.isnan(entropy) & (buckets == ENTROPY_BUCKETS.index(entropy_bucket)))
+        return mask
+
+    def pulse_bonus(self, rows: np.ndarray, pulse_state: Dict[str, Any]) -> np.ndarray:
+        """Pulse-state relevance bonus for the given rows (heat, mood, entropy terms)"""
+        bonus = np.zeros(len(rows))
+        if 'heat' in pulse_state:
+            heat = self.columns["pulse_heat"][rows]
+            similarity = 1.0 - np.abs(_number(pulse_state['heat']) - heat) / 100.0
+            bonus += np.where(np.isnan(heat), 0.0, np.maximum(0.0, similarity) * 0.2)
+        if 'mood' in pulse_state:
+            code = self.codes["pulse_mood"].get(pulse_state['mood'], NO_MATCH)
+            bonus += np.where(self.columns["pulse_mood"][rows] == code, 0.3, 0.0)
+        if 'entropy' in pulse_state:
+            entropy = self.columns["pulse_entropy"][rows]
+            similarity = 1.0 - np.abs(_number(pulse_state['entropy']) - entropy)
+            bonus += np.where(np.isnan(entropy), 0.0, np.maximum(0.0, similarity) * 0.2)
+        return bonus
+
+    def compacted(self, remap: np.ndarray, count: int) -> "MetadataBitmaps":
+        """Copy keeping rows with remap[row] >= 0, renumbered to remap[row]"""
+        compacted = MetadataBitmaps(max(count, 1))
+        compacted.codes = self.codes
+        old_rows = np.flatnonzero(remap[:self.count] >= 0)
+        for name, column in self.columns.items():
+            compacted.columns[name][remap[old_rows]] = column[old_rows]
+        compacted.count = count
+        return compacted
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            "rows": self.count,
+            "values": {name: len(codes) for name, codes in self.codes.items()},
+            "nbytes": int(sum(column.nbytes for column in self.columns.values())),
+        }
+
+    # ─── internals ─────────────────────────────────────────────────────────
+
+    def _code(self, column: str, value: Any) -> int:
+        if value is _ATTRIBUTE_ABSENT:
+            return ABSENT
+        try:
+            hash(value)
+        except TypeError:
+            value = str(value)
+        codes = self.codes[column]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+        return code
+
+    def _reserve(self, size: int):
+        capacity = len(self.columns["speaker"])
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        for name, column in self.columns.items():
+            grown = np.full(capacity, MISSING if column.dtype == np.int32 else np.nan, dtype=column.dtype)
+            grown[:len(column)] = column
+            self.columns[name] = grown
@@ -5,13 +5,21 @@ Integrates with existing memory infrastructure and supports FAISS backend.
 """
 
 import uuid
+import hashlib
+import json
 import numpy as np
 import logging
 import threading
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 from collections import defaultdict
 import time
+from pathlib import Path
+
+from .memory_chunk import MemoryChunk
+from .vector_engine import FlatVectorIndex, create_vector_engine
+from .vector_filters import MetadataBitmaps, chunk_filter_fields, memory_chunk_dict_fields
+from .vector_store import VectorSnapshotStore
 
 try:
     import faiss
@@ -34,26 +42,24 @@ class SimpleEmbedder:
     
     def embed_text(self, text: str) -> List[float]:
         """Generate embedding for text content."""
-        # Simple hash-based embedding for development
-        # In production, this would use a proper embedding model
-        import hashlib
-        
-        # Create a simple hash-based vector
-        hash_obj = hashlib.md5(text.lower().encode())
-        hash_bytes = hash_obj.digest()
-        
-        # Convert to float vector
-        vector = []
-        for i in range(0, len(hash_bytes), 4):
-            chunk_bytes = hash_bytes[i:i+4].ljust(4, b'\x00')
-            float_val = int.from_bytes(chunk_bytes, 'little') / (2**32)
-            vector.append(float_val)
-        
-        # Pad or truncate to desired dimension
-        while len(vector) < self.dimension:
-            vector.extend(vector[:min(len(vector), self.dimension - len(vector))])
+        return self.embed_texts([text])[0].tolist()
+    
+    def embed_batch(self, chunks: Sequence[Any]) -> np.ndarray:
+        """Generate an (n, dimension) embedding matrix for memory chunks."""
+        return self.embed_texts([self._extract_text(chunk) for chunk in chunks])
+    
+    def embed_texts(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Generate an (n, dimension) embedding matrix for texts.
         
-        return vector[:self.dimension]
+        Simple hash-based embedding for development (in production this would
+        use a proper embedding model): each MD5 digest is read as four
+        little-endian uint32 words scaled into [0, 1) and tiled across the
+        dimension. The whole batch is decoded with one frombuffer call.
+        """
+        digests = b"".join(hashlib.md5(text.lower().encode()).digest() for text in texts)
+        words = np.frombuffer(digests, dtype="<u4").reshape(len(texts), 4) / (2**32)
+        return words[:, np.arange(self.dimension) % 4]
     
     def _extract_text(self, chunk) -> str:
         """Extract text content from memory chunk."""
@@ -85,44 +91,56 @@ class IndexConfig:
     index_type: str = "flat"  # flat, ivf, hnsw
     metric: str = "cosine"  # cosine, l2, inner_product
     normalize_vectors: bool = True
+    nlist: Optional[int] = None  # IVF lists (None = sqrt(N), retrained as the index grows)
+    nprobe: int = 8  # IVF lists scanned per query
+    compaction_ratio: float = 0.25  # compact once this fraction of rows is tombstoned
+    min_compaction_rows: int = 1024  # ...and at least this many rows are dead
 
 
-class MockVectorIndex:
-    """Fallback vector index using cosine similarity"""
+# Backward-compatible name for the non-FAISS fallback
+MockVectorIndex = FlatVectorIndex
+
+# Sidecar record of a row whose chunk was removed before it was saved
+REMOVED_RECORD = b"{}"
+
+
+class _DeferredRecord:
+    """Undecoded snapshot sidecar line"""
+    __slots__ = ("line",)
     
-    def __init__(self, dimension: int):
-        self.dimension = dimension
-        self.vectors: List[np.ndarray] = []
-        self.chunk_ids: List[str] = []
-        
-    def add(self, vectors: np.ndarray):
-        """Add vectors to the mock index"""
-        if len(vectors.shape) == 1:
-            vectors = vectors.reshape(1, -1)
-        
-        for vector in vectors:
-            self.vectors.append(vector)
+    def __init__(self, line: bytes):
+        self.line = line
+
+
+class _LazyRecordMap(dict):
+    """chunk_id -> value dict whose snapshot-restored values are built on first access"""
     
-    def search(self, query_vector: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
-        """Search for similar vectors using cosine similarity"""
-        if not self.vectors:
-            return np.array([]), np.array([])
-        
-        # Stack all vectors
-        all_vectors = np.stack(self.vectors)
-        
-        # Normalize query and stored vectors
-        query_norm = query_vector / (np.linalg.norm(query_vector) + 1e-8)
-        vectors_norm = all_vectors / (np.linalg.norm(all_vectors, axis=1, keepdims=True) + 1e-8)
-        
-        # Calculate cosine similarities
-        similarities = np.dot(vectors_norm, query_norm)
-        
-        # Get top-k indices
-        top_indices = np.argsort(similarities)[::-1][:k]
-        top_scores = similarities[top_indices]
-        
-        return top_scores, top_indices
+    def __init__(self, materialise: Callable[[str, bytes], Any]):
+        super().__init__()
+        self._materialise = materialise
+    
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if type(value) is _DeferredRecord:
+            value = self._materialise(key, value.line)
+            super().__setitem__(key, value)
+        return value
+    
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+    
+    def pop(self, key, *default):
+        if key not in self:
+            return super().pop(key, *default)
+        value = self[key]
+        del self[key]
+        return value
+    
+    def values(self):
+        return [self[key] for key in self]
+    
+    def items(self):
+        return [(key, self[key]) for key in self]
 
 
 class DAWNVectorIndex:
@@ -133,8 +151,8 @@ class DAWNVectorIndex:
         self.embedder = embedder or SimpleEmbedder(dimension=self.config.dimension)
         
         # Storage for chunks and metadata
-        self.chunks: Dict[str, Any] = {}  # chunk_id -> MemoryChunk
-        self.chunk_metadata: Dict[str, Dict] = {}  # chunk_id -> metadata
+        self.chunks: Dict[str, Any] = _LazyRecordMap(self._materialise_chunk)  # chunk_id -> MemoryChunk
+        self.chunk_metadata: Dict[str, Dict] = _LazyRecordMap(self._materialise_metadata)  # chunk_id -> metadata
         self.id_to_index: Dict[str, int] = {}  # chunk_id -> vector index position
         self.index_to_id: Dict[int, str] = {}  # vector index position -> chunk_id
         
@@ -145,34 +163,59 @@ class DAWNVectorIndex:
         # Thread safety
         self.lock = threading.RLock()
         
+        # Per-row filter columns (rows restored from a snapshot are filled on first use)
+        self.filters = MetadataBitmaps()
+        self._pending_filter_lines: Optional[List[bytes]] = None
+        
+        # Tombstoned rows (masked by the backend until the next compaction)
+        self.tombstones = 0
+        self._compacting = False
+        self._compaction_thread: Optional[threading.Thread] = None
+        self._generation = 0  # bumped whenever row positions are reassigned
+        
+        # On-disk snapshot (rows [0, persisted_count) are already saved there)
+        self.snapshot_store: Optional[VectorSnapshotStore] = None
+        self.persisted_count = 0
+        self._deleted_since_save: List[int] = []
+        self._snapshot_stale = False
+        
         # Integration with DAWN memory systems
         self.dawn_integration_enabled = True
         
         self._initialize_index()
         
         logger.info(f"🔍 DAWN Vector Index initialized")
-        logger.info(f"   Backend: {'FAISS' if self.config.use_faiss else 'Mock'}")
+        logger.info(f"   Backend: {'FAISS' if self.config.use_faiss else self.vector_index.backend_name}")
         logger.info(f"   Dimensions: {self.config.dimension}")
         logger.info(f"   Metric: {self.config.metric}")
     
     def _initialize_index(self):
         """Initialize the vector index backend"""
+        self.vector_index = self._create_backend()
+        self.tombstones = 0
+        self._generation += 1
+    
+    def _create_backend(self):
+        """Create an empty vector index backend for the configuration"""
         if self.config.use_faiss and FAISS_AVAILABLE:
             # Initialize FAISS index
             if self.config.index_type == "flat":
                 if self.config.metric == "cosine":
-                    self.vector_index = faiss.IndexFlatIP(self.config.dimension)  # Inner product for cosine
+                    return faiss.IndexFlatIP(self.config.dimension)  # Inner product for cosine
                 elif self.config.metric == "l2":
-                    self.vector_index = faiss.IndexFlatL2(self.config.dimension)
+                    return faiss.IndexFlatL2(self.config.dimension)
                 else:
-                    self.vector_index = faiss.IndexFlatIP(self.config.dimension)
+                    return faiss.IndexFlatIP(self.config.dimension)
             else:
                 # Default to flat index
-                self.vector_index = faiss.IndexFlatIP(self.config.dimension)
+                return faiss.IndexFlatIP(self.config.dimension)
         else:
-            # Use mock index
-            self.vector_index = MockVectorIndex(self.config.dimension)
+            # Pure-NumPy engine (flat, or IVF for sub-linear search)
             self.config.use_faiss = False
+            return create_vector_engine(
+                self.config.dimension, self.config.index_type, self.config.metric,
+                nlist=self.config.nlist, nprobe=self.config.nprobe
+            )
     
     def add(self, chunk: Any, vector: Optional[List[float]] = None):
         """
@@ -199,34 +242,80 @@ class DAWNVectorIndex:
                 else:
                     vector = vector[:self.config.dimension]
             
-            # Normalize vector if configured
-            if self.config.normalize_vectors:
-                vector_array = np.array(vector, dtype=np.float32)
-                norm = np.linalg.norm(vector_array)
-                if norm > 0:
-                    vector_array = vector_array / norm
-            else:
-                vector_array = np.array(vector, dtype=np.float32)
+            self._add_vectors([chunk_id], [chunk], np.array(vector, dtype=np.float32).reshape(1, -1))
             
-            # Add to index mappings
-            current_index = self.vector_count
-            self.id_to_index[chunk_id] = current_index
-            self.index_to_id[current_index] = chunk_id
+            logger.debug(f"📚 Added chunk {chunk_id[:8]}... to vector index (total: {self.vector_count})")
+    
+    def add_batch(self, chunks: Sequence[Any], vectors: Optional[np.ndarray] = None,
+                  skip_existing: bool = False) -> List[str]:
+        """
+        Add many memory chunks with one embedding pass and one index insert.
+        
+        Args:
+            chunks: MemoryChunk objects to add
+            vectors: Pre-computed (n, dimension) embedding matrix (optional)
+            skip_existing: Leave chunks already in the index (e.g. restored
+                from a snapshot) untouched instead of embedding them again
             
-            # Store chunk and metadata
+        Returns:
+            List[str]: Chunk IDs in input order
+        """
+        if skip_existing:
+            with self.lock:
+                keep = [i for i, chunk in enumerate(chunks) if self._get_chunk_id(chunk) not in self.chunks]
+            chunks = [chunks[i] for i in keep]
+            if vectors is not None:
+                vectors = np.asarray(vectors)[keep]
+        if not chunks:
+            return []
+        
+        # Embed outside the lock; hashing dominates and needs no shared state
+        if vectors is None:
+            vectors = self.embedder.embed_batch(chunks)
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or len(vectors) != len(chunks):
+            raise ValueError(f"Expected {len(chunks)} vectors, got shape {vectors.shape}")
+        
+        if vectors.shape[1] != self.config.dimension:
+            logger.warning(f"Vector dimension mismatch: expected {self.config.dimension}, got {vectors.shape[1]}")
+            fitted = np.zeros((len(vectors), self.config.dimension), dtype=np.float32)
+            width = min(vectors.shape[1], self.config.dimension)
+            fitted[:, :width] = vectors[:, :width]
+            vectors = fitted
+        
+        with self.lock:
+            chunk_ids = [self._get_chunk_id(chunk) for chunk in chunks]
+            self._add_vectors(chunk_ids, chunks, vectors)
+        
+        logger.debug(f"📚 Added {len(chunk_ids)} chunks to vector index (total: {self.vector_count})")
+        return chunk_ids
+    
+    def _add_vectors(self, chunk_ids: List[str], chunks: Sequence[Any], vectors: np.ndarray):
+        """Normalize and append a vector matrix with its mappings (lock held)"""
+        if self.config.normalize_vectors:
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms > 0, norms, 1.0)
+        
+        # Add to index mappings and store chunks with metadata
+        start = self.vector_count
+        replaced = []
+        for offset, (chunk_id, chunk) in enumerate(zip(chunk_ids, chunks)):
+            previous = self.id_to_index.get(chunk_id)
+            if previous is not None:
+                replaced.append(previous)
+            self.id_to_index[chunk_id] = start + offset
+            self.index_to_id[start + offset] = chunk_id
             self.chunks[chunk_id] = chunk
             self.chunk_metadata[chunk_id] = self._extract_metadata(chunk)
-            
-            # Add to vector index
-            if self.config.use_faiss:
-                self.vector_index.add(vector_array.reshape(1, -1))
-            else:
-                self.vector_index.add(vector_array)
-                self.vector_index.chunk_ids.append(chunk_id)
-            
-            self.vector_count += 1
-            
-            logger.debug(f"📚 Added chunk {chunk_id[:8]}... to vector index (total: {self.vector_count})")
+        self.filters.set_rows(start, [chunk_filter_fields(chunk) for chunk in chunks])
+        
+        # Add to vector index
+        self.vector_index.add(np.ascontiguousarray(vectors, dtype=np.float32))
+        self.vector_count += len(chunk_ids)
+        
+        # Re-added chunks supersede their old rows
+        if replaced:
+            self._tombstone_rows(replaced)
     
     def search(self, query: str, top_k: int = 3) -> List[SearchResult]:
         """
@@ -240,45 +329,63 @@ class DAWNVectorIndex:
             List[SearchResult]: Ranked search results
         """
         with self.lock:
-            if self.vector_count == 0:
-                return []
-            
-            # Generate query embedding
-            query_vector = self.embedder.embed_text(query)
-            query_array = np.array(query_vector, dtype=np.float32)
-            
-            # Normalize query vector if configured
-            if self.config.normalize_vectors:
-                norm = np.linalg.norm(query_array)
-                if norm > 0:
-                    query_array = query_array / norm
-            
-            # Perform search
-            if self.config.use_faiss:
-                scores, indices = self.vector_index.search(query_array.reshape(1, -1), min(top_k, self.vector_count))
-                scores = scores[0]  # Remove batch dimension
-                indices = indices[0]
-            else:
-                scores, indices = self.vector_index.search(query_array, min(top_k, self.vector_count))
-            
-            # Build results
-            results = []
-            for rank, (score, idx) in enumerate(zip(scores, indices)):
-                if idx < 0 or idx >= self.vector_count:  # FAISS can return -1 for empty slots
-                    continue
-                    
-                chunk_id = self.index_to_id.get(idx)
-                if chunk_id and chunk_id in self.chunks:
-                    result = SearchResult(
-                        chunk=self.chunks[chunk_id],
-                        score=float(score),
-                        chunk_id=chunk_id,
-                        rank=rank
-                    )
-                    results.append(result)
-            
-            logger.debug(f"🔍 Vector search for '{query[:30]}...' returned {len(results)} results")
-            return results
+            rows, scores = self._search_live_rows(query, top_k)
+            results = self._build_results(rows, scores)
+        
+        logger.debug(f"🔍 Vector search for '{query[:30]}...' returned {len(results)} results")
+        return results
+    
+    def _search_live_rows(self, query: str, top_k: int,
+                          mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Top-k live rows (and scores) for a query, restricted to `mask` rows (lock held)"""
+        if self.vector_count == 0 or top_k <= 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        
+        # Generate query embedding
+        query_array = np.array(self.embedder.embed_text(query), dtype=np.float32)
+        
+        # Normalize query vector if configured
+        if self.config.normalize_vectors:
+            norm = np.linalg.norm(query_array)
+            if norm > 0:
+                query_array = query_array / norm
+        
+        # Perform search; NumPy engines mask tombstones and filters inside top-k
+        # selection, other backends (FAISS) over-fetch and are filtered here
+        query_array = query_array.reshape(1, -1)
+        if not hasattr(self.vector_index, 'remove'):
+            fetch = self.vector_count if mask is not None else top_k + self.tombstones
+            scores, indices = self.vector_index.search(query_array, min(fetch, self.vector_count))
+        elif mask is None:
+            scores, indices = self.vector_index.search(query_array, min(top_k, self.vector_count))
+        else:
+            scores, indices = self.vector_index.search(query_array, min(top_k, self.vector_count), mask=mask)
+        scores = scores[0]  # Remove batch dimension
+        indices = indices[0]
+        
+        # FAISS can return -1 for empty slots
+        valid = (indices >= 0) & (indices < self.vector_count)
+        if mask is not None:
+            valid &= mask[np.clip(indices, 0, self.vector_count - 1)]
+        rows, scores = indices[valid], scores[valid]
+        
+        # Keep rows that are still the current row of a stored chunk
+        live = [i for i, row in enumerate(rows.tolist())
+                if self.id_to_index.get(self.index_to_id.get(row)) == row]
+        return rows[live][:top_k], scores[live][:top_k]
+    
+    def _build_results(self, rows: np.ndarray, scores: np.ndarray) -> List[SearchResult]:
+        """SearchResults in row order (lock held)"""
+        results = []
+        for rank, (row, score) in enumerate(zip(rows.tolist(), scores.tolist())):
+            chunk_id = self.index_to_id[row]
+            results.append(SearchResult(
+                chunk=self.chunks[chunk_id],
+                score=float(score),
+                chunk_id=chunk_id,
+                rank=rank
+            ))
+        return results
     
     def search_by_chunk(self, chunk: Any, top_k: int = 3) -> List[SearchResult]:
         """
@@ -305,6 +412,11 @@ class DAWNVectorIndex:
         """
         Hybrid scoring with pulse state integration (DAWN-specific).
         
+        The top_k * 2 semantic candidates are reranked in one vectorised pass:
+        heat and entropy similarity (0.2 each) and a matching mood (0.3) are
+        added to the similarity score, using the pulse readings stored in the
+        filter columns when each chunk was indexed.
+        
         Args:
             query: Search query string
             pulse_state: Current pulse state for relevance weighting
@@ -313,57 +425,29 @@ class DAWNVectorIndex:
         Returns:
             List[SearchResult]: Ranked search results with pulse state weighting
         """
-        # Get base semantic results
-        base_results = self.search(query, top_k * 2)  # Get more to allow for reranking
-        
-        # Apply pulse state weighting
-        weighted_results = []
-        for result in base_results:
-            chunk = result.chunk
-            
-            # Calculate pulse state similarity bonus
-            pulse_bonus = 0.0
-            
-            if hasattr(chunk, 'pulse_state') and chunk.pulse_state:
-                chunk_pulse = chunk.pulse_state
-                
-                # Heat level boost for urgent memories
-                if 'heat' in pulse_state and 'heat' in chunk_pulse:
-                    heat_similarity = 1.0 - abs(pulse_state['heat'] - chunk_pulse['heat']) / 100.0
-                    pulse_bonus += max(0, heat_similarity) * 0.2
-                
-                # Mood-based relevance weighting
-                if 'mood' in pulse_state and 'mood' in chunk_pulse:
-                    if pulse_state['mood'] == chunk_pulse['mood']:
-                        pulse_bonus += 0.3
-                
-                # Entropy state similarity
-                if 'entropy' in pulse_state and 'entropy' in chunk_pulse:
-                    entropy_similarity = 1.0 - abs(pulse_state['entropy'] - chunk_pulse['entropy'])
-                    pulse_bonus += max(0, entropy_similarity) * 0.2
+        with self.lock:
+            # Get base semantic candidates (more than top_k to allow for reranking)
+            rows, scores = self._search_live_rows(query, top_k * 2)
+            self._ensure_filters()
             
-            # Create new result with adjusted score
-            adjusted_result = SearchResult(
-                chunk=result.chunk,
-                score=result.score + pulse_bonus,
-                chunk_id=result.chunk_id,
-                rank=result.rank
-            )
-            weighted_results.append(adjusted_result)
-        
-        # Re-sort by adjusted score and limit results
-        weighted_results.sort(key=lambda x: x.score, reverse=True)
+            # Apply pulse state weighting and re-sort (stable, like the list sort it replaces)
+            adjusted = scores.astype(np.float64) + self.filters.pulse_bonus(rows, pulse_state)
+            order = np.argsort(-adjusted, kind="stable")[:top_k]
+            results = self._build_results(rows[order], adjusted[order])
         
-        # Update ranks
-        for i, result in enumerate(weighted_results[:top_k]):
-            result.rank = i
-        
-        logger.debug(f"🌡️ Pulse-weighted search returned {len(weighted_results[:top_k])} results")
-        return weighted_results[:top_k]
+        logger.debug(f"🌡️ Pulse-weighted search returned {len(results)} results")
+        return results
     
-    def search_with_filters(self, query: str, speaker: str = None, topic: str = None, mood: str = None, top_k: int = 3) -> List[SearchResult]:
+    def search_with_filters(self, query: str, speaker: str = None, topic: str = None, mood: str = None,
+                            top_k: int = 3, entropy_bucket: str = None) -> List[SearchResult]:
         """
-        Filtered search by speaker, topic, or mood (DAWN-specific).
+        Filtered search by speaker, topic, mood or entropy bucket (DAWN-specific).
+        
+        Filters are evaluated on the metadata bitmaps and applied inside the
+        top-k kernel, so the result is the top-k among matching chunks and is
+        never short while enough chunks match, however selective the filter
+        is. It is exact except with index_type="ivf" and a broad filter, where
+        it is as approximate as unfiltered IVF search.
         
         Args:
             query: Search query string
@@ -371,43 +455,161 @@ class DAWNVectorIndex:
             topic: Filter by topic
             mood: Filter by mood state
             top_k: Number of top results to return
+            entropy_bucket: Filter by entropy bucket (very_low, low, medium, high, very_high)
             
         Returns:
             List[SearchResult]: Filtered search results
         """
-        # Get all semantic results
-        all_results = self.search(query, self.vector_count)
+        with self.lock:
+            self._ensure_filters()
+            mask = self.filters.mask(self.vector_count, speaker=speaker, topic=topic,
+                                     mood=mood, entropy_bucket=entropy_bucket)
+            rows, scores = self._search_live_rows(query, top_k, mask)
+            results = self._build_results(rows, scores)
+        
+        logger.debug(f"🔍 Filtered search returned {len(results)} results")
+        return results
+    
+    def _ensure_filters(self):
+        """Fill filter columns for snapshot-restored rows from their sidecar records (lock held)"""
+        lines = self._pending_filter_lines
+        if lines is None:
+            return
+        self._pending_filter_lines = None
+        fields = []
+        for line in lines:
+            record = json.loads(line)
+            if record.get('type') == 'MemoryChunk':
+                fields.append(memory_chunk_dict_fields(record['chunk']))
+            else:
+                fields.append(chunk_filter_fields(record.get('chunk')))
+        self.filters.set_rows(0, fields)
+    
+    def save(self, directory: Optional[str] = None) -> int:
+        """
+        Persist the index as a memory-mappable snapshot.
         
-        # Apply filters
-        filtered_results = []
-        for result in all_results:
-            chunk = result.chunk
-            
-            # Apply speaker filter
-            if speaker and hasattr(chunk, 'speaker') and chunk.speaker != speaker:
-                continue
+        Saving again to the same directory only appends the rows added and the
+        tombstones recorded since the last save or load; a different directory,
+        or the first save after a compaction renumbered the rows, gets a full
+        snapshot.
+        
+        Args:
+            directory: Snapshot directory (defaults to the last one used)
             
-            # Apply topic filter
-            if topic and hasattr(chunk, 'topic') and chunk.topic != topic:
-                continue
+        Returns:
+            int: Number of rows written
+        """
+        with self.lock:
+            if directory is None and self.snapshot_store is None:
+                raise ValueError("No snapshot directory given")
+            store = self.snapshot_store
+            rewrite = self._snapshot_stale
+            if directory is not None and (store is None or store.directory != Path(directory)):
+                store = VectorSnapshotStore(Path(directory))
+                rewrite = True
+            if rewrite:
+                store.reset()
+                self.persisted_count = 0
+                self._deleted_since_save = []
             
-            # Apply mood filter
-            if mood:
-                chunk_mood = getattr(chunk, 'get_mood', lambda: None)()
-                if chunk_mood != mood:
-                    continue
+            start = self.persisted_count
+            if start < self.vector_count or self._deleted_since_save:
+                ids = [self.index_to_id[row] for row in range(start, self.vector_count)]
+                records = [self._snapshot_record(chunk_id) if self.id_to_index.get(chunk_id) == row else {}
+                           for row, chunk_id in enumerate(ids, start)]
+                store.append(self._stored_vectors(start), ids, records, self._deleted_since_save)
             
-            filtered_results.append(result)
+            written = self.vector_count - start
+            self.snapshot_store = store
+            self.persisted_count = self.vector_count
+            self._deleted_since_save = []
+            self._snapshot_stale = False
+            logger.info(f"💾 Saved {written} vectors to {store.directory} (total: {self.vector_count})")
+            return written
+    
+    def load(self, directory: str) -> int:
+        """
+        Replace the index contents with a snapshot written by save().
+        
+        Vectors are memory-mapped read-only rather than re-embedded, and
+        chunks and metadata are decoded from the sidecar on first access, so
+        the load cost is reading the ID table.
+        
+        Args:
+            directory: Snapshot directory
             
-            if len(filtered_results) >= top_k:
-                break
+        Returns:
+            int: Number of rows loaded
+        """
+        store = VectorSnapshotStore(Path(directory))
+        vectors, ids, lines, deleted = store.load(parse_records=False)
+        if store.exists() and store.dimension != self.config.dimension:
+            raise ValueError(f"Snapshot dimension {store.dimension} != index dimension {self.config.dimension}")
         
-        # Update ranks
-        for i, result in enumerate(filtered_results):
-            result.rank = i
+        with self.lock:
+            self.chunks.clear()
+            self.chunk_metadata.clear()
+            self._initialize_index()
+            self.filters = MetadataBitmaps()
+            self._pending_filter_lines = lines
+            
+            if hasattr(self.vector_index, 'attach'):
+                self.vector_index.attach(vectors)
+            elif len(vectors):
+                self.vector_index.add(np.ascontiguousarray(vectors, dtype=np.float32))
+            
+            # Rows removed before they were saved have empty records
+            dead = set(deleted.tolist())
+            dead.update(row for row, line in enumerate(lines) if line == REMOVED_RECORD)
+            
+            self.index_to_id = dict(enumerate(ids))
+            self.id_to_index = {chunk_id: row for row, chunk_id in enumerate(ids) if row not in dead}
+            deferred = [(chunk_id, _DeferredRecord(line)) for row, (chunk_id, line) in enumerate(zip(ids, lines))
+                        if row not in dead]
+            self.chunks.update(deferred)
+            self.chunk_metadata.update(deferred)
+            self.vector_count = len(ids)
+            if dead:
+                self._tombstone_rows(sorted(dead), persisted=False)
+            
+            self.snapshot_store = store
+            self.persisted_count = self.vector_count
+            self._deleted_since_save = []
+            self._snapshot_stale = False
         
-        logger.debug(f"🔍 Filtered search returned {len(filtered_results)} results")
-        return filtered_results
+        logger.info(f"📂 Loaded {self.vector_count} vectors from {directory}")
+        return self.vector_count
+    
+    def _stored_vectors(self, start: int) -> np.ndarray:
+        """Rows [start, vector_count) exactly as held by the backend"""
+        if hasattr(self.vector_index, 'vectors'):
+            return self.vector_index.vectors[start:self.vector_count]
+        return self.vector_index.reconstruct_n(start, self.vector_count - start)
+    
+    def _snapshot_record(self, chunk_id: str) -> Dict[str, Any]:
+        """Sidecar record for a row (empty once the chunk was removed)"""
+        chunk = self.chunks.get(chunk_id)
+        if chunk is None:
+            return {}
+        return {
+            'type': type(chunk).__name__,
+            'chunk': chunk.to_dict() if hasattr(chunk, 'to_dict') else self._extract_text(chunk),
+            'added_timestamp': self.chunk_metadata.get(chunk_id, {}).get('added_timestamp'),
+        }
+    
+    def _materialise_chunk(self, chunk_id: str, line: bytes) -> Any:
+        record = json.loads(line)
+        if record.get('type') == 'MemoryChunk':
+            return MemoryChunk.from_dict(record['chunk'])
+        return record['chunk']
+    
+    def _materialise_metadata(self, chunk_id: str, line: bytes) -> Dict[str, Any]:
+        metadata = self._extract_metadata(self.chunks[chunk_id])
+        added_timestamp = json.loads(line).get('added_timestamp')
+        if added_timestamp is not None:
+            metadata['added_timestamp'] = added_timestamp
+        return metadata
     
     def get_chunk(self, chunk_id: str) -> Optional[Any]:
         """Get a specific chunk by ID"""
@@ -416,7 +618,8 @@ class DAWNVectorIndex:
     def remove_chunk(self, chunk_id: str) -> bool:
         """
         Remove a chunk from the index.
-        Note: FAISS doesn't support efficient removal, so this is a logical removal.
+        The vector row is tombstoned (masked out of searches) and reclaimed by
+        a background compaction once dead rows pass the configured threshold.
         """
         with self.lock:
             if chunk_id not in self.chunks:
@@ -425,19 +628,117 @@ class DAWNVectorIndex:
             # Remove from storage
             del self.chunks[chunk_id]
             del self.chunk_metadata[chunk_id]
+            row = self.id_to_index.pop(chunk_id, None)
+            if row is not None:
+                self._tombstone_rows([row])
+            
+            if self.needs_compaction():
+                self._schedule_compaction()
             
-            # Note: Actual vector removal from FAISS would require rebuilding the index
-            # For now, we just mark it as removed in our metadata
-            logger.debug(f"🗑️ Marked chunk {chunk_id[:8]}... for removal (index rebuild needed)")
+            logger.debug(f"🗑️ Tombstoned chunk {chunk_id[:8]}... ({self.tombstones} dead rows)")
             return True
     
+    def needs_compaction(self) -> bool:
+        """Whether enough rows are tombstoned to be worth a compaction"""
+        return self.tombstones > max(self.config.min_compaction_rows,
+                                     self.config.compaction_ratio * self.vector_count)
+    
+    def compact(self) -> int:
+        """
+        Rewrite the backend and ID maps without tombstoned rows.
+        
+        The compacted matrix is built outside the lock, so searches and adds
+        continue meanwhile; rows added or removed during the rebuild are
+        reconciled before the new backend is swapped in.
+        
+        Returns:
+            int: Number of rows reclaimed
+        """
+        with self.lock:
+            if self._compacting or not self.tombstones:
+                return 0
+            self._compacting = True
+            self._ensure_filters()
+            generation, backend, count = self._generation, self.vector_index, self.vector_count
+            keep = np.sort(np.fromiter(self.id_to_index.values(), dtype=np.int64, count=len(self.id_to_index)))
+            if not hasattr(backend, 'rebuild'):
+                stored = self._stored_vectors(0)
+        
+        try:
+            if hasattr(backend, 'rebuild'):
+                rebuilt = backend.rebuild(keep)
+            else:
+                rebuilt = self._create_backend()
+                if len(keep):
+                    rebuilt.add(np.ascontiguousarray(stored[keep]))
+            
+            with self.lock:
+                if generation != self._generation:
+                    return 0  # Index was reloaded or reset meanwhile
+                
+                # Append rows added during the rebuild, then renumber everything
+                if self.vector_count > count:
+                    rebuilt.add(np.ascontiguousarray(self._stored_vectors(count)))
+                remap = np.full(self.vector_count, -1, dtype=np.int64)
+                remap[keep] = np.arange(len(keep))
+                remap[count:] = np.arange(len(keep), len(keep) + self.vector_count - count)
+                reclaimed = self.vector_count - int((remap >= 0).sum())
+                
+                self.index_to_id = {int(remap[row]): chunk_id for row, chunk_id in self.index_to_id.items()
+                                    if remap[row] >= 0}
+                self.id_to_index = {chunk_id: int(remap[row]) for chunk_id, row in self.id_to_index.items()}
+                self.vector_index = rebuilt
+                self.vector_count = len(self.index_to_id)
+                self.filters = self.filters.compacted(remap, self.vector_count)
+                self._generation += 1
+                
+                # Rows removed during the rebuild are still tombstones in the new numbering
+                live = np.zeros(self.vector_count, dtype=bool)
+                live[list(self.id_to_index.values())] = True
+                self.tombstones = 0
+                self._tombstone_rows(np.flatnonzero(~live).tolist(), persisted=False)
+                
+                # Row positions changed, so the next save rewrites the snapshot
+                self._snapshot_stale = True
+                self.persisted_count = 0
+                self._deleted_since_save = []
+            
+            logger.info(f"🧹 Compacted vector index: reclaimed {reclaimed} rows ({self.vector_count} remain)")
+            return reclaimed
+        finally:
+            with self.lock:
+                self._compacting = False
+    
+    def wait_for_compaction(self, timeout: Optional[float] = None):
+        """Block until a running background compaction finishes"""
+        thread = self._compaction_thread
+        if thread is not None:
+            thread.join(timeout)
+    
+    def _schedule_compaction(self):
+        if self._compacting or (self._compaction_thread and self._compaction_thread.is_alive()):
+            return
+        self._compaction_thread = threading.Thread(target=self.compact, name="dawn-vector-compaction", daemon=True)
+        self._compaction_thread.start()
+    
+    def _tombstone_rows(self, rows: List[int], persisted: bool = True):
+        """Mask rows in the backend and record saved ones for the snapshot"""
+        if not rows:
+            return
+        if hasattr(self.vector_index, 'remove'):
+            self.vector_index.remove(rows)
+        self.tombstones += len(rows)
+        if persisted:
+            self._deleted_since_save.extend(row for row in rows if row < self.persisted_count)
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get index statistics"""
         with self.lock:
             return {
                 'total_chunks': len(self.chunks),
                 'vector_count': self.vector_count,
-                'backend': 'faiss' if self.config.use_faiss else 'mock',
+                'tombstones': self.tombstones,
+                'backend': 'faiss' if self.config.use_faiss else self.vector_index.backend_name,
                 'dimension': self.config.dimension,
                 'metric': self.config.metric,
                 'memory_usage_mb': self._estimate_memory_usage(),
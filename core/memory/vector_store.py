@@ -0,0 +1,214 @@
+"""
+DAWN Vector Snapshot Store - On-disk vectors, ID table and metadata for DAWNVectorIndex
+
+Layout of the store directory:
+    vectors.npy       float32 (rows, dimension) matrix in standard .npy format
+    ids.txt           one chunk ID per row
+    metadata.jsonl    one JSON record per row (chunk payload and index metadata)
+    deleted.bin       int64 row numbers tombstoned after they were saved
+    manifest.json     committed row count and byte lengths of the files above
+
+Saves are append-only: new rows are written past the committed end of each
+file and the .npy header's row count is rewritten in place (NumPy reserves
+header room for the growth axis). The manifest is replaced atomically last,
+so readers - including other processes sharing the same directory - only
+ever see the rows it commits, and a torn append is truncated on the next
+save. Loads memory-map the vector matrix read-only, so pages are shared
+between processes and only faulted in when searched.
+"""
+
+import io
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.lib import format as npy_format
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+
+class VectorSnapshotStore:
+    """Append-only, memory-mappable snapshot of a vector index"""
+
+    VECTORS_FILE = "vectors.npy"
+    IDS_FILE = "ids.txt"
+    METADATA_FILE = "metadata.jsonl"
+    DELETED_FILE = "deleted.bin"
+    MANIFEST_FILE = "manifest.json"
+
+    def __init__(self, directory: Path, fsync: bool = False):
+        self.directory = Path(directory)
+        self.fsync = fsync
+        self.manifest = self._read_manifest()
+
+    @property
+    def count(self) -> int:
+        return self.manifest["count"] if self.manifest else 0
+
+    @property
+    def dimension(self) -> Optional[int]:
+        return self.manifest["dimension"] if self.manifest else None
+
+    def exists(self) -> bool:
+        return self.manifest is not None
+
+    # ─── writing ───────────────────────────────────────────────────────────
+
+    def append(self, vectors: np.ndarray, ids: List[str], records: List[Dict[str, Any]],
+               deleted: Sequence[int] = ()):
+        """Append rows (and tombstones for previously saved rows) and commit them"""
+        vectors = np.ascontiguousarray(vectors, dtype="<f4")
+        if not (len(vectors) == len(ids) == len(records)):
+            raise ValueError("vectors, ids and records must have the same length")
+        if self.manifest and vectors.shape[1] != self.dimension:
+            raise ValueError(f"Expected dimension {self.dimension}, got {vectors.shape[1]}")
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        manifest = self.manifest or {
+            "version": MANIFEST_VERSION, "dimension": int(vectors.shape[1]), "count": 0,
+            "header_bytes": 0, "ids_bytes": 0, "metadata_bytes": 0, "deleted_bytes": 0,
+        }
+        count = manifest["count"] + len(vectors)
+
+        header_bytes = self._append_vectors(manifest, vectors, count)
+        id_payload = "".join(f"{chunk_id}\n" for chunk_id in ids).encode("utf-8")
+        metadata_payload = "".join(
+            json.dumps(record, separators=(",", ":"), default=str) + "\n" for record in records
+        ).encode("utf-8")
+        ids_bytes = self._append_bytes(self.IDS_FILE, manifest["ids_bytes"], id_payload)
+        metadata_bytes = self._append_bytes(self.METADATA_FILE, manifest["metadata_bytes"], metadata_payload)
+        deleted_bytes = self._append_bytes(self.DELETED_FILE, manifest.get("deleted_bytes", 0),
+                                           np.asarray(deleted, dtype="<i8").tobytes())
+
+        self._write_manifest(dict(manifest, count=count, header_bytes=header_bytes, ids_bytes=ids_bytes,
+                                  metadata_bytes=metadata_bytes, deleted_bytes=deleted_bytes))
+        logger.debug(f"💾 Appended {len(vectors)} vectors to {self.directory} (total: {count})")
+
+    def reset(self):
+        """Remove all snapshot files"""
+        for name in (self.MANIFEST_FILE, self.VECTORS_FILE, self.IDS_FILE, self.METADATA_FILE, self.DELETED_FILE):
+            path = self.directory / name
+            if path.exists():
+                path.unlink()
+        self.manifest = None
+
+    # ─── reading ───────────────────────────────────────────────────────────
+
+    def load(self, parse_records: bool = True) -> Tuple[np.ndarray, List[str], List[Any], np.ndarray]:
+        """
+        Read-only memmap of the committed vectors plus their IDs, records and
+        tombstoned row numbers.
+        With parse_records=False the records are returned as raw JSON lines
+        (bytes) so callers can defer decoding until a row is used.
+        """
+        self.manifest = self._read_manifest()
+        if not self.manifest:
+            return np.zeros((0, 0), dtype=np.float32), [], [], np.zeros(0, dtype=np.int64)
+
+        count, dimension = self.manifest["count"], self.manifest["dimension"]
+        if count:
+            vectors = np.memmap(self.directory / self.VECTORS_FILE, dtype="<f4", mode="r",
+                                offset=self.manifest["header_bytes"], shape=(count, dimension))
+        else:
+            vectors = np.zeros((0, dimension), dtype=np.float32)
+
+        ids = self._read_bytes(self.IDS_FILE, self.manifest["ids_bytes"]).decode("utf-8").splitlines()
+        records = self._read_bytes(self.METADATA_FILE, self.manifest["metadata_bytes"]).splitlines()
+        if parse_records:
+            records = [json.loads(line) for line in records]
+        if len(ids) != count or len(records) != count:
+            raise ValueError(f"Corrupt vector snapshot in {self.directory}: "
+                             f"{count} vectors, {len(ids)} ids, {len(records)} records")
+        deleted = np.frombuffer(self._read_bytes(self.DELETED_FILE, self.manifest.get("deleted_bytes", 0)),
+                                dtype="<i8").astype(np.int64)
+        return vectors, ids, records, deleted
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            "directory": str(self.directory),
+            "count": self.count,
+            "deleted": self.manifest.get("deleted_bytes", 0) // 8 if self.manifest else 0,
+            "dimension": self.dimension,
+            "bytes": sum((self.directory / name).stat().st_size
+                         for name in (self.VECTORS_FILE, self.IDS_FILE, self.METADATA_FILE, self.DELETED_FILE)
+                         if (self.directory / name).exists()),
+        }
+
+    # ─── internals ─────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _header(count: int, dimension: int) -> bytes:
+        buffer = io.BytesIO()
+        npy_format.write_array_header_1_0(
+            buffer, {"descr": "<f4", "fortran_order": False, "shape": (count, dimension)})
+        return buffer.getvalue()
+
+    def _append_vectors(self, manifest: Dict[str, Any], vectors: np.ndarray, count: int) -> int:
+        path = self.directory / self.VECTORS_FILE
+        header = self._header(count, manifest["dimension"])
+        committed = manifest["count"] * manifest["dimension"] * 4
+
+        if manifest["header_bytes"] and len(header) != manifest["header_bytes"]:
+            # Header outgrew its reserved padding: rewrite the file once
+            existing = np.fromfile(path, dtype="<f4", count=committed // 4, offset=manifest["header_bytes"])
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(header)
+                f.write(existing.tobytes())
+                f.write(vectors.tobytes())
+                self._sync(f)
+            os.replace(tmp_path, path)
+            return len(header)
+
+        with open(path, "r+b" if path.exists() and manifest["header_bytes"] else "wb") as f:
+            f.seek(len(header) + committed)
+            f.write(vectors.tobytes())
+            f.truncate()
+            f.seek(0)
+            f.write(header)
+            self._sync(f)
+        return len(header)
+
+    def _append_bytes(self, name: str, committed: int, payload: bytes) -> int:
+        path = self.directory / name
+        with open(path, "r+b" if path.exists() else "wb") as f:
+            f.seek(committed)
+            f.write(payload)
+            f.truncate()
+            self._sync(f)
+        return committed + len(payload)
+
+    def _read_bytes(self, name: str, length: int) -> bytes:
+        if not length:
+            return b""
+        with open(self.directory / name, "rb") as f:
+            return f.read(length)
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        path = self.directory / self.MANIFEST_FILE
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported vector snapshot version: {manifest.get('version')}")
+        return manifest
+
+    def _write_manifest(self, manifest: Dict[str, Any]):
+        path = self.directory / self.MANIFEST_FILE
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+            self._sync(f)
+        os.replace(tmp_path, path)
+        self.manifest = manifest
+
+    def _sync(self, f):
+        if self.fsync:
+            f.flush()
+            os.fsync(f.fileno())
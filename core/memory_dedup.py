@@ -0,0 +1,117 @@
+"""
+DAWN Memory Deduplication Index
+MinHash signatures with LSH banding for near-duplicate memory detection.
+Each memory's semantic keyword set is reduced to a fixed-size MinHash
+signature; signatures are split into bands and bucketed, so memories whose
+keyword Jaccard similarity is high collide in at least one band with high
+probability. Candidate lookup is proportional to bucket size, which makes a
+consolidation pass near-linear in the number of memories examined.
+"""
+
+import zlib
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+# Mersenne prime for universal hashing: (a * x + b) mod P
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+class MinHashLSH:
+    """
+    Incremental MinHash + LSH index over keyword sets.
+
+    With the defaults (16 bands x 4 rows) a pair at Jaccard 0.8 becomes a
+    candidate with probability ~0.9998, a pair at 0.5 with ~0.64 and a pair
+    at 0.2 with ~0.025; callers confirm candidates with an exact check.
+    """
+
+    def __init__(self, bands: int = 16, rows: int = 4, seed: int = 1):
+        self.bands = bands
+        self.rows = rows
+        self.num_perm = bands * rows
+
+        rng = np.random.default_rng(seed)
+        # a, b < 2^32 keeps a * x + b below 2^64 for 32-bit x
+        self._a = rng.integers(1, 1 << 32, size=self.num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, 1 << 32, size=self.num_perm, dtype=np.uint64)
+        # Mixes each band's rows into a single 64-bit bucket key
+        self._band_mix = rng.integers(1, 1 << 63, size=rows, dtype=np.uint64) | np.uint64(1)
+
+        self._buckets: List[Dict[int, Set[str]]] = [dict() for _ in range(bands)]
+        self._keys: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._keys
+
+    def signature(self, keywords: Iterable[str]) -> Optional[np.ndarray]:
+        """MinHash signature of a keyword set (None for an empty set)"""
+        hashes = np.fromiter(
+            (zlib.crc32(keyword.encode('utf-8')) for keyword in set(keywords)),
+            dtype=np.uint64
+        )
+        if not hashes.size:
+            return None
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=1)
+
+    def band_keys(self, signature: np.ndarray) -> np.ndarray:
+        """One bucket key per band"""
+        return (signature.reshape(self.bands, self.rows) * self._band_mix).sum(axis=1)
+
+    def query(self, keywords: Iterable[str], exclude: Optional[str] = None) -> Set[str]:
+        """IDs of indexed memories sharing at least one band with the keyword set"""
+        signature = self.signature(keywords)
+        if signature is None:
+            return set()
+        return self._query_keys(self.band_keys(signature), exclude)
+
+    def insert(self, memory_id: str, keywords: Iterable[str]) -> Set[str]:
+        """
+        Index a memory and return the candidates it collided with.
+        Re-inserting an ID replaces its previous entry.
+        """
+        if memory_id in self._keys:
+            self.remove(memory_id)
+
+        signature = self.signature(keywords)
+        if signature is None:
+            return set()
+
+        keys = self.band_keys(signature)
+        candidates = self._query_keys(keys, memory_id)
+        for band, key in enumerate(keys.tolist()):
+            self._buckets[band].setdefault(key, set()).add(memory_id)
+        self._keys[memory_id] = keys
+        return candidates
+
+    def remove(self, memory_id: str):
+        """Drop a memory from the index (no-op if absent)"""
+        keys = self._keys.pop(memory_id, None)
+        if keys is None:
+            return
+        for band, key in enumerate(keys.tolist()):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(memory_id)
+                if not bucket:
+                    del self._buckets[band][key]
+
+    def clear(self):
+        """Remove every indexed memory"""
+        for buckets in self._buckets:
+            buckets.clear()
+        self._keys.clear()
+
+    def _query_keys(self, keys: np.ndarray, exclude: Optional[str]) -> Set[str]:
+        candidates: Set[str] = set()
+        for band, key in enumerate(keys.tolist()):
+            bucket = self._buckets[band].get(key)
+            if bucket:
+                candidates.update(bucket)
+        candidates.discard(exclude)
+        return candidates
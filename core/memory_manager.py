@@ -19,6 +19,10 @@ import logging
 import re
 import statistics
 
+from core.memory_dedup import MinHashLSH
+from core.memory_retrieval import MemoryRetrievalEngine
+from core.memory_store import ASSOCIATIONS, CLUSTER, DECAY, META, TRACE, MemorySegmentStore
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -87,6 +91,12 @@ class MemoryManager:
         self.pattern_clusters: Dict[str, PatternCluster] = {}
         self.semantic_index: Dict[str, Set[str]] = defaultdict(set)  # keyword -> memory_ids
         self.emotional_index: Dict[str, List[str]] = defaultdict(list)  # emotion -> memory_ids
+        self.retrieval_engine = MemoryRetrievalEngine(self)
+        
+        # Near-duplicate index for consolidation; memories not yet examined
+        # by a consolidation pass wait in pending_consolidation
+        self.dedup_index = MinHashLSH()
+        self.pending_consolidation: List[str] = []
         
         # Memory management parameters
         self.max_active_memories = 10000  # Maximum memories in active storage
@@ -105,6 +115,10 @@ class MemoryManager:
         self.consolidation_cycles = 0
         self.last_consolidation = time.time()
         
+        # Incremental on-disk state (mutation log + compacted snapshots)
+        self.store = MemorySegmentStore(self.memory_directory / "segments")
+        self._snapshot_required = False
+        
         # Load existing memories
         self._load_memory_state()
         
@@ -151,6 +165,8 @@ class MemoryManager:
         # Store in active memory
         self.memory_traces[memory_id] = memory_trace
         self.working_memory.append(memory_id)
+        self.pending_consolidation.append(memory_id)
+        self.store.put_trace(memory_trace)
         
         # Update indices
         self._update_semantic_index(memory_id, semantic_keywords)
@@ -172,8 +188,18 @@ class MemoryManager:
         return memory_id
     
     def retrieve_similar(self, input_text: str, limit: int = 10, 
-                        min_similarity: float = None) -> List[Tuple[str, float]]:
-        """Retrieve memories similar to the given input with similarity scores"""
+                        min_similarity: float = None, scoring: str = "jaccard",
+                        exhaustive: bool = False) -> List[Tuple[str, float]]:
+        """
+        Retrieve memories similar to the given input with similarity scores.
+        
+        Candidates come from the semantic keyword index, so above the
+        non-semantic ceiling latency scales with the posting lists of the query
+        keywords rather than the corpus size; at lower thresholds memories
+        sharing no keyword are scored too.
+        scoring="bm25" weights keyword overlap by term rarity instead of Jaccard.
+        exhaustive=True forces the linear scan.
+        """
         
         if min_similarity is None:
             min_similarity = self.similarity_threshold
@@ -181,6 +207,24 @@ class MemoryManager:
         # Extract query keywords
         query_keywords = self._extract_keywords(input_text)
         
+        if exhaustive:
+            similarity_scores = self._scan_similar(query_keywords, input_text, min_similarity)
+        else:
+            similarity_scores = self.retrieval_engine.search(
+                query_keywords, input_text, limit, min_similarity, scoring=scoring
+            )
+        
+        # Boost memory strength for retrieved memories
+        for memory_id, _ in similarity_scores[:limit]:
+            self._boost_memory(memory_id)
+        
+        self.total_retrievals += len(similarity_scores[:limit])
+        return similarity_scores[:limit]
+    
+    def _scan_similar(self, query_keywords: List[str], input_text: str,
+                      min_similarity: float) -> List[Tuple[str, float]]:
+        """Score every memory trace against the query (linear scan)"""
+        
         # Calculate similarity scores for all memories
         similarity_scores = []
         
@@ -205,15 +249,9 @@ class MemoryManager:
             if combined_score >= min_similarity:
                 similarity_scores.append((memory_id, combined_score))
         
-        # Sort by similarity and return top results
+        # Sort by similarity
         similarity_scores.sort(key=lambda x: x[1], reverse=True)
-        
-        # Boost memory strength for retrieved memories
-        for memory_id, _ in similarity_scores[:limit]:
-            self._boost_memory(memory_id)
-        
-        self.total_retrievals += len(similarity_scores[:limit])
-        return similarity_scores[:limit]
+        return similarity_scores
     
     def get_echo_key(self, current_state: Dict[str, Any], query_context: str = "") -> EchoKey:
         """Generate an echo key for context-aware memory retrieval"""
@@ -257,8 +295,12 @@ class MemoryManager:
         logger.debug(f"Generated echo key with confidence {confidence_score:.3f}")
         return echo_key
     
-    def consolidate_memories(self, force: bool = False) -> Dict[str, Any]:
-        """Consolidate memories to compress history and strengthen important patterns"""
+    def consolidate_memories(self, force: bool = False, rescan: bool = False) -> Dict[str, Any]:
+        """
+        Consolidate memories to compress history and strengthen important patterns.
+        Near-duplicate merging only examines memories stored since the last
+        cycle unless rescan=True.
+        """
         
         if not force and time.time() - self.last_consolidation < 3600:  # Once per hour
             return {"status": "skipped", "reason": "too_recent"}
@@ -288,7 +330,7 @@ class MemoryManager:
             consolidation_stats["weak_memories_removed"] += 1
         
         # 3. Consolidate similar memories
-        consolidated_count = self._consolidate_similar_memories()
+        consolidated_count = self._consolidate_similar_memories(rescan=rescan)
         consolidation_stats["memories_consolidated"] = consolidated_count
         
         # 4. Merge overlapping pattern clusters
@@ -382,6 +424,7 @@ class MemoryManager:
             "working_memory_size": len(self.working_memory),
             "last_consolidation_hours_ago": (current_time - self.last_consolidation) / 3600,
             "semantic_index_size": len(self.semantic_index),
+            "retrieval_engine": self.retrieval_engine.get_statistics(),
             "memory_efficiency": len(self.memory_traces) / max(1, self.total_memories_stored)
         }
     
@@ -420,12 +463,18 @@ class MemoryManager:
         
         return results
     
-    def save_memory_state(self, filepath: str = None) -> bool:
-        """Save complete memory state to file"""
+    def save_memory_state(self, filepath: str = None, compact: bool = False) -> bool:
+        """
+        Save memory state.
+        
+        Without a filepath, changes since the last save are appended to the
+        segment store (compacting into a new snapshot when the log has grown
+        or compact=True). With a filepath, the complete state is exported as
+        JSON.
+        """
         
         if filepath is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filepath = self.memory_directory / f"memory_state_{timestamp}.json"
+            return self._persist_to_store(compact)
         
         try:
             memory_state = {
@@ -506,6 +555,10 @@ class MemoryManager:
             metadata = memory_state.get("metadata", {})
             self.consolidation_cycles = metadata.get("consolidation_cycles", 0)
             
+            # The segment store does not hold this state yet
+            self.store.discard_pending()
+            self._snapshot_required = True
+            
             logger.info(f"Memory state loaded: {len(self.memory_traces)} memories, {len(self.pattern_clusters)} patterns")
             return True
             
@@ -518,11 +571,127 @@ class MemoryManager:
     def _load_memory_state(self):
         """Load the most recent memory state on initialization"""
         
+        if self.store.exists():
+            self._load_from_store()
+            return
+        
         state_files = list(self.memory_directory.glob("memory_state_*.json*"))
         if state_files:
             latest_file = max(state_files, key=lambda f: f.stat().st_mtime)
             self.load_memory_state(str(latest_file))
     
+    def _persist_to_store(self, compact: bool = False) -> bool:
+        """Append pending mutations to the segment store, compacting if due"""
+        
+        try:
+            metadata = self._store_metadata()
+            if (compact or self._snapshot_required or not self.store.snapshot_bytes or
+                    self.store.needs_compaction()):
+                self.store.write_snapshot(self._snapshot_sections(), metadata)
+                self._snapshot_required = False
+                logger.info(f"Memory snapshot written: generation {self.store.generation}")
+            else:
+                records = self.store.flush(metadata)
+                logger.debug(f"Memory log appended: {records} records")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to persist memory state: {e}")
+            return False
+    
+    def _store_metadata(self) -> Dict[str, Any]:
+        """Scalar state carried with every snapshot and log flush"""
+        return {
+            "save_time": time.time(),
+            "total_memories": len(self.memory_traces),
+            "total_memories_stored": self.total_memories_stored,
+            "total_retrievals": self.total_retrievals,
+            "consolidation_cycles": self.consolidation_cycles,
+            "last_consolidation": self.last_consolidation,
+            "indexed_documents": self.retrieval_engine.document_count,
+            "indexed_keywords": self.retrieval_engine.total_keywords,
+            "version": "2.0"
+        }
+    
+    def _snapshot_sections(self) -> Dict[str, Any]:
+        """Full state, including indices, for a compacted snapshot"""
+        return {
+            "memory_traces": self.memory_traces,
+            "pattern_clusters": self.pattern_clusters,
+            "association_network": self.association_network,
+            "semantic_index": self.semantic_index,
+            "emotional_index": self.emotional_index,
+        }
+    
+    def _load_from_store(self):
+        """Load the memory-mapped snapshot and replay the log tail"""
+        
+        try:
+            sections, metadata, records = self.store.load()
+            
+            if sections:
+                self.memory_traces = sections["memory_traces"]
+                self.pattern_clusters = sections["pattern_clusters"]
+                self.association_network = sections["association_network"]
+                self.semantic_index = sections["semantic_index"]
+                self.emotional_index = sections["emotional_index"]
+                self._restore_metadata(metadata)
+            
+            replayed = 0
+            for kind, key, value in records:
+                self._apply_store_record(kind, key, value)
+                replayed += 1
+            
+            # Replay goes through the normal mutation paths; nothing new to log
+            self.store.discard_pending()
+            self.dedup_index.clear()
+            self.pending_consolidation = list(self.memory_traces)
+            
+            logger.info(f"Memory store loaded: {len(self.memory_traces)} memories, "
+                        f"{replayed} log records replayed")
+            
+        except Exception as e:
+            logger.error(f"Failed to load memory store: {e}")
+    
+    def _restore_metadata(self, metadata: Dict[str, Any]):
+        """Restore scalar state saved by _store_metadata"""
+        self.total_memories_stored = metadata.get("total_memories_stored", self.total_memories_stored)
+        self.total_retrievals = metadata.get("total_retrievals", self.total_retrievals)
+        self.consolidation_cycles = metadata.get("consolidation_cycles", self.consolidation_cycles)
+        self.last_consolidation = metadata.get("last_consolidation", self.last_consolidation)
+        self.retrieval_engine.document_count = metadata.get("indexed_documents", len(self.memory_traces))
+        self.retrieval_engine.total_keywords = metadata.get("indexed_keywords", 0)
+    
+    def _apply_store_record(self, kind: str, key: Any, value: Any):
+        """Apply one replayed mutation from the segment log"""
+        
+        if kind == TRACE:
+            existing = self.memory_traces.get(key)
+            if value is None:
+                self._remove_memory(key)
+            elif existing is None:
+                self.memory_traces[key] = value
+                self._update_semantic_index(key, value.semantic_keywords)
+                self._update_emotional_index(key, value.emotional_state)
+            else:
+                # Keywords and emotion are fixed at creation; indices stay valid
+                self.memory_traces[key] = value
+        elif kind == ASSOCIATIONS:
+            if value is None:
+                self.association_network.pop(key, None)
+            else:
+                self.association_network[key] = value
+        elif kind == CLUSTER:
+            if value is None:
+                self.pattern_clusters.pop(key, None)
+            else:
+                self.pattern_clusters[key] = value
+        elif kind == DECAY:
+            for memory in self.memory_traces.values():
+                memory.memory_strength *= value
+        elif kind == META:
+            self._restore_metadata(value)
+    
     def _extract_semantic_keywords(self, input_text: str, response_text: str) -> List[str]:
         """Extract semantic keywords from interaction text"""
         
@@ -602,6 +771,7 @@ class MemoryManager:
         """Update semantic keyword index"""
         for keyword in keywords:
             self.semantic_index[keyword].add(memory_id)
+        self.retrieval_engine.add_document(keywords)
     
     def _update_emotional_index(self, memory_id: str, emotional_state: str):
         """Update emotional state index"""
@@ -656,6 +826,7 @@ class MemoryManager:
         )
         
         self.association_network[from_memory].append(association)
+        self.store.put_associations(from_memory, self.association_network[from_memory])
     
     def _update_pattern_clusters(self, memory_id: str, memory_trace: MemoryTrace):
         """Update pattern clusters with new memory"""
@@ -682,6 +853,7 @@ class MemoryManager:
                 for emotion in emotions:
                     emotion_counts[emotion] += 1
                 matching_cluster.dominant_emotion = max(emotion_counts, key=emotion_counts.get)
+            self.store.put_cluster(matching_cluster)
         else:
             # Create new cluster
             cluster_id = f"cluster_{len(self.pattern_clusters)}_{int(time.time())}"
@@ -696,6 +868,7 @@ class MemoryManager:
                 last_updated=time.time()
             )
             self.pattern_clusters[cluster_id] = new_cluster
+            self.store.put_cluster(new_cluster)
     
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract keywords from text for similarity comparison"""
@@ -743,6 +916,7 @@ class MemoryManager:
             memory.memory_strength = min(1.0, memory.memory_strength * self.retrieval_boost)
             memory.retrieval_count += 1
             memory.last_retrieved = time.time()
+            self.store.put_trace(memory)
     
     def _calculate_current_emotional_resonance(self, current_state: Dict) -> float:
         """Calculate emotional resonance with current state"""
@@ -826,19 +1000,37 @@ class MemoryManager:
         
         for memory in self.memory_traces.values():
             memory.memory_strength *= decay_factor
+        self.store.decay(decay_factor)
     
-    def _consolidate_similar_memories(self) -> int:
-        """Consolidate very similar memories"""
+    def _consolidate_similar_memories(self, rescan: bool = False) -> int:
+        """
+        Consolidate very similar memories.
+        
+        Only memories stored since the previous pass are examined: each one is
+        looked up in the MinHash/LSH index for near-duplicate candidates, which
+        are confirmed with the exact keyword Jaccard and pattern checks.
+        rescan=True rebuilds the index and examines every memory.
+        """
         
+        if rescan:
+            self.dedup_index.clear()
+            self.pending_consolidation = list(self.memory_traces)
+        
+        pending, self.pending_consolidation = self.pending_consolidation, []
         consolidated_count = 0
-        memory_items = list(self.memory_traces.items())
         
-        for i, (mem_id1, mem1) in enumerate(memory_items):
+        for mem_id1 in pending:
+            mem1 = self.memory_traces.get(mem_id1)
+            if mem1 is None:  # Removed since it was queued
+                continue
+            
+            candidates = self.dedup_index.insert(mem_id1, mem1.semantic_keywords)
             if mem1.consolidation_level >= 2:  # Already consolidated
                 continue
             
-            for j, (mem_id2, mem2) in enumerate(memory_items[i+1:], i+1):
-                if mem2.consolidation_level >= 2:
+            for mem_id2 in sorted(candidates):
+                mem2 = self.memory_traces.get(mem_id2)
+                if mem2 is None or mem2.consolidation_level >= 2:
                     continue
                 
                 # Check similarity
@@ -850,10 +1042,12 @@ class MemoryManager:
                     if mem1.memory_strength >= mem2.memory_strength:
                         mem1.memory_strength = min(1.0, mem1.memory_strength + mem2.memory_strength * 0.3)
                         mem1.consolidation_level = 2
+                        self.store.put_trace(mem1)
                         self._remove_memory(mem_id2)
                     else:
                         mem2.memory_strength = min(1.0, mem2.memory_strength + mem1.memory_strength * 0.3)
                         mem2.consolidation_level = 2
+                        self.store.put_trace(mem2)
                         self._remove_memory(mem_id1)
                     
                     consolidated_count += 1
@@ -881,10 +1075,14 @@ class MemoryManager:
                         cluster1.member_memories.extend(cluster2.member_memories)
                         cluster1.frequency += cluster2.frequency
                         del self.pattern_clusters[cluster_id2]
+                        self.store.put_cluster(cluster1)
+                        self.store.delete_cluster(cluster_id2)
                     else:
                         cluster2.member_memories.extend(cluster1.member_memories)
                         cluster2.frequency += cluster1.frequency
                         del self.pattern_clusters[cluster_id1]
+                        self.store.put_cluster(cluster2)
+                        self.store.delete_cluster(cluster_id1)
                     
                     merged_count += 1
                     break
@@ -895,9 +1093,13 @@ class MemoryManager:
         """Strengthen frequently used associations"""
         
         for concept, links in self.association_network.items():
+            strengthened = False
             for link in links:
                 if link.frequency > 5:  # Frequently accessed
                     link.strength = min(1.0, link.strength * 1.1)
+                    strengthened = True
+            if strengthened:
+                self.store.put_associations(concept, links)
     
     def _remove_memory(self, memory_id: str):
         """Remove a memory and clean up indices"""
@@ -913,6 +1115,7 @@ class MemoryManager:
                 self.semantic_index[keyword].discard(memory_id)
                 if not self.semantic_index[keyword]:
                     del self.semantic_index[keyword]
+        self.retrieval_engine.remove_document(memory.semantic_keywords)
         
         # Remove from emotional index
         if memory.emotional_state in self.emotional_index:
@@ -923,19 +1126,30 @@ class MemoryManager:
         for cluster in self.pattern_clusters.values():
             if memory_id in cluster.member_memories:
                 cluster.member_memories.remove(memory_id)
+                self.store.put_cluster(cluster)
         
         # Remove from association network
         if memory_id in self.association_network:
             del self.association_network[memory_id]
+            self.store.put_associations(memory_id, None)
+        
+        # Remove from near-duplicate index
+        self.dedup_index.remove(memory_id)
         
         # Remove the memory itself
         del self.memory_traces[memory_id]
+        self.store.delete_trace(memory_id)
     
     def _rebuild_indices(self):
         """Rebuild all indices after loading from file"""
         
         self.semantic_index.clear()
         self.emotional_index.clear()
+        self.retrieval_engine.reset()
+        
+        # Loaded memories have not been through this process's dedup index
+        self.dedup_index.clear()
+        self.pending_consolidation = list(self.memory_traces)
         
         for memory_id, memory in self.memory_traces.items():
             self._update_semantic_index(memory_id, memory.semantic_keywords)
@@ -0,0 +1,177 @@
+"""
+DAWN Memory Retrieval Engine
+Inverted-index candidate retrieval for the MemoryManager.
+Generates candidates from the semantic keyword index (then memories sharing
+no keyword, while they can still qualify), scores them with the same weighted
+similarity as the linear scan, and keeps the best results in a
+bounded heap with upper-bound early termination. Optional BM25 weighting
+replaces the Jaccard keyword term.
+"""
+
+import heapq
+import itertools
+import math
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.memory_manager import MemoryManager
+
+# Weights of the combined similarity score (mirrors MemoryManager.retrieve_similar)
+SEMANTIC_WEIGHT = 0.4
+PATTERN_WEIGHT = 0.3
+TEMPORAL_WEIGHT = 0.2
+STRENGTH_WEIGHT = 0.1
+
+# Best score a memory can reach without sharing a single keyword with the query
+NON_SEMANTIC_CEILING = PATTERN_WEIGHT + TEMPORAL_WEIGHT + STRENGTH_WEIGHT
+
+
+class MemoryRetrievalEngine:
+    """Posting-list driven top-k retrieval over a MemoryManager's traces"""
+
+    def __init__(self, manager: 'MemoryManager', k1: float = 1.2, b: float = 0.75):
+        self.manager = manager
+        self.k1 = k1
+        self.b = b
+
+        # Corpus statistics for BM25 length normalisation
+        self.document_count = 0
+        self.total_keywords = 0
+
+        # Retrieval statistics
+        self.queries = 0
+        self.candidates_scored = 0
+
+    # ─── index maintenance hooks ───────────────────────────────────────────
+
+    def add_document(self, keywords: List[str]):
+        """Account for a newly indexed memory"""
+        self.document_count += 1
+        self.total_keywords += len(keywords)
+
+    def remove_document(self, keywords: List[str]):
+        """Account for a memory removed from the index"""
+        self.document_count = max(0, self.document_count - 1)
+        self.total_keywords = max(0, self.total_keywords - len(keywords))
+
+    def reset(self):
+        """Forget corpus statistics (before an index rebuild)"""
+        self.document_count = 0
+        self.total_keywords = 0
+
+    # ─── search ────────────────────────────────────────────────────────────
+
+    def search(self, query_keywords: List[str], input_text: str, limit: int,
+               min_similarity: float, scoring: str = "jaccard") -> List[Tuple[str, float]]:
+        """
+        Return up to `limit` (memory_id, score) pairs with score >= min_similarity,
+        best first.
+
+        Memories sharing keywords with the query are visited first, by
+        decreasing overlap. Without keyword overlap a memory cannot score
+        above NON_SEMANTIC_CEILING on structural similarity alone, so the
+        remaining memories are only visited while that ceiling can still
+        beat the current threshold.
+        """
+        if scoring not in ("jaccard", "bm25"):
+            raise ValueError(f"Unknown scoring mode: {scoring}")
+
+        self.queries += 1
+        if limit <= 0:
+            return []
+        query_terms = set(query_keywords)
+
+        # Candidate generation: overlap count per memory from the posting lists
+        semantic_index = self.manager.semantic_index
+        postings: Dict[str, Set[str]] = {
+            term: semantic_index[term] for term in query_terms if term in semantic_index
+        }
+
+        overlap: Counter = Counter()
+        for memory_ids in postings.values():
+            overlap.update(memory_ids)
+
+        if scoring == "bm25" and postings:
+            idf = self._idf(postings)
+            max_term = (self.k1 + 1) / (1 + self.k1 * (1 - self.b))
+            query_norm = sum(idf.values()) * max_term
+            avg_length = self.total_keywords / max(1, self.document_count)
+        query_size = len(query_terms)
+
+        # Visit candidates by decreasing overlap so the upper bound can stop the scan;
+        # memories without overlap come last, lazily
+        traces = self.manager.memory_traces
+        ordered = itertools.chain(
+            sorted(overlap.items(), key=lambda item: item[1], reverse=True),
+            ((memory_id, 0) for memory_id in traces if memory_id not in overlap)
+        )
+
+        heap: List[Tuple[float, str]] = []
+        threshold = min_similarity
+
+        for memory_id, shared in ordered:
+            # Jaccard can be at most shared / query_size (memory has >= shared keywords)
+            if not shared:
+                semantic_bound = 0.0
+            elif scoring == "jaccard":
+                semantic_bound = shared / query_size
+            else:
+                semantic_bound = 1.0
+            if SEMANTIC_WEIGHT * semantic_bound + NON_SEMANTIC_CEILING < threshold:
+                break
+
+            memory = traces.get(memory_id)
+            if memory is None or memory.memory_strength < 0.1:
+                continue
+            self.candidates_scored += 1
+
+            document_size = len(memory.semantic_keywords)
+            if not shared:
+                semantic_sim = 0.0
+            elif scoring == "jaccard":
+                union = query_size + document_size - shared
+                semantic_sim = shared / union if union > 0 else 0.0
+            else:
+                length_norm = self.k1 * (1 - self.b + self.b * document_size / max(avg_length, 1e-9))
+                bm25 = sum(idf[term] for term in postings if memory_id in postings[term])
+                semantic_sim = bm25 * (self.k1 + 1) / (1 + length_norm) / query_norm if query_norm > 0 else 0.0
+
+            pattern_sim = self.manager._calculate_pattern_similarity(input_text, memory.input_text)
+            temporal_relevance = self.manager._calculate_temporal_relevance(memory.timestamp)
+
+            score = (
+                semantic_sim * SEMANTIC_WEIGHT +
+                pattern_sim * PATTERN_WEIGHT +
+                temporal_relevance * TEMPORAL_WEIGHT +
+                memory.memory_strength * STRENGTH_WEIGHT
+            )
+
+            if score < min_similarity:
+                continue
+            if len(heap) < limit:
+                heapq.heappush(heap, (score, memory_id))
+            elif score > heap[0][0]:
+                heapq.heapreplace(heap, (score, memory_id))
+            if len(heap) == limit:
+                threshold = max(min_similarity, heap[0][0])
+
+        return [(memory_id, score) for score, memory_id in sorted(heap, reverse=True)]
+
+    def _idf(self, postings: Dict[str, Set[str]]) -> Dict[str, float]:
+        """BM25 inverse document frequency per query term"""
+        n = max(self.document_count, 1)
+        return {
+            term: math.log(1 + (n - len(memory_ids) + 0.5) / (len(memory_ids) + 0.5))
+            for term, memory_ids in postings.items()
+        }
+
+    def get_statistics(self) -> Dict[str, float]:
+        """Retrieval engine statistics"""
+        return {
+            "queries": self.queries,
+            "candidates_scored": self.candidates_scored,
+            "avg_candidates_per_query": self.candidates_scored / max(1, self.queries),
+            "indexed_documents": self.document_count,
+            "avg_keywords_per_document": self.total_keywords / max(1, self.document_count),
+        }
@@ -0,0 +1,259 @@
+"""
+DAWN Memory Segment Store
+Persistent, incremental binary storage for MemoryManager state.
+
+Layout of the store directory:
+    snapshot-<gen>.bin   compacted full state (sectioned pickle, memory-mapped on load)
+    log-<gen>.seg        append-only mutation log written after snapshot <gen>
+
+Each log record is framed as [u32 length][u32 crc32][pickle payload], so a
+torn write at the tail is detected and truncated on the next open. Mutations
+are coalesced in memory and appended in one write per flush, so saving costs
+time proportional to what changed. Once the log grows past a fraction of the
+snapshot size the state is compacted into a new snapshot (written to a temp
+file, fsynced and atomically renamed) and a fresh log is started.
+"""
+
+import json
+import logging
+import mmap
+import os
+import pickle
+import re
+import struct
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"DAWNMEM1"
+RECORD_HEADER = struct.Struct("<II")
+PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+# Record kinds
+TRACE = "trace"
+ASSOCIATIONS = "assoc"
+CLUSTER = "cluster"
+DECAY = "decay"
+META = "meta"
+
+
+class MemorySegmentStore:
+    """Append-only mutation log plus compacted snapshots for memory state"""
+
+    def __init__(self, directory: Path, compaction_ratio: float = 0.5,
+                 min_compaction_bytes: int = 1 << 20, fsync: bool = True):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.compaction_ratio = compaction_ratio
+        self.min_compaction_bytes = min_compaction_bytes
+        self.fsync = fsync
+
+        self.generation = self._latest_generation()
+        self.snapshot_bytes = self._snapshot_path(self.generation).stat().st_size \
+            if self._snapshot_path(self.generation).exists() else 0
+        self.log_bytes = 0
+
+        # Pending mutations keyed by (kind, key); values are serialised at flush
+        self._pending: "OrderedDict[Tuple[str, Any], Any]" = OrderedDict()
+        self._decay_seq = 0
+
+        # Statistics
+        self.records_written = 0
+        self.compactions = 0
+
+    # ─── change tracking ───────────────────────────────────────────────────
+
+    def put_trace(self, trace):
+        self._pending[(TRACE, trace.memory_id)] = trace
+
+    def delete_trace(self, memory_id: str):
+        self._pending[(TRACE, memory_id)] = None
+
+    def put_associations(self, concept: str, links: Optional[list]):
+        """Record a concept's full association list (None deletes it)"""
+        self._pending[(ASSOCIATIONS, concept)] = links
+
+    def put_cluster(self, cluster):
+        self._pending[(CLUSTER, cluster.cluster_id)] = cluster
+
+    def delete_cluster(self, cluster_id: str):
+        self._pending[(CLUSTER, cluster_id)] = None
+
+    def decay(self, factor: float):
+        """
+        Record a strength decay applied to every trace. Pending trace puts are
+        moved after it: they serialise the already-decayed state at flush time.
+        """
+        self._decay_seq += 1
+        self._pending[(DECAY, self._decay_seq)] = factor
+        for key in [key for key in self._pending if key[0] == TRACE]:
+            self._pending.move_to_end(key)
+
+    def discard_pending(self):
+        """Forget pending mutations (e.g. ones produced while replaying the log)"""
+        self._pending.clear()
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._pending)
+
+    # ─── persistence ───────────────────────────────────────────────────────
+
+    def flush(self, metadata: Dict[str, Any]) -> int:
+        """
+        Append all pending mutations (plus metadata) as one write.
+
+        Returns:
+            Number of records written
+        """
+        if not self._pending:
+            return 0
+
+        records = [self._encode((kind, key, value)) for (kind, key), value in self._pending.items()]
+        records.append(self._encode((META, None, metadata)))
+        payload = b"".join(records)
+
+        with open(self._log_path(self.generation), "ab") as f:
+            f.write(payload)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+
+        self._pending.clear()
+        self.log_bytes += len(payload)
+        self.records_written += len(records)
+        return len(records)
+
+    def needs_compaction(self) -> bool:
+        return self.log_bytes >= max(self.min_compaction_bytes,
+                                     self.snapshot_bytes * self.compaction_ratio)
+
+    def write_snapshot(self, sections: Dict[str, Any], metadata: Dict[str, Any]):
+        """Write a compacted snapshot of the full state and start a new log"""
+        blobs = {name: pickle.dumps(value, protocol=PICKLE_PROTOCOL) for name, value in sections.items()}
+
+        offsets = {}
+        position = 0
+        for name, blob in blobs.items():
+            offsets[name] = [position, len(blob)]
+            position += len(blob)
+        header = json.dumps({"sections": offsets, "metadata": metadata}, default=str).encode("utf-8")
+
+        generation = self.generation + 1
+        path = self._snapshot_path(generation)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            for blob in blobs.values():
+                f.write(blob)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+        previous = self.generation
+        self.generation = generation
+        self.snapshot_bytes = path.stat().st_size
+        self.log_bytes = 0
+        self._pending.clear()
+        self.compactions += 1
+
+        # Older generations are superseded once the new snapshot is durable
+        for old_path in (self._snapshot_path(previous), self._log_path(previous)):
+            if old_path.exists():
+                old_path.unlink()
+
+    def load(self) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any], Iterator[Tuple[str, Any, Any]]]:
+        """
+        Memory-map the latest snapshot and open its log tail.
+
+        Returns:
+            (sections or None, snapshot metadata, iterator of (kind, key, value) log records)
+        """
+        sections, metadata = None, {}
+        path = self._snapshot_path(self.generation)
+        if path.exists():
+            sections, metadata = self._read_snapshot(path)
+        return sections, metadata, self._replay_log()
+
+    def exists(self) -> bool:
+        return self._snapshot_path(self.generation).exists() or self._log_path(self.generation).exists()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            "generation": self.generation,
+            "snapshot_bytes": self.snapshot_bytes,
+            "log_bytes": self.log_bytes,
+            "pending_mutations": len(self._pending),
+            "records_written": self.records_written,
+            "compactions": self.compactions,
+        }
+
+    # ─── internals ─────────────────────────────────────────────────────────
+
+    def _read_snapshot(self, path: Path) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                if bytes(view[:len(SNAPSHOT_MAGIC)]) != SNAPSHOT_MAGIC:
+                    raise ValueError(f"Not a memory snapshot: {path}")
+                (header_length,) = struct.unpack_from("<I", view, len(SNAPSHOT_MAGIC))
+                start = len(SNAPSHOT_MAGIC) + 4
+                header = json.loads(bytes(view[start:start + header_length]))
+                base = start + header_length
+                sections = {
+                    name: pickle.loads(view[base + offset:base + offset + length])
+                    for name, (offset, length) in header["sections"].items()
+                }
+            finally:
+                view.release()
+        return sections, header.get("metadata", {})
+
+    def _replay_log(self) -> Iterator[Tuple[str, Any, Any]]:
+        path = self._log_path(self.generation)
+        if not path.exists():
+            return
+
+        with open(path, "rb") as f:
+            data = f.read()
+
+        position = 0
+        while position + RECORD_HEADER.size <= len(data):
+            length, checksum = RECORD_HEADER.unpack_from(data, position)
+            start = position + RECORD_HEADER.size
+            payload = data[start:start + length]
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                break
+            yield pickle.loads(payload)
+            position = start + length
+
+        self.log_bytes = position
+        if position < len(data):
+            logger.warning(f"Truncating torn memory log tail: {len(data) - position} bytes in {path}")
+            with open(path, "r+b") as f:
+                f.truncate(position)
+
+    @staticmethod
+    def _encode(record: Tuple[str, Any, Any]) -> bytes:
+        payload = pickle.dumps(record, protocol=PICKLE_PROTOCOL)
+        return RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+
+    def _latest_generation(self) -> int:
+        generations = [
+            int(match.group(1))
+            for path in self.directory.iterdir()
+            for match in [re.fullmatch(r"(?:snapshot|log)-(\d+)\.(?:bin|seg)", path.name)]
+            if match
+        ]
+        return max(generations, default=0)
+
+    def _snapshot_path(self, generation: int) -> Path:
+        return self.directory / f"snapshot-{generation:06d}.bin"
+
+    def _log_path(self, generation: int) -> Path:
+        return self.directory / f"log-{generation:06d}.seg"
@@ -18,8 +18,13 @@ import logging
 from dataclasses import dataclass
 import math
 
+from .matrix_profile import StreamingMotifProfile, recent_motif_profile
+
 logger = logging.getLogger(__name__)
 
+# Metric sequences scanned for repeating patterns, in tie-break order
+REBLOOP_METRICS = ('scup', 'entropy', 'heat')
+
 
 @dataclass
 class PatternInfo:
@@ -101,6 +106,10 @@ class PatternDetector:
         self.last_rebloop_time = None
         self.rebloop_threshold = 3  # Number of loops to trigger rebloop
         
+        # Matrix profile of the newest window of each length, kept current per data point
+        self.motif_profile = StreamingMotifProfile(len(REBLOOP_METRICS), min_pattern_length,
+                                                   self.max_pattern_length)
+        
         # Statistical tracking
         self.metric_stats = defaultdict(lambda: {'mean': 0, 'std': 0, 'values': deque(maxlen=100)})
         self.emotional_cycles = {}
@@ -133,6 +142,7 @@ class PatternDetector:
             'tick_count': metrics.get('tick_count', 0)
         }
         self.metric_history.append(metric_point)
+        self.motif_profile.append([_reading(metric_point[metric]) for metric in REBLOOP_METRICS])
         
         # Store emotion data
         emotion_point = {
@@ -187,30 +197,26 @@ class PatternDetector:
             PatternInfo if rebloop pattern detected, None otherwise
         """
         if history is None:
-            history = list(self.metric_history)
-        
-        if len(history) < self.min_pattern_length * 2:
-            return None
-        
-        # Extract metric sequences for pattern analysis
-        scup_sequence = [point['scup'] for point in history]
-        entropy_sequence = [point['entropy'] for point in history]
-        heat_sequence = [point['heat'] for point in history]
+            if len(self.metric_history) < self.min_pattern_length * 2:
+                return None
+            profile = self.motif_profile.profile()
+        else:
+            if len(history) < self.min_pattern_length * 2:
+                return None
+            series = [[_reading(point[metric]) for point in history] for metric in REBLOOP_METRICS]
+            profile = recent_motif_profile(np.array(series, dtype=float), self.min_pattern_length,
+                                           self.max_pattern_length)
         
-        # Look for repeating patterns in each metric
+        # Best repeating pattern across window lengths and metrics (one vectorised pass)
         best_pattern = None
-        max_confidence = 0
-        
-        for pattern_length in range(self.min_pattern_length, min(self.max_pattern_length, len(scup_sequence) // 2)):
-            for sequence, metric_name in [(scup_sequence, 'scup'), 
-                                        (entropy_sequence, 'entropy'), 
-                                        (heat_sequence, 'heat')]:
-                
-                pattern_info = self._detect_sequence_pattern(sequence, pattern_length, metric_name)
-                
-                if pattern_info and pattern_info.confidence > max_confidence:
-                    max_confidence = pattern_info.confidence
-                    best_pattern = pattern_info
+        best = profile.best(self.pattern_threshold) if profile is not None else None
+        if best is not None:
+            metric_index, length_index = best
+            best_pattern = self._build_sequence_pattern(
+                REBLOOP_METRICS[metric_index], int(profile.lengths[length_index]),
+                float(profile.scores[metric_index, length_index]),
+                int(profile.positions[metric_index, length_index]),
+                float(profile.amplitudes[metric_index, length_index]))
         
         # Check for reblooptrigger conditions
         if best_pattern and best_pattern.confidence > self.pattern_threshold:
@@ -227,56 +233,30 @@ class PatternDetector:
         
         return None
     
-    def _detect_sequence_pattern(self, sequence: List[float], pattern_length: int, metric_name: str) -> Optional[PatternInfo]:
-        """Detect repeating patterns in a metric sequence"""
-        if len(sequence) < pattern_length * 2:
-            return None
-        
-        # Extract potential pattern and following sequence
-        pattern = sequence[-pattern_length:]
-        preceding_sequence = sequence[-(pattern_length * 3):-pattern_length]
+    def _build_sequence_pattern(self, metric_name: str, pattern_length: int, confidence: float,
+                                match_position: int, amplitude: float) -> PatternInfo:
+        """Describe the newest `pattern_length` steps of a metric matching an earlier window"""
+        # Estimate phase based on pattern position
+        phase = (match_position % pattern_length) / pattern_length * 2 * math.pi
         
-        if len(preceding_sequence) < pattern_length:
-            return None
-        
-        # Calculate pattern matching confidence
-        best_match_score = 0
-        best_match_position = -1
-        
-        for i in range(len(preceding_sequence) - pattern_length + 1):
-            candidate = preceding_sequence[i:i + pattern_length]
-            
-            # Calculate similarity using normalized cross-correlation
-            similarity = self._calculate_pattern_similarity(pattern, candidate)
-            
-            if similarity > best_match_score:
-                best_match_score = similarity
-                best_match_position = i
-        
-        if best_match_score > self.pattern_threshold:
-            # Calculate pattern characteristics
-            amplitude = max(pattern) - min(pattern)
-            period = pattern_length
-            
-            # Estimate phase based on pattern position
-            phase = (best_match_position % pattern_length) / pattern_length * 2 * math.pi
-            
-            return PatternInfo(
-                pattern_type="repeating_sequence",
-                confidence=best_match_score,
-                period=period,
-                amplitude=amplitude,
-                phase=phase,
-                start_time=datetime.now() - timedelta(seconds=pattern_length * 2),
-                end_time=datetime.now(),
-                metrics_involved=[metric_name],
-                description=f"{metric_name} shows {pattern_length}-step repeating pattern (amplitude: {amplitude:.3f})"
-            )
-        
-        return None
+        return PatternInfo(
+            pattern_type="repeating_sequence",
+            confidence=confidence,
+            period=pattern_length,
+            amplitude=amplitude,
+            phase=phase,
+            start_time=datetime.now() - timedelta(seconds=pattern_length * 2),
+            end_time=datetime.now(),
+            metrics_involved=[metric_name],
+            description=f"{metric_name} shows {pattern_length}-step repeating pattern (amplitude: {amplitude:.3f})"
+        )
     
     def _calculate_pattern_similarity(self, pattern1: List[float], pattern2: List[float]) -> float:
-        """Calculate similarity between two patterns using multiple metrics"""
+        """Calculate similarity between two patterns using multiple metrics
+        
+        Reference definition of the score; detect_reloop computes it for every
+        window at once through core.matrix_profile.
+        """
         if len(pattern1) != len(pattern2):
             return 0.0
         
@@ -615,6 +595,14 @@ class PatternDetector:
         }
 
 
+def _reading(value: Any) -> float:
+    """Metric value as a float (NaN when missing or non-numeric)"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
 # Integration function for consciousness system
 def integrate_with_consciousness(consciousness, pattern_detector):
     """Integrate pattern detector with consciousness system for enhanced responses"""
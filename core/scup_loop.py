@@ -16,6 +16,7 @@ from enum import Enum
 
 # DAWN Core Imports
 from core.tick_emitter import current_tick, tick_subscribe
+from core.telemetry_sink import get_telemetry_sink
 from owl.owl_tracer_log import owl_log
 from schema.schema_flags import SchemaState
 
@@ -105,6 +106,9 @@ class SCUPLoop:
         # Emergency response system
         self.emergency_protocols = EmergencyProtocols()
         
+        # Telemetry is written off the tick path by the shared sink
+        self.telemetry = get_telemetry_sink()
+        
         # Threading and synchronization
         self.lock = threading.Lock()
         self.tick_subscription = None
@@ -537,19 +541,11 @@ class SCUPLoop:
             'tick': tick
         }
         
-        try:
-            with open(scup_file, 'w') as f:
-                json.dump(scup_data, f, indent=2)
-        except Exception as e:
-            owl_log(f"⚠️ [SCUP] Failed to write SCUP file: {e}", "warning")
+        self.telemetry.write_snapshot(scup_file, scup_data)
         
         # SCUP analytics curve
         analytics_file = "juliet_flowers/cluster_report/scup_analytics/scup_curve.csv"
-        try:
-            with open(analytics_file, 'a') as f:
-                f.write(f"{tick},{scup_value:.4f},{state.name},{pressure.magnitude:.4f}\n")
-        except Exception as e:
-            owl_log(f"⚠️ [SCUP] Failed to write analytics: {e}", "warning")
+        self.telemetry.append_line(analytics_file, f"{tick},{scup_value:.4f},{state.name},{pressure.magnitude:.4f}")
 
     def _record_crossover_event(self, scup_value: float, shi_value: float, health_zone: str):
         """Record genetic crossover event"""
@@ -566,11 +562,7 @@ class SCUPLoop:
             'event_id': self.crossover_events
         }
         
-        try:
-            with open(crossover_file, 'a') as f:
-                f.write(json.dumps(event_data) + '\n')
-        except Exception as e:
-            owl_log(f"⚠️ [SCUP] Failed to record crossover: {e}", "warning")
+        self.telemetry.append_json(crossover_file, event_data)
 
     def _record_emergency_adaptation(self, pressure: PressureVector, adaptations: Dict[str, float]):
         """Record emergency phenotype adaptation"""
@@ -592,11 +584,7 @@ class SCUPLoop:
             'genome_generation': self.genetic_mutations
         }
         
-        try:
-            with open(emergency_file, 'a') as f:
-                f.write(json.dumps(adaptation_data) + '\n')
-        except Exception as e:
-            owl_log(f"⚠️ [SCUP] Failed to record emergency adaptation: {e}", "warning")
+        self.telemetry.append_json(emergency_file, adaptation_data)
 
     def get_current_scup(self) -> float:
         """Get current SCUP value"""
@@ -626,7 +614,8 @@ class SCUPLoop:
             'history_size': {
                 'scup_history': len(self.scup_history),
                 'pressure_history': len(self.pressure_history)
-            }
+            },
+            'telemetry': self.telemetry.get_statistics()
         }
 
 # ═══════════════════════════════════════════════════════════════════════════════
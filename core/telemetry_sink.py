@@ -0,0 +1,245 @@
+"""
+DAWN Telemetry Sink - Background writer for tick telemetry
+
+Tick loops hand their readings to a shared sink instead of opening files
+themselves. Log lines (CSV rows, JSONL records) go through a bounded queue
+that one daemon thread drains, grouping each batch by file so a file is
+opened once per batch. "Latest readings" JSON files are coalesced - only the
+newest payload per path is kept - and atomically replaced at most every
+`snapshot_interval` seconds, so readers never see a half-written file.
+
+When the queue is full an append waits up to `put_timeout` seconds and is
+then dropped; both events are counted in get_statistics(). Snapshots are
+never dropped, only superseded.
+
+Records and snapshots are copied when they are queued, so callers may keep
+mutating their dicts. A batch that fails to write is counted in
+`write_errors` and skipped; the writer thread keeps running.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TelemetrySink:
+    """Bounded, batched, asynchronous writer for telemetry files"""
+
+    def __init__(self, max_queue: int = 8192, batch_size: int = 1024, flush_interval: float = 0.2,
+                 snapshot_interval: float = 0.5, put_timeout: float = 0.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.snapshot_interval = snapshot_interval
+        self.put_timeout = put_timeout
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._snapshots: Dict[str, Tuple[Any, Optional[int]]] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closing = threading.Event()
+        self._last_snapshot_write = 0.0
+        self._directories = set()
+        self._stats = defaultdict(int)
+
+    # ─── producer side (tick path) ─────────────────────────────────────────
+
+    def append_line(self, path: str, line: str) -> bool:
+        """Queue a text line (newline added) for appending; False if dropped"""
+        return self._enqueue((path, line, False))
+
+    def append_json(self, path: str, record: Dict[str, Any]) -> bool:
+        """Queue a copy of a JSONL record for appending (serialised on the writer thread)"""
+        return self._enqueue((path, _copy_payload(record), True))
+
+    def write_snapshot(self, path: str, data: Dict[str, Any], indent: Optional[int] = 2):
+        """Replace `path` with a copy of `data` on the next snapshot write (latest call wins)"""
+        data = _copy_payload(data)
+        with self._lock:
+            if path in self._snapshots:
+                self._stats['snapshots_coalesced'] += 1
+            self._snapshots[path] = (data, indent)
+        self._ensure_writer()
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until everything queued so far (and pending snapshots) is written"""
+        if self._closing.is_set():
+            return self._thread is None or not self._thread.is_alive()
+        self._ensure_writer()
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = 5.0):
+        """Write everything still queued and stop the writer thread"""
+        self._closing.set()
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            thread.join(timeout)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        stats = dict(self._stats)
+        return {
+            'queued': self._queue.qsize(),
+            'capacity': self._queue.maxsize,
+            'pending_snapshots': len(self._snapshots),
+            'lines_written': stats.get('lines_written', 0),
+            'batches_written': stats.get('batches_written', 0),
+            'snapshots_written': stats.get('snapshots_written', 0),
+            'snapshots_coalesced': stats.get('snapshots_coalesced', 0),
+            'backpressure_events': stats.get('backpressure_events', 0),
+            'dropped': stats.get('dropped', 0),
+            'write_errors': stats.get('write_errors', 0),
+            'high_water': stats.get('high_water', 0),
+        }
+
+    # ─── internals ─────────────────────────────────────────────────────────
+
+    def _enqueue(self, item) -> bool:
+        if self._closing.is_set():
+            self._count('dropped')
+            return False
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self._count('backpressure_events')
+            try:
+                if self.put_timeout <= 0:
+                    raise queue.Full
+                self._queue.put(item, timeout=self.put_timeout)
+            except queue.Full:
+                self._count('dropped')
+                return False
+        depth = self._queue.qsize()
+        if depth > self._stats['high_water']:
+            self._stats['high_water'] = depth
+        return True
+
+    def _count(self, name: str):
+        # Producers may run on several threads
+        with self._lock:
+            self._stats[name] += 1
+
+    def _ensure_writer(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="telemetry-sink", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                batch = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            markers = [item for item in batch if isinstance(item, threading.Event)]
+            closing = False
+            try:
+                self._write_lines([item for item in batch if not isinstance(item, threading.Event)])
+                closing = self._closing.is_set() and self._queue.empty()
+                self._write_snapshots(force=bool(markers) or closing)
+            except Exception as e:
+                # Losing one batch beats losing the writer (and every later tick) for good
+                self._stats['write_errors'] += 1
+                logger.error(f"❌ Telemetry batch failed: {e}")
+            for marker in markers:
+                marker.set()
+            if closing:
+                return
+
+    def _write_lines(self, items: List[Tuple[str, Any, bool]]):
+        if not items:
+            return
+        by_path: Dict[str, List[str]] = defaultdict(list)
+        for path, payload, is_record in items:
+            try:
+                line = json.dumps(payload, default=str) if is_record else payload
+            except Exception as e:
+                self._stats['write_errors'] += 1
+                logger.warning(f"⚠️ Unserialisable telemetry record for {path}: {e}")
+                continue
+            by_path[path].append(line + "\n")
+
+        for path, lines in by_path.items():
+            try:
+                self._ensure_directory(path)
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write("".join(lines))
+                self._stats['lines_written'] += len(lines)
+            except OSError as e:
+                self._stats['write_errors'] += 1
+                logger.warning(f"⚠️ Failed to append telemetry to {path}: {e}")
+        self._stats['batches_written'] += 1
+
+    def _write_snapshots(self, force: bool = False):
+        now = time.monotonic()
+        if not self._snapshots or (not force and now - self._last_snapshot_write < self.snapshot_interval):
+            return
+        with self._lock:
+            snapshots, self._snapshots = self._snapshots, {}
+        self._last_snapshot_write = now
+
+        for path, (data, indent) in snapshots.items():
+            tmp_path = f"{path}.tmp"
+            try:
+                self._ensure_directory(path)
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=indent, default=str)
+                os.replace(tmp_path, path)
+                self._stats['snapshots_written'] += 1
+            except Exception as e:
+                self._stats['write_errors'] += 1
+                logger.warning(f"⚠️ Failed to write telemetry snapshot {path}: {e}")
+
+    def _ensure_directory(self, path: str):
+        directory = os.path.dirname(path)
+        if directory and directory not in self._directories:
+            os.makedirs(directory, exist_ok=True)
+            self._directories.add(directory)
+
+
+def _copy_payload(value: Any) -> Any:
+    """Copy the containers of a JSON-shaped payload; leaf values are shared"""
+    if isinstance(value, dict):
+        return {key: _copy_payload(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_payload(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_copy_payload(item) for item in value)
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+_global_telemetry_sink = None
+_global_sink_lock = threading.Lock()
+
+
+def get_telemetry_sink() -> TelemetrySink:
+    """Get or create the shared telemetry sink (flushed at interpreter exit)"""
+    global _global_telemetry_sink
+    if _global_telemetry_sink is None:
+        with _global_sink_lock:
+            if _global_telemetry_sink is None:
+                _global_telemetry_sink = TelemetrySink()
+                atexit.register(_global_telemetry_sink.close)
+    return _global_telemetry_sink
@@ -1,9 +1,10 @@
 from pathlib import Path
 import numpy as np
-from numba import njit, prange
 from PIL import Image
 import os
 
+from fractal.fractal_engine import JuliaJob, Viewport, render_julia
+
 # Mood → base RGB color (used for gradient mapping)
 MOOD_RGB = {
     "neutral": (180, 180, 180),
@@ -15,36 +16,21 @@ MOOD_RGB = {
     "calm": (120, 220, 160)
 }
 
-@njit(parallel=True)
 def julia_optimized(width, height, zoom, max_iter, c_real, c_imag):
-    result = np.zeros((height, width), dtype=np.uint16)
-    for y in prange(height):
-        for x in prange(width):
-            zx = 1.5 * (x - width / 2) / (0.5 * zoom * width)
-            zy = 1.5 * (y - height / 2) / (0.5 * zoom * height)
-            z = complex(zx, zy)
-            c = complex(c_real, c_imag)
-            iter_count = 0
-            while abs(z) < 10 and iter_count < max_iter:
-                z = z*z + c
-                iter_count += 1
-            result[y, x] = iter_count
+    """Escape-time counts (|z| < 10 loop, capped at max_iter) on the shared fractal engine"""
+    scale = (0.5 * zoom * width / 1.5, 0.5 * zoom * height / 1.5)
+    viewport = Viewport.pixel_scale(width, height, (width / 2, height / 2), scale)
+    steps = render_julia(JuliaJob(complex(c_real, c_imag), viewport, max_iter, escape_radius=10.0)).steps
+    result = np.where(steps > 0, steps, max_iter).astype(np.uint16)
+    # Starting points already outside the radius never iterate
+    result[np.abs(viewport.grid()) >= 10] = 0
     return result
 
 def apply_color_map(iter_array, max_iter, base_color):
-    h, w = iter_array.shape
-    img = np.zeros((h, w, 3), dtype=np.uint8)
-    r_base, g_base, b_base = base_color
-    norm = iter_array / max_iter
-    for y in range(h):
-        for x in range(w):
-            scale = norm[y, x]
-            img[y, x] = (
-                int(scale * r_base),
-                int(scale * g_base),
-                int(scale * b_base)
-            )
-    return img
+    """Scale base_color by iteration count / max_iter, through a per-count lookup table"""
+    levels = np.arange(max_iter + 1) / max_iter
+    lut = (levels[:, None] * np.asarray(base_color, dtype=float)).astype(np.uint8)
+    return lut[iter_array]
 
 def generate_julia_set_optimized(bloom_id, c, mood="neutral", resolution=512, zoom=1.0, max_iter=256, save_path=None):
     width = height = resolution
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+DAWN Fractal Engine - Shared Julia-set renderer
+Escape-time iteration over only the shrinking set of unescaped points,
+rendered in row tiles that a process pool can work on in parallel, with
+optional smooth (continuous) escape values and a batch API that spreads the
+tiles of many blooms over the pool at once.
+
+Every Julia renderer (bloom spawner, fractal generator, fractal boost and
+the GUI canvas) maps its own coordinate layout onto a Viewport and its own
+iteration conventions onto JuliaResult.steps.
+"""
+
+import atexit
+import logging
+import math
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Viewport:
+    """Affine pixel -> complex-plane map: z(x, y) = origin + x * step_x + y * step_y"""
+    width: int
+    height: int
+    origin: complex
+    step_x: complex
+    step_y: complex
+
+    @classmethod
+    def linspace(cls, width: int, height: int, x_range: Tuple[float, float], y_range: Tuple[float, float],
+                 rotation: float = 0.0) -> "Viewport":
+        """np.meshgrid(np.linspace(*x_range, width), np.linspace(*y_range, height)), rotated about 0"""
+        turn = complex(math.cos(rotation), math.sin(rotation))
+        step_x = (x_range[1] - x_range[0]) / max(width - 1, 1)
+        step_y = (y_range[1] - y_range[0]) / max(height - 1, 1)
+        return cls(width, height, complex(x_range[0], y_range[0]) * turn, step_x * turn, 1j * step_y * turn)
+
+    @classmethod
+    def pixel_scale(cls, width: int, height: int, center: Tuple[float, float],
+                    scale: Tuple[float, float]) -> "Viewport":
+        """z = (x - center_x) / scale_x + i (y - center_y) / scale_y"""
+        return cls(width, height, complex(-center[0] / scale[0], -center[1] / scale[1]),
+                   1 / scale[0], 1j / scale[1])
+
+    def grid(self, row_start: int = 0, row_stop: Optional[int] = None) -> np.ndarray:
+        """Complex coordinates of rows [row_start, row_stop)"""
+        row_stop = self.height if row_stop is None else row_stop
+        columns = np.arange(self.width) * self.step_x
+        rows = np.arange(row_start, row_stop)[:, None] * self.step_y
+        return self.origin + rows + columns
+
+
+@dataclass(frozen=True)
+class JuliaJob:
+    """One Julia-set frame to render"""
+    c: complex
+    viewport: Viewport
+    max_iter: int
+    escape_radius: float = 2.0
+    smooth: bool = False
+
+
+class JuliaResult(NamedTuple):
+    """
+    steps: first k >= 1 with |z_k| > escape_radius, 0 if the point stayed
+    bounded for max_iter steps. smooth (smooth jobs only): the continuous
+    escape time k - log2(log2 |z_k|), NaN where steps == 0.
+    """
+    steps: np.ndarray
+    smooth: Optional[np.ndarray] = None
+
+
+def iterate_julia(z: np.ndarray, c: complex, max_iter: int, escape_radius: float = 2.0,
+                  smooth: bool = False) -> JuliaResult:
+    """
+    Escape-time iteration of z -> z^2 + c on an array of starting points.
+    Escaped points are compacted out of the working set, so the cost of
+    each step is proportional to the points still iterating.
+    """
+    shape = np.shape(z)
+    work = np.array(z, dtype=np.complex128).ravel()
+    active = np.arange(work.size)
+    steps = np.zeros(work.size, dtype=np.int32)
+    escape_moduli = np.full(work.size, np.nan) if smooth else None
+    limit = escape_radius * escape_radius
+
+    for step in range(1, max_iter + 1):
+        if not active.size:
+            break
+        np.multiply(work, work, out=work)
+        work += c
+        modulus = work.real * work.real + work.imag * work.imag
+        escaped = modulus > limit
+        if escaped.any():
+            indices = active[escaped]
+            steps[indices] = step
+            if smooth:
+                escape_moduli[indices] = modulus[escaped]
+            keep = ~escaped
+            active = active[keep]
+            work = work[keep]
+
+    smooth_values = None
+    if smooth:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # log2(log2 |z|) with |z| = sqrt(modulus)
+            smooth_values = steps - np.log2(0.5 * np.log2(escape_moduli))
+        smooth_values = smooth_values.reshape(shape)
+    return JuliaResult(steps.reshape(shape), smooth_values)
+
+
+def _render_rows(job: JuliaJob, row_start: int, row_stop: int) -> JuliaResult:
+    return iterate_julia(job.viewport.grid(row_start, row_stop), job.c, job.max_iter,
+                         job.escape_radius, job.smooth)
+
+
+class FractalEngine:
+    """
+    Renders JuliaJobs in row tiles. Frames of at least `min_parallel_pixels`
+    (or batches adding up to it) go to a process pool of `workers`
+    processes; smaller work, or workers <= 1, renders in-process.
+    """
+
+    def __init__(self, workers: Optional[int] = None, tile_rows: int = 64,
+                 min_parallel_pixels: int = 256 * 256):
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.tile_rows = tile_rows
+        self.min_parallel_pixels = min_parallel_pixels
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats = {'jobs': 0, 'tiles': 0, 'pixels': 0, 'parallel_batches': 0,
+                       'serial_batches': 0, 'pool_failures': 0, 'render_seconds': 0.0}
+
+    def render(self, job: JuliaJob) -> JuliaResult:
+        return self.render_batch([job])[0]
+
+    def render_batch(self, jobs: Sequence[JuliaJob]) -> List[JuliaResult]:
+        """Render several frames, sharing the pool between all of their tiles"""
+        start = time.perf_counter()
+        tiles = [(index, row, min(row + self.tile_rows, job.viewport.height))
+                 for index, job in enumerate(jobs)
+                 for row in range(0, job.viewport.height, self.tile_rows)]
+        pixels = sum(job.viewport.width * job.viewport.height for job in jobs)
+
+        parts = None
+        if self.workers > 1 and len(tiles) > 1 and pixels >= self.min_parallel_pixels:
+            parts = self._render_parallel(jobs, tiles)
+        if parts is None:
+            parts = [_render_rows(jobs[index], row_start, row_stop) for index, row_start, row_stop in tiles]
+            self._stats['serial_batches'] += 1
+
+        parts_by_job: List[List[JuliaResult]] = [[] for _ in jobs]
+        for (index, _, _), part in zip(tiles, parts):
+            parts_by_job[index].append(part)
+
+        results = []
+        for job, job_parts in zip(jobs, parts_by_job):
+            steps = np.concatenate([part.steps for part in job_parts]) if job_parts else \
+                np.zeros((0, job.viewport.width), dtype=np.int32)
+            smooth = np.concatenate([part.smooth for part in job_parts]) if job.smooth and job_parts else None
+            results.append(JuliaResult(steps, smooth))
+
+        self._stats['jobs'] += len(jobs)
+        self._stats['tiles'] += len(tiles)
+        self._stats['pixels'] += pixels
+        self._stats['render_seconds'] += time.perf_counter() - start
+        return results
+
+    def close(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def get_statistics(self) -> Dict:
+        stats = dict(self._stats)
+        stats['workers'] = self.workers
+        stats['pool_active'] = self._pool is not None
+        stats['megapixels_per_second'] = (stats['pixels'] / 1e6 / stats['render_seconds']
+                                          if stats['render_seconds'] else 0.0)
+        return stats
+
+    # ─── internals ─────────────────────────────────────────────────────────
+
+    def _render_parallel(self, jobs: Sequence[JuliaJob], tiles) -> Optional[List[JuliaResult]]:
+        try:
+            pool = self._get_pool()
+            futures = [pool.submit(_render_rows, jobs[index], row_start, row_stop)
+                       for index, row_start, row_stop in tiles]
+            parts = [future.result() for future in futures]
+        except Exception as e:
+            # Broken or unavailable pool (e.g. no fork/semaphores): render in-process from now on
+            logger.warning(f"⚠️ Fractal process pool unavailable, rendering serially: {e}")
+            self._stats['pool_failures'] += 1
+            self.workers = 1
+            self.close()
+            return None
+        self._stats['parallel_batches'] += 1
+        return parts
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            return self._pool
+
+
+_global_fractal_engine = None
+_global_engine_lock = threading.Lock()
+
+
+def get_fractal_engine() -> FractalEngine:
+    """Get or create the shared fractal engine (pool shut down at interpreter exit)"""
+    global _global_fractal_engine
+    if _global_fractal_engine is None:
+        with _global_engine_lock:
+            if _global_fractal_engine is None:
+                _global_fractal_engine = FractalEngine()
+                atexit.register(_global_fractal_engine.close)
+    return _global_fractal_engine
+
+
+def render_julia(job: JuliaJob) -> JuliaResult:
+    """Render one frame on the shared engine"""
+    return get_fractal_engine().render(job)
+
+
+def render_julia_batch(jobs: Sequence[JuliaJob]) -> List[JuliaResult]:
+    """Render many frames (e.g. a rebloom storm) concurrently on the shared engine"""
+    return get_fractal_engine().render_batch(jobs)
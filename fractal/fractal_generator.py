@@ -7,6 +7,8 @@ from datetime import datetime
 import hashlib
 import random
 from mycelium.nutrient_utils import get_nutrient_heat
+from fractal.fractal_engine import JuliaJob, Viewport, render_julia
+from fractal.render_cache import get_render_cache, quantise, render_key
 
 IMG_SIZE = (512, 512)
 SAVE_DIR = "juliet_flowers/fractal_signatures"
@@ -37,14 +39,19 @@ def evolve_fractal_signature(seed_id, entropy, lineage_depth, bloom_factor):
     return complex(real + offset, imag)
 
 
-def apply_heat_blend(img, heat, mood):
+def get_sigil_intensity():
+    from codex.sigil_memory_ring import get_sigil_energy_index
+    return get_sigil_energy_index()  # Returns value 0.0–1.0
+
+
+def apply_heat_blend(img, heat, mood, sigil_intensity=None):
     base = img.convert("RGB")
     tint = PLATONIC_PIGMENTS.get(mood, (180, 180, 180))
     overlay = Image.new("RGB", base.size, tint)
 
     # New: Modulate alpha by SCUP / Sigil Intensity
-    from codex.sigil_memory_ring import get_sigil_energy_index
-    sigil_intensity = get_sigil_energy_index()  # Returns value 0.0–1.0
+    if sigil_intensity is None:
+        sigil_intensity = get_sigil_intensity()
 
     alpha = min(0.6 + (sigil_intensity * 0.3), 0.95)
     return Image.blend(base, overlay, alpha=alpha)
@@ -74,11 +81,33 @@ def overlay_signature(img, seed_id, lineage_depth, mood, entropy, heat, bloom_fa
     return img
 
 
+def _signature_path(seed_id):
+    timestamp = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
+    return os.path.join(SAVE_DIR, f"{seed_id}_{timestamp}.png")
+
+
 def generate_julia_image(seed_id, lineage_depth, bloom_factor, entropy_score, mood="reflective", is_synthesis=False):
     """
     Full rendering pipeline for a bloom's Julia-set visual.
     Dynamically varies zoom, iterations, and offset by seed + semantic input.
+    Visuals whose quantised inputs were rendered before come from the render cache.
     """
+    bloom_factor = quantise(bloom_factor)
+    entropy_score = quantise(entropy_score)
+    heat = quantise(get_nutrient_heat(seed_id))
+    sigil_intensity = quantise(get_sigil_intensity())
+
+    cache = get_render_cache()
+    cache_key = render_key("fractal_generator", seed_id=seed_id, lineage_depth=lineage_depth,
+                           bloom_factor=bloom_factor, entropy_score=entropy_score, mood=mood,
+                           is_synthesis=is_synthesis, heat=heat, sigil_intensity=sigil_intensity,
+                           size=IMG_SIZE)
+    final_path = cache.fetch(cache_key, _signature_path(seed_id))
+    if final_path is not None:
+        print(f"[Fractal] ♻️ Reused cached render {os.path.basename(final_path)} | Mood: {mood} | "
+              f"Entropy: {entropy_score:.2f} | Heat: {heat:.2f}")
+        return final_path
+
     width, height = IMG_SIZE
     zoom_factor = 1.5 - (bloom_factor * 0.2)
     entropy_shift = (entropy_score - 0.5) * 1.2
@@ -88,12 +117,10 @@ def generate_julia_image(seed_id, lineage_depth, bloom_factor, entropy_score, mo
     offset_x = ((seed_hash % 1000) / 1000 - 0.5) * 1.2
     offset_y = (((seed_hash // 1000) % 1000) / 1000 - 0.5) * 1.2
 
-    # Generate meshgrid with offset
-    x = np.linspace(-zoom_factor + offset_x, zoom_factor + offset_x, width)
-    y = np.linspace(-zoom_factor + offset_y, zoom_factor + offset_y, height)
-    X, Y = np.meshgrid(x, y)
-    Z = X + 1j * Y
-
+    # Viewport with offset
+    viewport = Viewport.linspace(width, height,
+                                 (-zoom_factor + offset_x, zoom_factor + offset_x),
+                                 (-zoom_factor + offset_y, zoom_factor + offset_y))
 
     # More dynamic iterations
     iter_base = 240 + int((bloom_factor + entropy_score) * 40)
@@ -104,14 +131,9 @@ def generate_julia_image(seed_id, lineage_depth, bloom_factor, entropy_score, mo
     # Get complex constant for fractal generation
     c = evolve_fractal_signature(seed_id, entropy_score, lineage_depth, bloom_factor)
 
-    output = np.zeros(Z.shape, dtype=int)
-    mask = np.full(Z.shape, True, dtype=bool)
-
-    for i in range(iterations):
-        Z[mask] = Z[mask] ** 2 + c
-        mask, old_mask = abs(Z) < 4, mask
-        output += mask & old_mask
-
+    # Count of steps each point stayed inside |z| < 4
+    steps = render_julia(JuliaJob(c, viewport, iterations, escape_radius=4.0)).steps
+    output = np.where(steps > 0, steps - 1, iterations)
 
     max_val = output.max()
     if max_val == 0:
@@ -121,18 +143,17 @@ def generate_julia_image(seed_id, lineage_depth, bloom_factor, entropy_score, mo
     img = Image.fromarray(output_normalized).convert("L").resize(IMG_SIZE)
 
     # Add mood + pressure tint
-    heat = get_nutrient_heat(seed_id)
-    img_colored = apply_heat_blend(img, heat, mood)
+    img_colored = apply_heat_blend(img, heat, mood, sigil_intensity)
 
     # Add visual signature overlay
     final = overlay_signature(img_colored, seed_id, lineage_depth, mood, entropy_score, heat, bloom_factor)
 
     # Save
-    timestamp = datetime.now().strftime("%Y-%m-%dT%H-%M-%S")
-    filename = f"{seed_id}_{timestamp}.png"
-    final_path = os.path.join(SAVE_DIR, filename)
+    final_path = _signature_path(seed_id)
     final.save(final_path)
-    print(f"[Fractal] 🌸 Rendered {filename} | Mood: {mood} | Entropy: {entropy_score:.2f} | Heat: {heat:.2f}")
+    cache.store(cache_key, final_path)
+    print(f"[Fractal] 🌸 Rendered {os.path.basename(final_path)} | Mood: {mood} | "
+          f"Entropy: {entropy_score:.2f} | Heat: {heat:.2f}")
 
     return final_path
 
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+DAWN Fractal Render Cache - Content-addressed store for bloom visuals
+Bloom images are keyed by a hash of their quantised fractal parameters, so
+a repeated or near-identical rebloom costs a lookup instead of a full-frame
+render and PNG encode. Encoded PNGs live in a byte-bounded in-memory LRU in
+front of a size-bounded on-disk store; a hit is published at the caller's
+path as an atomically written copy. Cache entries and published files never
+share an inode, so rewriting a published image cannot corrupt the cache.
+The cache is best-effort: disk errors are logged and count as misses, so
+a full disk or unwritable cache directory never fails a render.
+"""
+
+import hashlib
+import json
+import logging
+import numbers
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+RENDER_CACHE_DIR = "juliet_flowers/fractal_cache"
+RENDER_QUANTUM = 0.01
+
+
+def quantise(value: float, step: float = RENDER_QUANTUM) -> float:
+    """Snap a fractal parameter to the cache grid"""
+    return round(round(float(value) / step) * step, 10)
+
+
+def _canonical(value: Any):
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    if isinstance(value, numbers.Real):
+        return float(value)
+    if isinstance(value, numbers.Complex):
+        return [float(value.real), float(value.imag)]
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    return str(value)
+
+
+def render_key(namespace: str, **params) -> str:
+    """Content address of a render: hash of the renderer name and its (already quantised) parameters"""
+    payload = json.dumps([namespace, {name: _canonical(value) for name, value in params.items()}],
+                         sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+class FractalRenderCache:
+    """
+    Two-tier PNG cache: `max_memory_bytes` of encoded images in an LRU,
+    backed by `max_disk_bytes` of files in `directory` evicted least
+    recently used first (by modification time across restarts).
+    """
+
+    def __init__(self, directory: str = RENDER_CACHE_DIR, max_memory_bytes: int = 64 * 1024 * 1024,
+                 max_disk_bytes: int = 512 * 1024 * 1024):
+        self.directory = directory
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: Optional["OrderedDict[str, int]"] = None
+        self._disk_bytes = 0
+        self._lock = threading.RLock()
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0,
+                       'memory_evictions': 0, 'disk_evictions': 0, 'copies': 0}
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.png")
+
+    def fetch(self, key: str, destination: Optional[str] = None) -> Optional[str]:
+        """
+        Publish the cached image for `key` at `destination` (default: the
+        stored file itself) and return its path, or None on a miss.
+        """
+        with self._lock:
+            try:
+                return self._fetch(key, destination)
+            except OSError as e:
+                # The cache is best-effort: an unusable disk tier means the caller renders
+                logger.warning(f"⚠️ Render cache unavailable for {key}: {e}")
+                self._stats['misses'] += 1
+                return None
+
+    def store(self, key: str, source: str):
+        """Add a freshly rendered image file to both tiers"""
+        try:
+            with open(source, 'rb') as handle:
+                data = handle.read()
+        except OSError as e:
+            logger.warning(f"⚠️ Could not cache render {source}: {e}")
+            return
+        with self._lock:
+            self._admit_memory(key, data)
+            self._stats['stores'] += 1
+            try:
+                self._disk_index()
+                self._admit_disk(key, data)
+            except OSError as e:
+                logger.warning(f"⚠️ Render {key} cached in memory only: {e}")
+
+    def clear_memory(self):
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    def get_statistics(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            try:
+                disk = self._disk_index()
+            except OSError:
+                disk = {}
+            stats['hits'] = stats['memory_hits'] + stats['disk_hits']
+            lookups = stats['hits'] + stats['misses']
+            stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+            stats['memory_entries'] = len(self._memory)
+            stats['memory_bytes'] = self._memory_bytes
+            stats['disk_entries'] = len(disk)
+            stats['disk_bytes'] = self._disk_bytes
+            return stats
+
+    # ─── internals ─────────────────────────────────────────────────────────
+
+    def _fetch(self, key: str, destination: Optional[str]) -> Optional[str]:
+        disk = self._disk_index()
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+            if key not in disk or not os.path.exists(self.path_for(key)):
+                self._admit_disk(key, data)
+            tier = 'memory_hits'
+        elif key in disk and os.path.exists(self.path_for(key)):
+            disk.move_to_end(key)
+            try:
+                with open(self.path_for(key), 'rb') as handle:
+                    self._admit_memory(key, handle.read())
+            except OSError as e:
+                logger.warning(f"⚠️ Unreadable cached render {key}: {e}")
+                self._drop_disk(key)
+                self._stats['misses'] += 1
+                return None
+            tier = 'disk_hits'
+        else:
+            if key in disk:
+                self._drop_disk(key)  # removed behind our back
+            self._stats['misses'] += 1
+            return None
+
+        if destination is not None:
+            self._publish(key, destination)
+        self._stats[tier] += 1
+        return destination or self.path_for(key)
+
+    def _disk_index(self) -> "OrderedDict[str, int]":
+        if self._disk is None:
+            os.makedirs(self.directory, exist_ok=True)
+            entries = []
+            for entry in os.scandir(self.directory):
+                if entry.is_file() and entry.name.endswith('.png'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.name[:-4], stat.st_size))
+            self._disk = OrderedDict((key, size) for _, key, size in sorted(entries))
+            self._disk_bytes = sum(self._disk.values())
+        return self._disk
+
+    def _admit_memory(self, key: str, data: bytes):
+        if key in self._memory:
+            self._memory_bytes -= len(self._memory.pop(key))
+        if len(data) > self.max_memory_bytes:
+            return
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self._stats['memory_evictions'] += 1
+
+    def _admit_disk(self, key: str, data: bytes):
+        self._write(data, self.path_for(key))
+        if key in self._disk:
+            self._disk_bytes -= self._disk.pop(key)
+        self._disk[key] = len(data)
+        self._disk_bytes += len(data)
+        while self._disk_bytes > self.max_disk_bytes and len(self._disk) > 1:
+            evicted = next(iter(self._disk))
+            self._drop_disk(evicted)
+            self._stats['disk_evictions'] += 1
+
+    def _drop_disk(self, key: str):
+        self._disk_bytes -= self._disk.pop(key, 0)
+        try:
+            os.remove(self.path_for(key))
+        except OSError:
+            pass
+
+    def _publish(self, key: str, destination: str):
+        data = self._memory.get(key)
+        if data is None:
+            with open(self.path_for(key), 'rb') as handle:
+                data = handle.read()
+        self._write(data, destination)
+        self._stats['copies'] += 1
+
+    @staticmethod
+    def _write(data: bytes, destination: str):
+        temporary = f"{destination}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temporary, 'wb') as handle:
+                handle.write(data)
+            os.replace(temporary, destination)
+        except OSError:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+            raise
+
+
+_global_render_cache = None
+_global_cache_lock = threading.Lock()
+
+
+def get_render_cache() -> FractalRenderCache:
+    """Get or create the shared bloom render cache"""
+    global _global_render_cache
+    if _global_render_cache is None:
+        with _global_cache_lock:
+            if _global_render_cache is None:
+                _global_render_cache = FractalRenderCache()
+    return _global_render_cache
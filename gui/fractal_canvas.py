@@ -9,8 +9,42 @@ File: gui/fractal_canvas.py
 import tkinter as tk
 import math
 import colorsys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+
+from fractal.fractal_engine import JuliaJob, Viewport, render_julia
+
+
+def fractal_color_lut(max_iterations: int, palette: List[Tuple[float, float, float]],
+                      complexity: float) -> np.ndarray:
+    """
+    RGB colour of every iteration count 0..max_iterations as a uint8 table:
+    FractalCanvas.get_fractal_color below max_iterations, the darkened base
+    palette colour for points inside the set.
+    """
+    colors = np.asarray(palette, dtype=np.float64)
+    intensity = np.arange(max_iterations + 1) / max_iterations
+    scaled_intensity = intensity * (0.5 + complexity * 0.5)
+    palette_index = np.clip((scaled_intensity * (len(colors) - 1)).astype(np.int64), 0, len(colors) - 1)
+    brightness = 0.6 + intensity * 0.4
+    lut = (np.minimum(1.0, colors[palette_index] * brightness[:, None]) * 255).astype(np.uint8)
+    lut[max_iterations] = (colors[0] * 80).astype(np.uint8)
+    return lut
+
+
+def fractal_frame(iterations: np.ndarray, max_iterations: int, palette: List[Tuple[float, float, float]],
+                  complexity: float) -> np.ndarray:
+    """(height, width, 3) uint8 frame for a (height, width) array of julia_iteration counts"""
+    return fractal_color_lut(max_iterations, palette, complexity)[iterations]
+
+
+def ppm_bytes(rgb: np.ndarray) -> bytes:
+    """Binary PPM encoding of an RGB frame, which tk.PhotoImage reads without PIL"""
+    height, width = rgb.shape[:2]
+    return b"P6 %d %d 255\n" % (width, height) + np.ascontiguousarray(rgb, dtype=np.uint8).tobytes()
+
 
 class FractalCanvas:
     def __init__(self, parent, width=300, height=300):
@@ -55,6 +89,12 @@ class FractalCanvas:
         # Rendering throttle to prevent too-frequent updates
         self.last_render_time = 0
         
+        # Frames render on a background thread; only the newest one is shown
+        self._render_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fractal-canvas")
+        self._render_generation = 0
+        self._fractal_item = None
+        self._fractal_photo = None
+        
         # Fractal parameters
         self.max_iterations = 50
         self.zoom = 200
@@ -269,7 +309,7 @@ class FractalCanvas:
                 
                 self.render_bloom_fractal(palette, depth, complexity)
                 render_time = __import__('time').time() - render_start_time
-                print(f"  Fractal rendered in {render_time:.3f} seconds")
+                print(f"  Fractal frame queued in {render_time:.3f} seconds")
                 
                 # DEBUG: Visual indicators
                 print("\nVISUAL INDICATORS:")
@@ -402,42 +442,65 @@ class FractalCanvas:
         return varied_palette
     
     def render_bloom_fractal(self, palette: List[Tuple[float, float, float]], depth: int, complexity: float):
-        """Render the main bloom fractal using Julia set algorithm"""
-        center_x = self.width // 2
-        center_y = self.height // 2
-        
-        # Create pixel grid for fractal
-        pixels = []
-        
-        for py in range(0, self.height, 1):  # High quality - every pixel
-            for px in range(0, self.width, 1):
-                # Convert pixel coordinates to complex plane
-                zx = (px - center_x) / self.zoom
-                zy = (py - center_y) / self.zoom
-                
-                # Julia set iteration
-                iteration = self.julia_iteration(zx, zy, self.cx, self.cy)
-                
-                # Map iteration to color
-                if iteration == self.max_iterations:
-                    # Inside set - use darkest palette color instead of pure black
-                    r, g, b = palette[0]  # Use base color from palette
-                    # Make it darker but not pure black
-                    color = f"#{int(r*80):02x}{int(g*80):02x}{int(b*80):02x}"
-                else:
-                    # Color based on iteration count and palette
-                    color_intensity = iteration / self.max_iterations
-                    color = self.get_fractal_color(color_intensity, palette, complexity)
-                
-                # Store pixel for batch rendering
-                pixels.append((px, py, color))
-        
-        # Batch render pixels
-        self.render_pixels(pixels)
+        """
+        Render the main bloom fractal. The frame is computed as one RGB array
+        on the render thread and blitted as a single PhotoImage back on the Tk
+        thread; until it arrives the previous frame stays on screen.
+        """
+        self._render_generation += 1
+        generation = self._render_generation
+        
+        # Image item at the bottom of the stack, so overlays drawn now stay on top
+        self._fractal_item = self.canvas.create_image(0, 0, anchor="nw", tags=("fractal",))
+        if self._fractal_photo is not None:
+            self.canvas.itemconfigure(self._fractal_item, image=self._fractal_photo)
+        self.canvas.tag_lower(self._fractal_item)
+        
+        self._render_executor.submit(self._render_frame, generation, complex(self.cx, self.cy),
+                                     self.zoom, self.max_iterations, list(palette), complexity)
         
         # Add bloom center glow
         self.add_bloom_center_glow(palette[0])
     
+    def _render_frame(self, generation: int, c: complex, zoom: float, max_iterations: int,
+                      palette: List[Tuple[float, float, float]], complexity: float):
+        """Render thread: compute the frame and hand it to the Tk thread"""
+        if generation != self._render_generation:
+            return  # superseded before it started
+        try:
+            iterations = self.julia_iterations(c, zoom, max_iterations)
+            frame = ppm_bytes(fractal_frame(iterations, max_iterations, palette, complexity))
+            self.canvas.after(0, self._present_frame, generation, frame)
+        except Exception as e:
+            print(f"  ERROR during fractal frame render: {e}")
+            try:
+                self.canvas.after(0, self._present_failure, generation)
+            except Exception:
+                pass  # canvas destroyed
+    
+    def _present_frame(self, generation: int, frame: bytes):
+        """Tk thread: blit a finished frame unless a newer render has started"""
+        if generation != self._render_generation or not self.canvas.winfo_exists():
+            return
+        self._fractal_photo = tk.PhotoImage(data=frame, format="PPM")
+        self.canvas.itemconfigure(self._fractal_item, image=self._fractal_photo)
+    
+    def _present_failure(self, generation: int):
+        if generation == self._render_generation and self.canvas.winfo_exists():
+            self.canvas.delete("fractal")
+            self.draw_placeholder_flower()
+    
+    def julia_iterations(self, c: Optional[complex] = None, zoom: Optional[float] = None,
+                         max_iterations: Optional[int] = None) -> np.ndarray:
+        """julia_iteration for every canvas pixel, as a (height, width) array"""
+        c = complex(self.cx, self.cy) if c is None else c
+        zoom = self.zoom if zoom is None else zoom
+        max_iterations = self.max_iterations if max_iterations is None else max_iterations
+        viewport = Viewport.pixel_scale(self.width, self.height, (self.width // 2, self.height // 2),
+                                        (zoom, zoom))
+        steps = render_julia(JuliaJob(c, viewport, max_iterations)).steps
+        return np.where(steps > 0, steps - 1, max_iterations)
+    
     def julia_iteration(self, zx: float, zy: float, cx: float, cy: float) -> int:
         """Perform Julia set iteration for a point"""
         iteration = 0
@@ -477,24 +540,6 @@ class FractalCanvas:
         # Convert to hex
         return f"#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}"
     
-    def render_pixels(self, pixels: List[Tuple[int, int, str]]):
-        """Batch render fractal pixels to canvas"""
-        print(f"  PIXEL RENDERING: Starting to render {len(pixels)} pixels")
-        
-        try:
-            for px, py, color in pixels:
-                # Check canvas validity periodically during rendering
-                if not self.canvas.winfo_exists():
-                    print("  WARNING: Canvas destroyed during pixel rendering, stopping")
-                    return
-                # High quality single pixel rendering
-                self.canvas.create_rectangle(px, py, px+1, py+1, fill=color, outline="")
-        except Exception as e:
-            print(f"  ERROR during pixel rendering: {e}")
-            return
-            
-        print(f"  PIXEL RENDERING: Complete")
-    
     def add_bloom_center_glow(self, primary_color: Tuple[float, float, float]):
         """Add glowing center point representing bloom core"""
         center_x = self.width // 2
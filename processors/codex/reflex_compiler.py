@@ -0,0 +1,200 @@
+"""
+DAWN Reflex Compiler - Flat decision table for the symbolic reflex table
+
+Each reflex trigger is compiled once into a predicate closure over the
+context keys it reads, and the table keeps a metric -> trigger dependency
+index. A tick only re-runs the predicates whose input metrics changed since
+the previous context; the cached results of the others still hold because
+predicates are pure functions of their inputs. Reflexes with no true
+predicate cannot fire and are skipped entirely, so a tick costs
+O(changed metrics' dependents + reflexes with a true predicate) instead of
+O(reflexes x triggers).
+
+Cooldowns use the monotonic clock (trigger.cooldown_until). Semantics match
+ReflexTrigger.check_trigger: triggers are tried in order, the first one
+that is out of cooldown and true fires its reflex, and reflexes fire in
+table order.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+Predicate = Callable[[Dict[str, Any]], bool]
+
+_MISSING = object()
+
+
+def _constant(value: bool) -> Predicate:
+    return lambda context: value
+
+
+def _threshold_predicate(conditions: Dict[str, Any], sensitivity: float) -> Tuple[Predicate, Tuple[str, ...]]:
+    metric = conditions.get('metric')
+    threshold = conditions.get('threshold')
+    operator = conditions.get('operator', 'greater_than')
+    if not metric or threshold is None:
+        return _constant(False), ()
+
+    if operator == 'greater_than':
+        limit = threshold * sensitivity
+        return (lambda context: context.get(metric, 0) > limit), (metric,)
+    if operator == 'less_than':
+        limit = threshold * sensitivity
+        return (lambda context: context.get(metric, 0) < limit), (metric,)
+    if operator == 'equals':
+        tolerance = conditions.get('tolerance', 0.1)
+        return (lambda context: abs(context.get(metric, 0) - threshold) < tolerance), (metric,)
+    return _constant(False), ()
+
+
+def _equality_predicate(expected: Dict[str, Any]) -> Tuple[Predicate, Tuple[str, ...]]:
+    items = tuple(expected.items())
+    return (lambda context: all(context.get(key) == value for key, value in items)), tuple(expected)
+
+
+def compile_trigger(trigger_type: Any, conditions: Dict[str, Any],
+                    sensitivity: float = 1.0) -> Tuple[Predicate, Tuple[str, ...]]:
+    """
+    Predicate closure for one trigger (without its cooldown) plus the context
+    keys it reads. trigger_type is a TriggerType or its string value.
+    """
+    trigger_type = getattr(trigger_type, 'value', trigger_type)
+
+    if trigger_type == 'threshold':
+        return _threshold_predicate(conditions, sensitivity)
+
+    if trigger_type == 'pattern':
+        pattern = conditions.get('pattern')
+        return _equality_predicate(pattern) if pattern else (_constant(False), ())
+
+    if trigger_type == 'combination':
+        logic = conditions.get('logic', 'AND')
+        if logic not in ('AND', 'OR'):
+            return _constant(False), ()
+        # Sub-conditions are plain threshold checks (sensitivity 1.0, no cooldown)
+        compiled = [_threshold_predicate(condition, 1.0) for condition in conditions.get('conditions', [])]
+        checks = tuple(predicate for predicate, _ in compiled)
+        inputs = tuple(dict.fromkeys(key for _, keys in compiled for key in keys))
+        if logic == 'AND':
+            return (lambda context: all(check(context) for check in checks)), inputs
+        return (lambda context: any(check(context) for check in checks)), inputs
+
+    if trigger_type == 'contextual':
+        return _equality_predicate(conditions.get('required_context', {}))
+
+    # Temporal triggers are placeholders that never fire
+    return _constant(False), ()
+
+
+class ReflexDecisionTable:
+    """
+    Flat trigger table compiled from a sequence of reflexes (objects with
+    `triggers` and `enabled`; triggers carry trigger_type, conditions,
+    sensitivity, cooldown_seconds, cooldown_until and mark_triggered(now)).
+    Recompile after changing trigger definitions.
+    """
+
+    def __init__(self, reflexes: Sequence[Any]):
+        self.reflexes = list(reflexes)
+        self.triggers: List[Any] = []
+        self.trigger_reflex: List[int] = []
+        self.reflex_slots: List[range] = []
+        self.predicates: List[Predicate] = []
+        self.dependents: Dict[str, List[int]] = {}
+        self.state: List[bool] = []
+
+        for reflex_index, reflex in enumerate(self.reflexes):
+            start = len(self.triggers)
+            for trigger in reflex.triggers:
+                slot = len(self.triggers)
+                predicate, inputs = compile_trigger(trigger.trigger_type, trigger.conditions, trigger.sensitivity)
+                self.triggers.append(trigger)
+                self.trigger_reflex.append(reflex_index)
+                self.predicates.append(predicate)
+                self.state.append(False)
+                for key in inputs:
+                    self.dependents.setdefault(key, []).append(slot)
+            self.reflex_slots.append(range(start, len(self.triggers)))
+
+        self._true_counts = [0] * len(self.reflexes)
+        self._hot: Dict[int, None] = {}
+        self._previous: Optional[Dict[str, Any]] = None
+        self.evaluations = 0
+        self.predicate_calls = 0
+
+    def __len__(self) -> int:
+        return len(self.triggers)
+
+    def evaluate(self, context: Dict[str, Any], now: Optional[float] = None) -> List[Tuple[Any, Any]]:
+        """
+        (reflex, trigger) pairs that fire for this context, in table order.
+        Fired triggers are marked (starting their cooldowns).
+        """
+        self.evaluations += 1
+        # Triggers reading no context key are evaluated once, on the first tick
+        try:
+            for slot in self._changed_slots(context):
+                self._set_state(slot, bool(self.predicates[slot](context)))
+                self.predicate_calls += 1
+        except Exception:
+            # Cached states may be stale now: re-run everything next time
+            self._previous = None
+            raise
+
+        if not self._hot:
+            return []
+        now = time.monotonic() if now is None else now
+        fired = []
+        for reflex_index in sorted(self._hot):
+            reflex = self.reflexes[reflex_index]
+            if not reflex.enabled:
+                continue
+            for slot in self.reflex_slots[reflex_index]:
+                trigger = self.triggers[slot]
+                if not self.state[slot]:
+                    continue
+                if trigger.cooldown_seconds > 0 and now < trigger.cooldown_until:
+                    continue
+                trigger.mark_triggered(now)
+                fired.append((reflex, trigger))
+                break
+        return fired
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            'reflexes': len(self.reflexes),
+            'triggers': len(self.triggers),
+            'metrics': len(self.dependents),
+            'hot_reflexes': len(self._hot),
+            'evaluations': self.evaluations,
+            'predicate_calls': self.predicate_calls,
+        }
+
+    # ─── internals ─────────────────────────────────────────────────────────
+
+    def _changed_slots(self, context: Dict[str, Any]) -> List[int]:
+        previous, self._previous = self._previous, {key: context.get(key, _MISSING) for key in self.dependents}
+        if previous is None:
+            return list(range(len(self.triggers)))
+
+        changed: Dict[int, None] = {}
+        for key, value in self._previous.items():
+            old = previous[key]
+            try:
+                same = old is value or bool(old == value)
+            except Exception:
+                same = False
+            if not same:
+                changed.update(dict.fromkeys(self.dependents[key]))
+        return list(changed)
+
+    def _set_state(self, slot: int, value: bool):
+        if self.state[slot] == value:
+            return
+        self.state[slot] = value
+        reflex_index = self.trigger_reflex[slot]
+        self._true_counts[reflex_index] += 1 if value else -1
+        if self._true_counts[reflex_index]:
+            self._hot[reflex_index] = None
+        else:
+            self._hot.pop(reflex_index, None)
@@ -0,0 +1,230 @@
+"""
+DAWN Reflex Context - Provider registry for reflex evaluation context
+
+Each context source (pulse heat, SCUP, qualia, tension, goals, memory
+anchors...) is a ContextProvider: the symbols it imports, a function that
+turns them into context values, fallback values and a TTL. Imports are
+resolved once; a source that cannot be imported (or fails while importing)
+is remembered as unavailable and serves its fallback without touching the import machinery
+again (until reset()). Values are reused until the provider's TTL expires,
+so slow-changing sources refresh on their own cadence, and every provider
+is timed so get_statistics() shows which source dominates a gather.
+"""
+
+import importlib
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ContextProvider:
+    """One context source. gather(context_so_far, *symbols) -> context values."""
+    name: str
+    imports: Sequence[Tuple[str, str]]  # (module, attribute) pairs
+    gather: Callable[..., Dict[str, Any]]
+    fallback: Dict[str, Any] = field(default_factory=dict)
+    ttl: float = 0.0  # seconds; 0 refreshes on every gather
+
+
+@dataclass
+class _ProviderState:
+    symbols: Optional[List[Any]] = None
+    unavailable: Optional[str] = None
+    values: Optional[Dict[str, Any]] = None
+    expires_at: float = 0.0
+    calls: int = 0
+    cache_hits: int = 0
+    fallbacks: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    last_time: float = 0.0
+
+
+class ContextProviderRegistry:
+    """Ordered providers; later providers see the values of earlier ones."""
+
+    def __init__(self, providers: Sequence[ContextProvider] = ()):
+        self.providers: Dict[str, ContextProvider] = {}
+        self._state: Dict[str, _ProviderState] = {}
+        for provider in providers:
+            self.register(provider)
+
+    def register(self, provider: ContextProvider):
+        """Add or replace a provider (replacing keeps its position)."""
+        self.providers[provider.name] = provider
+        self._state[provider.name] = _ProviderState()
+
+    def gather(self, context: Optional[Dict[str, Any]] = None, now: Optional[float] = None) -> Dict[str, Any]:
+        """Merge every provider's values into `context` (a new dict if None)."""
+        context = {} if context is None else context
+        now = time.monotonic() if now is None else now
+        for name, provider in self.providers.items():
+            state = self._state[name]
+            if state.values is not None and now < state.expires_at:
+                state.cache_hits += 1
+                context.update(state.values)
+                continue
+
+            start = time.perf_counter()
+            values = self._run(provider, state, context)
+            elapsed = time.perf_counter() - start
+            state.calls += 1
+            state.total_time += elapsed
+            state.last_time = elapsed
+
+            state.values = values
+            state.expires_at = now + provider.ttl
+            context.update(values)
+        return context
+
+    def reset(self, name: Optional[str] = None):
+        """Forget resolved imports, memoised failures and cached values."""
+        for key in ([name] if name is not None else list(self._state)):
+            if key in self._state:
+                self._state[key] = _ProviderState()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        providers = {}
+        for name, state in self._state.items():
+            providers[name] = {
+                'available': state.unavailable is None,
+                'unavailable_reason': state.unavailable,
+                'ttl': self.providers[name].ttl,
+                'calls': state.calls,
+                'cache_hits': state.cache_hits,
+                'fallbacks': state.fallbacks,
+                'errors': state.errors,
+                'last_ms': state.last_time * 1000,
+                'mean_ms': state.total_time * 1000 / state.calls if state.calls else 0.0,
+                'total_ms': state.total_time * 1000,
+            }
+        slowest = max(providers, key=lambda name: providers[name]['total_ms'], default=None)
+        return {'providers': providers, 'slowest_provider': slowest}
+
+    # ─── internals ─────────────────────────────────────────────────────────
+
+    def _run(self, provider: ContextProvider, state: _ProviderState, context: Dict[str, Any]) -> Dict[str, Any]:
+        if state.symbols is None and state.unavailable is None:
+            self._resolve(provider, state)
+        if state.unavailable is not None:
+            state.fallbacks += 1
+            return dict(provider.fallback)
+
+        try:
+            return dict(provider.gather(context, *state.symbols))
+        except ImportError as e:
+            # Lazy imports inside the source itself; not memoised
+            state.fallbacks += 1
+            logger.debug(f"Context provider '{provider.name}' import failed at call time: {e}")
+        except Exception as e:
+            state.errors += 1
+            logger.warning(f"⚠️ Context provider '{provider.name}' failed: {e}")
+        return dict(provider.fallback)
+
+    def _resolve(self, provider: ContextProvider, state: _ProviderState):
+        symbols = []
+        for module_name, attribute in provider.imports:
+            try:
+                symbols.append(getattr(importlib.import_module(module_name), attribute))
+            except Exception as e:
+                # ImportError, a missing attribute, or a module failing while it imports
+                state.unavailable = f"{module_name}.{attribute}: {e}"
+                logger.info(f"🔌 Context provider '{provider.name}' unavailable, using fallback ({e})")
+                return
+        state.symbols = symbols
+
+
+# ─── reflex table sources ──────────────────────────────────────────────────
+
+def _pulse_context(context, pulse):
+    thermal_profile = pulse.get_thermal_profile()
+    return {
+        'pulse_heat': thermal_profile.get('current_heat', 2.0),
+        'thermal_stability': thermal_profile.get('stability_index', 1.0),
+        'thermal_momentum': thermal_profile.get('thermal_momentum', 0.0),
+        'current_zone': thermal_profile.get('current_zone', 'unknown'),
+    }
+
+
+def _scup_context(context, compute_scup, current_alignment_probe, mood_urgency_probe,
+                  get_active_sigil_entropy_list):
+    entropy_list = get_active_sigil_entropy_list()
+    entropy_level = sum(entropy_list) / len(entropy_list) if entropy_list else 0.0
+    scup_score = compute_scup(
+        tp_rar=current_alignment_probe(None),
+        pressure_score=context.get('pulse_heat', 2.0),
+        urgency_level=mood_urgency_probe(None),
+        sigil_entropy=entropy_level,
+        pulse=None,
+        entropy_log=[]
+    )
+    return {'entropy_level': entropy_level, 'scup_score': scup_score}
+
+
+def _alignment_context(context, current_alignment_probe):
+    return {'alignment_score': current_alignment_probe()}
+
+
+def _qualia_context(context, get_current_feeling):
+    feeling_state = get_current_feeling()
+    if 'qualia_type' not in feeling_state:
+        return {}
+    return {
+        'qualia_type': feeling_state['qualia_type'],
+        'qualia_intensity': feeling_state.get('intensity', 0.5),
+        'qualia_coherence': feeling_state.get('characteristics', {}).get('coherence', 0.5),
+    }
+
+
+def _tension_context(context, get_tension_state):
+    tension_state = get_tension_state()
+    if 'current_tension' not in tension_state:
+        return {}
+    return {
+        'tension_level': tension_state['current_tension'],
+        'tension_zone': tension_state.get('current_zone', 'unknown'),
+    }
+
+
+def _goal_context(context, get_all_goals_summary):
+    goals_summary = get_all_goals_summary()
+    return {
+        'active_goals': goals_summary.get('active_goals', 0),
+        'recent_achievements': len(goals_summary.get('recent_achievements', [])),
+    }
+
+
+def _memory_context(context, get_memory_statistics):
+    memory_stats = get_memory_statistics()
+    return {
+        'total_anchors': memory_stats.get('total_anchors', 0),
+        'recent_anchors': memory_stats.get('recent_anchors_7d', 0),
+    }
+
+
+def default_reflex_providers() -> List[ContextProvider]:
+    """The context sources SymbolicReflexTable evaluates reflexes against."""
+    return [
+        ContextProvider('pulse', [('pulse.pulse_heat', 'pulse')], _pulse_context,
+                        {'pulse_heat': 2.0, 'thermal_stability': 1.0, 'thermal_momentum': 0.0,
+                         'current_zone': 'unknown'}),
+        ContextProvider('scup', [('core.scup', 'compute_scup'),
+                                 ('schema.alignment_probe', 'current_alignment_probe'),
+                                 ('schema.mood_urgency_probe', 'mood_urgency_probe'),
+                                 ('codex.sigil_memory_ring', 'get_active_sigil_entropy_list')],
+                        _scup_context, {'entropy_level': 0.5, 'scup_score': 0.7}),
+        ContextProvider('alignment', [('schema.alignment_vector', 'current_alignment_probe')],
+                        _alignment_context, {'alignment_score': 0.6}),
+        ContextProvider('qualia', [('core.qualia_kernel', 'get_current_feeling')], _qualia_context,
+                        {'qualia_type': 'unknown', 'qualia_intensity': 0.5, 'qualia_coherence': 0.5}),
+        ContextProvider('tension', [('core.tension_engine', 'get_tension_state')], _tension_context,
+                        {'tension_level': 0.3, 'tension_zone': 'creative'}),
+        ContextProvider('goals', [('schema.schema_goal', 'get_all_goals_summary')], _goal_context,
+                        {'active_goals': 0, 'recent_achievements': 0}, ttl=5.0),
+        ContextProvider('memory_anchors', [('memory.memory_anchor', 'get_memory_statistics')],
+                        _memory_context, {'total_anchors': 0, 'recent_anchors': 0}, ttl=30.0),
+    ]
@@ -10,6 +10,7 @@ import sys, os
 import json
 import time
 from typing import Dict, List, Optional, Callable, Any, Union, Tuple
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -17,6 +18,9 @@ from pathlib import Path
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
+from processors.codex.reflex_compiler import ReflexDecisionTable
+from processors.codex.reflex_context import ContextProviderRegistry, default_reflex_providers
+
 class ReflexMode(Enum):
     """Modes of reflex activation."""
     SOFT = "soft"           # Gentle suggestion, can be overridden
@@ -49,12 +53,12 @@ class ReflexTrigger:
     sensitivity: float = 1.0
     cooldown_seconds: float = 0.0
     last_triggered: Optional[datetime] = None
+    cooldown_until: float = 0.0  # time.monotonic() deadline
     
     def check_trigger(self, context: Dict[str, Any]) -> bool:
         """Check if this trigger should fire given current context."""
         # Check cooldown
-        if (self.last_triggered and self.cooldown_seconds > 0 and
-            (datetime.utcnow() - self.last_triggered).total_seconds() < self.cooldown_seconds):
+        if self.cooldown_seconds > 0 and time.monotonic() < self.cooldown_until:
             return False
         
         if self.trigger_type == TriggerType.THRESHOLD:
@@ -72,9 +76,14 @@ class ReflexTrigger:
     
     def _check_threshold(self, context: Dict[str, Any]) -> bool:
         """Check threshold-based trigger."""
-        metric = self.conditions.get('metric')
-        threshold = self.conditions.get('threshold')
-        operator = self.conditions.get('operator', 'greater_than')
+        return self._threshold_met(self.conditions, self.sensitivity, context)
+    
+    @staticmethod
+    def _threshold_met(conditions: Dict[str, Any], sensitivity: float, context: Dict[str, Any]) -> bool:
+        """Evaluate one threshold condition against the context."""
+        metric = conditions.get('metric')
+        threshold = conditions.get('threshold')
+        operator = conditions.get('operator', 'greater_than')
         
         if not metric or threshold is None:
             return False
@@ -82,11 +91,11 @@ class ReflexTrigger:
         current_value = context.get(metric, 0)
         
         if operator == 'greater_than':
-            return current_value > threshold * self.sensitivity
+            return current_value > threshold * sensitivity
         elif operator == 'less_than':
-            return current_value < threshold * self.sensitivity
+            return current_value < threshold * sensitivity
         elif operator == 'equals':
-            tolerance = self.conditions.get('tolerance', 0.1)
+            tolerance = conditions.get('tolerance', 0.1)
             return abs(current_value - threshold) < tolerance
         
         return False
@@ -109,14 +118,8 @@ class ReflexTrigger:
         sub_conditions = self.conditions.get('conditions', [])
         logic = self.conditions.get('logic', 'AND')
         
-        results = []
-        for condition in sub_conditions:
-            # Create temporary trigger for each condition
-            temp_trigger = ReflexTrigger(
-                trigger_type=TriggerType.THRESHOLD,
-                conditions=condition
-            )
-            results.append(temp_trigger.check_trigger(context))
+        # Each sub-condition is a plain threshold check (no sensitivity, no cooldown)
+        results = [self._threshold_met(condition, 1.0, context) for condition in sub_conditions]
         
         if logic == 'AND':
             return all(results)
@@ -140,9 +143,10 @@ class ReflexTrigger:
         
         return True
     
-    def mark_triggered(self):
-        """Mark this trigger as having fired."""
+    def mark_triggered(self, now: Optional[float] = None):
+        """Mark this trigger as having fired (now: time.monotonic() reading)."""
         self.last_triggered = datetime.utcnow()
+        self.cooldown_until = (time.monotonic() if now is None else now) + self.cooldown_seconds
 
 @dataclass
 class ReflexAction:
@@ -544,6 +548,12 @@ class SymbolicReflexTable:
         self.total_activations = 0
         self.activation_history = deque(maxlen=1000)
         
+        # Compiled trigger table, rebuilt when reflex definitions change
+        self._decision_table: Optional[ReflexDecisionTable] = None
+        
+        # Context sources: imports resolved once, failures memoised, per-source TTLs
+        self.context_providers = ContextProviderRegistry(default_reflex_providers())
+        
         # Initialize default reflexes
         self._create_default_reflexes()
         
@@ -773,8 +783,21 @@ class SymbolicReflexTable:
             self.reflexes_by_category[reflex.category] = []
         self.reflexes_by_category[reflex.category].append(reflex.id)
         
+        self.invalidate_decision_table()
         return reflex
     
+    @property
+    def decision_table(self) -> ReflexDecisionTable:
+        """Compiled trigger table over the current reflexes."""
+        table = self._decision_table
+        if table is None or len(table.reflexes) != len(self.reflexes):
+            table = self._decision_table = ReflexDecisionTable(list(self.reflexes.values()))
+        return table
+    
+    def invalidate_decision_table(self):
+        """Recompile on the next evaluation (call after editing trigger definitions)."""
+        self._decision_table = None
+    
     def evaluate_reflexes(self, context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Evaluate all reflexes against current context and execute triggered ones."""
         self.total_evaluations += 1
@@ -785,122 +808,36 @@ class SymbolicReflexTable:
         # Apply global sensitivity
         adjusted_context = context.copy()
         
-        for reflex in self.reflexes.values():
-            if reflex.evaluate_triggers(adjusted_context):
-                # Execute reflex actions
-                results = reflex.execute_actions(adjusted_context)
-                
-                activation_record = {
-                    'reflex_id': reflex.id,
-                    'reflex_name': reflex.name,
-                    'category': reflex.category.value,
-                    'mode': reflex.mode.value,
-                    'timestamp': datetime.utcnow().isoformat(),
-                    'results': results
-                }
-                
-                activated_reflexes.append(activation_record)
-                self.activation_history.append(activation_record)
-                self.total_activations += 1
-                
-                print(f"[ReflexTable] ⚡ Reflex activated: {reflex.name} "
-                      f"({reflex.mode.value} mode, {len(results)} actions)")
-                
-                # If absolute mode, we might need to break early
-                if reflex.mode == ReflexMode.ABSOLUTE:
-                    print(f"[ReflexTable] 🛑 Absolute reflex '{reflex.name}' executed - prioritizing safety")
+        # Only triggers whose input metrics changed are re-evaluated
+        for reflex, _ in self.decision_table.evaluate(adjusted_context):
+            # Execute reflex actions
+            results = reflex.execute_actions(adjusted_context)
+            
+            activation_record = {
+                'reflex_id': reflex.id,
+                'reflex_name': reflex.name,
+                'category': reflex.category.value,
+                'mode': reflex.mode.value,
+                'timestamp': datetime.utcnow().isoformat(),
+                'results': results
+            }
+            
+            activated_reflexes.append(activation_record)
+            self.activation_history.append(activation_record)
+            self.total_activations += 1
+            
+            print(f"[ReflexTable] ⚡ Reflex activated: {reflex.name} "
+                  f"({reflex.mode.value} mode, {len(results)} actions)")
+            
+            # If absolute mode, we might need to break early
+            if reflex.mode == ReflexMode.ABSOLUTE:
+                print(f"[ReflexTable] 🛑 Absolute reflex '{reflex.name}' executed - prioritizing safety")
         
         return activated_reflexes
     
     def gather_system_context(self) -> Dict[str, Any]:
         """Gather comprehensive system context for reflex evaluation."""
-        context = {}
-        
-        try:
-            # Get pulse thermal data
-            thermal_profile = pulse.get_thermal_profile()
-            context['pulse_heat'] = thermal_profile.get('current_heat', 2.0)
-            context['thermal_stability'] = thermal_profile.get('stability_index', 1.0)
-            context['thermal_momentum'] = thermal_profile.get('thermal_momentum', 0.0)
-            context['current_zone'] = thermal_profile.get('current_zone', 'unknown')
-        except ImportError:
-            context['pulse_heat'] = 2.0
-            context['thermal_stability'] = 1.0
-            context['thermal_momentum'] = 0.0
-            context['current_zone'] = 'unknown'
-        
-        try:
-            # Get SCUP and entropy data
-            from core.scup import compute_scup
-            from schema.alignment_probe import current_alignment_probe
-            from schema.mood_urgency_probe import mood_urgency_probe
-            from codex.sigil_memory_ring import get_active_sigil_entropy_list
-            
-            entropy_list = get_active_sigil_entropy_list()
-            context['entropy_level'] = sum(entropy_list) / len(entropy_list) if entropy_list else 0.0
-            
-            context['scup_score'] = compute_scup(
-                tp_rar=current_alignment_probe(None),
-                pressure_score=context['pulse_heat'],
-                urgency_level=mood_urgency_probe(None),
-                sigil_entropy=context['entropy_level'],
-                pulse=None,
-                entropy_log=[]
-            )
-        except ImportError:
-            context['entropy_level'] = 0.5
-            context['scup_score'] = 0.7
-        
-        try:
-            # Get alignment data
-            from schema.alignment_vector import current_alignment_probe
-            context['alignment_score'] = current_alignment_probe()
-        except ImportError:
-            context['alignment_score'] = 0.6
-        
-        try:
-            # Get current qualia state
-            from core.qualia_kernel import get_current_feeling
-            feeling_state = get_current_feeling()
-            if 'qualia_type' in feeling_state:
-                context['qualia_type'] = feeling_state['qualia_type']
-                context['qualia_intensity'] = feeling_state.get('intensity', 0.5)
-                context['qualia_coherence'] = feeling_state.get('characteristics', {}).get('coherence', 0.5)
-        except ImportError:
-            context['qualia_type'] = 'unknown'
-            context['qualia_intensity'] = 0.5
-            context['qualia_coherence'] = 0.5
-        
-        try:
-            # Get tension state
-            from core.tension_engine import get_tension_state
-            tension_state = get_tension_state()
-            if 'current_tension' in tension_state:
-                context['tension_level'] = tension_state['current_tension']
-                context['tension_zone'] = tension_state.get('current_zone', 'unknown')
-        except ImportError:
-            context['tension_level'] = 0.3
-            context['tension_zone'] = 'creative'
-        
-        try:
-            # Get goal status
-            from schema.schema_goal import get_all_goals_summary
-            goals_summary = get_all_goals_summary()
-            context['active_goals'] = goals_summary.get('active_goals', 0)
-            context['recent_achievements'] = len(goals_summary.get('recent_achievements', []))
-        except ImportError:
-            context['active_goals'] = 0
-            context['recent_achievements'] = 0
-        
-        try:
-            # Get memory anchor status
-            from memory.memory_anchor import get_memory_statistics
-            memory_stats = get_memory_statistics()
-            context['total_anchors'] = memory_stats.get('total_anchors', 0)
-            context['recent_anchors'] = memory_stats.get('recent_anchors_7d', 0)
-        except ImportError:
-            context['total_anchors'] = 0
-            context['recent_anchors'] = 0
+        context = self.context_providers.gather()
         
         # Add timestamp and evaluation context
         context['timestamp'] = datetime.utcnow().isoformat()
@@ -974,7 +911,8 @@ class SymbolicReflexTable:
             'average_success_rate': avg_success_rate,
             'most_active_reflexes': most_active_info,
             'global_sensitivity': self.global_sensitivity,
-            'override_mode': self.override_mode
+            'override_mode': self.override_mode,
+            'context_providers': self.context_providers.get_statistics()
         }
     
     def get_conscience_report(self) -> str:
@@ -19,6 +19,7 @@ from collections import defaultdict, deque
 from core.schema_anomaly_logger import log_anomaly, AnomalySeverity
 from schema.registry import registry
 from schema.schema_climate import CLIMATE
+from schema.nutrient_spatial import PacketStore, PointIndex, attraction_deltas, diffuse
 from rhizome.propagation import emit_signal, SignalType
 from utils.metrics_collector import metrics
 
@@ -54,7 +55,11 @@ class NutrientState(Enum):
 
 @dataclass
 class NutrientPacket:
-    """A discrete packet of nutrient energy"""
+    """A discrete packet of nutrient energy
+    
+    While a packet is tracked by a NutrientCycle, `position` and `velocity`
+    are views into the cycle's packet arrays: update them in place.
+    """
     packet_id: str
     nutrient_type: NutrientType
     amount: float
@@ -134,6 +139,15 @@ class NutrientCycle:
         self.max_pools = 50
         self.pool_merge_distance = 10.0
         
+        # Spatial acceleration
+        self.packet_query_radius = 20.0      # Typical consume radius, used as packet grid cell
+        self.attraction_radius = 50.0
+        self.diffusion_range = 100.0
+        self.packet_store = PacketStore(cell_size=self.packet_query_radius)
+        self._nutrient_codes = {nt: code for code, nt in enumerate(NutrientType)}
+        self._pool_index: Optional[PointIndex] = None
+        self._pool_index_ids: Tuple[str, ...] = ()
+        
         # Statistics
         self.total_generated: Dict[NutrientType, float] = defaultdict(float)
         self.total_consumed: Dict[NutrientType, float] = defaultdict(float)
@@ -272,6 +286,7 @@ class NutrientCycle:
         )
         
         self.nutrient_packets[packet.packet_id] = packet
+        self.packet_store.add(packet, self._nutrient_codes[nutrient_type])
         
         # Deduct from global pool
         self.global_nutrients[nutrient_type] = max(
@@ -310,7 +325,7 @@ class NutrientCycle:
                 # Remove depleted packets
                 if packet.amount <= 0.01:
                     packet.state = NutrientState.DEPLETED
-                    del self.nutrient_packets[packet.packet_id]
+                    self._remove_packet(packet.packet_id)
             
             # Then try pools
             if consumed_amount < required_amount:
@@ -473,72 +488,70 @@ class NutrientCycle:
                 self.global_nutrients[flow.nutrient_type] += loss * 0.5
     
     def update_packets(self, delta_time: float):
-        """Update all nutrient packets"""
-        for packet_id, packet in list(self.nutrient_packets.items()):
-            if packet.state == NutrientState.DEPLETED:
-                del self.nutrient_packets[packet_id]
-                continue
-            
-            # Apply velocity
-            packet.position += packet.velocity * delta_time
-            
-            # Apply friction
-            packet.velocity *= (1 - self.flow_resistance * delta_time)
-            
-            # Apply attraction to nearby pools
-            nearby_pools = self._find_nearby_pools(packet.position, 50.0)
-            for pool in nearby_pools:
-                direction = pool.position - packet.position
-                distance = np.linalg.norm(direction)
-                if distance > 0:
-                    attraction = (direction / distance) * self.attraction_strength / (distance + 1)
-                    packet.velocity += attraction * delta_time
-            
-            # Decay
-            decay_rate = self.decay_rates.get(packet.nutrient_type, 0.01)
-            decay_modifier = CLIMATE.get_nutrient_modifier(
-                packet.nutrient_type.value,
-                "decay"
-            )
-            
-            decay_amount = packet.amount * decay_rate * decay_modifier * delta_time
-            packet.amount -= decay_amount
-            self.total_decayed[packet.nutrient_type] += decay_amount
-            
+        """Update all nutrient packets (vectorised over the packet arrays)"""
+        self._sync_packet_store()
+        for packet_id in [pid for pid, packet in self.nutrient_packets.items()
+                          if packet.state == NutrientState.DEPLETED]:
+            self._remove_packet(packet_id)
+        
+        store = self.packet_store
+        count = len(store)
+        if not count:
+            return
+        
+        # Apply velocity and friction
+        positions, velocities = store.integrate(delta_time, self.flow_resistance)
+        
+        # Apply attraction to nearby pools
+        velocities += attraction_deltas(positions, self._get_pool_index(), self.attraction_radius,
+                                        self.attraction_strength) * delta_time
+        store.refresh_cells()
+        
+        # Decay (climate modifier looked up once per nutrient type)
+        nutrient_types = list(NutrientType)
+        decay_factors = np.array([
+            self.decay_rates.get(nt, 0.01) * CLIMATE.get_nutrient_modifier(nt.value, "decay") * delta_time
+            for nt in nutrient_types
+        ])
+        type_codes = store.type_codes[:count]
+        amounts = np.fromiter((packet.amount for packet in store.packets), dtype=float, count=count)
+        decay_amounts = amounts * decay_factors[type_codes]
+        amounts -= decay_amounts
+        
+        decayed_by_type = np.bincount(type_codes, weights=decay_amounts, minlength=len(decay_factors))
+        for code in np.flatnonzero(decayed_by_type).tolist():
+            nutrient_type = nutrient_types[code]
+            self.total_decayed[nutrient_type] += decayed_by_type[code]
             # Return some decay to global pool
-            self.global_nutrients[packet.nutrient_type] += decay_amount * 0.3
-            
-            # Update purity based on state
+            self.global_nutrients[nutrient_type] += decayed_by_type[code] * 0.3
+        
+        # Write back amounts; update purity based on state
+        flowing_keep = 1 - 0.01 * delta_time        # Slight degradation
+        transforming_keep = 1 - 0.05 * delta_time   # More degradation
+        for packet, amount in zip(store.packets, amounts.tolist()):
+            packet.amount = amount
             if packet.state == NutrientState.FLOWING:
-                packet.purity *= (1 - 0.01 * delta_time)  # Slight degradation
+                packet.purity *= flowing_keep
             elif packet.state == NutrientState.TRANSFORMING:
-                packet.purity *= (1 - 0.05 * delta_time)  # More degradation
+                packet.purity *= transforming_keep
     
     def apply_diffusion(self, delta_time: float):
-        """Apply nutrient diffusion between pools"""
-        # For each pool pair within range
-        pool_list = list(self.nutrient_pools.values())
-        
-        for i, pool1 in enumerate(pool_list):
-            for pool2 in pool_list[i+1:]:
-                distance = np.linalg.norm(pool1.position - pool2.position)
-                
-                if distance < 100.0:  # Diffusion range
-                    # Calculate diffusion strength
-                    diffusion_strength = self.diffusion_rate * math.exp(-distance / 50.0)
-                    
-                    # Diffuse each nutrient type
-                    for nutrient_type in NutrientType:
-                        conc1 = pool1.nutrients.get(nutrient_type, 0.0)
-                        conc2 = pool2.nutrients.get(nutrient_type, 0.0)
-                        
-                        # Flow from high to low concentration
-                        gradient = conc1 - conc2
-                        flow = gradient * diffusion_strength * delta_time
-                        
-                        if abs(flow) > 0.01:
-                            pool1.nutrients[nutrient_type] = conc1 - flow
-                            pool2.nutrients[nutrient_type] = conc2 + flow
+        """Apply nutrient diffusion between pools within range (sparse pair list)"""
+        pool_index = self._get_pool_index()
+        first, second, distances = pool_index.pairs(self.diffusion_range)
+        if not len(first):
+            return
+        
+        pools = [self.nutrient_pools[pool_id] for pool_id in self._pool_index_ids]
+        nutrient_types = list(NutrientType)
+        concentrations = np.array([[pool.nutrients.get(nt, 0.0) for nt in nutrient_types] for pool in pools])
+        
+        # Flow from high to low concentration
+        strengths = self.diffusion_rate * np.exp(-distances / 50.0)
+        updated, touched = diffuse(concentrations, first, second, strengths, delta_time)
+        
+        for row, column in np.argwhere(touched).tolist():
+            pools[row].nutrients[nutrient_types[column]] = float(updated[row, column])
     
     def crystallize_nutrients(self, position: np.ndarray,
                             nutrients: Dict[NutrientType, float]) -> Optional[str]:
@@ -570,6 +583,7 @@ class NutrientCycle:
             )
             
             self.nutrient_pools[pool.pool_id] = pool
+            self._pool_index = None
             
             emit_signal(
                 SignalType.NUTRIENT,
@@ -587,35 +601,45 @@ class NutrientCycle:
     
     def _find_nearby_packets(self, position: np.ndarray, radius: float,
                            nutrient_type: Optional[NutrientType] = None) -> List[NutrientPacket]:
-        """Find packets within radius of position"""
-        nearby = []
-        
-        for packet in self.nutrient_packets.values():
-            if nutrient_type and packet.nutrient_type != nutrient_type:
-                continue
-            
-            distance = np.linalg.norm(packet.position - position)
-            if distance <= radius:
-                nearby.append(packet)
-        
-        # Sort by distance
-        nearby.sort(key=lambda p: np.linalg.norm(p.position - position))
-        
-        return nearby
+        """Find packets within radius of position, nearest first"""
+        self._sync_packet_store()
+        store = self.packet_store
+        store.refresh_cells()  # positions may have been edited in place since the last tick
+        slots, _ = store.within(position, radius)
+        if nutrient_type:
+            slots = slots[store.type_codes[slots] == self._nutrient_codes[nutrient_type]]
+        return [store.packets[slot] for slot in slots.tolist()]
     
     def _find_nearby_pools(self, position: np.ndarray, radius: float) -> List[NutrientPool]:
-        """Find pools within radius of position"""
-        nearby = []
-        
-        for pool in self.nutrient_pools.values():
-            distance = np.linalg.norm(pool.position - position)
-            if distance <= radius:
-                nearby.append(pool)
-        
-        # Sort by distance
-        nearby.sort(key=lambda p: np.linalg.norm(p.position - position))
-        
-        return nearby
+        """Find pools within radius of position, nearest first"""
+        indices, _ = self._get_pool_index().within(position, radius)
+        return [self.nutrient_pools[self._pool_index_ids[index]] for index in indices.tolist()]
+    
+    def _remove_packet(self, packet_id: str):
+        """Drop a packet from the cycle and its spatial arrays"""
+        self.nutrient_packets.pop(packet_id, None)
+        self.packet_store.remove(packet_id)
+    
+    def _sync_packet_store(self):
+        """Track packets added to / removed from nutrient_packets directly"""
+        store = self.packet_store
+        if len(store) == len(self.nutrient_packets):
+            return
+        for packet_id in [pid for pid in store.slot_of if pid not in self.nutrient_packets]:
+            store.remove(packet_id)
+        for packet_id, packet in self.nutrient_packets.items():
+            if packet_id not in store or store.packets[store.slot_of[packet_id]] is not packet:
+                store.add(packet, self._nutrient_codes[packet.nutrient_type])
+    
+    def _get_pool_index(self) -> PointIndex:
+        """Grid over pool positions, rebuilt when the pool set changes"""
+        if self._pool_index is None or len(self._pool_index_ids) != len(self.nutrient_pools):
+            self._pool_index_ids = tuple(self.nutrient_pools)
+            self._pool_index = PointIndex(
+                [pool.position for pool in self.nutrient_pools.values()],
+                cell_size=self.attraction_radius
+            )
+        return self._pool_index
     
     def balance_nutrients(self):
         """Balance nutrients across the system"""
@@ -0,0 +1,316 @@
+# schema/nutrient_spatial.py
+"""
+Spatial Acceleration for the Nutrient Cycle
+===========================================
+Uniform-grid spatial hash and structure-of-arrays packet storage used by
+NutrientCycle. Packets keep their kinematics (positions, velocities) as
+rows of shared arrays so a tick integrates every packet in a few numpy
+operations, and the grid is updated incrementally: only packets whose cell
+changed are re-bucketed. Radius queries visit the cells overlapping the
+query sphere instead of scanning every packet or pool, and pool diffusion
+runs over a cached sparse list of in-range pool pairs.
+"""
+
+import itertools
+import math
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+Cell = Tuple[int, int, int]
+
+
+class SpatialHash:
+    """Uniform grid over 3-D points, keyed by integer slot"""
+
+    def __init__(self, cell_size: float):
+        self.cell_size = float(cell_size)
+        self.buckets: Dict[Cell, Set[int]] = {}
+        self.cell_of: Dict[int, Cell] = {}
+        self.relocations = 0
+
+    def __len__(self) -> int:
+        return len(self.cell_of)
+
+    def cells(self, positions: np.ndarray) -> np.ndarray:
+        """Integer cell coordinates of one point (3,) or many points (N, 3)"""
+        return np.floor(np.asarray(positions, dtype=float) / self.cell_size).astype(np.int64)
+
+    def insert(self, key: int, position: np.ndarray) -> np.ndarray:
+        cell = self.cells(position)
+        self._add(key, tuple(cell.tolist()))
+        return cell
+
+    def remove(self, key: int):
+        cell = self.cell_of.pop(key, None)
+        if cell is None:
+            return
+        bucket = self.buckets[cell]
+        bucket.discard(key)
+        if not bucket:
+            del self.buckets[cell]
+
+    def update(self, old_cells: np.ndarray, new_cells: np.ndarray) -> int:
+        """Re-bucket slots 0..N-1 whose cell changed; returns how many moved"""
+        moved = np.flatnonzero((old_cells != new_cells).any(axis=1))
+        for key in moved.tolist():
+            self.remove(key)
+            self._add(key, tuple(new_cells[key].tolist()))
+        self.relocations += len(moved)
+        return len(moved)
+
+    def query(self, position: np.ndarray, radius: float) -> List[int]:
+        """Candidate keys in the cells overlapping the sphere (exact test is the caller's)"""
+        position = np.asarray(position, dtype=float)
+        low = self.cells(position - radius).tolist()
+        high = self.cells(position + radius).tolist()
+        span = (high[0] - low[0] + 1) * (high[1] - low[1] + 1) * (high[2] - low[2] + 1)
+
+        keys: List[int] = []
+        if span > len(self.buckets):
+            # Large radius relative to occupancy: filter the occupied cells instead
+            for cell, bucket in self.buckets.items():
+                if all(low[axis] <= cell[axis] <= high[axis] for axis in range(3)):
+                    keys.extend(bucket)
+            return keys
+
+        for cell in itertools.product(*(range(low[axis], high[axis] + 1) for axis in range(3))):
+            bucket = self.buckets.get(cell)
+            if bucket:
+                keys.extend(bucket)
+        return keys
+
+    def query_many(self, positions: np.ndarray, radius: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Candidate (point index, key) pairs for many query points at once.
+        Points are grouped by cell so each occupied cell's neighbourhood is
+        looked up once.
+        """
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        if not len(positions) or not self.buckets:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        reach = int(math.ceil(radius / self.cell_size))
+        offsets = list(itertools.product(range(-reach, reach + 1), repeat=3))
+        unique, inverse = np.unique(self.cells(positions), axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        order = np.argsort(inverse, kind='stable')
+        bounds = np.searchsorted(inverse[order], np.arange(len(unique) + 1))
+
+        point_parts, key_parts = [], []
+        for group, (x, y, z) in enumerate(unique.tolist()):
+            candidates = []
+            for dx, dy, dz in offsets:
+                bucket = self.buckets.get((x + dx, y + dy, z + dz))
+                if bucket:
+                    candidates.extend(bucket)
+            if not candidates:
+                continue
+            members = order[bounds[group]:bounds[group + 1]]
+            point_parts.append(np.repeat(members, len(candidates)))
+            key_parts.append(np.tile(np.asarray(candidates, dtype=np.int64), len(members)))
+
+        if not point_parts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return np.concatenate(point_parts), np.concatenate(key_parts)
+
+    # ─── internals ─────────────────────────────────────────────────────────
+
+    def _add(self, key: int, cell: Cell):
+        self.cell_of[key] = cell
+        self.buckets.setdefault(cell, set()).add(key)
+
+
+class PacketStore:
+    """
+    Structure-of-arrays kinematics for nutrient packets. Registered packets'
+    `position` and `velocity` attributes become views of rows in the shared
+    arrays, so existing per-packet code keeps working while ticks operate on
+    whole arrays. Slots stay dense (removal moves the last packet into the
+    freed slot).
+    """
+
+    def __init__(self, cell_size: float = 20.0, capacity: int = 64):
+        self.packets: List[Any] = []
+        self.slot_of: Dict[str, int] = {}
+        self.grid = SpatialHash(cell_size)
+        self.positions = np.zeros((capacity, 3))
+        self.velocities = np.zeros((capacity, 3))
+        self.cells = np.zeros((capacity, 3), dtype=np.int64)
+        self.type_codes = np.zeros(capacity, dtype=np.int64)
+        self.sequence = np.zeros(capacity, dtype=np.int64)  # insertion order, for stable ties
+        self._next_sequence = 0
+
+    def __len__(self) -> int:
+        return len(self.packets)
+
+    def __contains__(self, packet_id: str) -> bool:
+        return packet_id in self.slot_of
+
+    def add(self, packet: Any, type_code: int = 0):
+        if packet.packet_id in self.slot_of:
+            self.remove(packet.packet_id)
+        slot = len(self.packets)
+        if slot == len(self.positions):
+            self._grow()
+
+        self.positions[slot] = packet.position
+        self.velocities[slot] = packet.velocity
+        self.type_codes[slot] = type_code
+        self.sequence[slot] = self._next_sequence
+        self._next_sequence += 1
+        self.cells[slot] = self.grid.insert(slot, self.positions[slot])
+
+        self.packets.append(packet)
+        self.slot_of[packet.packet_id] = slot
+        self._bind(slot)
+
+    def remove(self, packet_id: str) -> Optional[Any]:
+        slot = self.slot_of.pop(packet_id, None)
+        if slot is None:
+            return None
+        packet = self.packets[slot]
+        # Detach: the packet keeps its last kinematics as private arrays
+        packet.position = self.positions[slot].copy()
+        packet.velocity = self.velocities[slot].copy()
+
+        last = len(self.packets) - 1
+        self.grid.remove(last)
+        if slot != last:
+            self.grid.remove(slot)
+            for array in (self.positions, self.velocities, self.cells, self.type_codes, self.sequence):
+                array[slot] = array[last]
+            moved = self.packets[last]
+            self.packets[slot] = moved
+            self.slot_of[moved.packet_id] = slot
+            self.grid._add(slot, tuple(self.cells[slot].tolist()))
+            self._bind(slot)
+        self.packets.pop()
+        return packet
+
+    def integrate(self, delta_time: float, friction: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Advance positions by velocity, then damp velocities; returns live views"""
+        count = len(self.packets)
+        positions, velocities = self.positions[:count], self.velocities[:count]
+        positions += velocities * delta_time
+        velocities *= (1 - friction * delta_time)
+        return positions, velocities
+
+    def refresh_cells(self) -> int:
+        """Re-bucket packets that crossed a cell boundary (call after moving packets)"""
+        count = len(self.packets)
+        new_cells = self.grid.cells(self.positions[:count])
+        moved = self.grid.update(self.cells[:count], new_cells)
+        self.cells[:count] = new_cells
+        return moved
+
+    def within(self, position: np.ndarray, radius: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Slots within `radius` of `position` and their distances, nearest first"""
+        slots = np.asarray(self.grid.query(position, radius), dtype=np.int64)
+        if not len(slots):
+            return slots, np.empty(0)
+        distances = np.linalg.norm(self.positions[slots] - np.asarray(position, dtype=float), axis=1)
+        keep = distances <= radius
+        slots, distances = slots[keep], distances[keep]
+        order = np.lexsort((self.sequence[slots], distances))
+        return slots[order], distances[order]
+
+    # ─── internals ─────────────────────────────────────────────────────────
+
+    def _bind(self, slot: int):
+        packet = self.packets[slot]
+        packet.position = self.positions[slot]
+        packet.velocity = self.velocities[slot]
+
+    def _grow(self):
+        capacity = 2 * len(self.positions)
+        for name in ('positions', 'velocities', 'cells', 'type_codes', 'sequence'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+        for slot in range(len(self.packets)):
+            self._bind(slot)
+
+
+class PointIndex:
+    """Static point set (e.g. nutrient pools) with a grid for radius queries"""
+
+    def __init__(self, positions: Sequence[np.ndarray], cell_size: float):
+        self.positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        self.grid = SpatialHash(cell_size)
+        for index, position in enumerate(self.positions):
+            self.grid.insert(index, position)
+        self._pairs: Dict[float, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def within(self, position: np.ndarray, radius: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Indices within `radius` of `position` and their distances, nearest first"""
+        indices = np.asarray(self.grid.query(position, radius), dtype=np.int64)
+        if not len(indices):
+            return indices, np.empty(0)
+        distances = np.linalg.norm(self.positions[indices] - np.asarray(position, dtype=float), axis=1)
+        keep = distances <= radius
+        indices, distances = indices[keep], distances[keep]
+        order = np.lexsort((indices, distances))
+        return indices[order], distances[order]
+
+    def cross(self, points: np.ndarray, radius: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(point index, index, distance) for every point/index pair within `radius`"""
+        point_index, index = self.grid.query_many(points, radius)
+        distances = np.linalg.norm(self.positions[index] - points[point_index], axis=1)
+        keep = distances <= radius
+        return point_index[keep], index[keep], distances[keep]
+
+    def pairs(self, radius: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Cached (i, j, distance) for i < j strictly closer than `radius`, in (i, j) order"""
+        if radius not in self._pairs:
+            first, second, distances = self.cross(self.positions, radius)
+            keep = (first < second) & (distances < radius)
+            first, second, distances = first[keep], second[keep], distances[keep]
+            order = np.lexsort((second, first))
+            self._pairs[radius] = (first[order], second[order], distances[order])
+        return self._pairs[radius]
+
+
+def attraction_deltas(positions: np.ndarray, targets: PointIndex, radius: float,
+                      strength: float) -> np.ndarray:
+    """
+    Summed pull of every target within `radius` on each point:
+    unit(direction) * strength / (distance + 1), zero for coincident points.
+    """
+    deltas = np.zeros_like(positions)
+    if not len(positions) or not len(targets):
+        return deltas
+    point_index, index, distances = targets.cross(positions, radius)
+    keep = distances > 0
+    point_index, index, distances = point_index[keep], index[keep], distances[keep]
+    direction = targets.positions[index] - positions[point_index]
+    pull = direction * (strength / (distances * (distances + 1)))[:, None]
+    np.add.at(deltas, point_index, pull)
+    return deltas
+
+
+def diffuse(concentrations: np.ndarray, first: np.ndarray, second: np.ndarray,
+            strengths: np.ndarray, delta_time: float,
+            min_flow: float = 0.01) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    One explicit diffusion step over sparse pairs: every pair moves
+    (c_first - c_second) * strength * dt from first to second, per column,
+    all computed from the same starting concentrations; flows of magnitude
+    min_flow or less are skipped. Returns (new concentrations, touched mask).
+    """
+    flows = (concentrations[first] - concentrations[second]) * (strengths * delta_time)[:, None]
+    active = np.abs(flows) > min_flow
+    flows = np.where(active, flows, 0.0)
+
+    updated = concentrations.copy()
+    np.subtract.at(updated, first, flows)
+    np.add.at(updated, second, flows)
+
+    touched = np.zeros(concentrations.shape, dtype=bool)
+    np.logical_or.at(touched, first, active)
+    np.logical_or.at(touched, second, active)
+    return updated, touched
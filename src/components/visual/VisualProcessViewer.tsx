@@ -1,5 +1,5 @@
-import React, { useEffect, useRef, useState } from 'react';
-import { useWebSocket } from '../../hooks/useWebSocket';
+import React, { useCallback, useEffect, useRef, useState } from 'react';
+import { useWebSocket, WebSocketMessage } from '../../hooks/useWebSocket';
 
 interface ProcessMetadata {
   name: string;
@@ -27,51 +27,49 @@ export const VisualProcessViewer: React.FC<VisualProcessViewerProps> = ({
   const [metadata, setMetadata] = useState<ProcessMetadata | null>(null);
   const [isActive, setIsActive] = useState(false);
   const [error, setError] = useState<string | null>(null);
-  
+  // Source frame size from the last keyframe, and the chain of pending draws
+  const frameSizeRef = useRef({ width, height });
+  const drawQueueRef = useRef<Promise<void>>(Promise.resolve());
+
+  // Keyframes cover the whole canvas; deltas are the changed rectangle at (x, y).
+  // Every message is drawn, in arrival order, or deltas would land on stale pixels.
+  const handleMessage = useCallback((data: WebSocketMessage) => {
+    if ((data.type === 'frame' || data.type === 'delta') && data.process === processName) {
+      if (data.type === 'frame' && data.width && data.height) {
+        frameSizeRef.current = { width: data.width, height: data.height };
+      }
+      const source = frameSizeRef.current;
+      const img = new Image();
+      const loaded = new Promise<void>((resolve) => {
+        img.onload = () => resolve();
+        img.onerror = () => resolve();
+      });
+      img.src = `data:image/png;base64,${data.frame}`;
+      drawQueueRef.current = drawQueueRef.current.then(() => loaded).then(() => {
+        const ctx = canvasRef.current?.getContext('2d');
+        if (ctx && img.naturalWidth) {
+          const sx = width / source.width;
+          const sy = height / source.height;
+          ctx.drawImage(img, (data.x ?? 0) * sx, (data.y ?? 0) * sy,
+                        (data.width ?? source.width) * sx, (data.height ?? source.height) * sy);
+        }
+      });
+    } else if (data.type === 'error') {
+      setError(data.message ?? null);
+    }
+  }, [processName, width, height]);
+
   // WebSocket connection for real-time updates
-  const { send, lastMessage, isConnected } = useWebSocket();
+  const { send, isConnected } = useWebSocket(undefined, handleMessage);
 
-  // Request frame updates
+  // Stream frames from the process's shared-memory ring while it is active
   useEffect(() => {
     if (isConnected && isActive) {
-      const interval = setInterval(() => {
-        send({
-          type: 'capture_frame',
-          process: processName
-        });
-      }, 1000 / 30); // 30 FPS
-
-      return () => clearInterval(interval);
+      send({ type: 'stream_frames', process: processName, fps: 30 });
+      return () => send({ type: 'stop_stream', process: processName });
     }
   }, [isConnected, isActive, processName, send]);
 
-  // Handle incoming frames
-  useEffect(() => {
-    if (lastMessage) {
-      try {
-        const data = JSON.parse(lastMessage);
-        if (data.type === 'frame' && data.process === processName) {
-          // Update canvas with new frame
-          const canvas = canvasRef.current;
-          if (canvas) {
-            const ctx = canvas.getContext('2d');
-            if (ctx) {
-              const img = new Image();
-              img.onload = () => {
-                ctx.drawImage(img, 0, 0, width, height);
-              };
-              img.src = `data:image/png;base64,${data.frame}`;
-            }
-          }
-        } else if (data.type === 'error') {
-          setError(data.message);
-        }
-      } catch (e) {
-        console.error('Error processing WebSocket message:', e);
-      }
-    }
-  }, [lastMessage, processName, width, height]);
-
   // Fetch process metadata
   useEffect(() => {
     const fetchMetadata = async () => {
@@ -149,7 +147,7 @@ export const VisualProcessViewer: React.FC<VisualProcessViewerProps> = ({
               <span className="metric-value">{metadata.frame_count}</span>
             </div>
             {Object.entries(metadata)
-              .filter(([key]) => !['name', 'is_active', 'fps', 'frame_count', 'last_update'].includes(key))
+              .filter(([key]) => !['name', 'is_active', 'fps', 'frame_count', 'last_update', 'frame_segment'].includes(key))
               .map(([key, value]) => (
                 <div key={key} className="metric">
                   <span className="metric-label">{key}</span>
@@ -1,14 +1,26 @@
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useEffect, useCallback, useRef } from 'react';
 
-interface WebSocketMessage {
+export interface WebSocketMessage {
   type: string;
   process?: string;
+  segment?: string;
   frame?: string;
   message?: string;
+  fps?: number;
+  x?: number;
+  y?: number;
+  width?: number;
+  height?: number;
 }
 
-export const useWebSocket = (url: string = 'ws://localhost:8000/ws') => {
+// onMessage sees every message; lastMessage only the newest one per render
+export const useWebSocket = (
+  url: string = 'ws://localhost:8000/ws',
+  onMessage?: (message: WebSocketMessage) => void
+) => {
   const [socket, setSocket] = useState<WebSocket | null>(null);
+  const onMessageRef = useRef(onMessage);
+  onMessageRef.current = onMessage;
   const [isConnected, setIsConnected] = useState(false);
   const [lastMessage, setLastMessage] = useState<WebSocketMessage | null>(null);
   const [error, setError] = useState<string | null>(null);
@@ -34,6 +46,7 @@ export const useWebSocket = (url: string = 'ws://localhost:8000/ws') => {
     ws.onmessage = (event) => {
       try {
         const data = JSON.parse(event.data);
+        onMessageRef.current?.(data);
         setLastMessage(data);
       } catch (e) {
         console.error('Error parsing WebSocket message:', e);
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test the vectorised CognitiveRouter feature index against the per-chunk scans
+"""
+
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.memory.cognitive_router import CognitiveRouter
+from core.memory.memory_chunk import MemoryChunk
+
+WORDS = "dawn pattern entropy sigil heat bloom memory recursive spiral gentle warm calm".split()
+
+
+def make_chunks(count: int, seed: int = 2):
+    rng = random.Random(seed)
+    return [
+        MemoryChunk(
+            timestamp=datetime(2025, 1, 1) + timedelta(seconds=rng.randrange(20000)),
+            speaker=rng.choice(["dawn", "jackson"]),
+            content=" ".join(rng.sample(WORDS, 4)) + f" note{i}",
+            topic=rng.choice([None, "reflection", "thermal"]),
+            pulse_state={"entropy": round(rng.random(), 2), "heat": rng.uniform(0, 60),
+                         "scup": rng.random(), "mood": rng.choice(["calm", "anxious"])},
+            sigils=rng.sample(["STABILIZE", "REBLOOM", "PRUNE", "ECHO"], rng.randrange(4))
+        )
+        for i in range(count)
+    ]
+
+
+def build_router(chunks):
+    router = CognitiveRouter()
+    router.feature_index.merge_threshold = 32  # exercise merging and compaction
+    for chunk in chunks:
+        router.add_chunk(chunk)
+    for chunk in chunks[::3]:
+        router.delete_chunk(chunk.memory_id)
+    for chunk in chunks[:60:3]:
+        router.add_chunk(chunk)
+    return router
+
+
+def test_rebloom_matches_pairwise_similarity():
+    chunks = make_chunks(600)
+    router = build_router(chunks)
+
+    for query in chunks[:40]:
+        query_words = set(router._extract_keywords(query.content))
+        expected = [
+            (router._calculate_dawn_similarity(query, chunk, query_words), chunk_id)
+            for chunk_id, chunk in router.chunks.items() if chunk_id != query.memory_id
+        ]
+        expected = [item for item in expected if item[0] > 0]
+        expected.sort(key=lambda item: item[0], reverse=True)
+
+        result = router.rebloom_candidates(query, max_candidates=10)
+        assert [chunk.memory_id for chunk in result] == [chunk_id for _, chunk_id in expected[:10]]
+
+
+def test_range_and_pulse_queries_match_scans():
+    chunks = make_chunks(600, seed=4)
+    router = build_router(chunks)
+    stored = list(router.chunks.values())
+
+    assert [c.memory_id for c in router.find_by_entropy_range(0.25, 0.5)] == \
+        [c.memory_id for c in stored if 0.25 <= c.get_entropy() <= 0.5]
+
+    reference = chunks[1]
+    expected = [
+        c.memory_id for c in stored
+        if c.memory_id != reference.memory_id
+        and abs(c.get_entropy() - reference.get_entropy()) <= 0.2
+        and abs(c.get_heat() - reference.get_heat()) <= 10
+        and abs(c.get_scup() - reference.get_scup()) <= 0.2
+    ]
+    assert [c.memory_id for c in router.find_similar_pulse_state(reference)] == expected
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Test incremental entropy statistics against direct NumPy/SciPy computation
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+from scipy import stats
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.entropy_stats import EntropySampleColumns, RunningMoments, SlidingWindowStats
+from core.entropy_analyzer import EntropyAnalyzer
+
+
+def test_running_moments_push_pop():
+    rng = np.random.default_rng(0)
+    values = rng.random(500)
+    moments = RunningMoments()
+    for v in values:
+        moments.push(v)
+    for v in values[:200]:
+        moments.pop(v)
+
+    assert moments.count == 300
+    assert np.isclose(moments.mean, values[200:].mean())
+    assert np.isclose(moments.variance, values[200:].var())
+
+
+def test_sliding_window_matches_direct_computation():
+    rng = np.random.default_rng(1)
+    window = SlidingWindowStats(capacity=64, trend_window=10, volatility_window=20)
+    history = []
+
+    for v in rng.random(1000):
+        window.push(v)
+        history.append(v)
+        retained = np.array(history[-64:])
+
+        assert np.allclose(window.values(), retained)
+        assert np.isclose(window.mean, retained.mean())
+        assert np.isclose(window.variance, retained.var())
+        assert window.min == retained.min()
+        assert window.max == retained.max()
+
+        if len(history) >= 10:
+            recent = retained[-10:]
+            slope = stats.linregress(np.arange(10), recent).slope
+            assert np.isclose(window.trend_slope(), slope)
+
+            diffs = np.diff(recent)
+            sign_changes = int(np.sum(diffs[1:] * diffs[:-1] < 0))
+            assert window.is_oscillating() == (sign_changes > len(diffs) * 0.6)
+            assert np.isclose(window.acceleration(), np.mean(np.diff(diffs)))
+
+        if len(history) >= 20:
+            assert np.isclose(window.return_volatility(), np.std(np.diff(retained[-20:])))
+
+        z = np.abs(retained - retained.mean()) / (retained.std() or 1.0)
+        assert window.anomaly_count(2.5) == int(np.sum(z > 2.5))
+
+
+def test_analyzer_global_stats_track_retained_samples():
+    analyzer = EntropyAnalyzer(max_samples_per_bloom=30)
+    rng = np.random.default_rng(2)
+    retained = {}
+    for i in range(600):
+        bloom_id = f"bloom_{i % 7}"
+        value = float(rng.random())
+        analyzer.add_entropy_sample(bloom_id, value)
+        retained.setdefault(bloom_id, []).append(value)
+
+    all_values = np.concatenate([np.array(v[-30:]) for v in retained.values()])
+    assert np.isclose(analyzer.global_entropy_mean, all_values.mean())
+    assert np.isclose(analyzer.global_entropy_std, all_values.std())
+
+    profile = analyzer.profiles["bloom_3"]
+    assert np.isclose(profile.mean, np.mean(retained["bloom_3"][-30:]))
+    assert profile.sample_count == 30
+
+
+def test_sample_columns_wraparound_views():
+    store = EntropySampleColumns(capacity=5)
+    for i in range(12):
+        store.append(i / 10.0, 1000.0 + i, i % 3)
+
+    assert len(store) == 5
+    assert np.allclose(store.values(), [0.7, 0.8, 0.9, 1.0, 1.1])
+    assert np.allclose(store.timestamps(), [1007, 1008, 1009, 1010, 1011])
+    assert store.source_codes().tolist() == [1, 2, 0, 1, 2]
+    assert store.last_timestamp == 1011.0
+    assert not store.values().flags.writeable
+
+
+def test_analyzer_samples_round_trip_sources():
+    analyzer = EntropyAnalyzer(max_samples_per_bloom=8)
+    for i in range(20):
+        analyzer.add_entropy_sample("bloom", 0.05 * i, source="thermal" if i % 2 else "sigil")
+
+    samples = analyzer.get_samples("bloom")
+    assert len(samples) == 8
+    assert [s.source for s in samples[:2]] == ["sigil", "thermal"]
+    assert np.isclose(samples[-1].entropy, 0.95)
+    assert len(analyzer.get_entropy_trajectory("bloom", window_size=3)) == 3
+    assert analyzer.get_entropy_phase_portrait("bloom")["trajectory_length"] == 7
+
+
+def test_score_blooms_matches_per_bloom_chaos():
+    rng = np.random.default_rng(3)
+    analyzer = EntropyAnalyzer(max_samples_per_bloom=120, volatility_window=30)
+    bloom_ids = [f"bloom_{i}" for i in range(12)]
+    for step in range(150):
+        # Blooms drop in over time so windows have different fill levels
+        active = bloom_ids[:1 + step // 12]
+        analyzer.add_entropy_samples_batch(active, rng.random(len(active)) ** (1 + step % 3))
+
+    scores = analyzer.score_blooms(bloom_ids)
+    for bloom_id, chaos in zip(scores['bloom_ids'], scores['chaos']):
+        assert np.isclose(chaos, analyzer._calculate_chaos_score(bloom_id))
+        assert np.isclose(analyzer.profiles[bloom_id].chaos_score, chaos)
+
+
+def test_score_blooms_matches_scalar_path_below_volatility_window():
+    rng = np.random.default_rng(5)
+    analyzer = EntropyAnalyzer(volatility_window=50)
+    counts = {"bloom_20": 20, "bloom_30": 30, "bloom_49": 49, "bloom_50": 50, "bloom_70": 70}
+    for bloom_id, count in counts.items():
+        for value in rng.random(count):
+            analyzer.add_entropy_sample(bloom_id, float(value))
+
+    # Scored together and alone: a batch of short blooms is narrower than the window
+    for batch in [list(counts)] + [[bloom_id] for bloom_id in counts]:
+        scores = analyzer.score_blooms(batch)
+        for bloom_id, volatility, chaos in zip(scores['bloom_ids'], scores['volatility'], scores['chaos']):
+            assert np.isclose(volatility, analyzer.samples[bloom_id].return_volatility())
+            assert np.isclose(chaos, analyzer._calculate_chaos_score(bloom_id))
+            assert (volatility > 0) == (counts[bloom_id] >= 50)
+
+
+def test_batch_ingest_matches_sequential_ingest():
+    rng = np.random.default_rng(4)
+    bloom_ids = [f"bloom_{i % 5}" for i in range(400)]
+    values = rng.random(400)
+
+    sequential = EntropyAnalyzer(max_samples_per_bloom=50)
+    for bloom_id, value in zip(bloom_ids, values):
+        sequential.add_entropy_sample(bloom_id, value)
+    batched = EntropyAnalyzer(max_samples_per_bloom=50)
+    profiles = batched.add_entropy_samples_batch(bloom_ids, values)
+
+    assert set(profiles) == {f"bloom_{i}" for i in range(5)}
+    assert batched.total_samples == 400
+    assert np.isclose(batched.global_entropy_mean, sequential.global_entropy_mean)
+    for bloom_id, profile in profiles.items():
+        expected = sequential.profiles[bloom_id]
+        assert np.isclose(profile.mean, expected.mean)
+        assert np.isclose(profile.chaos_score, expected.chaos_score)
+        assert profile.trend == expected.trend
+
+
+def test_correlation_matrix_matches_pairwise_and_caches():
+    rng = np.random.default_rng(5)
+    analyzer = EntropyAnalyzer(max_samples_per_bloom=100)
+    base = rng.random(80)
+    bloom_ids = [f"bloom_{i}" for i in range(6)]
+    for step in range(80):
+        values = [base[step], 1 - base[step]] + list(rng.random(4))
+        analyzer.add_entropy_samples_batch(bloom_ids, values)
+    for value in rng.random(20):
+        analyzer.add_entropy_sample("short_bloom", value)
+
+    ids = bloom_ids + ["short_bloom"]
+    correlations = analyzer.get_entropy_correlations(ids)
+    for (b1, b2), corr in correlations.items():
+        n = min(50, len(analyzer.samples[b1]), len(analyzer.samples[b2]))
+        expected = np.corrcoef(analyzer.samples[b1].values()[-n:],
+                               analyzer.samples[b2].values()[-n:])[0, 1]
+        assert np.isclose(corr, expected)
+    assert len(correlations) == 21
+
+    result = analyzer.get_entropy_correlation_matrix(bloom_ids, top_k=2)
+    assert np.isclose(result['matrix'][0, 1], -1.0)
+    assert result['top_partners']['bloom_0'][0][0] == 'bloom_1'
+    assert analyzer.get_entropy_correlation_matrix(bloom_ids, top_k=2) is result
+
+    analyzer.add_entropy_sample("bloom_3", 0.5)
+    assert analyzer.get_entropy_correlation_matrix(bloom_ids, top_k=2) is not result
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test the array pixel pipeline of the Tk fractal canvas
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from gui.fractal_canvas import FractalCanvas, fractal_color_lut, fractal_frame, ppm_bytes
+
+PALETTE = [(0.8, 0.2, 0.0), (1.0, 0.4, 0.1), (1.0, 0.6, 0.3)]
+
+
+def hex_rgb(color):
+    return tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+
+
+def test_color_table_matches_per_pixel_colors():
+    max_iterations = 45
+    for complexity in (0.0, 0.6, 1.7):
+        lut = fractal_color_lut(max_iterations, PALETTE, complexity)
+        expected = [hex_rgb(FractalCanvas.get_fractal_color(None, iteration / max_iterations, PALETTE, complexity))
+                    for iteration in range(max_iterations)]
+        assert [tuple(color) for color in lut[:max_iterations]] == expected
+        assert tuple(lut[max_iterations]) == tuple(int(channel * 80) for channel in PALETTE[0])
+
+
+def test_frame_and_ppm_encoding():
+    iterations = np.array([[0, 10, 45], [45, 3, 20]])
+    frame = fractal_frame(iterations, 45, PALETTE, 0.6)
+    assert frame.shape == (2, 3, 3) and frame.dtype == np.uint8
+    assert (frame[0, 2] == frame[1, 0]).all()
+
+    encoded = ppm_bytes(frame)
+    header = b"P6 3 2 255\n"
+    assert encoded.startswith(header)
+    assert encoded[len(header):] == frame.tobytes()
+
+
+class RecordingCanvas:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, callback, *args):
+        self.scheduled.append((delay, callback.__name__, args))
+
+
+def test_render_thread_hands_newest_frame_to_tk():
+    fractal = FractalCanvas.__new__(FractalCanvas)
+    fractal.width, fractal.height = 24, 16
+    fractal.canvas = RecordingCanvas()
+    fractal._render_generation = 2
+
+    fractal._render_frame(1, complex(-0.7269, 0.1889), 200.0, 40, PALETTE, 0.6)  # superseded
+    fractal._render_frame(2, complex(-0.7269, 0.1889), 200.0, 40, PALETTE, 0.6)
+
+    [(delay, callback, (generation, frame))] = fractal.canvas.scheduled
+    assert (delay, callback, generation) == (0, "_present_frame", 2)
+    iterations = fractal.julia_iterations(complex(-0.7269, 0.1889), 200.0, 40)
+    assert frame == ppm_bytes(fractal_frame(iterations, 40, PALETTE, 0.6))
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Test the shared-memory frame ring between visualizers and the server
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.visual.frame_transport import Frame, FrameEdgeEncoder, FrameReader, FrameWriter, frame_segment_name
+
+
+@pytest.fixture
+def segment():
+    return f"dawn_test_{os.getpid()}"
+
+
+def frame(value, height=6, width=8):
+    return np.full((height, width, 3), value, dtype=np.uint8)
+
+
+def test_newest_frame_round_trip_and_acknowledgement(segment):
+    assert FrameReader.attach(segment) is None
+    writer = FrameWriter(segment, width=8, height=6, slots=3)
+    reader = FrameReader.attach(segment)
+    try:
+        assert reader.read() is None
+        writer.write(frame(1), frame_count=10)
+        taken = reader.read()
+        assert (taken.seq, taken.frame_count, taken.dropped) == (1, 10, 0)
+        assert (taken.pixels == 1).all()
+        assert reader.read() is None and writer.consumer_lag() == 0
+
+        # The reader skips to the newest frame and reports what it missed
+        for value in range(2, 7):
+            writer.write(frame(value))
+        assert writer.consumer_lag() == 5
+        taken = reader.read()
+        assert (taken.seq, taken.dropped) == (6, 4) and (taken.pixels == 6).all()
+
+        # Smaller frames fit; larger ones are refused
+        writer.write(frame(7, height=3, width=4))
+        assert reader.read().pixels.shape == (3, 4, 3)
+        with pytest.raises(ValueError):
+            writer.write(frame(8, height=7))
+    finally:
+        reader.close()
+        writer.close()
+    assert FrameReader.attach(segment) is None
+
+
+def test_torn_slot_is_not_returned(segment):
+    writer = FrameWriter(segment, width=8, height=6, slots=2)
+    reader = FrameReader(segment)
+    try:
+        writer.write(frame(1))
+        writer._slot_seqs[1][0] = 0  # writer mid-copy into the newest slot
+        assert reader.read() is None
+        writer._slot_seqs[1][0] = 1
+        assert reader.read().seq == 1
+    finally:
+        reader.close()
+        writer.close()
+
+
+def test_edge_encoder_sends_keyframes_and_changed_rectangles():
+    pytest.importorskip("PIL")
+    encoder = FrameEdgeEncoder(keyframe_interval=3)
+    pixels = np.zeros((20, 30, 3), dtype=np.uint8)
+
+    first = encoder.encode(Frame(1, 0.0, 1, pixels))
+    assert first["type"] == "frame" and (first["width"], first["height"]) == (30, 20)
+    assert encoder.encode(Frame(2, 0.0, 2, pixels.copy())) is None
+
+    changed = pixels.copy()
+    changed[5:8, 10:14] = 255
+    delta = encoder.encode(Frame(3, 0.0, 3, changed))
+    assert delta["type"] == "delta"
+    assert (delta["x"], delta["y"], delta["width"], delta["height"]) == (10, 5, 4, 3)
+
+    sent = []
+    for seq in (4, 5):
+        changed = changed.copy()
+        changed[0, 0] = seq
+        sent.append(encoder.encode(Frame(seq, 0.0, seq, changed))["type"])
+    assert sent == ["delta", "frame"]  # every third frame sent is a keyframe
+
+
+def test_frame_segment_names_are_short_and_distinct():
+    names = {frame_segment_name(f"process_{index}") for index in range(50)}
+    assert len(names) == 50 and max(len(name) for name in names) <= 31
+    assert frame_segment_name("neural_network") == frame_segment_name("neural_network")
+    assert frame_segment_name("neural_network", owner=1) != frame_segment_name("neural_network", owner=2)
+
+
+def test_visual_manager_publishes_process_frames_to_advertised_segments():
+    pytest.importorskip("cv2")
+    from backend.visual.base_visual import BaseVisualProcess
+    from backend.visual.visual_manager import VisualManager
+
+    class Counter(BaseVisualProcess):
+        def _update_impl(self, dt):
+            self._frame[...] = (self.frame_count, 0, 200)  # BGR
+
+    manager = VisualManager()
+    process = Counter(f"counter_{os.getpid()}", width=8, height=6)
+    manager.register_process(process)
+    segment = manager.list_processes()[0]['frame_segment']
+    assert segment == manager.frame_segments[process.name]
+    try:
+        process.start()
+        manager.update_all()
+        reader = FrameReader(segment)
+        try:
+            taken = reader.read()
+            assert taken.frame_count == 1 and tuple(taken.pixels[0, 0]) == (200, 0, 1)  # RGB
+
+            # With nobody reading the ring fills up and publishing pauses
+            for _ in range(5):
+                manager.update_all()
+            assert manager._frame_writers[process.name].consumer_lag() == 3
+            assert reader.read().frame_count == 4
+        finally:
+            reader.close()
+    finally:
+        manager.unregister_process(process.name)
+    assert process.name not in manager.frame_segments and FrameReader.attach(segment) is None
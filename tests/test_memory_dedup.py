@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test MinHash/LSH near-duplicate consolidation in the MemoryManager
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.memory_dedup import MinHashLSH
+from core.memory_manager import MemoryManager, MemoryTrace
+
+
+def make_trace(memory_id: str, keywords, strength: float = 0.5) -> MemoryTrace:
+    return MemoryTrace(
+        memory_id=memory_id, timestamp=time.time(), input_text=" ".join(keywords),
+        response_text="", emotional_state="calm", consciousness_state={},
+        metrics_snapshot={}, interaction_outcome="neutral", pattern_tags=["emotion_calm"],
+        semantic_keywords=list(keywords), emotional_intensity=0.5, retrieval_count=0,
+        last_retrieved=0.0, memory_strength=strength, consolidation_level=0
+    )
+
+
+def test_lsh_finds_near_duplicates_and_forgets_removed():
+    index = MinHashLSH()
+    base = [f"word{i}" for i in range(20)]
+    index.insert("original", base)
+    index.insert("unrelated", [f"other{i}" for i in range(20)])
+
+    near_duplicate = base[:19] + ["extra"]  # Jaccard 19/21
+    assert index.query(near_duplicate) == {"original"}
+
+    index.remove("original")
+    assert index.query(near_duplicate) == set()
+    assert len(index) == 1
+
+
+def test_incremental_consolidation(tmp_path):
+    manager = MemoryManager(memory_directory=str(tmp_path))
+    rng = random.Random(0)
+    vocabulary = [f"term{i}" for i in range(2000)]
+
+    def add(memory_id, keywords, strength=0.5):
+        manager.memory_traces[memory_id] = make_trace(memory_id, keywords, strength)
+        manager._update_semantic_index(memory_id, keywords)
+        manager.pending_consolidation.append(memory_id)
+
+    for i in range(300):
+        add(f"mem_{i}", rng.sample(vocabulary, 15))
+    assert manager._consolidate_similar_memories() == 0
+    assert manager.pending_consolidation == []
+
+    # A near copy of an already-examined memory is merged on the next pass
+    duplicate = list(manager.memory_traces["mem_42"].semantic_keywords)
+    duplicate[-1] = "novel_term"  # Jaccard 14/16 > 0.8
+    add("mem_dup", duplicate, strength=0.9)
+    assert manager._consolidate_similar_memories() == 1
+    assert "mem_42" not in manager.memory_traces
+    assert manager.memory_traces["mem_dup"].consolidation_level == 2
+    assert "mem_42" not in manager.dedup_index
+
+    assert manager._consolidate_similar_memories() == 0
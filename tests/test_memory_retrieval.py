@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test inverted-index memory retrieval against the linear scan
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.memory_manager import MemoryManager, MemoryTrace
+
+VOCABULARY = [f"concept{i:03d}" for i in range(300)]
+
+
+def build_manager(tmp_path, count: int, seed: int = 0) -> MemoryManager:
+    rng = random.Random(seed)
+    manager = MemoryManager(memory_directory=str(tmp_path))
+    now = time.time()
+    for i in range(count):
+        words = rng.sample(VOCABULARY, rng.randint(3, 12))
+        text = " ".join(words) + ("?" if i % 3 == 0 else "")
+        trace = MemoryTrace(
+            memory_id=f"mem_{i}", timestamp=now - rng.random() * 86400 * 3,
+            input_text=text, response_text="", emotional_state="calm",
+            consciousness_state={}, metrics_snapshot={}, interaction_outcome="neutral",
+            pattern_tags=[], semantic_keywords=manager._extract_semantic_keywords(text, ""),
+            emotional_intensity=0.5, retrieval_count=0, last_retrieved=0.0,
+            memory_strength=rng.uniform(0.05, 1.0), consolidation_level=0
+        )
+        manager.memory_traces[trace.memory_id] = trace
+        manager._update_semantic_index(trace.memory_id, trace.semantic_keywords)
+    return manager
+
+
+def test_indexed_retrieval_matches_linear_scan(tmp_path):
+    manager = build_manager(tmp_path, 2000)
+    rng = random.Random(1)
+    for _ in range(25):
+        query = " ".join(rng.sample(VOCABULARY, 6))
+        keywords = manager._extract_keywords(query)
+        # Above the non-semantic ceiling every match must share a keyword
+        expected = manager._scan_similar(keywords, query, 0.62)[:10]
+        actual = manager.retrieval_engine.search(keywords, query, 10, 0.62)
+        assert [mid for mid, _ in actual] == [mid for mid, _ in expected]
+        for (_, a), (_, b) in zip(actual, expected):
+            assert abs(a - b) < 1e-6
+
+
+def test_bm25_scoring_and_removal(tmp_path):
+    manager = build_manager(tmp_path, 500)
+    query = " ".join(VOCABULARY[:5])
+    results = manager.retrieve_similar(query, limit=5, min_similarity=0.3, scoring="bm25")
+    assert results
+    assert all(0.3 <= score <= 1.0 for _, score in results)
+    assert [s for _, s in results] == sorted((s for _, s in results), reverse=True)
+
+    top_id = results[0][0]
+    manager._remove_memory(top_id)
+    assert manager.retrieval_engine.document_count == 499
+    remaining = manager.retrieve_similar(query, limit=5, min_similarity=0.3, scoring="bm25")
+    assert top_id not in [mid for mid, _ in remaining]
+
+
+def test_low_threshold_includes_memories_without_keyword_overlap(tmp_path):
+    manager = build_manager(tmp_path, 300)
+    for query in ("climbing mountains", " ".join(VOCABULARY[:3]), ""):
+        keywords = manager._extract_keywords(query)
+        for threshold in (0.3, 0.5, 0.6):
+            expected = manager._scan_similar(keywords, query, threshold)[:10]
+            actual = manager.retrieval_engine.search(keywords, query, 10, threshold)
+            assert [mid for mid, _ in actual] == [mid for mid, _ in expected]
+            for (_, a), (_, b) in zip(actual, expected):
+                assert abs(a - b) < 1e-6
+    assert manager.retrieve_similar("climbing mountains", limit=5, min_similarity=0.3)
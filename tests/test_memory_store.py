@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test incremental segment-store persistence for the MemoryManager
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.memory_manager import MemoryManager
+from core.memory_store import DECAY, TRACE, MemorySegmentStore
+
+
+def populate(manager: MemoryManager, count: int, offset: int = 0):
+    for i in range(offset, offset + count):
+        manager.store_interaction(
+            f"How does pattern {i} relate to recursive consciousness?",
+            f"Pattern {i} reflects recursive structure",
+            "curious", {"depth": 0.5}, {"scup": 0.5, "entropy": 0.4}
+        )
+
+
+def test_incremental_save_and_reload(tmp_path):
+    manager = MemoryManager(str(tmp_path))
+    populate(manager, 30)
+    assert manager.save_memory_state()
+    snapshot_bytes = manager.store.snapshot_bytes
+
+    # A few more interactions only append to the log
+    populate(manager, 3, offset=30)
+    assert manager.save_memory_state()
+    assert manager.store.snapshot_bytes == snapshot_bytes
+    assert 0 < manager.store.log_bytes < snapshot_bytes
+
+    reloaded = MemoryManager(str(tmp_path))
+    assert set(reloaded.memory_traces) == set(manager.memory_traces)
+    assert set(reloaded.pattern_clusters) == set(manager.pattern_clusters)
+    assert reloaded.semantic_index.keys() == manager.semantic_index.keys()
+    assert reloaded.total_memories_stored == manager.total_memories_stored
+    assert reloaded.retrieval_engine.document_count == len(reloaded.memory_traces)
+
+    query = "recursive consciousness pattern"
+    expected = [memory_id for memory_id, _ in manager.retrieve_similar(query, limit=3)]
+    assert [memory_id for memory_id, _ in reloaded.retrieve_similar(query, limit=3)] == expected
+
+
+def test_compaction_drops_superseded_generation(tmp_path):
+    manager = MemoryManager(str(tmp_path))
+    populate(manager, 10)
+    manager.save_memory_state()
+    populate(manager, 2, offset=10)
+    manager.save_memory_state()
+    assert manager.save_memory_state(compact=True)
+
+    files = sorted(path.name for path in manager.store.directory.iterdir())
+    assert files == [f"snapshot-{manager.store.generation:06d}.bin"]
+    assert len(MemoryManager(str(tmp_path)).memory_traces) == 12
+
+
+def test_torn_log_tail_is_truncated(tmp_path):
+    manager = MemoryManager(str(tmp_path))
+    populate(manager, 5)
+    manager.save_memory_state()
+    populate(manager, 1, offset=5)
+    manager.save_memory_state()
+
+    log_path = manager.store._log_path(manager.store.generation)
+    intact = log_path.stat().st_size
+    with open(log_path, "ab") as f:
+        f.write(b"\x40\x00\x00\x00partial")
+
+    reloaded = MemoryManager(str(tmp_path))
+    assert len(reloaded.memory_traces) == 6
+    assert log_path.stat().st_size == intact
+
+
+def test_decay_is_replayed_before_later_trace_updates(tmp_path):
+    store = MemorySegmentStore(tmp_path, fsync=False)
+
+    store.put_trace(SimpleNamespace(memory_id="mem"))
+    store.decay(0.5)
+    store.flush({})
+    kinds = [kind for kind, _, _ in MemorySegmentStore(tmp_path).load()[2]]
+    assert kinds[:2] == [DECAY, TRACE]
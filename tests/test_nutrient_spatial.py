@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test the spatial hash, packet arrays and kernels behind NutrientCycle
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from schema.nutrient_spatial import PacketStore, PointIndex, SpatialHash, attraction_deltas, diffuse
+
+
+def make_packet(packet_id, rng):
+    return SimpleNamespace(packet_id=packet_id, position=rng.uniform(-60, 60, 3), velocity=rng.normal(0, 3, 3))
+
+
+def test_grid_updates_incrementally_and_queries_match_brute_force():
+    rng = np.random.default_rng(0)
+    grid = SpatialHash(cell_size=10.0)
+    positions = rng.uniform(-50, 50, (300, 3))
+    cells = np.array([grid.insert(key, position) for key, position in enumerate(positions)])
+
+    positions += rng.normal(0, 1.0, positions.shape)
+    new_cells = grid.cells(positions)
+    moved = grid.update(cells, new_cells)
+    assert 0 < moved < len(positions)
+
+    for center, radius in [(np.zeros(3), 12.0), (np.array([40.0, -20, 5]), 33.0), (np.zeros(3), 500.0)]:
+        expected = set(np.flatnonzero(np.linalg.norm(positions - center, axis=1) <= radius).tolist())
+        candidates = grid.query(center, radius)
+        assert len(candidates) == len(set(candidates))
+        assert expected <= set(candidates)
+
+    point_index, keys = grid.query_many(positions[:50], 15.0)
+    close = np.linalg.norm(positions[keys] - positions[point_index], axis=1) <= 15.0
+    found = set(zip(point_index[close].tolist(), keys[close].tolist()))
+    distances = np.linalg.norm(positions[:50, None] - positions[None], axis=2)
+    assert found == set(zip(*np.nonzero(distances <= 15.0)))
+
+
+def test_packet_store_keeps_views_bound_through_growth_and_removal():
+    rng = np.random.default_rng(1)
+    store = PacketStore(cell_size=20.0, capacity=4)
+    packets = [make_packet(f"p{i}", rng) for i in range(40)]
+    for packet in packets:
+        store.add(packet)
+
+    removed = store.remove("p3")
+    store.remove("p39")
+    assert removed.position.base is None and "p3" not in store
+    live = [packet for packet in packets if packet.packet_id not in ("p3", "p39")]
+    before = {packet.packet_id: (packet.position.copy(), packet.velocity.copy()) for packet in live}
+
+    store.integrate(0.5, friction=0.1)
+    store.refresh_cells()
+    for packet in live:
+        position, velocity = before[packet.packet_id]
+        np.testing.assert_allclose(packet.position, position + velocity * 0.5)
+        np.testing.assert_allclose(packet.velocity, velocity * 0.95)
+        assert store.packets[store.slot_of[packet.packet_id]] is packet
+
+    # Nearest first, ties broken by insertion order
+    live[5].position[:] = live[2].position
+    assert store.refresh_cells() == 1
+    center = live[2].position + 1e-9
+    slots, distances = store.within(center, 25.0)
+    expected = sorted((np.linalg.norm(p.position - center), packets.index(p), p.packet_id)
+                      for p in live if np.linalg.norm(p.position - center) <= 25.0)
+    assert [store.packets[slot].packet_id for slot in slots] == [item[2] for item in expected]
+    assert np.all(np.diff(distances) >= 0)
+
+
+def test_attraction_and_pairs_match_loops():
+    rng = np.random.default_rng(2)
+    pools = PointIndex(rng.uniform(-100, 100, (30, 3)), cell_size=50.0)
+    points = rng.uniform(-100, 100, (200, 3))
+    points[0] = pools.positions[0]
+
+    expected = np.zeros_like(points)
+    for i, point in enumerate(points):
+        for target in pools.positions:
+            direction = target - point
+            distance = np.linalg.norm(direction)
+            if 0 < distance <= 50.0:
+                expected[i] += (direction / distance) * 0.2 / (distance + 1)
+    np.testing.assert_allclose(attraction_deltas(points, pools, 50.0, 0.2), expected, atol=1e-12)
+
+    first, second, distances = pools.pairs(100.0)
+    brute = [(i, j) for i in range(30) for j in range(i + 1, 30)
+             if np.linalg.norm(pools.positions[i] - pools.positions[j]) < 100.0]
+    assert list(zip(first.tolist(), second.tolist())) == brute
+    assert pools.pairs(100.0)[0] is first
+
+
+def test_diffusion_conserves_mass_and_skips_small_flows():
+    concentrations = np.array([[50.0, 1.0], [10.0, 1.0], [30.0, 1.2]])
+    first, second = np.array([0, 1]), np.array([1, 2])
+    strengths = np.array([0.05, 0.02])
+    updated, touched = diffuse(concentrations, first, second, strengths, delta_time=1.0)
+
+    np.testing.assert_allclose(updated.sum(axis=0), concentrations.sum(axis=0))
+    np.testing.assert_allclose(updated[:, 0], [48.0, 12.4, 29.6])
+    np.testing.assert_allclose(updated[:, 1], concentrations[:, 1])
+    assert touched[:, 0].all() and not touched[:, 1].any()
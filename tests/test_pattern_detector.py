@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test matrix-profile rebloop detection against the original per-window scan
+"""
+
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.matrix_profile import StreamingMotifProfile, recent_motif_profile
+from core.pattern_detector import REBLOOP_METRICS, PatternDetector
+
+
+def legacy_scores(detector: PatternDetector, series: np.ndarray):
+    """Best similarity per (metric, window length) from the scalar loop"""
+    sequences = [list(row) for row in series]
+    lengths = range(detector.min_pattern_length, min(detector.max_pattern_length, len(sequences[0]) // 2))
+    scores = np.zeros((len(sequences), len(lengths)))
+    for j, length in enumerate(lengths):
+        for c, sequence in enumerate(sequences):
+            pattern = sequence[-length:]
+            preceding = sequence[-(length * 3):-length]
+            scores[c, j] = max(detector._calculate_pattern_similarity(pattern, preceding[i:i + length])
+                               for i in range(len(preceding) - length + 1))
+    return scores
+
+
+def metric_series(count: int, seed: int = 3) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    steps = np.arange(count)
+    return np.stack([
+        0.5 + 0.3 * np.sin(steps * 0.5) + rng.normal(0, 0.05, count),
+        np.cumsum(rng.normal(0, 0.05, count)),
+        0.3 + 0.2 * np.sign(np.sin(steps * 0.9)) + rng.normal(0, 0.02, count),
+    ])
+
+
+def feed(detector: PatternDetector, series: np.ndarray):
+    for values in series.T:
+        detector.add_data_point(dict(zip(REBLOOP_METRICS, values.tolist())), {})
+
+
+def test_profile_matches_scalar_similarity():
+    detector = PatternDetector()
+    for count in (7, 20, 61, 150, 240):
+        series = metric_series(count)
+        profile = recent_motif_profile(series, detector.min_pattern_length, detector.max_pattern_length)
+        expected = legacy_scores(detector, series)
+        if expected.size == 0:
+            assert profile is None
+            continue
+        assert np.allclose(profile.scores, expected, atol=1e-9)
+
+
+def test_constant_and_missing_readings():
+    detector = PatternDetector()
+    series = metric_series(160)
+    series[0] = 0.5
+    series[2, 120:124] = np.nan
+    profile = recent_motif_profile(series, 3, 50)
+    clean = legacy_scores(detector, np.nan_to_num(series[:2]))
+    assert np.allclose(profile.scores[:2], clean, atol=1e-9)
+    # Windows overlapping the missing readings never match
+    assert profile.scores[2, profile.lengths >= 40].max() == 0.0
+
+
+def test_streaming_profile_matches_full_pass():
+    series = metric_series(600, seed=5)
+    stream = StreamingMotifProfile(3, 3, 50, refresh_interval=100)
+    for t, values in enumerate(series.T):
+        stream.append(values)
+        if t % 5 == 0 or t >= 140:
+            profile = stream.profile()
+            expected = recent_motif_profile(series[:, :t + 1], 3, 50)
+            if expected is None:
+                assert profile is None
+                continue
+            assert np.allclose(profile.scores, expected.scores, atol=1e-7)
+            assert (profile.positions == expected.positions).all()
+            assert np.allclose(profile.amplitudes, expected.amplitudes)
+
+
+def test_detect_reloop_finds_periodic_pattern():
+    detector = PatternDetector()
+    steps = np.arange(200)
+    series = np.stack([0.5 + 0.3 * np.sin(steps * 2 * math.pi / 12),
+                       np.full(200, 0.5), np.full(200, 0.3)])
+    feed(detector, series)
+
+    pattern = detector.detect_reloop()
+    assert pattern is not None
+    assert pattern.metrics_involved == ['scup']
+    # Half a period is the shortest window with an exact repeat in its span
+    assert pattern.period == 6 and pattern.confidence > 0.9999
+    assert abs(pattern.amplitude - np.ptp(series[0, -6:])) < 1e-12
+    # Detected once, then rate limited
+    assert pattern.rebloop_trigger and detector.rebloop_count == 1
+    assert not detector.detect_reloop().rebloop_trigger
+
+    explicit = detector.detect_reloop(list(detector.metric_history))
+    assert (explicit.period, explicit.metrics_involved) == (pattern.period, pattern.metrics_involved)
+    assert abs(explicit.confidence - pattern.confidence) < 1e-6
+
+
+def test_detect_reloop_matches_legacy_choice():
+    detector = PatternDetector()
+    series = metric_series(180, seed=11)
+    feed(detector, series)
+
+    expected = legacy_scores(detector, series)
+    pattern = detector.detect_reloop()
+    above = expected > detector.pattern_threshold
+    if not above.any():
+        assert pattern is None
+        return
+    assert abs(pattern.confidence - expected[above].max()) < 1e-6
+    metric = REBLOOP_METRICS.index(pattern.metrics_involved[0])
+    length = pattern.period - detector.min_pattern_length
+    assert abs(expected[metric, length] - expected[above].max()) < 1e-6
+
+
+def test_short_history():
+    detector = PatternDetector()
+    assert detector.detect_reloop() is None
+    feed(detector, metric_series(5))
+    assert detector.detect_reloop() is None
+    assert detector.detect_reloop([{'scup': 0.5, 'entropy': 0.5, 'heat': 0.3}] * 4) is None
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test the NumPy raster primitives shared by the DAWN visualizers
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.visual.raster import (apply_palette, draw_arrows, draw_lines, draw_points, get_palette,
+                                   linear_gradient, palette_lut)
+
+
+def test_palette_lookup():
+    lut = palette_lut([(0, 0, 255), (255, 0, 0)], size=256)
+    assert lut.shape == (256, 3) and lut.dtype == np.uint8
+    assert tuple(lut[0]) == (0, 0, 255) and tuple(lut[-1]) == (255, 0, 0) and tuple(lut[51]) == (51, 0, 204)
+
+    values = np.array([[-1.0, 0.0, 0.5], [1.0, 3.0, np.nan]])
+    colors = apply_palette(values, 'heat')
+    assert colors.shape == (2, 3, 3)
+    assert (colors[0, 0] == colors[0, 1]).all() and (colors[1, 0] == colors[1, 1]).all()
+    assert (colors[1, 2] == get_palette('heat')[0]).all()
+    assert (apply_palette(np.full((2, 2), 7.0), lut, 7.0, 7.0) == lut[0]).all()
+
+
+def test_linear_gradient_matches_pixel_loop():
+    width, height, top, bottom = 5, 7, (10, 200, 30), (250, 0, 90)
+    frame = linear_gradient(width, height, top, bottom)
+    for y in range(height):
+        expected = [int(top[c] * (1 - y / height) + bottom[c] * (y / height)) for c in range(3)]
+        assert (frame[y] == expected).all()
+    assert linear_gradient(4, 2, top, bottom, vertical=False)[1, 3].tolist() == \
+        [int(top[c] * 0.25 + bottom[c] * 0.75) for c in range(3)]
+
+
+def test_lines_and_arrows():
+    frame = np.zeros((10, 12, 3), dtype=np.uint8)
+    draw_lines(frame, [[0, 0], [0, 9]], [[11, 0], [20, 9]], [(255, 0, 0), (0, 255, 0)])
+    assert (frame[0, :, 0] == 255).all()
+    assert (frame[9, :, 1] == 255).all()  # clipped at the frame edge
+    diagonal = np.zeros((6, 6, 3), dtype=np.uint8)
+    draw_lines(diagonal, [[0, 0]], [[5, 5]], (1, 2, 3))
+    assert [tuple(p) for p in np.argwhere(diagonal[..., 0])] == [(k, k) for k in range(6)]
+
+    field = np.zeros((30, 30, 3), dtype=np.uint8)
+    draw_arrows(field, [[5, 15], [20, 20]], [[10, 0], [0, 0]], (9, 9, 9), scale=2.0)
+    lit = {tuple(p) for p in np.argwhere(field[..., 0])}
+    assert {(15, x) for x in range(5, 26)} <= lit  # shaft
+    assert {(12, 20), (18, 20)} <= lit  # barb ends behind the tip at (25, 15)
+    assert (20, 20) not in lit  # zero-length arrow skipped
+
+
+def test_points_discs_and_rings():
+    frame = np.zeros((20, 20, 3), dtype=np.uint8)
+    draw_points(frame, [[5, 5], [14, 14], [19, 0]], [(1, 1, 1), (2, 2, 2), (3, 3, 3)], radius=[2, 3, 1])
+    assert frame[5, 5, 0] == 1 and frame[5, 7, 0] == 1 and frame[5, 8, 0] == 0
+    assert frame[14, 17, 0] == 2 and frame[0, 19, 0] == 3 and frame[1, 19, 0] == 3
+
+    ring = np.zeros((20, 20, 3), dtype=np.uint8)
+    draw_points(ring, [[10, 10]], (5, 5, 5), radius=4, outline=True)
+    assert ring[10, 14, 0] == 5 and ring[10, 10, 0] == 0 and ring[10, 12, 0] == 0
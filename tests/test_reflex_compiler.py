@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test the compiled reflex decision table against the original trigger walk
+"""
+
+import random
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from processors.codex.reflex_compiler import ReflexDecisionTable, compile_trigger
+
+
+class Trigger(SimpleNamespace):
+    def __init__(self, trigger_type, conditions, sensitivity=1.0, cooldown_seconds=0.0):
+        super().__init__(trigger_type=trigger_type, conditions=conditions, sensitivity=sensitivity,
+                         cooldown_seconds=cooldown_seconds, cooldown_until=0.0, fired=0)
+
+    def mark_triggered(self, now):
+        self.fired += 1
+        self.cooldown_until = now + self.cooldown_seconds
+
+
+def reference_fire(reflexes, context, now):
+    """The original walk: every reflex, every trigger, first hit fires"""
+    fired = []
+    for reflex in reflexes:
+        if not reflex.enabled:
+            continue
+        for trigger in reflex.triggers:
+            if trigger.cooldown_seconds > 0 and now < trigger.cooldown_until:
+                continue
+            predicate, _ = compile_trigger(trigger.trigger_type, trigger.conditions, trigger.sensitivity)
+            if predicate(context):
+                trigger.mark_triggered(now)
+                fired.append((reflex, trigger))
+                break
+    return fired
+
+
+def random_trigger(rng, metrics):
+    kind = rng.choice(['threshold', 'threshold', 'combination', 'pattern', 'contextual', 'temporal'])
+    if kind == 'threshold':
+        conditions = {'metric': rng.choice(metrics), 'threshold': rng.random(),
+                      'operator': rng.choice(['greater_than', 'less_than', 'equals'])}
+        return Trigger(kind, conditions, rng.choice([0.8, 1.0, 1.2]), rng.choice([0.0, 0.0, 2.5]))
+    if kind == 'combination':
+        conditions = {'logic': rng.choice(['AND', 'OR']), 'conditions': [
+            {'metric': rng.choice(metrics), 'threshold': rng.random(), 'operator': 'greater_than'}
+            for _ in range(rng.randint(0, 3))]}
+        return Trigger(kind, conditions, cooldown_seconds=rng.choice([0.0, 1.5]))
+    if kind == 'pattern':
+        return Trigger(kind, {'pattern': {'zone': rng.choice(['calm', 'active', 'surge'])}})
+    if kind == 'contextual':
+        return Trigger(kind, {'required_context': {'zone': 'surge', 'mode': rng.choice(['a', 'b'])}})
+    return Trigger(kind, {'period': 5})
+
+
+def build(seed):
+    rng = random.Random(seed)
+    metrics = ['heat', 'entropy', 'scup', 'tension', 'drift']
+    reflexes = [SimpleNamespace(enabled=rng.random() > 0.1,
+                                triggers=[random_trigger(rng, metrics) for _ in range(rng.randint(1, 3))])
+                for _ in range(60)]
+    return rng, metrics, reflexes
+
+
+def test_table_matches_reference_walk_with_cooldowns():
+    rng, metrics, reflexes = build(7)
+    _, _, mirror = build(7)
+    table = ReflexDecisionTable(reflexes)
+
+    context = {metric: 0.5 for metric in metrics}
+    context.update(zone='calm', mode='a')
+    for tick in range(300):
+        now = tick * 0.5
+        for _ in range(rng.randint(0, 2)):
+            context[rng.choice(metrics)] = rng.random()
+        if tick % 17 == 0:
+            context['zone'] = rng.choice(['calm', 'active', 'surge'])
+        if tick % 23 == 0:
+            context.pop('drift', None)
+
+        fired = table.evaluate(dict(context), now=now)
+        expected = reference_fire(mirror, dict(context), now)
+        assert [(reflexes.index(r), r.triggers.index(t)) for r, t in fired] == \
+            [(mirror.index(r), r.triggers.index(t)) for r, t in expected]
+
+    assert table.predicate_calls < 300 * len(table)
+
+
+def test_unchanged_context_skips_predicates():
+    trigger = Trigger('threshold', {'metric': 'heat', 'threshold': 0.7}, cooldown_seconds=10.0)
+    reflex = SimpleNamespace(enabled=True, triggers=[trigger])
+    table = ReflexDecisionTable([reflex])
+
+    assert table.evaluate({'heat': 0.9}, now=0.0) == [(reflex, trigger)]
+    calls = table.predicate_calls
+    assert table.evaluate({'heat': 0.9}, now=5.0) == []
+    assert table.predicate_calls == calls
+    # Cooldown expiry fires again without re-running the predicate
+    assert table.evaluate({'heat': 0.9}, now=10.0) == [(reflex, trigger)]
+    assert table.predicate_calls == calls
+    assert table.evaluate({'heat': 0.1}, now=30.0) == []
+    assert trigger.fired == 2
+
+
+def test_disabled_reflex_and_empty_combinations():
+    always = Trigger('combination', {'logic': 'AND', 'conditions': []})
+    never = Trigger('combination', {'logic': 'OR', 'conditions': []})
+    reflexes = [SimpleNamespace(enabled=False, triggers=[always]),
+                SimpleNamespace(enabled=True, triggers=[never, Trigger('temporal', {})]),
+                SimpleNamespace(enabled=True, triggers=[always])]
+    table = ReflexDecisionTable(reflexes)
+
+    assert table.evaluate({}, now=0.0) == [(reflexes[2], always)]
+    reflexes[0].enabled = True
+    assert [r for r, _ in table.evaluate({}, now=1.0)] == [reflexes[0], reflexes[2]]
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test the reflex context provider registry
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from processors.codex import reflex_context
+from processors.codex.reflex_context import ContextProvider, ContextProviderRegistry
+
+
+def counting_imports(monkeypatch):
+    calls = []
+    import_module = reflex_context.importlib.import_module
+
+    def tracked(name):
+        calls.append(name)
+        return import_module(name)
+
+    monkeypatch.setattr(reflex_context.importlib, "import_module", tracked)
+    return calls
+
+
+def test_failed_imports_are_memoised(monkeypatch):
+    calls = counting_imports(monkeypatch)
+    registry = ContextProviderRegistry([
+        ContextProvider('missing', [('dawn_no_such_module', 'probe')], lambda context, probe: {'x': probe()},
+                        {'x': 0.6}),
+        ContextProvider('missing_attr', [('math', 'no_such_function')], lambda context, f: {'y': f()},
+                        {'y': 0.3}),
+    ])
+
+    for tick in range(5):
+        assert registry.gather(now=float(tick)) == {'x': 0.6, 'y': 0.3}
+    assert calls == ['dawn_no_such_module', 'math']
+
+    stats = registry.get_statistics()['providers']
+    assert not stats['missing']['available'] and stats['missing']['fallbacks'] == 5
+    assert 'dawn_no_such_module' in stats['missing']['unavailable_reason']
+
+    registry.reset('missing')
+    registry.gather(now=10.0)
+    assert calls.count('dawn_no_such_module') == 2
+
+
+def test_ttl_and_provider_order():
+    readings = {'heat': 1.0, 'goals': 0}
+
+    def heat(context, floor):
+        return {'pulse_heat': floor(readings['heat'])}
+
+    def goals(context, floor):
+        readings['goals'] += 1
+        return {'active_goals': readings['goals'], 'seen_heat': context['pulse_heat']}
+
+    registry = ContextProviderRegistry([
+        ContextProvider('pulse', [('math', 'floor')], heat),
+        ContextProvider('goals', [('math', 'floor')], goals, ttl=5.0),
+    ])
+
+    assert registry.gather(now=0.0) == {'pulse_heat': 1, 'active_goals': 1, 'seen_heat': 1}
+    readings['heat'] = 3.5
+    assert registry.gather(now=4.0) == {'pulse_heat': 3, 'active_goals': 1, 'seen_heat': 1}
+    assert registry.gather(now=5.0) == {'pulse_heat': 3, 'active_goals': 2, 'seen_heat': 3}
+
+    stats = registry.get_statistics()['providers']
+    assert stats['pulse']['calls'] == 3 and stats['pulse']['cache_hits'] == 0
+    assert stats['goals']['calls'] == 2 and stats['goals']['cache_hits'] == 1
+
+
+def test_runtime_errors_use_fallback_and_retry():
+    state = {'fail': True}
+
+    def flaky(context, sqrt):
+        if state['fail']:
+            raise RuntimeError("sensor offline")
+        return {'tension_level': sqrt(0.25)}
+
+    def partial(context, sqrt):
+        return {}
+
+    registry = ContextProviderRegistry([
+        ContextProvider('tension', [('math', 'sqrt')], flaky, {'tension_level': 0.3}),
+        ContextProvider('qualia', [('math', 'sqrt')], partial, {'qualia_type': 'unknown'}),
+    ])
+
+    assert registry.gather() == {'tension_level': 0.3}
+    state['fail'] = False
+    assert registry.gather() == {'tension_level': 0.5}
+
+    stats = registry.get_statistics()
+    assert stats['providers']['tension']['errors'] == 1
+    assert stats['providers']['tension']['available']
+    assert stats['slowest_provider'] in ('tension', 'qualia')
+
+
+def test_default_providers_cover_reflex_context_keys():
+    registry = ContextProviderRegistry(reflex_context.default_reflex_providers())
+    context = registry.gather()
+    for key in ('pulse_heat', 'entropy_level', 'scup_score', 'alignment_score',
+                'active_goals', 'total_anchors'):
+        assert key in context
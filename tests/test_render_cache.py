@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test the content-addressed fractal render cache
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from fractal.render_cache import FractalRenderCache, quantise, render_key
+
+
+def write_render(path, payload):
+    path.write_bytes(payload)
+    return str(path)
+
+
+def test_keys_are_stable_over_quantised_parameters():
+    params = dict(seed_id="seed_a", lineage_depth=3, mood="joyful", size=(512, 512))
+    first = render_key("bloom", bloom_factor=quantise(1.2012), entropy_score=quantise(0.4449), **params)
+    second = render_key("bloom", entropy_score=quantise(0.4362), bloom_factor=quantise(1.1988), **params)
+    assert first == second
+    assert render_key("bloom", bloom_factor=quantise(1.21), entropy_score=quantise(0.44), **params) != first
+    assert render_key("generator", bloom_factor=quantise(1.2), entropy_score=quantise(0.44), **params) != first
+
+
+def test_memory_and_disk_tiers_publish_hits(tmp_path):
+    cache = FractalRenderCache(str(tmp_path / "cache"))
+    assert cache.fetch("k1", str(tmp_path / "miss.png")) is None
+    cache.store("k1", write_render(tmp_path / "first.png", b"png-one"))
+
+    published = cache.fetch("k1", str(tmp_path / "again.png"))
+    assert published == str(tmp_path / "again.png")
+    assert Path(published).read_bytes() == b"png-one"
+
+    # A fresh process only has the disk tier
+    restarted = FractalRenderCache(str(tmp_path / "cache"))
+    assert Path(restarted.fetch("k1")).read_bytes() == b"png-one"
+    assert restarted.fetch("k1", str(tmp_path / "again.png")) == str(tmp_path / "again.png")
+
+    stats, restarted_stats = cache.get_statistics(), restarted.get_statistics()
+    assert (stats['memory_hits'], stats['misses'], stats['stores']) == (1, 1, 1)
+    assert (restarted_stats['disk_hits'], restarted_stats['memory_hits']) == (1, 1)
+    assert restarted_stats['hit_rate'] == 1.0 and restarted_stats['disk_entries'] == 1
+
+
+def test_size_based_eviction_in_both_tiers(tmp_path):
+    cache = FractalRenderCache(str(tmp_path / "cache"), max_memory_bytes=25, max_disk_bytes=35)
+    for index in range(4):
+        cache.store(f"k{index}", write_render(tmp_path / f"r{index}.png", bytes([index]) * 10))
+    cache.fetch("k1")  # most recently used survives the next store
+    cache.store("k4", write_render(tmp_path / "r4.png", b"\x04" * 10))
+
+    stats = cache.get_statistics()
+    assert stats['memory_bytes'] <= 25 and stats['disk_bytes'] <= 35
+    assert sorted(name[:-4] for name in os.listdir(tmp_path / "cache")) == ["k1", "k3", "k4"]
+    assert stats['disk_evictions'] == 2 and stats['memory_evictions'] == 4
+    assert cache.fetch("k0") is None
+
+    # Evicted from disk but still in memory: the stored file is restored
+    os.remove(cache.path_for("k4"))
+    assert Path(cache.fetch("k4")).read_bytes() == b"\x04" * 10
+
+
+def test_rewriting_a_published_file_leaves_the_cache_intact(tmp_path):
+    cache = FractalRenderCache(str(tmp_path / "cache"))
+    published = tmp_path / "bloom.png"
+    cache.store("k_red", write_render(published, b"red-pixels"))
+    published.write_bytes(b"blue-pixels")  # in-place rewrite of the same path
+    cache.store("k_blue", str(published))
+    assert Path(cache.fetch("k_red")).read_bytes() == b"red-pixels"
+
+    # Hits are copies too: rewriting a fetched file doesn't reach the store
+    cache.clear_memory()
+    fetched = Path(cache.fetch("k_red", str(tmp_path / "fetched.png")))
+    fetched.write_bytes(b"scribbled")
+    assert Path(cache.path_for("k_red")).read_bytes() == b"red-pixels"
+    assert os.stat(fetched).st_ino != os.stat(cache.path_for("k_red")).st_ino
+
+
+def render_through(cache, key, path):
+    """The fetch-or-render-then-store sequence of generate_julia_image and spawn_bloom"""
+    published = cache.fetch(key, str(path))
+    if published is None:
+        published = write_render(path, b"fresh-render")
+        cache.store(key, published)
+    return published
+
+
+def test_unwritable_cache_directory_never_fails_a_render(tmp_path):
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_bytes(b"")
+    cache = FractalRenderCache(str(blocker / "cache"))
+    for attempt in range(2):
+        path = tmp_path / f"bloom_{attempt}.png"
+        assert render_through(cache, "k1", path) == str(path)
+        assert path.read_bytes() == b"fresh-render"
+    stats = cache.get_statistics()
+    assert (stats['misses'], stats['stores'], stats['disk_entries']) == (2, 2, 0)
+
+    # A failed publish leaves no temporary file behind
+    working = FractalRenderCache(str(tmp_path / "cache"))
+    working.store("k1", str(tmp_path / "bloom_0.png"))
+    occupied = tmp_path / "occupied"
+    occupied.mkdir()
+    assert working.fetch("k1", str(occupied)) is None
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test indexed semantic graph building against the pairwise definition
+"""
+
+import random
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.memory.memory_trace_log import (
+    GenomicMemoryTrace, MemoryCrossover, MemoryGenome, SemanticMemoryGraph
+)
+
+
+def make_traces(count: int, seed: int = 3):
+    rng = random.Random(seed)
+    traces = []
+    for i in range(count):
+        crossovers = [
+            MemoryCrossover(memory_anchor="◈", linguistic_trigger=f"trigger{rng.randrange(6)}",
+                            success_rate=0.5, constitutional_alignment=0.9)
+            for _ in range(rng.randrange(3))
+        ]
+        traces.append(GenomicMemoryTrace(
+            timestamp=f"trace-{i}", thought_fragment="gentle", thermal_trace=rng.uniform(0, 20),
+            entropy_signature=rng.uniform(0, 20), awareness_level=50, sigil_cause="test",
+            fractal_anchor="◈", emotional_valence=rng.uniform(-1, 1), coherence_note="",
+            linguistic_genome=MemoryGenome(strand_a={}, strand_b={}, memory_crossovers=crossovers),
+            successful_expressions=["still here"] if rng.random() < 0.5 else [],
+            constitutional_markers=["kindness"] if rng.random() < 0.5 else []
+        ))
+    return traces
+
+
+def pairwise_edges(traces):
+    nodes, edges = {}, defaultdict(set)
+    for trace in traces:
+        nodes[trace.timestamp] = trace
+        for memory_id, other in nodes.items():
+            if memory_id != trace.timestamp and trace.similarity_score(other) > 0.6:
+                edges[trace.timestamp].add(memory_id)
+                edges[memory_id].add(trace.timestamp)
+    return dict(edges)
+
+
+def test_incremental_and_bulk_match_pairwise():
+    traces = make_traces(400)
+    traces.append(traces[7])  # re-added memory
+    expected = pairwise_edges(traces)
+
+    incremental = SemanticMemoryGraph()
+    for trace in traces:
+        incremental.add_memory(trace)
+
+    bulk = SemanticMemoryGraph()
+    bulk.add_memories(traces)
+
+    assert dict(incremental.semantic_edges) == expected
+    assert dict(bulk.semantic_edges) == expected
+    assert set(bulk.linguistic_pathways) == set(incremental.linguistic_pathways)
+    assert bulk.constitutional_clusters == incremental.constitutional_clusters
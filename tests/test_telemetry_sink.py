@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test the asynchronous telemetry sink used by the SCUP and entropy loops
+"""
+
+import json
+import sys
+import threading
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.telemetry_sink import TelemetrySink
+
+
+def test_lines_and_records_are_appended_in_order(tmp_path):
+    sink = TelemetrySink(batch_size=7)
+    curve = str(tmp_path / "analytics" / "curve.csv")
+    events = str(tmp_path / "events.jsonl")
+    for tick in range(100):
+        sink.append_line(curve, f"{tick},{tick / 100:.4f}")
+        if tick % 10 == 0:
+            sink.append_json(events, {"tick": tick, "state": "STABLE"})
+    assert sink.flush()
+
+    assert Path(curve).read_text().splitlines() == [f"{tick},{tick / 100:.4f}" for tick in range(100)]
+    records = [json.loads(line) for line in Path(events).read_text().splitlines()]
+    assert [record["tick"] for record in records] == list(range(0, 100, 10))
+    stats = sink.get_statistics()
+    assert stats["lines_written"] == 110 and stats["dropped"] == 0
+    sink.close()
+
+
+def test_snapshots_are_coalesced_and_atomic(tmp_path):
+    sink = TelemetrySink(snapshot_interval=60.0)
+    readings = str(tmp_path / "scup_readings.json")
+    for tick in range(50):
+        sink.write_snapshot(readings, {"tick": tick, "current_scup": 0.5})
+    assert sink.flush()
+
+    assert json.loads(Path(readings).read_text())["tick"] == 49
+    assert not Path(readings + ".tmp").exists()
+    stats = sink.get_statistics()
+    assert stats["snapshots_written"] == 1 and stats["snapshots_coalesced"] == 49
+    sink.close()
+
+
+def test_full_queue_counts_backpressure_and_drops(tmp_path):
+    sink = TelemetrySink(max_queue=4)
+    release = threading.Event()
+    write_lines = sink._write_lines
+
+    def stalled_write(items):
+        release.wait(5)
+        write_lines(items)
+
+    sink._write_lines = stalled_write
+    curve = str(tmp_path / "curve.csv")
+    accepted = [sink.append_line(curve, str(i)) for i in range(20)]
+    release.set()
+    assert sink.flush()
+
+    stats = sink.get_statistics()
+    assert stats["dropped"] == accepted.count(False) > 0
+    assert stats["backpressure_events"] >= stats["dropped"]
+    assert len(Path(curve).read_text().splitlines()) == accepted.count(True)
+    sink.close()
+
+
+def test_close_writes_pending_data(tmp_path):
+    sink = TelemetrySink(flush_interval=0.05, snapshot_interval=60.0)
+    curve = str(tmp_path / "curve.csv")
+    readings = str(tmp_path / "readings.json")
+    sink.append_line(curve, "1,0.5000")
+    sink.write_snapshot(readings, {"tick": 1})
+    sink.close()
+
+    assert Path(curve).read_text() == "1,0.5000\n"
+    assert json.loads(Path(readings).read_text()) == {"tick": 1}
+    assert sink.append_line(curve, "2,0.5000") is False
+
+
+def test_writer_survives_unexpected_errors(tmp_path):
+    sink = TelemetrySink()
+    write_lines = sink._write_lines
+    failures = [RuntimeError("disk gremlin")]
+
+    def flaky_write(items):
+        if failures:
+            raise failures.pop()
+        write_lines(items)
+
+    sink._write_lines = flaky_write
+    curve = str(tmp_path / "curve.csv")
+    sink.append_line(curve, "lost")
+    assert sink.flush()
+    sink.append_line(curve, "kept")
+    assert sink.flush()
+
+    assert Path(curve).read_text() == "kept\n"
+    assert sink.get_statistics()["write_errors"] == 1 and sink._thread.is_alive()
+    sink.close()
+
+
+def test_payloads_are_copied_when_queued(tmp_path):
+    sink = TelemetrySink(snapshot_interval=60.0)
+    release = threading.Event()
+    write_lines = sink._write_lines
+
+    def stalled_write(items):
+        release.wait(5)
+        write_lines(items)
+
+    sink._write_lines = stalled_write
+    events = str(tmp_path / "events.jsonl")
+    readings = str(tmp_path / "readings.json")
+    record = {"tick": 1, "zones": ["calm"]}
+    sink.append_json(events, record)
+    sink.write_snapshot(readings, record)
+    record["tick"] = 2
+    record["zones"].append("active")
+    release.set()
+    assert sink.flush()
+
+    assert json.loads(Path(events).read_text()) == {"tick": 1, "zones": ["calm"]}
+    assert json.loads(Path(readings).read_text()) == {"tick": 1, "zones": ["calm"]}
+    sink.close()
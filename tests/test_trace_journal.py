@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test the append-only genomic trace journal
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.memory.memory_trace_log import EnhancedMemoryTraceLog
+from core.memory.trace_journal import TraceJournal
+
+
+def log_traces(memory: EnhancedMemoryTraceLog, count: int):
+    return [
+        memory.log_genomic_trace(
+            thought_fragment=f"gentle pattern {i} breathing", thermal_trace=7.0,
+            entropy_signature=6.5, awareness_level=70, sigil_cause="test",
+            fractal_anchor="◈◊◈", successful_expressions=[f"expression {i}"]
+        )
+        for i in range(count)
+    ]
+
+
+def test_traces_survive_reload_with_updates(tmp_path):
+    log_path = tmp_path / "traces.json"
+    memory = EnhancedMemoryTraceLog(str(log_path), background_flush=False)
+    traces = log_traces(memory, 12)
+    memory.evolve_memory_language_genome(traces[3], "success")
+    memory.close()
+
+    # One line per append; the evolved trace is superseded, not duplicated on load
+    assert sum(1 for _ in open(memory.journal.path, encoding="utf-8")) == 13
+
+    reloaded = EnhancedMemoryTraceLog(str(log_path), background_flush=False)
+    assert [t.timestamp for t in reloaded.traces] == [t.timestamp for t in traces]
+    assert reloaded.traces[3].genome_evolution_log[0]["outcome"] == "success"
+    reloaded.close()
+
+
+def test_background_flusher_group_commits(tmp_path):
+    journal = TraceJournal(tmp_path / "log.jsonl", group_size=8, flush_interval=0.05)
+    for i in range(20):
+        journal.append({"timestamp": str(i)})
+    journal.close()
+
+    assert [r["timestamp"] for r in journal.load()] == [str(i) for i in range(20)]
+    assert journal.group_commits < 20
+
+
+def test_compaction_keeps_latest_retained_records(tmp_path):
+    journal = TraceJournal(tmp_path / "log.jsonl", retain=5, min_compaction_records=10,
+                           background=False)
+    for i in range(30):
+        journal.append({"timestamp": str(i % 8), "version": i})
+    journal.flush()
+
+    lines = [json.loads(line) for line in open(journal.path, encoding="utf-8")]
+    assert journal.compactions == 1
+    assert [r["timestamp"] for r in lines] == ["3", "4", "5", "6", "7"]
+    assert [r["version"] for r in lines] == [27, 28, 29, 22, 23]
+
+
+def test_legacy_json_log_is_migrated(tmp_path):
+    log_path = tmp_path / "traces.json"
+    memory = EnhancedMemoryTraceLog(str(log_path), background_flush=False)
+    log_traces(memory, 3)
+    memory.export_traces()
+    memory.close()
+    memory.journal.path.unlink()
+
+    migrated = EnhancedMemoryTraceLog(str(log_path), background_flush=False)
+    assert len(migrated.traces) == 3
+    assert migrated.journal.path.exists()
+    migrated.close()
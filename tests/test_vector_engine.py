@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test the NumPy vector engines behind DAWNVectorIndex
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.memory.memory_chunk import create_memory_now
+from core.memory.memory_routing_system import MemoryRouter
+from core.memory.vector_engine import FlatVectorIndex, IVFVectorIndex
+from core.memory.vector_index import DAWNVectorIndex, IndexConfig, SimpleEmbedder
+
+
+def clustered_vectors(count: int, dimension: int = 32, clusters: int = 40, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dimension))
+    labels = rng.integers(0, clusters, size=count)
+    return (centers[labels] + 0.3 * rng.normal(size=(count, dimension))).astype(np.float32)
+
+
+def test_flat_matches_brute_force_for_each_metric():
+    vectors = clustered_vectors(3000)
+    queries = clustered_vectors(5, seed=1)
+
+    for metric in ("cosine", "inner_product", "l2"):
+        index = FlatVectorIndex(32, metric=metric, capacity=16)  # forces growth
+        index.add(vectors[:1000])
+        index.add(vectors[1000:])
+        scores, indices = index.search(queries, 10)
+
+        if metric == "cosine":
+            unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+            q = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+            expected = np.argsort(-(q @ unit.T), axis=1)[:, :10]
+        elif metric == "inner_product":
+            expected = np.argsort(-(queries @ vectors.T), axis=1)[:, :10]
+        else:
+            distances = ((queries[:, None, :] - vectors[None, :, :]) ** 2).sum(axis=2)
+            expected = np.argsort(distances, axis=1)[:, :10]
+            assert np.allclose(scores, np.take_along_axis(distances, indices, axis=1), rtol=1e-3, atol=1e-3)
+        assert (indices == expected).all(), metric
+
+
+def test_ivf_recall_and_padding():
+    vectors = clustered_vectors(8000)
+    queries = clustered_vectors(50, seed=2)
+
+    flat = FlatVectorIndex(32)
+    flat.add(vectors)
+    ivf = IVFVectorIndex(32, nprobe=8, min_train_size=2000)
+    for start in range(0, len(vectors), 500):
+        ivf.add(vectors[start:start + 500])
+
+    assert ivf.is_trained and ivf.list_sizes().sum() == len(vectors)
+    _, exact = flat.search(queries, 10)
+    _, approx = ivf.search(queries, 10)
+    recall = np.mean([len(set(a) & set(e)) / 10 for a, e in zip(approx, exact)])
+    assert recall > 0.9
+
+    small = FlatVectorIndex(32)
+    small.add(vectors[:3])
+    scores, indices = small.search(queries[0], 5)
+    assert indices[0, 3:].tolist() == [-1, -1] and np.isneginf(scores[0, 3:]).all()
+
+
+def test_dawn_vector_index_uses_numpy_engine():
+    index = DAWNVectorIndex(IndexConfig(use_faiss=False, dimension=64, index_type="ivf"))
+    for i in range(50):
+        index.add(f"memory about topic {i}")
+    results = index.search("memory about topic 7", top_k=3)
+
+    assert index.get_stats()["backend"] == "numpy-ivf"
+    assert results[0].score > 0.999 and [r.rank for r in results] == [0, 1, 2]
+
+
+def test_batch_embedding_matches_single_adds():
+    embedder = SimpleEmbedder(dimension=50)
+    texts = ["Spiral memory", "gentle warmth", ""]
+    assert np.array_equal(embedder.embed_texts(texts), np.array([embedder.embed_text(t) for t in texts]))
+
+    chunks = [create_memory_now("dawn", f"reflection number {i}") for i in range(40)]
+    single = DAWNVectorIndex(IndexConfig(use_faiss=False, dimension=64))
+    for chunk in chunks:
+        single.add(chunk)
+    batched = DAWNVectorIndex(IndexConfig(use_faiss=False, dimension=64))
+    ids = batched.add_batch(chunks)
+
+    assert ids == [chunk.memory_id for chunk in chunks] and batched.vector_count == 40
+    assert np.allclose(single.vector_index.vectors, batched.vector_index.vectors)
+    for query in ("reflection number 3", "unrelated"):
+        assert [r.chunk_id for r in single.search(query, 5)] == [r.chunk_id for r in batched.search(query, 5)]
+
+
+def test_route_memories_indexes_in_one_batch():
+    router = MemoryRouter(enable_cognitive_routing=False)
+    chunks = [create_memory_now("dawn", f"bulk memory {i}") for i in range(10)]
+    results = router.route_memories(chunks)
+
+    assert all(result['vector_indexed'] and result['recent_memory'] for result in results)
+    assert router.vector_index.vector_count == 10
+    assert router.vector_search("bulk memory 4", top_k=1)[0].memory_id == chunks[4].memory_id
+
+
+def test_tombstones_are_masked_and_compacted():
+    vectors = clustered_vectors(3000)
+    queries = clustered_vectors(10, seed=3)
+    dead = np.arange(0, 3000, 3)
+    keep = np.setdiff1d(np.arange(3000), dead)
+
+    for engine in (FlatVectorIndex(32), IVFVectorIndex(32, nprobe=64, min_train_size=1000)):
+        engine.add(vectors)
+        assert engine.remove(dead) == len(dead) and engine.remove(dead[:5]) == 0
+        _, indices = engine.search(queries, 10)
+        assert not np.isin(indices, dead).any()
+
+        rebuilt = engine.rebuild(keep)
+        _, rebuilt_indices = rebuilt.search(queries, 10)
+        assert rebuilt.ntotal == len(keep) and (keep[rebuilt_indices] == indices).all()
+
+
+def test_dawn_vector_index_compacts_removed_chunks():
+    config = IndexConfig(use_faiss=False, dimension=32, min_compaction_rows=10, compaction_ratio=0.2)
+    index = DAWNVectorIndex(config)
+    chunks = [create_memory_now("dawn", f"pruned memory {i}") for i in range(100)]
+    index.add_batch(chunks)
+    index.add(chunks[7])  # re-adding supersedes the old row
+    assert index.tombstones == 1 and len(index.search("pruned memory 7", 100)) == 100
+
+    for chunk in chunks[:30]:
+        index.remove_chunk(chunk.memory_id)
+    index.wait_for_compaction(timeout=10)
+
+    assert index.tombstones <= 10 and index.vector_count < 101
+    results = index.search("pruned memory 50", 100)
+    assert len(results) == 70 and results[0].chunk_id == chunks[50].memory_id
+    assert {r.chunk_id for r in results} == {c.memory_id for c in chunks[30:]}
+
+    router = MemoryRouter(enable_cognitive_routing=True)
+    router.route_memories(chunks[:10])
+    assert router.remove_memory(chunks[3].memory_id)
+    router.compress_memories()
+    assert router.vector_index.tombstones == 0 and router.vector_index.vector_count == 9
+    assert chunks[3].memory_id not in router.cognitive_router.chunks
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test filtered and pulse-weighted DAWNVectorIndex search against the
+original search-then-filter implementation
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.memory.memory_chunk import create_memory_now
+from core.memory.vector_index import DAWNVectorIndex, IndexConfig
+
+MOODS = ["calm", "anxious", "curious"]
+
+
+def make_index(count: int = 600, index_type: str = "flat", seed: int = 4, **config):
+    rng = random.Random(seed)
+    index = DAWNVectorIndex(IndexConfig(use_faiss=False, dimension=48, index_type=index_type,
+                                        min_compaction_rows=10, **config))
+    chunks = []
+    for i in range(count):
+        pulse_state = {"entropy": round(rng.random(), 2), "heat": rng.uniform(0, 80), "mood": rng.choice(MOODS)}
+        if i % 7 == 0:
+            pulse_state = {}
+        chunks.append(create_memory_now(
+            "rare" if i % 50 == 0 else rng.choice(["dawn", "jackson"]), f"memory number {i} of the spiral",
+            topic=rng.choice([None, "reflection", "thermal"]), pulse_state=pulse_state))
+    index.add_batch(chunks)
+    index.add("a plain string without attributes")
+    return index, chunks
+
+
+def legacy_filtered(index, query, speaker=None, topic=None, mood=None, top_k=3):
+    results = []
+    for result in index.search(query, index.vector_count):
+        chunk = result.chunk
+        if speaker and hasattr(chunk, 'speaker') and chunk.speaker != speaker:
+            continue
+        if topic and hasattr(chunk, 'topic') and chunk.topic != topic:
+            continue
+        if mood and getattr(chunk, 'get_mood', lambda: None)() != mood:
+            continue
+        results.append(result.chunk_id)
+    return results[:top_k]
+
+
+def legacy_pulse(index, query, pulse_state, top_k=3):
+    weighted = []
+    for result in index.search(query, top_k * 2):
+        bonus = 0.0
+        chunk_pulse = getattr(result.chunk, 'pulse_state', None)
+        if chunk_pulse:
+            if 'heat' in pulse_state and 'heat' in chunk_pulse:
+                bonus += max(0, 1.0 - abs(pulse_state['heat'] - chunk_pulse['heat']) / 100.0) * 0.2
+            if 'mood' in pulse_state and 'mood' in chunk_pulse and pulse_state['mood'] == chunk_pulse['mood']:
+                bonus += 0.3
+            if 'entropy' in pulse_state and 'entropy' in chunk_pulse:
+                bonus += max(0, 1.0 - abs(pulse_state['entropy'] - chunk_pulse['entropy'])) * 0.2
+        weighted.append((result.score + bonus, result.chunk_id))
+    weighted.sort(key=lambda x: x[0], reverse=True)
+    return weighted[:top_k]
+
+
+def check_against_legacy(index):
+    for query in ("memory number 100 of the spiral", "thermal reflection", "memory number 7"):
+        for filters in ({"speaker": "rare"}, {"speaker": "rare", "topic": "thermal"}, {"mood": "calm"},
+                        {"mood": "neutral", "top_k": 10}, {"speaker": "nobody"}, {}):
+            expected = legacy_filtered(index, query, **filters)
+            assert [r.chunk_id for r in index.search_with_filters(query, **filters)] == expected, filters
+
+        pulse_state = {"heat": 40.0, "mood": "calm", "entropy": 0.5}
+        expected = legacy_pulse(index, query, pulse_state, top_k=5)
+        results = index.search_with_pulse_state(query, pulse_state, top_k=5)
+        assert [r.chunk_id for r in results] == [chunk_id for _, chunk_id in expected]
+        assert all(abs(r.score - score) < 1e-9 for r, (score, _) in zip(results, expected))
+        assert [r.rank for r in results] == list(range(len(results)))
+
+
+def test_filtered_search_matches_search_then_filter():
+    index, chunks = make_index()
+    check_against_legacy(index)
+
+    # Selective filters still return a full, exact top-k
+    results = index.search_with_filters("spiral", speaker="rare", top_k=20)
+    assert len(results) == 13 and all(getattr(r.chunk, 'speaker', 'rare') == 'rare' for r in results)
+
+    very_low = index.search_with_filters("spiral", entropy_bucket="very_low", top_k=1000)
+    assert all(r.chunk.get_entropy() < 0.2 for r in very_low)
+    assert len(very_low) == sum(1 for c in chunks if c.get_entropy() < 0.2)
+
+
+def test_filters_follow_removal_compaction_and_reload(tmp_path):
+    index, chunks = make_index(index_type="ivf")
+    for chunk in chunks[:200]:
+        index.remove_chunk(chunk.memory_id)
+    index.wait_for_compaction(timeout=10)
+    index.compact()
+    assert index.tombstones == 0
+    check_against_legacy(index)
+
+    index.save(str(tmp_path))
+    restored = DAWNVectorIndex(IndexConfig(use_faiss=False, dimension=48))
+    restored.load(str(tmp_path))
+    restored.add(create_memory_now("rare", "added after reload"))
+    check_against_legacy(restored)
+    assert restored.search_with_filters("added after reload", speaker="rare", top_k=1)[0].chunk.content == \
+        "added after reload"
+
+
+def test_ivf_filtered_search_fills_top_k():
+    # Trained IVF with one probed list: a broad filter matches fewer than top_k rows there
+    index, chunks = make_index(count=2100, index_type="ivf", nprobe=1)
+    matching = sum(1 for c in chunks if c.get_mood() == "calm")
+    assert 0.2 < matching / len(chunks) < 0.4
+    for query in ("memory number 100 of the spiral", "thermal reflection"):
+        results = index.search_with_filters(query, mood="calm", top_k=60)
+        assert len(results) == 60 and all(r.chunk.get_mood() == "calm" for r in results)
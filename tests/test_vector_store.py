@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test persisted, memory-mapped DAWNVectorIndex snapshots
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.memory.memory_chunk import MemoryChunk, create_memory_now
+from core.memory.vector_index import DAWNVectorIndex, IndexConfig
+from core.memory.vector_store import VectorSnapshotStore
+
+
+def new_index(index_type: str = "flat") -> DAWNVectorIndex:
+    return DAWNVectorIndex(IndexConfig(use_faiss=False, dimension=32, index_type=index_type))
+
+
+def test_save_load_round_trip_is_memory_mapped(tmp_path):
+    index = new_index()
+    chunks = [create_memory_now("dawn", f"spiral memory {i}", topic="reflection") for i in range(30)]
+    index.add_batch(chunks)
+    index.add("a plain string chunk")
+    assert index.save(str(tmp_path)) == 31
+
+    restored = new_index()
+    assert restored.load(str(tmp_path)) == 31
+    assert isinstance(restored.vector_index.vectors.base, np.memmap)
+    assert isinstance(restored.get_chunk(chunks[5].memory_id), MemoryChunk)
+    assert restored.chunk_metadata[chunks[5].memory_id]['topic'] == "reflection"
+    for query in ("spiral memory 5", "a plain string chunk"):
+        assert [(r.chunk_id, round(r.score, 5)) for r in index.search(query, 4)] == \
+               [(r.chunk_id, round(r.score, 5)) for r in restored.search(query, 4)]
+
+    # Adding after a load copies off the read-only mapping
+    restored.add(create_memory_now("dawn", "fresh thought"))
+    assert restored.search("fresh thought", 1)[0].chunk.content == "fresh thought"
+
+
+def test_incremental_saves_append_only_new_rows(tmp_path):
+    index = new_index()
+    index.add_batch([create_memory_now("dawn", f"first {i}") for i in range(10)])
+    index.save(str(tmp_path))
+    size = (tmp_path / "vectors.npy").stat().st_size
+
+    index.add_batch([create_memory_now("dawn", f"second {i}") for i in range(5)])
+    removed = create_memory_now("dawn", "forgotten")
+    index.add(removed)
+    index.remove_chunk(removed.memory_id)
+    assert index.save() == 6
+    assert index.save() == 0
+    assert (tmp_path / "vectors.npy").stat().st_size == size + 6 * 32 * 4
+
+    # Other readers see a valid .npy file and the committed rows
+    assert np.load(tmp_path / "vectors.npy", mmap_mode="r").shape == (16, 32)
+    restored = new_index("ivf")
+    restored.load(str(tmp_path))
+    assert restored.vector_count == 16 and len(restored.chunks) == 15
+    assert removed.memory_id not in [r.chunk_id for r in restored.search("forgotten", 16)]
+
+
+def test_torn_append_is_ignored_and_truncated(tmp_path):
+    index = new_index()
+    index.add_batch([create_memory_now("dawn", f"memory {i}") for i in range(4)])
+    index.save(str(tmp_path))
+
+    # Simulate a crash after writing rows but before the manifest commit
+    with open(tmp_path / "ids.txt", "ab") as f:
+        f.write(b"half-written-id")
+    with open(tmp_path / "vectors.npy", "ab") as f:
+        f.write(b"\x00" * 100)
+    vectors, ids, records, _ = VectorSnapshotStore(tmp_path).load()
+    assert len(vectors) == len(ids) == len(records) == 4
+
+    restored = new_index()
+    restored.load(str(tmp_path))
+    restored.add(create_memory_now("dawn", "after crash"))
+    restored.save()
+    vectors, ids, _, _ = VectorSnapshotStore(tmp_path).load()
+    assert len(ids) == 5 and "half-written-id" not in "".join(ids)
+    assert (tmp_path / "vectors.npy").stat().st_size == 128 + 5 * 32 * 4
+
+
+def test_removals_persist_and_survive_compaction(tmp_path):
+    index = new_index()
+    chunks = [create_memory_now("dawn", f"memory {i}") for i in range(20)]
+    index.add_batch(chunks)
+    index.save(str(tmp_path))
+    for chunk in chunks[:5]:
+        index.remove_chunk(chunk.memory_id)
+    index.save()
+
+    restored = new_index()
+    restored.load(str(tmp_path))
+    assert restored.tombstones == 5 and len(restored.chunks) == 15
+    assert chunks[2].memory_id not in [r.chunk_id for r in restored.search("memory 2", 20)]
+
+    assert restored.compact() == 5
+    assert restored.vector_count == 15 and restored.tombstones == 0
+    restored.save()
+    reloaded = new_index()
+    reloaded.load(str(tmp_path))
+    assert reloaded.vector_count == 15
+    assert reloaded.search("memory 12", 1)[0].chunk_id == chunks[12].memory_id
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+bench_cognitive_router.py - CognitiveRouter retrieval benchmark
+Rebloom, entropy-range and pulse-state query latency at increasing chunk
+counts using the packed feature index, against the per-chunk Python scan
+(_calculate_dawn_similarity over every stored chunk, sampled).
+
+Usage:
+    python tools/benchmarks/bench_cognitive_router.py --chunks 10000 100000 1000000
+"""
+
+import argparse
+import contextlib
+import io
+import logging
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logging.disable(logging.CRITICAL)
+
+from core.memory.cognitive_router import CognitiveRouter
+from core.memory.memory_chunk import MemoryChunk
+
+WORDS = [f"word{i}" for i in range(5000)]
+SIGILS = [f"SIGIL_{i}" for i in range(50)]
+
+
+def make_chunk(i: int, rng: random.Random) -> MemoryChunk:
+    return MemoryChunk(
+        timestamp=datetime(2025, 1, 1) + timedelta(seconds=i),
+        speaker=rng.choice(["dawn", "jackson", "owl"]),
+        content=" ".join(rng.sample(WORDS, 8)),
+        topic=rng.choice([None, "reflection", "thermal", "entropy"]),
+        pulse_state={"entropy": rng.random(), "heat": rng.uniform(0, 100),
+                     "scup": rng.random(), "mood": rng.choice(["calm", "anxious", "curious"])},
+        sigils=rng.sample(SIGILS, rng.randrange(3))
+    )
+
+
+def timed(fn, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CognitiveRouter retrieval benchmark")
+    parser.add_argument("--chunks", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--queries", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    print(f"{'chunks':>8} {'add us':>7} {'scan ms (est)':>14} {'rebloom ms':>11} "
+          f"{'range ms':>9} {'pulse ms':>9}")
+    for count in args.chunks:
+        with contextlib.redirect_stdout(io.StringIO()):
+            router = CognitiveRouter()
+        chunks = [make_chunk(i, rng) for i in range(count)]
+        start = time.perf_counter()
+        for chunk in chunks:
+            router.add_chunk(chunk)
+        add_us = (time.perf_counter() - start) / count * 1e6
+
+        # Per-chunk scan baseline on a sample, extrapolated to all chunks
+        query = make_chunk(count, rng)
+        query_words = set(router._extract_keywords(query.content))
+        sample = chunks[:min(count, 20000)]
+        start = time.perf_counter()
+        for chunk in sample:
+            router._calculate_dawn_similarity(query, chunk, query_words)
+        scan_ms = (time.perf_counter() - start) / len(sample) * count * 1e3
+
+        queries = [make_chunk(count + i, rng) for i in range(args.queries)]
+        rebloom_ms = timed(lambda: [router.rebloom_candidates(q) for q in queries], 1) / len(queries)
+        range_ms = timed(lambda: router.find_by_entropy_range(0.40, 0.41), args.queries)
+        pulse_ms = timed(lambda: router.find_similar_pulse_state(queries[0], tolerance=0.02), args.queries)
+
+        print(f"{count:>8} {add_us:>7.1f} {scan_ms:>14.1f} {rebloom_ms:>11.2f} "
+              f"{range_ms:>9.2f} {pulse_ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
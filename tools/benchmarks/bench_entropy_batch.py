@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+bench_entropy_batch.py - Per-sample vs batched entropy ingest benchmark
+Feeds one tick (one sample per bloom) through add_entropy_sample in a loop and
+through add_entropy_samples_batch, then times recommend_stabilization.
+
+Usage:
+    python tools/benchmarks/bench_entropy_batch.py --blooms 100 1000 3000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.entropy_analyzer import EntropyAnalyzer
+
+
+def populated_analyzer(bloom_ids, warmup_ticks: int, rng) -> EntropyAnalyzer:
+    analyzer = EntropyAnalyzer(max_samples_per_bloom=200)
+    for _ in range(warmup_ticks):
+        analyzer.add_entropy_samples_batch(bloom_ids, rng.random(len(bloom_ids)))
+    return analyzer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched entropy ingest benchmark")
+    parser.add_argument("--blooms", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--warmup", type=int, default=60, help="ticks preloaded per bloom")
+    parser.add_argument("--ticks", type=int, default=5, help="timed ticks")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = np.random.default_rng(11)
+
+    print(f"{'blooms':>8} {'loop ms/tick':>13} {'batch ms/tick':>14} {'recommend ms':>13}")
+    for bloom_count in args.blooms:
+        bloom_ids = [f"bloom_{i}" for i in range(bloom_count)]
+        analyzer = populated_analyzer(bloom_ids, args.warmup, rng)
+        ticks = [rng.random(bloom_count) for _ in range(args.ticks)]
+
+        start = time.perf_counter()
+        for tick in ticks:
+            for bloom_id, value in zip(bloom_ids, tick):
+                analyzer.add_entropy_sample(bloom_id, float(value))
+        loop_ms = (time.perf_counter() - start) / args.ticks * 1e3
+
+        start = time.perf_counter()
+        for tick in ticks:
+            analyzer.add_entropy_samples_batch(bloom_ids, tick)
+        batch_ms = (time.perf_counter() - start) / args.ticks * 1e3
+
+        start = time.perf_counter()
+        analyzer.recommend_stabilization()
+        recommend_ms = (time.perf_counter() - start) * 1e3
+
+        print(f"{bloom_count:>8} {loop_ms:>13.1f} {batch_ms:>14.1f} {recommend_ms:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
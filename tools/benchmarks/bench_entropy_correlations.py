@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+bench_entropy_correlations.py - Entropy correlation benchmark
+Compares the per-pair np.corrcoef loop with the single matrix-product
+correlation matrix, and shows the cost of a cached repeat call.
+
+Usage:
+    python tools/benchmarks/bench_entropy_correlations.py --blooms 100 500
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.entropy_analyzer import EntropyAnalyzer
+
+
+def pairwise_loop(analyzer: EntropyAnalyzer, bloom_ids, window: int = 50) -> int:
+    """Reference per-pair correlation loop"""
+    found = 0
+    for i in range(len(bloom_ids)):
+        for j in range(i + 1, len(bloom_ids)):
+            a = analyzer.samples[bloom_ids[i]].values()[-window:]
+            b = analyzer.samples[bloom_ids[j]].values()[-window:]
+            if not np.isnan(np.corrcoef(a, b)[0, 1]):
+                found += 1
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Entropy correlation benchmark")
+    parser.add_argument("--blooms", type=int, nargs="+", default=[100, 500])
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = np.random.default_rng(3)
+
+    print(f"{'blooms':>8} {'pairwise ms':>12} {'matrix ms':>10} {'cached ms':>10}")
+    for bloom_count in args.blooms:
+        analyzer = EntropyAnalyzer(max_samples_per_bloom=100)
+        bloom_ids = [f"bloom_{i}" for i in range(bloom_count)]
+        for _ in range(60):
+            analyzer.add_entropy_samples_batch(bloom_ids, rng.random(bloom_count))
+
+        start = time.perf_counter()
+        pairwise_loop(analyzer, bloom_ids)
+        pairwise_ms = (time.perf_counter() - start) * 1e3
+
+        start = time.perf_counter()
+        analyzer.get_entropy_correlation_matrix(bloom_ids, top_k=5)
+        matrix_ms = (time.perf_counter() - start) * 1e3
+
+        start = time.perf_counter()
+        analyzer.get_entropy_correlation_matrix(bloom_ids, top_k=5)
+        cached_ms = (time.perf_counter() - start) * 1e3
+
+        print(f"{bloom_count:>8} {pairwise_ms:>12.1f} {matrix_ms:>10.2f} {cached_ms:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
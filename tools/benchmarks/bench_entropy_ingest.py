@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+bench_entropy_ingest.py - EntropyAnalyzer ingest latency benchmark
+Measures per-sample cost of add_entropy_sample as the number of tracked blooms
+grows. With incremental statistics the latency should stay flat.
+
+Usage:
+    python tools/benchmarks/bench_entropy_ingest.py --blooms 10 100 1000 3000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.entropy_analyzer import EntropyAnalyzer
+
+
+def bench_ingest(bloom_count: int, samples_per_bloom: int, measure: int) -> float:
+    """Fill bloom_count blooms, then return mean microseconds per extra sample"""
+    analyzer = EntropyAnalyzer(max_samples_per_bloom=samples_per_bloom)
+    rng = np.random.default_rng(42)
+
+    bloom_ids = [f"bloom_{i}" for i in range(bloom_count)]
+    for bloom_id in bloom_ids:
+        for value in rng.random(samples_per_bloom):
+            analyzer.add_entropy_sample(bloom_id, float(value))
+
+    values = rng.random(measure)
+    targets = rng.integers(0, bloom_count, size=measure)
+
+    start = time.perf_counter()
+    for value, target in zip(values, targets):
+        analyzer.add_entropy_sample(bloom_ids[target], float(value))
+    elapsed = time.perf_counter() - start
+
+    return elapsed / measure * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EntropyAnalyzer ingest benchmark")
+    parser.add_argument("--blooms", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--samples", type=int, default=200,
+                        help="samples preloaded per bloom (window size)")
+    parser.add_argument("--measure", type=int, default=5000,
+                        help="timed samples after preload")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'blooms':>8} {'retained':>10} {'us/sample':>10}")
+    for bloom_count in args.blooms:
+        latency = bench_ingest(bloom_count, args.samples, args.measure)
+        print(f"{bloom_count:>8} {bloom_count * args.samples:>10} {latency:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+bench_entropy_storage.py - EntropyAnalyzer sample storage benchmark
+Reports retained-sample memory (via tracemalloc) and the latency of the
+array-backed analysis paths for a populated analyzer.
+
+Usage:
+    python tools/benchmarks/bench_entropy_storage.py --blooms 200 --samples 1000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.entropy_analyzer import EntropyAnalyzer
+
+
+def time_call(fn, repeat: int = 20) -> float:
+    """Mean milliseconds per call"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EntropyAnalyzer storage benchmark")
+    parser.add_argument("--blooms", type=int, default=200)
+    parser.add_argument("--samples", type=int, default=1000)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = np.random.default_rng(7)
+    bloom_ids = [f"bloom_{i}" for i in range(args.blooms)]
+
+    tracemalloc.start()
+    analyzer = EntropyAnalyzer(max_samples_per_bloom=args.samples)
+    baseline, _ = tracemalloc.get_traced_memory()
+    for bloom_id in bloom_ids:
+        for value in rng.random(args.samples):
+            analyzer.add_entropy_sample(bloom_id, float(value), source="bloom")
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    retained = args.blooms * args.samples
+    print(f"retained samples : {retained}")
+    print(f"bytes per sample : {(current - baseline) / retained:.1f}")
+
+    target = bloom_ids[0]
+    print(f"trajectory       : {time_call(lambda: analyzer.get_entropy_trajectory(target, 100)):.3f} ms")
+    print(f"phase portrait   : {time_call(lambda: analyzer.get_entropy_phase_portrait(target)):.3f} ms")
+    print(f"anomalies        : {time_call(lambda: analyzer.detect_entropy_anomalies(target)):.3f} ms")
+    print(f"prediction       : {time_call(lambda: analyzer.predict_entropy_future(target)):.3f} ms")
+    print(f"correlations(20) : {time_call(lambda: analyzer.get_entropy_correlations(bloom_ids[:20]), 5):.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+bench_fractal_canvas.py - Tk fractal canvas pixel pipeline benchmark
+Cost of turning one frame of julia_iteration counts into something Tk can
+draw: the original per-pixel hex colour strings (each later issued as its
+own create_rectangle) against the colour table lookup and PPM encoding
+that feeds a single PhotoImage. With --tk and a display, also times the
+Tk-thread side of both (rectangle items versus one PhotoImage blit).
+
+Usage:
+    python tools/benchmarks/bench_fractal_canvas.py --size 300 --tk
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from gui.fractal_canvas import FractalCanvas, fractal_frame, ppm_bytes
+
+PALETTE = [(0.0, 0.2, 0.8), (0.1, 0.4, 1.0), (0.3, 0.6, 1.0)]
+COMPLEXITY = 0.6
+
+
+def legacy_pixels(iterations, max_iterations):
+    """Colour loop of the original FractalCanvas.render_bloom_fractal"""
+    pixels = []
+    for py, row in enumerate(iterations.tolist()):
+        for px, iteration in enumerate(row):
+            if iteration == max_iterations:
+                r, g, b = PALETTE[0]
+                color = f"#{int(r*80):02x}{int(g*80):02x}{int(b*80):02x}"
+            else:
+                color = FractalCanvas.get_fractal_color(None, iteration / max_iterations, PALETTE, COMPLEXITY)
+            pixels.append((px, py, color))
+    return pixels
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fractal canvas pixel pipeline benchmark")
+    parser.add_argument("--size", type=int, default=300)
+    parser.add_argument("--iterations", type=int, default=75)
+    parser.add_argument("--tk", action="store_true", help="also time the Tk-thread drawing")
+    args = parser.parse_args()
+
+    fractal = FractalCanvas.__new__(FractalCanvas)
+    fractal.width = fractal.height = args.size
+    iterations = fractal.julia_iterations(complex(-0.7269, 0.1889), 200.0, args.iterations)
+
+    pixels = []
+    legacy_ms = timed(lambda: pixels.extend(legacy_pixels(iterations, args.iterations))) * 1000
+    frame = []
+    array_ms = timed(lambda: frame.append(ppm_bytes(fractal_frame(iterations, args.iterations,
+                                                                  PALETTE, COMPLEXITY)))) * 1000
+    print(f"{args.size}x{args.size} colouring: per-pixel {legacy_ms:.1f} ms, "
+          f"array + PPM {array_ms:.1f} ms ({legacy_ms / array_ms:.0f}x)")
+
+    if args.tk:
+        import tkinter as tk
+        root = tk.Tk()
+        canvas = tk.Canvas(root, width=args.size, height=args.size)
+        canvas.pack()
+
+        def rectangles():
+            for px, py, color in pixels:
+                canvas.create_rectangle(px, py, px + 1, py + 1, fill=color, outline="")
+            canvas.update_idletasks()
+
+        def blit():
+            photo = tk.PhotoImage(data=frame[0], format="PPM")
+            canvas.create_image(0, 0, anchor="nw", image=photo)
+            canvas.update_idletasks()
+
+        rectangles_ms = timed(rectangles) * 1000
+        canvas.delete("all")
+        blit_ms = timed(blit) * 1000
+        root.destroy()
+        print(f"Tk thread: {len(pixels)} rectangles {rectangles_ms:.0f} ms, "
+              f"one PhotoImage {blit_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+bench_fractal_engine.py - Julia renderer benchmark
+Frame time of each original Julia renderer (bloom spawner, fractal
+generator, fractal boost, GUI canvas) against the same frame on the shared
+fractal engine, plus a rebloom storm rendered one bloom at a time versus
+through the batch API on the process pool.
+
+Usage:
+    python tools/benchmarks/bench_fractal_engine.py --size 256 --storm 8
+"""
+
+import argparse
+import logging
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logging.disable(logging.CRITICAL)
+
+import numpy as np
+
+from fractal.fractal_engine import FractalEngine, JuliaJob, Viewport
+
+C = complex(-0.7269, 0.1889)
+
+
+def legacy_bloom(size: int, iterations: int):
+    """bloom_spawner.EnhancedJuliaFractal._generate_julia_set"""
+    x = np.linspace(-1.3, 1.3, size)
+    X, Y = np.meshgrid(x, x)
+    Z = (X * math.cos(0.4) - Y * math.sin(0.4)) + 1j * (X * math.sin(0.4) + Y * math.cos(0.4))
+    escape_count = np.zeros(Z.shape)
+    smooth_escape = np.zeros(Z.shape)
+    for i in range(iterations):
+        mask = np.abs(Z) <= 4
+        Z[mask] = Z[mask] ** 2 + C
+        escaped = (np.abs(Z) > 4) & (escape_count == 0)
+        if np.any(escaped):
+            smooth_escape[escaped] = i + 1 - np.log2(np.log2(np.abs(Z[escaped])))
+            escape_count[escaped] = i
+    smooth_escape[escape_count == 0] = iterations
+    return smooth_escape / iterations
+
+
+def legacy_generator(size: int, iterations: int):
+    """fractal_generator.generate_julia_image iteration"""
+    x = np.linspace(-1.3, 1.3, size)
+    X, Y = np.meshgrid(x, x)
+    Z = X + 1j * Y
+    output = np.zeros(Z.shape, dtype=int)
+    mask = np.full(Z.shape, True, dtype=bool)
+    for _ in range(iterations):
+        Z[mask] = Z[mask] ** 2 + C
+        mask, old_mask = abs(Z) < 4, mask
+        output += mask & old_mask
+    return output
+
+
+def legacy_boost(size: int, iterations: int):
+    """fractal_boost.julia_optimized loop (numba @njit when available)"""
+    def julia(width, height, zoom, max_iter, c_real, c_imag):
+        result = np.zeros((height, width), dtype=np.uint16)
+        for y in range(height):
+            for x in range(width):
+                z = complex(1.5 * (x - width / 2) / (0.5 * zoom * width), 1.5 * (y - height / 2) / (0.5 * zoom * height))
+                c = complex(c_real, c_imag)
+                iter_count = 0
+                while abs(z) < 10 and iter_count < max_iter:
+                    z = z * z + c
+                    iter_count += 1
+                result[y, x] = iter_count
+        return result
+
+    try:
+        from numba import njit
+        julia = njit(julia)
+        julia(8, 8, 1.0, 10, C.real, C.imag)  # compile outside the timing
+    except ImportError:
+        pass
+    return lambda: julia(size, size, 1.0, iterations, C.real, C.imag)
+
+
+def legacy_canvas(size: int, iterations: int):
+    """FractalCanvas.render_bloom_fractal per-pixel julia_iteration loop"""
+    counts = []
+    for py in range(size):
+        for px in range(size):
+            zx, zy = (px - size // 2) / 200.0, (py - size // 2) / 200.0
+            iteration = 0
+            while iteration < iterations:
+                zx, zy = zx * zx - zy * zy + C.real, 2 * zx * zy + C.imag
+                if zx * zx + zy * zy > 4:
+                    break
+                iteration += 1
+            counts.append(iteration)
+    return counts
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Julia renderer benchmark")
+    parser.add_argument("--size", type=int, default=256)
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--canvas-size", type=int, default=150)
+    parser.add_argument("--storm", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    size, iterations = args.size, args.iterations
+    engine = FractalEngine(workers=1)
+    square = Viewport.linspace(size, size, (-1.3, 1.3), (-1.3, 1.3))
+    rotated = Viewport.linspace(size, size, (-1.3, 1.3), (-1.3, 1.3), rotation=0.4)
+    boost_view = Viewport.pixel_scale(size, size, (size / 2, size / 2), (size / 3, size / 3))
+    canvas_view = Viewport.pixel_scale(args.canvas_size, args.canvas_size,
+                                       (args.canvas_size // 2, args.canvas_size // 2), (200.0, 200.0))
+
+    cases = [
+        ("bloom_spawner", lambda: legacy_bloom(size, iterations),
+         JuliaJob(C, rotated, iterations, escape_radius=4.0, smooth=True)),
+        ("fractal_generator", lambda: legacy_generator(size, iterations),
+         JuliaJob(C, square, iterations, escape_radius=4.0)),
+        ("fractal_boost", legacy_boost(size, iterations),
+         JuliaJob(C, boost_view, iterations, escape_radius=10.0)),
+        ("fractal_canvas", lambda: legacy_canvas(args.canvas_size, 50),
+         JuliaJob(C, canvas_view, 50)),
+    ]
+
+    print(f"{'renderer':>18} {'legacy ms':>10} {'engine ms':>10} {'speedup':>8}")
+    for name, legacy, job in cases:
+        legacy_ms = timed(legacy) * 1000
+        engine_ms = timed(lambda: engine.render(job)) * 1000
+        print(f"{name:>18} {legacy_ms:>10.1f} {engine_ms:>10.1f} {legacy_ms / engine_ms:>7.1f}x")
+
+    storm = [JuliaJob(complex(-0.8 + 0.02 * i, 0.156), rotated, iterations, escape_radius=4.0, smooth=True)
+             for i in range(args.storm)]
+    one_by_one = timed(lambda: [engine.render(job) for job in storm]) * 1000
+    pool_engine = FractalEngine(workers=args.workers, min_parallel_pixels=1)
+    pool_engine.render(storm[0])  # start the pool outside the timing
+    batched = timed(lambda: pool_engine.render_batch(storm)) * 1000
+    pool_engine.close()
+    print(f"\nrebloom storm of {args.storm} ({size}x{size}, {args.workers} workers): "
+          f"one by one {one_by_one:.0f} ms, batch {batched:.0f} ms ({one_by_one / batched:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+bench_frame_transport.py - Visualizer frame transport benchmark
+CPU cost of moving visualizer frames to the server: the original path
+(PNG encode, base64, JSON line on stdout, then JSON parse and base64 decode
+in the server) against the shared-memory frame ring (raw copy in, raw copy
+out), reported per frame and as the share of one core needed for N
+visualizers at the target frame rate.
+
+Usage:
+    python tools/benchmarks/bench_frame_transport.py --visualizers 12 --fps 30
+"""
+
+import argparse
+import base64
+import importlib.util
+import io
+import json
+import os
+import time
+
+import numpy as np
+
+# Load the module on its own: the backend.visual package imports every visualizer
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+spec = importlib.util.spec_from_file_location(
+    "frame_transport", os.path.join(project_root, "backend", "visual", "frame_transport.py"))
+frame_transport = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(frame_transport)
+
+
+def legacy_round_trip(pixels, frame_count):
+    """BaseVisualizer._create_frame_data on one side, the server's json/base64 parse on the other"""
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG")
+    line = json.dumps({"frame": base64.b64encode(buffer.getvalue()).decode(), "timestamp": time.time(),
+                       "frame_count": frame_count, "metadata": {}})
+    return base64.b64decode(json.loads(line)["frame"]), len(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Visualizer frame transport benchmark")
+    parser.add_argument("--width", type=int, default=800)
+    parser.add_argument("--height", type=int, default=600)
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--visualizers", type=int, default=12)
+    parser.add_argument("--fps", type=float, default=30.0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    base = (rng.random((args.height, args.width, 3)) * 64).astype(np.uint8)
+    frames = [np.roll(base, shift, axis=1) for shift in range(8)]
+    budget = args.visualizers * args.fps
+
+    segment = f"dawn_bench_{os.getpid()}"
+    writer = frame_transport.FrameWriter(segment, args.width, args.height)
+    reader = frame_transport.FrameReader(segment)
+    start = time.process_time()
+    for index in range(args.frames):
+        writer.write(frames[index % len(frames)], index)
+        reader.read()
+    ring_ms = (time.process_time() - start) * 1000 / args.frames
+    reader.close()
+    writer.close()
+    print(f"shared-memory ring: {ring_ms:.3f} ms/frame, "
+          f"{ring_ms * budget / 10:.1f}% of a core for {args.visualizers} x {args.fps:.0f} FPS")
+
+    try:
+        start = time.process_time()
+        payload = 0
+        for index in range(args.frames):
+            payload += legacy_round_trip(frames[index % len(frames)], index)[1]
+        legacy_ms = (time.process_time() - start) * 1000 / args.frames
+        print(f"PNG/base64/JSON:    {legacy_ms:.3f} ms/frame, "
+              f"{legacy_ms * budget / 10:.1f}% of a core, {payload / args.frames / 1024:.0f} KiB per line")
+    except ImportError:
+        print("PNG/base64/JSON:    skipped (Pillow not installed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+bench_memory_consolidation.py - Near-duplicate consolidation benchmark
+Times MinHash/LSH candidate generation plus exact confirmation for a store of
+synthetic keyword sets (with a planted fraction of near duplicates), and the
+cost of an incremental pass over newly added traces. The O(N^2) pairwise
+baseline is measured on a sample and extrapolated.
+
+Usage:
+    python tools/benchmarks/bench_memory_consolidation.py --traces 10000 100000 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.memory_dedup import MinHashLSH
+
+
+def jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+def make_store(count: int, vocabulary, duplicate_rate: float, rng):
+    store = []
+    for i in range(count):
+        if store and rng.random() < duplicate_rate:
+            keywords = set(rng.choice(store))
+            keywords.discard(next(iter(keywords)))
+            keywords.add(f"variant{i}")
+        else:
+            keywords = set(rng.sample(vocabulary, 15))
+        store.append(keywords)
+    return store
+
+
+def lsh_pass(index: MinHashLSH, store, start: int) -> int:
+    """Index traces [start:] and count confirmed near-duplicate pairs"""
+    found = 0
+    for i in range(start, len(store)):
+        for candidate in index.insert(str(i), store[i]):
+            if jaccard(store[i], store[int(candidate)]) > 0.8:
+                found += 1
+                break
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory consolidation benchmark")
+    parser.add_argument("--traces", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--duplicates", type=float, default=0.05)
+    parser.add_argument("--incremental", type=int, default=1000,
+                        help="traces added before the incremental pass")
+    args = parser.parse_args()
+
+    rng = random.Random(9)
+    vocabulary = [f"term{i}" for i in range(50000)]
+
+    print(f"{'traces':>8} {'pairwise s (est)':>17} {'lsh full s':>11} {'lsh incr ms':>12} {'dupes':>7}")
+    for count in args.traces:
+        store = make_store(count + args.incremental, vocabulary, args.duplicates, rng)
+        base = store[:count]
+
+        # Pairwise baseline on a sample, extrapolated to N^2 / 2 comparisons
+        sample = base[:min(count, 1000)]
+        start = time.perf_counter()
+        for i in range(len(sample)):
+            for j in range(i + 1, len(sample)):
+                jaccard(sample[i], sample[j])
+        pairs = len(sample) * (len(sample) - 1) / 2
+        pairwise_s = (time.perf_counter() - start) / pairs * count * (count - 1) / 2
+
+        index = MinHashLSH()
+        start = time.perf_counter()
+        found = lsh_pass(index, base, 0)
+        full_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        lsh_pass(index, store, count)
+        incremental_ms = (time.perf_counter() - start) * 1e3
+
+        print(f"{count:>8} {pairwise_s:>17.1f} {full_s:>11.2f} {incremental_ms:>12.1f} {found:>7}")
+
+
+if __name__ == "__main__":
+    main()
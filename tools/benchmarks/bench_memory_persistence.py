@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+bench_memory_persistence.py - MemoryManager persistence benchmark
+Compares the legacy full JSON export against the incremental segment store:
+time to save after a small batch of new interactions, bytes written per save,
+and cold-start load time (snapshot + log replay vs JSON parse + index rebuild).
+
+Usage:
+    python tools/benchmarks/bench_memory_persistence.py --memories 1000 10000 --delta 50
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logging.disable(logging.CRITICAL)
+
+from core.memory_manager import MemoryManager
+
+
+def populate(manager: MemoryManager, count: int, offset: int = 0):
+    emotions = ["curious", "calm", "focused", "excited"]
+    for i in range(offset, offset + count):
+        manager.store_interaction(
+            f"Question {i} about topic{i % 97} and theme{i % 31} in recursive pattern{i % 13}?",
+            f"Answer {i} discussing idea{i % 53} with structure{i % 17}",
+            emotions[i % len(emotions)], {"depth": (i % 10) / 10}, {"scup": 0.5, "entropy": 0.4}
+        )
+
+
+def directory_bytes(path: Path) -> int:
+    return sum(entry.stat().st_size for entry in path.rglob("*") if entry.is_file())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory persistence benchmark")
+    parser.add_argument("--memories", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--delta", type=int, default=50,
+                        help="interactions stored between saves")
+    args = parser.parse_args()
+
+    print(f"{'memories':>9} {'json save ms':>13} {'json bytes':>11} {'seg save ms':>12} "
+          f"{'seg bytes':>10} {'json load ms':>13} {'seg load ms':>12}")
+    for count in args.memories:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            manager = MemoryManager(str(root / "segment"))
+            populate(manager, count)
+            manager.save_memory_state()
+            populate(manager, args.delta, offset=count)
+
+            json_path = root / "legacy" / "memory_state_bench.json"
+            json_path.parent.mkdir()
+            start = time.perf_counter()
+            manager.save_memory_state(str(json_path))
+            json_save_ms = (time.perf_counter() - start) * 1e3
+            json_bytes = directory_bytes(json_path.parent)
+
+            before = manager.store.log_bytes
+            start = time.perf_counter()
+            manager.save_memory_state()
+            segment_save_ms = (time.perf_counter() - start) * 1e3
+            segment_bytes = manager.store.log_bytes - before
+
+            start = time.perf_counter()
+            MemoryManager(str(root / "legacy"))
+            json_load_ms = (time.perf_counter() - start) * 1e3
+
+            start = time.perf_counter()
+            MemoryManager(str(root / "segment"))
+            segment_load_ms = (time.perf_counter() - start) * 1e3
+
+        print(f"{count:>9} {json_save_ms:>13.1f} {json_bytes:>11} {segment_save_ms:>12.1f} "
+              f"{segment_bytes:>10} {json_load_ms:>13.1f} {segment_load_ms:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
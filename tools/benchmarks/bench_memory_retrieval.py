@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+bench_memory_retrieval.py - MemoryManager.retrieve_similar benchmark
+Compares inverted-index retrieval (Jaccard and BM25) with the exhaustive
+linear scan as the number of memory traces grows.
+
+Usage:
+    python tools/benchmarks/bench_memory_retrieval.py --traces 10000 100000
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.memory_manager import MemoryManager, MemoryTrace
+
+
+def populate(manager: MemoryManager, count: int, vocabulary, rng):
+    """Insert synthetic traces directly (bypasses association/cluster upkeep)"""
+    now = time.time()
+    for i in range(count):
+        text = " ".join(rng.sample(vocabulary, rng.randint(4, 15)))
+        trace = MemoryTrace(
+            memory_id=f"mem_{i}", timestamp=now - rng.random() * 86400 * 7,
+            input_text=text, response_text="", emotional_state="calm",
+            consciousness_state={}, metrics_snapshot={}, interaction_outcome="neutral",
+            pattern_tags=[], semantic_keywords=manager._extract_semantic_keywords(text, ""),
+            emotional_intensity=0.5, retrieval_count=0, last_retrieved=0.0,
+            memory_strength=rng.uniform(0.1, 1.0), consolidation_level=0
+        )
+        manager.memory_traces[trace.memory_id] = trace
+        manager._update_semantic_index(trace.memory_id, trace.semantic_keywords)
+
+
+def time_queries(fn, queries) -> float:
+    """Mean milliseconds per query"""
+    start = time.perf_counter()
+    for query in queries:
+        fn(query)
+    return (time.perf_counter() - start) / len(queries) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory retrieval benchmark")
+    parser.add_argument("--traces", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--vocabulary", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(5)
+    vocabulary = [f"term{i:05d}" for i in range(args.vocabulary)]
+
+    print(f"{'traces':>8} {'scan ms':>9} {'index ms':>9} {'bm25 ms':>9} {'cand/query':>11}")
+    for count in args.traces:
+        with tempfile.TemporaryDirectory() as directory:
+            manager = MemoryManager(memory_directory=directory)
+            populate(manager, count, vocabulary, rng)
+            queries = [" ".join(rng.sample(vocabulary, 6)) for _ in range(args.queries)]
+
+            scan_ms = time_queries(
+                lambda q: manager.retrieve_similar(q, limit=10, min_similarity=0.3, exhaustive=True), queries)
+
+            engine = manager.retrieval_engine
+            engine.queries = engine.candidates_scored = 0
+            index_ms = time_queries(
+                lambda q: manager.retrieve_similar(q, limit=10, min_similarity=0.3), queries)
+            candidates = engine.get_statistics()["avg_candidates_per_query"]
+            bm25_ms = time_queries(
+                lambda q: manager.retrieve_similar(q, limit=10, min_similarity=0.3, scoring="bm25"), queries)
+
+        print(f"{count:>8} {scan_ms:>9.2f} {index_ms:>9.3f} {bm25_ms:>9.3f} {candidates:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+bench_nutrient_cycle.py - Nutrient cycle scaling benchmark
+Cost of one packet update pass, one batch of consume-style radius queries
+and one pool diffusion pass as packet and pool counts grow: the original
+per-packet loops (full scans with np.linalg.norm, all-pairs diffusion)
+against the grid-indexed, array-based kernels NutrientCycle now uses.
+
+Usage:
+    python tools/benchmarks/bench_nutrient_cycle.py --packets 1000 5000 20000 --pools 50 500
+"""
+
+import argparse
+import logging
+import math
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logging.disable(logging.CRITICAL)
+
+import numpy as np
+
+from schema.nutrient_spatial import PacketStore, PointIndex, attraction_deltas, diffuse
+
+DT, FRICTION, ATTRACTION, DECAY = 0.1, 0.1, 0.2, 0.01
+NUTRIENT_TYPES = 13
+
+
+def make_world(packet_count: int, pool_count: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    extent = 60.0 * max(1.0, (packet_count / 1000) ** (1 / 3))
+    packets = [SimpleNamespace(packet_id=f"packet_{i}", type_code=i % NUTRIENT_TYPES,
+                               amount=float(rng.uniform(1, 10)), position=rng.uniform(-extent, extent, 3),
+                               velocity=rng.normal(0, 2, 3)) for i in range(packet_count)]
+    pools = [SimpleNamespace(position=rng.uniform(-extent, extent, 3),
+                             nutrients=rng.uniform(0, 50, NUTRIENT_TYPES)) for _ in range(pool_count)]
+    queries = rng.uniform(-extent, extent, (100, 3))
+    return packets, pools, queries
+
+
+def legacy_nearby(items, position, radius):
+    nearby = [item for item in items if np.linalg.norm(item.position - position) <= radius]
+    nearby.sort(key=lambda item: np.linalg.norm(item.position - position))
+    return nearby
+
+
+def legacy_update(packets, pools):
+    for packet in packets:
+        packet.position += packet.velocity * DT
+        packet.velocity *= (1 - FRICTION * DT)
+        for pool in legacy_nearby(pools, packet.position, 50.0):
+            direction = pool.position - packet.position
+            distance = np.linalg.norm(direction)
+            if distance > 0:
+                packet.velocity += (direction / distance) * ATTRACTION / (distance + 1) * DT
+        packet.amount -= packet.amount * DECAY * DT
+
+
+def legacy_diffusion(pools):
+    for i, pool1 in enumerate(pools):
+        for pool2 in pools[i + 1:]:
+            distance = np.linalg.norm(pool1.position - pool2.position)
+            if distance < 100.0:
+                strength = 0.05 * math.exp(-distance / 50.0)
+                for column in range(NUTRIENT_TYPES):
+                    flow = (pool1.nutrients[column] - pool2.nutrients[column]) * strength * DT
+                    if abs(flow) > 0.01:
+                        pool1.nutrients[column] -= flow
+                        pool2.nutrients[column] += flow
+
+
+def array_update(store: PacketStore, pool_index: PointIndex):
+    count = len(store)
+    positions, velocities = store.integrate(DT, FRICTION)
+    velocities += attraction_deltas(positions, pool_index, 50.0, ATTRACTION) * DT
+    store.refresh_cells()
+    amounts = np.fromiter((packet.amount for packet in store.packets), dtype=float, count=count)
+    amounts -= amounts * DECAY * DT
+    for packet, amount in zip(store.packets, amounts.tolist()):
+        packet.amount = amount
+
+
+def array_diffusion(pool_index: PointIndex, concentrations: np.ndarray) -> np.ndarray:
+    first, second, distances = pool_index.pairs(100.0)
+    updated, _ = diffuse(concentrations, first, second, 0.05 * np.exp(-distances / 50.0), DT)
+    return updated
+
+
+def timed_ms(function, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Nutrient cycle scaling benchmark")
+    parser.add_argument("--packets", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--pools", type=int, nargs="+", default=[50, 500])
+    args = parser.parse_args()
+
+    print(f"{'packets':>8} {'pools':>6} | {'update ms':>19} | {'100 queries ms':>19} | {'diffusion ms':>19}")
+    print(f"{'':>8} {'':>6} | {'legacy':>9} {'grid':>9} | {'legacy':>9} {'grid':>9} | {'legacy':>9} {'grid':>9}")
+    for pool_count in args.pools:
+        for packet_count in args.packets:
+            packets, pools, queries = make_world(packet_count, pool_count)
+            legacy_update_ms = timed_ms(lambda: legacy_update(packets, pools), 1)
+            legacy_query_ms = timed_ms(lambda: [legacy_nearby(packets, q, 20.0) for q in queries], 1)
+            legacy_diffusion_ms = timed_ms(lambda: legacy_diffusion(pools), 1)
+
+            packets, pools, queries = make_world(packet_count, pool_count)
+            store = PacketStore(cell_size=20.0)
+            for packet in packets:
+                store.add(packet, packet.type_code)
+            pool_index = PointIndex([pool.position for pool in pools], cell_size=50.0)
+            concentrations = np.array([pool.nutrients for pool in pools])
+            array_diffusion(pool_index, concentrations)  # builds the cached pair list
+            update_ms = timed_ms(lambda: array_update(store, pool_index), 5)
+            query_ms = timed_ms(lambda: [store.within(q, 20.0) for q in queries], 5)
+            diffusion_ms = timed_ms(lambda: array_diffusion(pool_index, concentrations), 5)
+
+            print(f"{packet_count:>8} {pool_count:>6} | {legacy_update_ms:>9.1f} {update_ms:>9.2f} | "
+                  f"{legacy_query_ms:>9.1f} {query_ms:>9.2f} | {legacy_diffusion_ms:>9.1f} {diffusion_ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+bench_pattern_detector.py - Rebloop detection benchmark
+Per-tick cost of PatternDetector.detect_reloop (add_data_point + detection)
+with the matrix-profile engine, against the original scan that scored every
+window length, metric and candidate position with _calculate_pattern_similarity.
+
+Usage:
+    python tools/benchmarks/bench_pattern_detector.py --history 200 1000
+"""
+
+import argparse
+import logging
+import math
+import os
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logging.disable(logging.CRITICAL)
+# The original scan divides by zero on constant windows
+warnings.simplefilter("ignore", RuntimeWarning)
+
+import numpy as np
+
+from core.pattern_detector import REBLOOP_METRICS, PatternDetector
+
+
+def legacy_detect(detector: PatternDetector):
+    """The original scan: best similarity over lengths x metrics x positions"""
+    history = list(detector.metric_history)
+    best = 0.0
+    for length in range(detector.min_pattern_length, min(detector.max_pattern_length, len(history) // 2)):
+        for metric in REBLOOP_METRICS:
+            sequence = [point[metric] for point in history]
+            pattern = sequence[-length:]
+            preceding = sequence[-(length * 3):-length]
+            for i in range(len(preceding) - length + 1):
+                best = max(best, detector._calculate_pattern_similarity(pattern, preceding[i:i + length]))
+    return best
+
+
+def metrics_at(step: int, rng) -> dict:
+    return {
+        'scup': 0.5 + 0.3 * math.sin(step * 0.4) + rng.normal(0, 0.05),
+        'entropy': 0.5 + 0.2 * math.sin(step * 0.13) + rng.normal(0, 0.05),
+        'heat': 0.3 + 0.1 * np.sign(math.sin(step * 0.9)) + rng.normal(0, 0.02),
+    }
+
+
+def per_tick_ms(detector: PatternDetector, rng, start: int, ticks: int, detect) -> float:
+    begin = time.perf_counter()
+    for step in range(start, start + ticks):
+        detector.add_data_point(metrics_at(step, rng), {})
+        detect(detector)
+    return (time.perf_counter() - begin) * 1000 / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebloop detection benchmark")
+    parser.add_argument("--history", type=int, nargs="+", default=[200, 1000])
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--legacy-ticks", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'history':>8} {'legacy ms/tick':>15} {'profile ms/tick':>16} {'speedup':>8}")
+    for history in args.history:
+        rng = np.random.default_rng(4)
+        detector = PatternDetector(max_history=history)
+        for step in range(history):
+            detector.add_data_point(metrics_at(step, rng), {})
+
+        legacy_ms = per_tick_ms(detector, rng, history, args.legacy_ticks, legacy_detect)
+        profile_ms = per_tick_ms(detector, rng, history + args.legacy_ticks, args.ticks,
+                                 lambda d: d.detect_reloop())
+        print(f"{history:>8} {legacy_ms:>15.2f} {profile_ms:>16.3f} {legacy_ms / profile_ms:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
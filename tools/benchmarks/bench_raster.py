@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+bench_raster.py - Visualizer raster primitives benchmark
+Per-frame cost of the original pixel-at-a-time helpers (gradient background,
+blue-to-red heatmap, per-cell vector field) against the NumPy raster
+primitives in backend/visual/raster.py on the same frame size.
+
+Usage:
+    python tools/benchmarks/bench_raster.py --size 512
+"""
+
+import argparse
+import importlib.util
+import os
+import time
+
+import numpy as np
+
+# Load the module on its own: the backend.visual package imports every visualizer
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+spec = importlib.util.spec_from_file_location("raster", os.path.join(project_root, "backend", "visual", "raster.py"))
+raster = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(raster)
+
+
+def legacy_gradient(width, height, color1, color2):
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    for y in range(height):
+        for x in range(width):
+            frame[y, x] = [int(color1[c] * (1 - y / height) + color2[c] * (y / height)) for c in range(3)]
+    return frame
+
+
+def legacy_heatmap(data):
+    frame = np.zeros(data.shape + (3,), dtype=np.uint8)
+    for y in range(data.shape[0]):
+        for x in range(data.shape[1]):
+            value = min(max(float(data[y, x]), 0.0), 1.0)
+            frame[y, x] = (int(value * 255), 0, int((1 - value) * 255))
+    return frame
+
+
+def legacy_vector_field(vectors, width, height, scale):
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    for y in range(0, height, 20):
+        for x in range(0, width, 20):
+            vx, vy = vectors[y, x]
+            steps = int(max(abs(vx), abs(vy)) * scale) + 1
+            for k in range(steps + 1):
+                px, py = int(round(x + vx * scale * k / steps)), int(round(y + vy * scale * k / steps))
+                if 0 <= px < width and 0 <= py < height:
+                    frame[py, px] = (0, 255, 136)
+    return frame
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Raster primitives benchmark")
+    parser.add_argument("--size", type=int, default=512)
+    args = parser.parse_args()
+
+    size = args.size
+    rng = np.random.default_rng(0)
+    data = rng.random((size, size))
+    vectors = rng.normal(0, 5, (size, size, 2))
+    origins = np.stack(np.meshgrid(np.arange(0, size, 20), np.arange(0, size, 20)), axis=-1).reshape(-1, 2)
+
+    cases = [
+        ("gradient", lambda: legacy_gradient(size, size, (0, 0, 40), (0, 80, 40)),
+         lambda: raster.linear_gradient(size, size, (0, 0, 40), (0, 80, 40))),
+        ("heatmap", lambda: legacy_heatmap(data), lambda: raster.apply_palette(data, 'heat')),
+        ("vector field", lambda: legacy_vector_field(vectors, size, size, 2.0),
+         lambda: raster.draw_arrows(np.zeros((size, size, 3), dtype=np.uint8), origins,
+                                    vectors[origins[:, 1], origins[:, 0]], (0, 255, 136), scale=2.0)),
+    ]
+
+    print(f"{'primitive':>14} {'legacy ms':>10} {'raster ms':>10} {'speedup':>8}")
+    for name, legacy, vectorised in cases:
+        legacy_ms = timed(legacy) * 1000
+        raster_ms = timed(vectorised) * 1000
+        print(f"{name:>14} {legacy_ms:>10.1f} {raster_ms:>10.2f} {legacy_ms / raster_ms:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+bench_reflex_context.py - Reflex context gathering benchmark
+Per-tick cost of the original gather_system_context body (a dozen
+function-local imports, most failing with ImportError on every call)
+against the ContextProviderRegistry with the default reflex providers,
+followed by the registry's per-provider timing table.
+
+Usage:
+    python tools/benchmarks/bench_reflex_context.py --ticks 2000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+# reflex_table resolves `codex.*` relative to processors/
+sys.path.append(os.path.join(project_root, "processors"))
+
+logging.disable(logging.CRITICAL)
+
+from processors.codex.reflex_context import ContextProviderRegistry, default_reflex_providers
+
+
+def legacy_gather() -> dict:
+    """
+    The original body, with the undefined `pulse` name imported and the
+    handlers widened to Exception (schema.schema_goal raises NameError while
+    importing, which the original ImportError handlers let escape)
+    """
+    context = {}
+    try:
+        from pulse.pulse_heat import pulse
+        thermal_profile = pulse.get_thermal_profile()
+        context['pulse_heat'] = thermal_profile.get('current_heat', 2.0)
+        context['thermal_stability'] = thermal_profile.get('stability_index', 1.0)
+        context['thermal_momentum'] = thermal_profile.get('thermal_momentum', 0.0)
+        context['current_zone'] = thermal_profile.get('current_zone', 'unknown')
+    except Exception:
+        context.update(pulse_heat=2.0, thermal_stability=1.0, thermal_momentum=0.0, current_zone='unknown')
+    try:
+        from core.scup import compute_scup
+        from schema.alignment_probe import current_alignment_probe
+        from schema.mood_urgency_probe import mood_urgency_probe
+        from codex.sigil_memory_ring import get_active_sigil_entropy_list
+        entropy_list = get_active_sigil_entropy_list()
+        context['entropy_level'] = sum(entropy_list) / len(entropy_list) if entropy_list else 0.0
+        context['scup_score'] = compute_scup(tp_rar=current_alignment_probe(None),
+                                             pressure_score=context['pulse_heat'],
+                                             urgency_level=mood_urgency_probe(None),
+                                             sigil_entropy=context['entropy_level'], pulse=None, entropy_log=[])
+    except Exception:
+        context.update(entropy_level=0.5, scup_score=0.7)
+    try:
+        from schema.alignment_vector import current_alignment_probe
+        context['alignment_score'] = current_alignment_probe()
+    except Exception:
+        context['alignment_score'] = 0.6
+    try:
+        from core.qualia_kernel import get_current_feeling
+        feeling_state = get_current_feeling()
+        if 'qualia_type' in feeling_state:
+            context['qualia_type'] = feeling_state['qualia_type']
+    except Exception:
+        context.update(qualia_type='unknown', qualia_intensity=0.5, qualia_coherence=0.5)
+    try:
+        from core.tension_engine import get_tension_state
+        tension_state = get_tension_state()
+        if 'current_tension' in tension_state:
+            context['tension_level'] = tension_state['current_tension']
+    except Exception:
+        context.update(tension_level=0.3, tension_zone='creative')
+    try:
+        from schema.schema_goal import get_all_goals_summary
+        goals_summary = get_all_goals_summary()
+        context['active_goals'] = goals_summary.get('active_goals', 0)
+        context['recent_achievements'] = len(goals_summary.get('recent_achievements', []))
+    except Exception:
+        context.update(active_goals=0, recent_achievements=0)
+    try:
+        from memory.memory_anchor import get_memory_statistics
+        memory_stats = get_memory_statistics()
+        context['total_anchors'] = memory_stats.get('total_anchors', 0)
+        context['recent_anchors'] = memory_stats.get('recent_anchors_7d', 0)
+    except Exception:
+        context.update(total_anchors=0, recent_anchors=0)
+    return context
+
+
+def per_tick_us(gather, ticks: int) -> float:
+    gather()  # first call pays one-off module imports
+    start = time.perf_counter()
+    for _ in range(ticks):
+        gather()
+    return (time.perf_counter() - start) * 1e6 / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reflex context gathering benchmark")
+    parser.add_argument("--ticks", type=int, default=2000)
+    args = parser.parse_args()
+
+    registry = ContextProviderRegistry(default_reflex_providers())
+    legacy_us = per_tick_us(legacy_gather, args.ticks)
+    registry_us = per_tick_us(registry.gather, args.ticks)
+
+    print(f"{'path':>9} {'us/tick':>9}")
+    print(f"{'legacy':>9} {legacy_us:>9.1f}")
+    print(f"{'registry':>9} {registry_us:>9.1f}   ({legacy_us / registry_us:.0f}x)")
+
+    print(f"\n{'provider':>15} {'available':>10} {'ttl s':>6} {'calls':>6} {'hits':>6} {'mean us':>8}")
+    for name, stats in registry.get_statistics()['providers'].items():
+        print(f"{name:>15} {str(stats['available']):>10} {stats['ttl']:>6.1f} {stats['calls']:>6} "
+              f"{stats['cache_hits']:>6} {stats['mean_ms'] * 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+bench_reflex_table.py - Reflex evaluation benchmark
+Per-tick cost of the compiled ReflexDecisionTable against the original walk
+over every reflex and trigger (ReflexTrigger.check_trigger semantics), for
+large synthetic reflex sets where only a few context metrics move per tick.
+
+Usage:
+    python tools/benchmarks/bench_reflex_table.py --reflexes 1000 5000 --changed 3
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logging.disable(logging.CRITICAL)
+
+from processors.codex.reflex_compiler import ReflexDecisionTable
+
+
+class Trigger(SimpleNamespace):
+    def mark_triggered(self, now=None):
+        self.cooldown_until = (time.monotonic() if now is None else now) + self.cooldown_seconds
+
+
+def legacy_check(trigger, context, now) -> bool:
+    """ReflexTrigger.check_trigger for threshold / combination triggers"""
+    if trigger.cooldown_seconds > 0 and now < trigger.cooldown_until:
+        return False
+    if trigger.trigger_type == 'threshold':
+        return legacy_threshold(trigger.conditions, trigger.sensitivity, context)
+    results = [legacy_threshold(condition, 1.0, context) for condition in trigger.conditions['conditions']]
+    return all(results) if trigger.conditions['logic'] == 'AND' else any(results)
+
+
+def legacy_threshold(conditions, sensitivity, context) -> bool:
+    value = context.get(conditions['metric'], 0)
+    if conditions['operator'] == 'greater_than':
+        return value > conditions['threshold'] * sensitivity
+    return value < conditions['threshold'] * sensitivity
+
+
+def legacy_evaluate(reflexes, context):
+    now = time.monotonic()
+    fired = []
+    for reflex in reflexes:
+        if not reflex.enabled:
+            continue
+        for trigger in reflex.triggers:
+            if legacy_check(trigger, context, now):
+                trigger.mark_triggered(now)
+                fired.append((reflex, trigger))
+                break
+    return fired
+
+
+def make_reflexes(count: int, metrics, rng):
+    # Mostly far-off thresholds: firing is rare, as in a healthy system
+    def condition():
+        if rng.random() < 0.8:
+            return {'metric': rng.choice(metrics), 'threshold': rng.uniform(0.9, 1.5), 'operator': 'greater_than'}
+        return {'metric': rng.choice(metrics), 'threshold': rng.uniform(-0.5, 0.1), 'operator': 'less_than'}
+
+    reflexes = []
+    for _ in range(count):
+        triggers = []
+        for _ in range(rng.randint(1, 3)):
+            if rng.random() < 0.7:
+                trigger_type, conditions = 'threshold', condition()
+            else:
+                trigger_type = 'combination'
+                conditions = {'logic': rng.choice(['AND', 'OR']),
+                              'conditions': [condition() for _ in range(rng.randint(2, 3))]}
+            triggers.append(Trigger(trigger_type=trigger_type, conditions=conditions, sensitivity=1.0,
+                                    cooldown_seconds=30.0, cooldown_until=0.0))
+        reflexes.append(SimpleNamespace(enabled=True, triggers=triggers))
+    return reflexes
+
+
+def per_tick_us(evaluate, reflexes, metrics, changed: int, ticks: int, seed: int) -> float:
+    rng = random.Random(seed)
+    context = {metric: 0.5 for metric in metrics}
+    evaluate(reflexes, dict(context))
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for metric in rng.sample(metrics, changed):
+            context[metric] = rng.uniform(0.0, 1.0)
+        evaluate(reflexes, dict(context))
+    return (time.perf_counter() - start) * 1e6 / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reflex decision table benchmark")
+    parser.add_argument("--reflexes", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--metrics", type=int, default=200)
+    parser.add_argument("--changed", type=int, default=3)
+    parser.add_argument("--ticks", type=int, default=500)
+    args = parser.parse_args()
+
+    metrics = [f"metric_{i}" for i in range(args.metrics)]
+    print(f"{'reflexes':>9} {'triggers':>9} {'legacy us/tick':>15} {'table us/tick':>14} {'speedup':>8}")
+    for count in args.reflexes:
+        legacy_reflexes = make_reflexes(count, metrics, random.Random(count))
+        legacy_us = per_tick_us(legacy_evaluate, legacy_reflexes, metrics, args.changed, args.ticks, 1)
+
+        reflexes = make_reflexes(count, metrics, random.Random(count))
+        table = ReflexDecisionTable(reflexes)
+        table_us = per_tick_us(lambda _, context: table.evaluate(context), reflexes, metrics,
+                               args.changed, args.ticks, 1)
+        print(f"{count:>9} {len(table):>9} {legacy_us:>15.1f} {table_us:>14.1f} {legacy_us / table_us:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
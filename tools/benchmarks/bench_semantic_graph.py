@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+bench_semantic_graph.py - SemanticMemoryGraph build benchmark
+Graph build time at increasing trace counts: the pairwise similarity_score
+loop (sampled and extrapolated for large N), incremental add_memory through
+the similarity index, and bulk add_memories as used on reload. Graph density
+(and so the unavoidable per-edge bookkeeping) is controlled by --spread.
+
+Usage:
+    python tools/benchmarks/bench_semantic_graph.py --traces 1000 5000 10000
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logging.disable(logging.CRITICAL)
+
+from core.memory.memory_trace_log import (
+    GenomicMemoryTrace, MemoryCrossover, MemoryGenome, SemanticMemoryGraph
+)
+
+
+def make_traces(count: int, rng: random.Random, spread: float):
+    traces = []
+    for i in range(count):
+        crossovers = [
+            MemoryCrossover(memory_anchor="◈", linguistic_trigger=f"trigger{rng.randrange(200)}",
+                            success_rate=0.5, constitutional_alignment=0.9)
+            for _ in range(rng.choice([0, 0, 1, 2]))
+        ]
+        traces.append(GenomicMemoryTrace(
+            timestamp=f"trace-{i}", thought_fragment="gentle", thermal_trace=rng.gauss(7.0, spread),
+            entropy_signature=rng.gauss(6.5, spread), awareness_level=50, sigil_cause="bench",
+            fractal_anchor="◈", emotional_valence=rng.uniform(-1, 1), coherence_note="",
+            linguistic_genome=MemoryGenome(strand_a={}, strand_b={}, memory_crossovers=crossovers)
+        ))
+    return traces
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Semantic graph build benchmark")
+    parser.add_argument("--traces", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--spread", type=float, default=3.0,
+                        help="std-dev of thermal/entropy readings (lower = denser graph)")
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    print(f"{'traces':>8} {'pairwise s (est)':>17} {'incremental s':>14} {'bulk s':>8} {'edges':>10}")
+    for count in args.traces:
+        traces = make_traces(count, rng, args.spread)
+
+        # Pairwise baseline on a sample, extrapolated to N^2 / 2 comparisons
+        sample = traces[:min(count, 500)]
+        start = time.perf_counter()
+        for i, trace in enumerate(sample):
+            for other in sample[:i]:
+                trace.similarity_score(other)
+        pairs = len(sample) * (len(sample) - 1) / 2
+        pairwise_s = (time.perf_counter() - start) / pairs * count * (count - 1) / 2
+
+        graph = SemanticMemoryGraph()
+        start = time.perf_counter()
+        for trace in traces:
+            graph.add_memory(trace)
+        incremental_s = time.perf_counter() - start
+
+        graph = SemanticMemoryGraph()
+        start = time.perf_counter()
+        graph.add_memories(traces)
+        bulk_s = time.perf_counter() - start
+
+        edges = sum(len(e) for e in graph.semantic_edges.values()) // 2
+        print(f"{count:>8} {pairwise_s:>17.1f} {incremental_s:>14.2f} {bulk_s:>8.2f} {edges:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+bench_telemetry_sink.py - Tick-path cost of SCUP/entropy telemetry
+Per-tick latency of the original synchronous persistence (rewrite the
+pretty-printed readings JSON and append a CSV row on every tick) against
+handing the same payloads to the shared TelemetrySink, plus the time to
+drain the sink afterwards.
+
+Usage:
+    python tools/benchmarks/bench_telemetry_sink.py --ticks 500
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logging.disable(logging.CRITICAL)
+
+import numpy as np
+
+from core.telemetry_sink import TelemetrySink
+
+
+def reading(tick: int) -> dict:
+    return {
+        'current_scup': 0.5, 'state': 'STABLE', 'pressure_magnitude': 0.3,
+        'pressure_components': {'thermal': 0.1, 'entropy': 0.2, 'temporal': 0.0, 'memorial': 0.0, 'emergent': 0.0},
+        'timestamp': time.time(), 'tick': tick,
+    }
+
+
+def legacy_tick(directory: str, tick: int):
+    with open(os.path.join(directory, "scup_readings.json"), 'w') as f:
+        json.dump(reading(tick), f, indent=2)
+    with open(os.path.join(directory, "scup_curve.csv"), 'a') as f:
+        f.write(f"{tick},0.5000,STABLE,0.3000\n")
+
+
+def sink_tick(sink: TelemetrySink, directory: str, tick: int):
+    sink.write_snapshot(os.path.join(directory, "scup_readings.json"), reading(tick))
+    sink.append_line(os.path.join(directory, "scup_curve.csv"), f"{tick},0.5000,STABLE,0.3000")
+
+
+def latencies_us(tick_function, ticks: int) -> np.ndarray:
+    samples = np.empty(ticks)
+    for tick in range(ticks):
+        start = time.perf_counter()
+        tick_function(tick)
+        samples[tick] = (time.perf_counter() - start) * 1e6
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Telemetry sink benchmark")
+    parser.add_argument("--ticks", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'path':>8} {'mean us':>9} {'p50 us':>8} {'p99 us':>8} {'drain ms':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        legacy = latencies_us(lambda tick: legacy_tick(directory, tick), args.ticks)
+        print(f"{'legacy':>8} {legacy.mean():>9.1f} {np.median(legacy):>8.1f} "
+              f"{np.percentile(legacy, 99):>8.1f} {'-':>9}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        sink = TelemetrySink()
+        samples = latencies_us(lambda tick: sink_tick(sink, directory, tick), args.ticks)
+        start = time.perf_counter()
+        sink.flush()
+        drain_ms = (time.perf_counter() - start) * 1000
+        print(f"{'sink':>8} {samples.mean():>9.1f} {np.median(samples):>8.1f} "
+              f"{np.percentile(samples, 99):>8.1f} {drain_ms:>9.1f}")
+        stats = sink.get_statistics()
+        sink.close()
+    print(f"\nsink: {stats['lines_written']} lines in {stats['batches_written']} batches, "
+          f"{stats['snapshots_written']} snapshot writes ({stats['snapshots_coalesced']} coalesced), "
+          f"{stats['dropped']} dropped, high water {stats['high_water']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+bench_trace_log.py - Genomic trace persistence benchmark
+Per-trace persistence cost at increasing log sizes: the legacy full JSON
+rewrite (export_traces) against the append-only journal with background
+group commit. Semantic-graph maintenance is excluded so only I/O is compared.
+
+Usage:
+    python tools/benchmarks/bench_trace_log.py --sizes 100 1000 5000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logging.disable(logging.CRITICAL)
+
+from core.memory.memory_trace_log import EnhancedMemoryTraceLog, GenomicMemoryTrace
+
+
+def make_trace(memory: EnhancedMemoryTraceLog, i: int) -> GenomicMemoryTrace:
+    return GenomicMemoryTrace(
+        timestamp=f"2025-01-01T00:00:{i:09d}", thought_fragment=f"gentle pattern {i} breathing",
+        thermal_trace=7.0, entropy_signature=6.5, awareness_level=70, sigil_cause="bench",
+        fractal_anchor="◈◊◈", emotional_valence=0.2, coherence_note="bench",
+        linguistic_genome=memory._create_default_genome(), expression_attempts=[],
+        successful_expressions=[f"expression {i}"], genome_evolution_log=[],
+        semantic_connections=[], constitutional_markers=[]
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Trace log persistence benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--appends", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'traces':>8} {'rewrite ms/trace':>17} {'journal us/trace':>17} {'speedup':>9}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            memory = EnhancedMemoryTraceLog(str(Path(tmp) / "traces.json"))
+            for i in range(size):
+                memory.traces.append(make_trace(memory, i))
+
+            # Legacy behaviour: full rewrite per trace (sampled)
+            samples = min(args.appends, 20)
+            start = time.perf_counter()
+            for _ in range(samples):
+                memory.export_traces()
+            rewrite_s = (time.perf_counter() - start) / samples
+
+            start = time.perf_counter()
+            for i in range(args.appends):
+                trace = make_trace(memory, size + i)
+                memory.traces.append(trace)
+                memory.journal.append(memory._serialize_trace(trace))
+            journal_s = (time.perf_counter() - start) / args.appends
+            memory.close()
+
+        print(f"{size:>8} {rewrite_s * 1e3:>17.2f} {journal_s * 1e6:>17.1f} {rewrite_s / journal_s:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
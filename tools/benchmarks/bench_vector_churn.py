@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+bench_vector_churn.py - DAWNVectorIndex search latency under prune/add churn
+Each cycle prunes a fraction of the live memories and adds the same number
+of new ones, as a long-running session does. Without compaction the dead
+rows stay in the matrix (as with the old logical removal) and every search
+keeps scanning them; with compaction they are reclaimed in the background.
+
+Usage:
+    python tools/benchmarks/bench_vector_churn.py --chunks 50000 --cycles 10
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logging.disable(logging.CRITICAL)
+
+from core.memory.memory_chunk import create_memory_now
+from core.memory.vector_index import DAWNVectorIndex, IndexConfig
+
+
+def search_ms(index: DAWNVectorIndex, queries: int = 50) -> float:
+    start = time.perf_counter()
+    for i in range(queries):
+        index.search(f"memory {i * 7} about the spiral", 10)
+    return (time.perf_counter() - start) * 1000 / queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vector index churn benchmark")
+    parser.add_argument("--chunks", type=int, default=50000)
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--prune", type=float, default=0.2, help="fraction pruned per cycle")
+    parser.add_argument("--dim", type=int, default=384)
+    args = parser.parse_args()
+
+    runs = {
+        "tombstones only": IndexConfig(use_faiss=False, dimension=args.dim, min_compaction_rows=1 << 62),
+        "compaction": IndexConfig(use_faiss=False, dimension=args.dim),
+    }
+    print(f"{'cycle':>6} " + " ".join(f"{name + ' ms/q':>22} {'rows':>8}" for name in runs))
+
+    indices = {name: DAWNVectorIndex(config) for name, config in runs.items()}
+    live = {}
+    for name, index in indices.items():
+        chunks = [create_memory_now("dawn", f"memory {i} about the spiral") for i in range(args.chunks)]
+        index.add_batch(chunks)
+        live[name] = [chunk.memory_id for chunk in chunks]
+    serial = args.chunks
+
+    for cycle in range(args.cycles + 1):
+        row = f"{cycle:>6} "
+        for name, index in indices.items():
+            index.wait_for_compaction()
+            row += f"{search_ms(index):>22.2f} {index.vector_count:>8} "
+        print(row)
+        if cycle == args.cycles:
+            break
+
+        pruned_count = int(args.chunks * args.prune)
+        fresh = [create_memory_now("dawn", f"memory {serial + i} about the spiral") for i in range(pruned_count)]
+        serial += pruned_count
+        for name, index in indices.items():
+            rng = random.Random(cycle)
+            rng.shuffle(live[name])
+            for memory_id in live[name][:pruned_count]:
+                index.remove_chunk(memory_id)
+            copies = [create_memory_now("dawn", chunk.content) for chunk in fresh]
+            index.add_batch(copies)
+            live[name] = live[name][pruned_count:] + [chunk.memory_id for chunk in copies]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+bench_vector_filters.py - Filtered DAWNVectorIndex search benchmark
+Per-query latency of unfiltered search, bitmap-filtered search with a rare
+(about 1%) and a common (about 50%) filter, and pulse-weighted search,
+against the original search_with_filters path that ranked every chunk and
+filtered the results in Python.
+
+Usage:
+    python tools/benchmarks/bench_vector_filters.py --chunks 10000 100000
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logging.disable(logging.CRITICAL)
+
+from core.memory.memory_chunk import create_memory_now
+from core.memory.vector_index import DAWNVectorIndex, IndexConfig
+
+
+def legacy_filtered(index: DAWNVectorIndex, query: str, speaker: str, top_k: int):
+    """The original path: rank everything, then filter per result"""
+    results = []
+    for result in index.search(query, index.vector_count):
+        if getattr(result.chunk, 'speaker', speaker) == speaker:
+            results.append(result)
+            if len(results) >= top_k:
+                break
+    return results
+
+
+def per_query_ms(function, queries: int) -> float:
+    start = time.perf_counter()
+    for i in range(queries):
+        function(f"memory {i * 13} about the spiral")
+    return (time.perf_counter() - start) * 1000 / queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Filtered vector search benchmark")
+    parser.add_argument("--chunks", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(9)
+    print(f"{'chunks':>8} {'legacy rare ms':>15} {'unfiltered ms':>14} {'rare ms':>8} "
+          f"{'common ms':>10} {'pulse ms':>9}")
+    for count in args.chunks:
+        index = DAWNVectorIndex(IndexConfig(use_faiss=False, dimension=args.dim))
+        index.add_batch([
+            create_memory_now("rare" if rng.random() < 0.01 else "dawn", f"memory {i} about the spiral",
+                              pulse_state={"mood": rng.choice(["calm", "anxious"]), "heat": rng.uniform(0, 80),
+                                           "entropy": rng.random()})
+            for i in range(count)
+        ])
+        pulse_state = {"mood": "calm", "heat": 30.0, "entropy": 0.4}
+
+        legacy_ms = per_query_ms(lambda q: legacy_filtered(index, q, "rare", 10), max(1, args.queries // 10))
+        unfiltered_ms = per_query_ms(lambda q: index.search(q, 10), args.queries)
+        rare_ms = per_query_ms(lambda q: index.search_with_filters(q, speaker="rare", top_k=10), args.queries)
+        common_ms = per_query_ms(lambda q: index.search_with_filters(q, mood="calm", top_k=10), args.queries)
+        pulse_ms = per_query_ms(lambda q: index.search_with_pulse_state(q, pulse_state, top_k=10), args.queries)
+        print(f"{count:>8} {legacy_ms:>15.2f} {unfiltered_ms:>14.2f} {rare_ms:>8.2f} "
+              f"{common_ms:>10.2f} {pulse_ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
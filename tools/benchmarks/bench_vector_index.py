@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+bench_vector_index.py - NumPy vector engine benchmark
+Per-query latency and recall@k at increasing index sizes for the previous
+list-of-vectors mock (np.array over the list + full argsort per query), the
+flat engine and the IVF engine. Vectors are drawn around random cluster
+centres so IVF recall is representative of embedded text.
+
+Usage:
+    python tools/benchmarks/bench_vector_index.py --sizes 10000 100000 --dim 384
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logging.disable(logging.CRITICAL)
+
+from core.memory.vector_engine import FlatVectorIndex, IVFVectorIndex
+
+
+def make_vectors(count: int, dimension: int, rng: np.random.Generator, clusters: int = 256) -> np.ndarray:
+    centers = rng.normal(size=(clusters, dimension))
+    labels = rng.integers(0, clusters, size=count)
+    return (centers[labels] + 0.5 * rng.normal(size=(count, dimension))).astype(np.float32)
+
+
+def mock_search(vectors: list, query: np.ndarray, k: int) -> np.ndarray:
+    """The previous MockVectorIndex: re-stack the list and fully sort per query"""
+    matrix = np.array(vectors)
+    similarities = matrix @ query / (np.linalg.norm(matrix, axis=1) * np.linalg.norm(query))
+    return np.argsort(similarities)[::-1][:k]
+
+
+def recall(approx: np.ndarray, exact: np.ndarray) -> float:
+    k = exact.shape[1]
+    return float(np.mean([len(set(a) & set(e)) / k for a, e in zip(approx, exact)]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vector engine benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 50000])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, default=8)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(11)
+    print(f"{'vectors':>9} {'mock ms/q':>10} {'flat ms/q':>10} {'ivf ms/q':>9} "
+          f"{'ivf build s':>12} {'ivf recall@k':>13}")
+    for size in args.sizes:
+        vectors = make_vectors(size, args.dim, rng)
+        queries = make_vectors(args.queries, args.dim, rng)
+        vector_list = list(vectors)
+
+        mock_queries = queries[:min(len(queries), 10)]
+        start = time.perf_counter()
+        for query in mock_queries:
+            mock_search(vector_list, query, args.k)
+        mock_ms = (time.perf_counter() - start) * 1000 / len(mock_queries)
+
+        flat = FlatVectorIndex(args.dim)
+        flat.add(vectors)
+        start = time.perf_counter()
+        exact = np.vstack([flat.search(query, args.k)[1] for query in queries])
+        flat_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+        start = time.perf_counter()
+        ivf = IVFVectorIndex(args.dim, nprobe=args.nprobe)
+        ivf.add(vectors)
+        build_s = time.perf_counter() - start
+        start = time.perf_counter()
+        approx = np.vstack([ivf.search(query, args.k)[1] for query in queries])
+        ivf_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+        print(f"{size:>9} {mock_ms:>10.2f} {flat_ms:>10.2f} {ivf_ms:>9.2f} "
+              f"{build_s:>12.2f} {recall(approx, exact):>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
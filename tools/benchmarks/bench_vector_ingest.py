@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+bench_vector_ingest.py - DAWNVectorIndex reload benchmark
+Time to index a reloaded memory file: per-chunk add() (the old reload path,
+sampled and extrapolated for large N) against one add_batch() call, plus
+MemoryRouter.route_memories for the full routing path without the
+cognitive router.
+
+Usage:
+    python tools/benchmarks/bench_vector_ingest.py --chunks 10000 100000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logging.disable(logging.CRITICAL)
+
+from core.memory.memory_chunk import create_memory_now
+from core.memory.memory_routing_system import MemoryRouter
+from core.memory.vector_index import DAWNVectorIndex, IndexConfig
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vector index reload benchmark")
+    parser.add_argument("--chunks", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--dim", type=int, default=384)
+    args = parser.parse_args()
+
+    config = dict(use_faiss=False, dimension=args.dim)
+    print(f"{'chunks':>8} {'add() s (est)':>14} {'add_batch s':>12} {'route_memories s':>17} {'speedup':>8}")
+    for count in args.chunks:
+        chunks = [create_memory_now("dawn", f"memory {i} about the spiral and warmth") for i in range(count)]
+
+        sample = chunks[:min(count, 10000)]
+        index = DAWNVectorIndex(IndexConfig(**config))
+        start = time.perf_counter()
+        for chunk in sample:
+            index.add(chunk)
+        single_s = (time.perf_counter() - start) * count / len(sample)
+
+        index = DAWNVectorIndex(IndexConfig(**config))
+        start = time.perf_counter()
+        index.add_batch(chunks)
+        batch_s = time.perf_counter() - start
+
+        router = MemoryRouter(enable_cognitive_routing=False)
+        router.vector_index = DAWNVectorIndex(IndexConfig(**config))
+        start = time.perf_counter()
+        router.route_memories(chunks)
+        route_s = time.perf_counter() - start
+
+        print(f"{count:>8} {single_s:>14.2f} {batch_s:>12.2f} {route_s:>17.2f} {single_s / batch_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+bench_vector_snapshot.py - DAWNVectorIndex persistence benchmark
+Restart cost of rebuilding the index by re-embedding every chunk against
+loading the memory-mapped snapshot, the cost of a full save against an
+incremental save of a small batch of new rows, and the first query after
+load (which faults in the mapped pages).
+
+Usage:
+    python tools/benchmarks/bench_vector_snapshot.py --chunks 10000 100000
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+logging.disable(logging.CRITICAL)
+
+from core.memory.memory_chunk import create_memory_now
+from core.memory.vector_index import DAWNVectorIndex, IndexConfig
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vector snapshot benchmark")
+    parser.add_argument("--chunks", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--increment", type=int, default=1000)
+    args = parser.parse_args()
+
+    config = IndexConfig(use_faiss=False, dimension=args.dim)
+    print(f"{'chunks':>8} {'re-embed s':>11} {'load s':>8} {'first query ms':>15} "
+          f"{'full save s':>12} {'incr save ms':>13} {'MB on disk':>11}")
+    for count in args.chunks:
+        chunks = [create_memory_now("dawn", f"memory {i} about the spiral and warmth") for i in range(count)]
+        directory = tempfile.mkdtemp(prefix="dawn-vectors-")
+        try:
+            start = time.perf_counter()
+            index = DAWNVectorIndex(config)
+            index.add_batch(chunks)
+            rebuild_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            index.save(directory)
+            full_save_s = time.perf_counter() - start
+
+            index.add_batch([create_memory_now("dawn", f"new memory {i}") for i in range(args.increment)])
+            start = time.perf_counter()
+            index.save()
+            incremental_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            restored = DAWNVectorIndex(config)
+            restored.load(directory)
+            load_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            restored.search("memory 42 about the spiral", 5)
+            query_ms = (time.perf_counter() - start) * 1000
+
+            disk_mb = sum(entry.stat().st_size for entry in os.scandir(directory)) / 1e6
+            print(f"{count:>8} {rebuild_s:>11.2f} {load_s:>8.2f} {query_ms:>15.1f} "
+                  f"{full_save_s:>12.2f} {incremental_ms:>13.1f} {disk_mb:>11.1f}")
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()